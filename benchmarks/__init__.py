@@ -0,0 +1,13 @@
+"""
+Benchmarks of the hot paths of xknx.
+
+The suite requires `pytest-benchmark` and is not collected by a regular test run.
+Save a baseline, change the code and compare against it:
+
+    pytest benchmarks --benchmark-save=baseline
+    pytest benchmarks --benchmark-json=current.json
+    python script/compare_benchmarks.py .benchmarks current.json --threshold 10
+
+Runs are stored in `.benchmarks/` - baselines are only comparable on the machine
+they were recorded on.
+"""
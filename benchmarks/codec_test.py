@@ -0,0 +1,123 @@
+"""Benchmarks of parsing and serializing KNX/IP frames, cEMI frames, APDUs and addresses."""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from xknx.cemi import CEMIFrame
+from xknx.dpt import (
+    DPTArray,
+    DPTBase,
+    DPTElectricPotential,
+    DPTScaling,
+    DPTString,
+    DPTSwitch,
+    DPTTemperature,
+    DPTValue4Count,
+)
+from xknx.knxip import KNXIPFrame
+from xknx.telegram import AddressFilter, GroupAddress
+from xknx.telegram.apci import APCI
+
+
+def test_knxip_routing_indication_from_knx(
+    benchmark: BenchmarkFixture, raw_routing_indication: bytes
+) -> None:
+    """Parse a received RoutingIndication."""
+    benchmark(KNXIPFrame.from_knx, raw_routing_indication)
+
+
+def test_knxip_secure_wrapper_from_knx(
+    benchmark: BenchmarkFixture, raw_secure_wrapper: bytes
+) -> None:
+    """Parse a received SecureWrapper frame - without decryption."""
+    benchmark(KNXIPFrame.from_knx, raw_secure_wrapper)
+
+
+def test_knxip_to_knx(
+    benchmark: BenchmarkFixture, raw_routing_indication: bytes
+) -> None:
+    """Serialize a RoutingIndication."""
+    knxipframe, _ = KNXIPFrame.from_knx(raw_routing_indication)
+    benchmark(knxipframe.to_knx)
+
+
+@pytest.mark.parametrize("fixture", ["raw_cemi", "raw_data_secure_cemi"])
+def test_cemi_from_knx(
+    benchmark: BenchmarkFixture, request: pytest.FixtureRequest, fixture: str
+) -> None:
+    """Parse a received cEMI frame."""
+    benchmark(CEMIFrame.from_knx, request.getfixturevalue(fixture))
+
+
+@pytest.mark.parametrize("fixture", ["raw_cemi", "raw_data_secure_cemi"])
+def test_cemi_to_knx(
+    benchmark: BenchmarkFixture, request: pytest.FixtureRequest, fixture: str
+) -> None:
+    """Serialize a cEMI frame."""
+    cemi = CEMIFrame.from_knx(request.getfixturevalue(fixture))
+    benchmark(cemi.to_knx)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        pytest.param(bytes.fromhex("0000"), id="GroupValueRead"),
+        pytest.param(bytes.fromhex("0081"), id="GroupValueWrite-binary"),
+        pytest.param(bytes.fromhex("00800c33"), id="GroupValueWrite-array"),
+        pytest.param(
+            bytes.fromhex("0040" + "4b4e58206973204f4b0000000000"),
+            id="GroupValueResponse-string",
+        ),
+        pytest.param(
+            bytes.fromhex("03f110002446cfef4ac085e7092ab062b44d"), id="SecureAPDU"
+        ),
+    ],
+)
+def test_apci_from_knx(benchmark: BenchmarkFixture, raw: bytes) -> None:
+    """Parse an APDU."""
+    benchmark(APCI.from_knx, raw)
+
+
+DPT_VALUES = [
+    pytest.param(DPTSwitch, True, id="1.001"),
+    pytest.param(DPTScaling, 50, id="5.001"),
+    pytest.param(DPTTemperature, 21.5, id="9.001"),
+    pytest.param(DPTValue4Count, -5, id="13.001"),
+    pytest.param(DPTElectricPotential, 230.1, id="14.027"),
+    pytest.param(DPTString, "KNX is OK", id="16.000"),
+]
+
+
+@pytest.mark.parametrize(("transcoder", "value"), DPT_VALUES)
+def test_dpt_from_knx(
+    benchmark: BenchmarkFixture, transcoder: type[DPTBase], value: object
+) -> None:
+    """Decode a value."""
+    benchmark(transcoder.from_knx, transcoder.to_knx(value))
+
+
+@pytest.mark.parametrize(("transcoder", "value"), DPT_VALUES)
+def test_dpt_to_knx(
+    benchmark: BenchmarkFixture, transcoder: type[DPTBase], value: object
+) -> None:
+    """Encode a value."""
+    benchmark(transcoder.to_knx, value)
+
+
+def test_dpt_array_from_bytes(benchmark: BenchmarkFixture) -> None:
+    """Create a DPTArray payload from received bytes."""
+    benchmark(DPTArray, b"\x0c\x33")
+
+
+@pytest.mark.parametrize("address", ["1/2/3", "1/2", "4711"])
+def test_group_address_from_string(benchmark: BenchmarkFixture, address: str) -> None:
+    """Parse a group address string."""
+    benchmark(GroupAddress, address)
+
+
+@pytest.mark.parametrize("pattern", ["1/2/3", "1/*/3-10", "1-5/2-4,6/*"])
+def test_address_filter_match(benchmark: BenchmarkFixture, pattern: str) -> None:
+    """Match a group address against a filter."""
+    address_filter = AddressFilter(pattern)
+    address = GroupAddress("1/2/4")
+    benchmark(address_filter.match, address)
@@ -0,0 +1,86 @@
+"""Fixtures for the benchmarks."""
+
+import pytest
+
+from xknx import XKNX
+from xknx.cemi import CEMIFrame, CEMILData, CEMIMessageCode
+from xknx.devices import NumericValue, Switch
+from xknx.dpt import DPTArray
+from xknx.knxip import KNXIPFrame, RoutingIndication
+from xknx.telegram import (
+    GroupAddress,
+    IndividualAddress,
+    Telegram,
+    TelegramDirection,
+    apci,
+)
+
+DEVICE_COUNT = 10_000
+
+
+def group_telegram(
+    destination: GroupAddress | str = "1/2/3",
+    payload: apci.APCI | None = None,
+) -> Telegram:
+    """Return an incoming group telegram."""
+    return Telegram(
+        destination_address=GroupAddress(destination),
+        direction=TelegramDirection.INCOMING,
+        payload=payload or apci.GroupValueWrite(DPTArray((0x0C, 0x33))),
+        source_address=IndividualAddress("1.1.5"),
+    )
+
+
+@pytest.fixture(name="raw_cemi")
+def fixture_raw_cemi() -> bytes:
+    """Return a L_DATA_IND with a GroupValueWrite of a 2 byte float."""
+    return CEMIFrame(
+        code=CEMIMessageCode.L_DATA_IND,
+        data=CEMILData.init_from_telegram(group_telegram()),
+    ).to_knx()
+
+
+@pytest.fixture(name="raw_routing_indication")
+def fixture_raw_routing_indication(raw_cemi: bytes) -> bytes:
+    """Return a RoutingIndication as received from the network."""
+    return KNXIPFrame.init_from_body(RoutingIndication(raw_cemi=raw_cemi)).to_knx()
+
+
+@pytest.fixture(name="raw_data_secure_cemi")
+def fixture_raw_data_secure_cemi() -> bytes:
+    """Return a Data Secure L_DATA_IND - GroupValueResponse from 4.0.9 to 0/4/0."""
+    return bytes.fromhex("29003ce0400904001103f110002446cfef4ac085e7092ab062b44d")
+
+
+@pytest.fixture(name="raw_secure_wrapper")
+def fixture_raw_secure_wrapper() -> bytes:
+    """Return a SecureWrapper frame of an IP Secure session."""
+    return bytes.fromhex(
+        "06 10 09 50 00 3e 00 01 00 00 00 00 00 00 00 fa 12 34 56 78 af fe"
+        "79 15 a4 f3 6e 6e 42 08 d2 8b 4a 20 7d 8f 35 c0 d1 38 c2 6a 7b 5e 71 69"
+        "52 db a8 e7 e4 bd 80 bd 7d 86 8a 3a e7 87 49 de"
+    )
+
+
+@pytest.fixture(name="xknx_10k")
+def fixture_xknx_10k() -> XKNX:
+    """Return an XKNX instance with a registry of 10k devices."""
+    xknx = XKNX()
+    for number in range(DEVICE_COUNT // 2):
+        xknx.devices.async_add(
+            Switch(
+                xknx,
+                f"switch_{number}",
+                group_address=GroupAddress(number + 1),
+                group_address_state=GroupAddress(number + 20_001),
+            )
+        )
+        xknx.devices.async_add(
+            NumericValue(
+                xknx,
+                f"sensor_{number}",
+                group_address=GroupAddress(number + 10_001),
+                value_type="temperature",
+            )
+        )
+    return xknx
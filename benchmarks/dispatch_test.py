@@ -0,0 +1,77 @@
+"""Benchmarks of dispatching received telegrams to callbacks and devices."""
+
+import asyncio
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from xknx import XKNX
+from xknx.core import PipelineMetrics
+from xknx.telegram import AddressFilter, GroupAddress, Telegram
+
+from .conftest import DEVICE_COUNT, group_telegram
+
+CALLBACK_COUNT = 100
+
+
+def test_telegram_received_cbs(benchmark: BenchmarkFixture) -> None:
+    """Run telegram callbacks - unfiltered, by address filter and by group address."""
+    xknx = XKNX()
+    received: list[Telegram] = []
+    for number in range(CALLBACK_COUNT // 4):
+        xknx.telegram_queue.register_telegram_received_cb(received.append)
+        xknx.telegram_queue.register_telegram_received_cb(
+            received.append, address_filters=[AddressFilter(f"{number % 32}/*/*")]
+        )
+        xknx.telegram_queue.register_telegram_received_cb(
+            received.append, group_addresses=[GroupAddress(number + 1)]
+        )
+        xknx.telegram_queue.register_telegram_received_cb(
+            received.append,
+            group_addresses=[GroupAddress(number + 1), GroupAddress("1/2/3")],
+        )
+    telegram = group_telegram()
+
+    def run() -> None:
+        xknx.telegram_queue._run_telegram_received_cbs(telegram)
+        received.clear()
+
+    benchmark(run)
+
+
+def test_devices_process(benchmark: BenchmarkFixture, xknx_10k: XKNX) -> None:
+    """Process a telegram for a sensor in a registry of 10k devices."""
+    assert len(xknx_10k.devices) == DEVICE_COUNT
+    benchmark(xknx_10k.devices.process, group_telegram(GroupAddress(10_001)))
+
+
+def test_devices_process_unknown_address(
+    benchmark: BenchmarkFixture, xknx_10k: XKNX
+) -> None:
+    """Process a telegram for a group address no device uses."""
+    benchmark(xknx_10k.devices.process, group_telegram("31/7/255"))
+
+
+def test_devices_by_group_address(benchmark: BenchmarkFixture, xknx_10k: XKNX) -> None:
+    """Look up the devices of a group address."""
+    group_address = GroupAddress(1)
+    benchmark(lambda: list(xknx_10k.devices.devices_by_group_address(group_address)))
+
+
+@pytest.mark.parametrize("metrics", [False, True], ids=["plain", "metrics"])
+def test_process_telegram_incoming(
+    benchmark: BenchmarkFixture, xknx_10k: XKNX, metrics: bool
+) -> None:
+    """Process an incoming telegram - with and without pipeline metrics."""
+    if metrics:
+        PipelineMetrics(xknx_10k)
+    telegram = group_telegram(GroupAddress(10_001))
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark(
+            lambda: loop.run_until_complete(
+                xknx_10k.telegram_queue.process_telegram_incoming(telegram)
+            )
+        )
+    finally:
+        loop.close()
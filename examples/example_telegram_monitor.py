@@ -8,6 +8,7 @@ import sys
 from typing import TYPE_CHECKING
 
 from xknx import XKNX
+from xknx.cemi import CaptureRecorder
 from xknx.io.connection import ConnectionConfig
 from xknx.telegram import AddressFilter, IndividualAddress, Telegram
 from xknx.telegram.apci import GroupValueResponse, GroupValueWrite
@@ -30,6 +31,9 @@ def show_help() -> None:
     print(
         "-k --knxproject  myproject.knxproj       Load KNX project file for address resolution"
     )
+    print(
+        "-c --capture     bus.knxcap              Record raw cEMI frames to capture files"
+    )
     print("-h --help                                Print help")
     print()
     print("Example:")
@@ -64,6 +68,7 @@ async def monitor(
     ia: IndividualAddress | None,
     address_filters: list[AddressFilter] | None,
     knx_project: KNXProject | None = None,
+    capture_path: str | None = None,
 ) -> None:
     """Set telegram_received_cb within XKNX and connect to KNX/IP device in daemon mode."""
     xknx = XKNX(
@@ -106,7 +111,11 @@ async def monitor(
     xknx.telegram_queue.register_telegram_received_cb(
         telegram_received_cb, address_filters
     )
+    if capture_path is not None:
+        # rotate capture files hourly
+        xknx.cemi_handler.recorder = CaptureRecorder(capture_path, max_file_age=3600)
     await xknx.start()
+    # closes the recorder
     await xknx.stop()
 
 
@@ -114,7 +123,9 @@ async def main(argv: list[str]) -> None:
     """Parse command line arguments and start monitor."""
     try:
         opts, _ = getopt.getopt(
-            argv, "hf:i:k:", ["help", "filter=", "interface=", "knxproject="]
+            argv,
+            "hf:i:k:c:",
+            ["help", "filter=", "interface=", "knxproject=", "capture="],
         )
     except getopt.GetoptError:
         show_help()
@@ -123,6 +134,7 @@ async def main(argv: list[str]) -> None:
     address_filters = None
     ia = None
     knx_project = None
+    capture_path = None
     for opt, arg in opts:
         if opt in ["-h", "--help"]:
             show_help()
@@ -133,8 +145,10 @@ async def main(argv: list[str]) -> None:
             ia = IndividualAddress(arg)
         if opt in ["-k", "--knxproject"]:
             knx_project = load_project(arg)
+        if opt in ["-c", "--capture"]:
+            capture_path = arg
 
-    await monitor(ia, address_filters, knx_project)
+    await monitor(ia, address_filters, knx_project, capture_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+"""
+Benchmark the DPT catalogue of the xknx MCP tools.
+
+Print the time it takes to build the catalogue on first use and the throughput of
+`list_dpts` and `describe_dpt` served from it.
+"""
+
+import asyncio
+import timeit
+
+try:
+    from xknx.mcp import DptFilter, describe_dpt, list_dpts
+    from xknx.mcp.dpt_catalogue import DptCatalogue, dpt_catalogue
+except ModuleNotFoundError:
+    exit(
+        "Add the `xknx` directory to python path via `export PYTHONPATH=$HOME/directory/to/xknx`"
+    )
+
+NUMBER = 2_000
+
+
+async def calls() -> None:
+    """Print tool calls per second."""
+    dpt_catalogue()  # build before measuring
+    for name, coroutine_function in (
+        ("list_dpts", lambda: list_dpts(DptFilter(limit=50))),
+        ("list_dpts main", lambda: list_dpts(DptFilter(main=9))),
+        ("list_dpts text", lambda: list_dpts(DptFilter(text="temperature"))),
+        ("describe_dpt number", lambda: describe_dpt("9.001")),
+        ("describe_dpt name", lambda: describe_dpt("temperature")),
+    ):
+        start = asyncio.get_running_loop().time()
+        for _ in range(NUMBER):
+            await coroutine_function()
+        seconds = asyncio.get_running_loop().time() - start
+        print(f"{name:>20}: {NUMBER / seconds:10.0f} calls/s")
+
+
+if __name__ == "__main__":
+    seconds = min(timeit.repeat(DptCatalogue.build, number=10, repeat=5)) / 10
+    print(f"{'catalogue build':>20}: {seconds * 1000:10.2f} ms")
+    asyncio.run(calls())
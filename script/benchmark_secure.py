@@ -0,0 +1,97 @@
+"""
+Benchmark KNX Secure throughput.
+
+Compare Data Secure telegrams secured with one-shot AES functions and a cached AESCipher,
+and SecureWrapper frames decrypted from their received data and re-serialized ones.
+"""
+
+import asyncio
+import timeit
+
+try:
+    from xknx.io.ip_secure import SecureGroup
+    from xknx.knxip import KNXIPFrame, RoutingIndication
+    from xknx.secure.security_primitives import (
+        AESCipher,
+        calculate_message_authentication_code_cbc,
+        decrypt_ctr,
+        encrypt_data_ctr,
+    )
+except ModuleNotFoundError:
+    exit(
+        "Add the `xknx` directory to python path via `export PYTHONPATH=$HOME/directory/to/xknx`"
+    )
+
+KEY = bytes.fromhex("00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f")
+ADDITIONAL_DATA = bytes.fromhex("10 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00")
+BLOCK_0 = bytes.fromhex("c0 c1 c2 c3 c4 c5 00 fa 12 34 56 78 af fe 00 11")
+COUNTER_0 = bytes.fromhex("c0 c1 c2 c3 c4 c5 00 fa 12 34 56 78 af fe ff 00")
+# GroupValueWrite APDU with 2 byte payload
+PAYLOAD = bytes.fromhex("00 80 0c 1a")
+NUMBER = 20_000
+
+
+def one_shot() -> None:
+    """Secure and unsecure a telegram creating a cipher context for every step."""
+    mac_cbc = calculate_message_authentication_code_cbc(
+        KEY, additional_data=ADDITIONAL_DATA, payload=PAYLOAD, block_0=BLOCK_0
+    )[:4]
+    encrypted, mac = encrypt_data_ctr(KEY, COUNTER_0, mac_cbc, PAYLOAD)
+    decrypted, _ = decrypt_ctr(KEY, COUNTER_0, mac, encrypted)
+    calculate_message_authentication_code_cbc(
+        KEY, additional_data=ADDITIONAL_DATA, payload=decrypted, block_0=BLOCK_0
+    )
+
+
+CIPHER = AESCipher(KEY)
+
+
+def cached() -> None:
+    """Secure and unsecure a telegram reusing the cipher contexts of the key."""
+    mac_cbc = CIPHER.calculate_message_authentication_code_cbc(
+        additional_data=ADDITIONAL_DATA, payload=PAYLOAD, block_0=BLOCK_0
+    )[:4]
+    encrypted, mac = CIPHER.encrypt_data_ctr(COUNTER_0, mac_cbc, PAYLOAD)
+    decrypted, _ = CIPHER.decrypt_ctr(COUNTER_0, mac, encrypted)
+    CIPHER.calculate_message_authentication_code_cbc(
+        additional_data=ADDITIONAL_DATA, payload=decrypted, block_0=BLOCK_0
+    )
+
+
+async def secure_frames() -> None:
+    """Print SecureWrapper frames received per second."""
+    # SecureSequenceTimer requires a running loop
+    secure_group = SecureGroup(
+        local_addr=("127.0.0.1", 3671),
+        remote_addr=("224.0.23.12", 3671),
+        backbone_key=KEY,
+        latency_ms=1000,
+    )
+    encrypted_frame = secure_group.encrypt_frame(
+        KNXIPFrame.init_from_body(
+            RoutingIndication(raw_cemi=bytes.fromhex("2900bcd011010a03010081"))
+        )
+    )
+    raw = encrypted_frame.to_knx()
+
+    def received_data() -> None:
+        """Parse and decrypt a frame using its received data."""
+        knxipframe, _ = KNXIPFrame.from_knx(raw)
+        secure_group.decrypt_frame(knxipframe)
+
+    def serialized() -> None:
+        """Parse and decrypt a frame serializing it again."""
+        knxipframe, _ = KNXIPFrame.from_knx(raw)
+        knxipframe.raw = None
+        secure_group.decrypt_frame(knxipframe)
+
+    for name, func in (("re-serialized", serialized), ("received data", received_data)):
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:>20}: {NUMBER / seconds:10.0f} SecureWrapper frames/s")
+
+
+if __name__ == "__main__":
+    for name, func in (("one-shot functions", one_shot), ("AESCipher", cached)):
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:>20}: {NUMBER / seconds:10.0f} secure telegrams/s")
+    asyncio.run(secure_frames())
@@ -0,0 +1,81 @@
+"""
+Compare a benchmark run with a baseline.
+
+Both are JSON files written by pytest-benchmark - for a directory, eg. the `.benchmarks`
+storage of `--benchmark-save`, the latest run in it is used. Exits with 1 if a benchmark
+is slower than the baseline by more than the threshold. Usage:
+
+    python script/compare_benchmarks.py .benchmarks current.json [--threshold 10]
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+STATS = ("min", "mean", "median")
+
+
+def load(path: Path) -> dict[str, dict[str, float]]:
+    """Return the statistics of the benchmarks of a run by their name."""
+    if path.is_dir():
+        runs = sorted(path.rglob("*.json"), key=lambda file: file.stat().st_mtime)
+        if not runs:
+            sys.exit(f"No benchmark run found in {path}")
+        path = runs[-1]
+    with path.open(encoding="utf-8") as file:
+        return {
+            benchmark["fullname"]: benchmark["stats"]
+            for benchmark in json.load(file)["benchmarks"]
+        }
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    stat: str,
+    threshold: float,
+) -> list[str]:
+    """Print the change of every benchmark. Return the names of the slowed down ones."""
+    slower: list[str] = []
+    width = max(map(len, baseline | current), default=0)
+    print(f"{'benchmark':<{width}}  {'baseline':>12}  {'current':>12}  {'change':>8}")
+    for name in sorted(baseline | current):
+        if name not in current:
+            print(f"{name:<{width}}  {'':>12}  {'removed':>12}")
+            continue
+        if name not in baseline:
+            print(f"{name:<{width}}  {'new':>12}  {current[name][stat] * 1e6:10.3f}us")
+            continue
+        before = baseline[name][stat]
+        after = current[name][stat]
+        change = (after - before) / before * 100
+        flag = ""
+        if change > threshold:
+            slower.append(name)
+            flag = "  SLOWER"
+        print(
+            f"{name:<{width}}  {before * 1e6:10.3f}us  {after * 1e6:10.3f}us"
+            f"  {change:+7.1f}%{flag}"
+        )
+    return slower
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", type=Path, help="baseline run or storage directory")
+    parser.add_argument("current", type=Path, help="run or storage directory to check")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="slowdown in percent to flag - default 10",
+    )
+    parser.add_argument(
+        "--stat", choices=STATS, default="median", help="statistic to compare"
+    )
+    args = parser.parse_args()
+    slower = compare(load(args.baseline), load(args.current), args.stat, args.threshold)
+    if slower:
+        print(f"\n{len(slower)} benchmark(s) slower by more than {args.threshold}%")
+        sys.exit(1)
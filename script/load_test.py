@@ -0,0 +1,63 @@
+"""
+Run an end-to-end load test of the telegram pipeline.
+
+Connect an XKNX instance to a simulated KNXnet/IP server in memory, push mixed
+traffic through it and print the report as JSON - or write it to a file to track it
+across releases. Usage:
+
+    python script/load_test.py [--incoming-rate 1000] [--outgoing-rate 100] [--output report.json]
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+
+try:
+    from xknx import XKNX
+    from xknx.tools import run_load_test
+except ModuleNotFoundError:
+    exit(
+        "Add the `xknx` directory to python path via `export PYTHONPATH=$HOME/directory/to/xknx`"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the load test and print or write the report."""
+    report = await run_load_test(
+        XKNX(),
+        incoming_rate=args.incoming_rate,
+        outgoing_rate=args.outgoing_rate,
+        duration=args.duration,
+        devices=args.devices,
+        latency=args.latency,
+    )
+    result = json.dumps(report.as_dict(), indent=2)
+    if args.output is None:
+        print(result)
+    else:
+        args.output.write_text(result, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--incoming-rate",
+        type=float,
+        default=1000,
+        help="received telegrams per second",
+    )
+    parser.add_argument(
+        "--outgoing-rate", type=float, default=100, help="sent values per second"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="seconds to generate traffic"
+    )
+    parser.add_argument(
+        "--devices", type=int, default=1000, help="number of sensors and switches"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="delay of the simulated server"
+    )
+    parser.add_argument("--output", type=Path, default=None, help="JSON report file")
+    asyncio.run(main(parser.parse_args()))
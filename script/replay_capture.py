@@ -0,0 +1,44 @@
+"""
+Replay a capture recorded by `xknx.cemi.CaptureRecorder`.
+
+Feed the received frames into an XKNX instance without connection and print the
+replay report as JSON. Usage:
+
+    python script/replay_capture.py bus.knxcap [--speed 10] [--since 1700000000]
+"""
+
+import argparse
+import asyncio
+import json
+
+try:
+    from xknx import XKNX
+    from xknx.cemi import capture_frames
+    from xknx.tools import replay
+except ModuleNotFoundError:
+    exit(
+        "Add the `xknx` directory to python path via `export PYTHONPATH=$HOME/directory/to/xknx`"
+    )
+
+
+async def main(path: str, speed: float | None, since: float | None) -> None:
+    """Replay the capture and print the report."""
+    xknx = XKNX()
+    report = await replay(xknx, capture_frames(path, since=since), speed=speed)
+    print(json.dumps(report.as_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="capture file or path given to the recorder")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=None,
+        help="factor of the original speed - as fast as possible if omitted",
+    )
+    parser.add_argument(
+        "--since", type=float, default=None, help="start at this Unix timestamp"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.path, args.speed, args.since))
@@ -0,0 +1,201 @@
+"""Test for capturing raw cEMI frames."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from xknx import XKNX
+from xknx.cemi import (
+    CapturedFrame,
+    CaptureReader,
+    CaptureRecorder,
+    CEMIFrame,
+    CEMILData,
+    CEMIMessageCode,
+    capture_files,
+    capture_frames,
+)
+from xknx.dpt import DPTArray
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection, apci
+
+RAW_CEMI = bytes.fromhex("2900bce011020a0302008066")
+
+
+async def test_record_and_read(tmp_path: Path) -> None:
+    """Test frames are written in a batch and read back."""
+    path = tmp_path / "bus.knxcap"
+    recorder = CaptureRecorder(path)
+    with patch("time.time", side_effect=[10.0, 11.5]):
+        recorder.record(RAW_CEMI, TelegramDirection.INCOMING)
+        recorder.record(RAW_CEMI[:-1], TelegramDirection.OUTGOING)
+    # nothing written before the flush delay
+    assert not capture_files(path)
+    await recorder.close()
+    # recording after close is ignored
+    recorder.record(RAW_CEMI, TelegramDirection.INCOMING)
+
+    assert capture_files(path) == [tmp_path / "bus.0001.knxcap"]
+    with CaptureReader(tmp_path / "bus.0001.knxcap") as reader:
+        assert list(reader) == [
+            CapturedFrame(10.0, TelegramDirection.INCOMING, RAW_CEMI),
+            CapturedFrame(11.5, TelegramDirection.OUTGOING, RAW_CEMI[:-1]),
+        ]
+        assert list(reader.frames(since=11)) == [
+            CapturedFrame(11.5, TelegramDirection.OUTGOING, RAW_CEMI[:-1]),
+        ]
+        assert list(reader.frames(since=12)) == []
+
+
+async def test_flush_delay(tmp_path: Path) -> None:
+    """Test pending frames are written after the flush delay."""
+    path = tmp_path / "bus.knxcap"
+    recorder = CaptureRecorder(path, flush_delay=0)
+    recorder.record(RAW_CEMI, TelegramDirection.INCOMING)
+    await asyncio.sleep(0)
+    # wait for the writer thread
+    await recorder.close()
+    with CaptureReader(capture_files(path)[0]) as reader:
+        assert len(list(reader)) == 1
+
+
+async def test_rotation(tmp_path: Path) -> None:
+    """Test files are rotated by size and continue after existing files."""
+    path = tmp_path / "bus.knxcap"
+    (tmp_path / "bus.0007.knxcap").touch()
+    (tmp_path / "bus.other.knxcap").touch()
+    frame_size = 11 + len(RAW_CEMI)
+    recorder = CaptureRecorder(
+        path, max_file_size=24 + 2 * frame_size, batch_size=frame_size
+    )
+    for _ in range(5):
+        recorder.record(RAW_CEMI, TelegramDirection.INCOMING)
+    await recorder.close()
+
+    files = capture_files(path)
+    assert [file.name for file in files] == [
+        "bus.0007.knxcap",
+        "bus.0008.knxcap",
+        "bus.0009.knxcap",
+        "bus.0010.knxcap",
+    ]
+    frames = []
+    for file in files[1:]:
+        with CaptureReader(file) as reader:
+            frames.append(len(list(reader)))
+    assert frames == [2, 2, 1]
+
+
+async def test_rotation_by_age(tmp_path: Path) -> None:
+    """Test files are rotated by age."""
+    path = tmp_path / "bus"
+    recorder = CaptureRecorder(path, max_file_age=60, batch_size=1)
+    with patch("time.time", side_effect=[0, 30, 61]):
+        for _ in range(3):
+            recorder.record(RAW_CEMI, TelegramDirection.INCOMING)
+        await recorder.close()
+    assert [file.name for file in capture_files(path)] == ["bus.0001", "bus.0002"]
+
+
+@patch("xknx.cemi.capture.INDEX_INTERVAL", 3)
+def test_seek(tmp_path: Path) -> None:
+    """Test seeking by time using the sparse index."""
+    path = tmp_path / "bus.knxcap"
+    recorder = CaptureRecorder(path)
+    timestamps = [1.0, 2.0, 2.0, 2.0, 2.0, 3.0, 4.0, 5.0]
+    with patch("time.time", side_effect=timestamps):
+        # without running loop frames are written immediately
+        for _ in timestamps:
+            recorder.record(RAW_CEMI, TelegramDirection.INCOMING)
+    asyncio.run(recorder.close())
+
+    with CaptureReader(capture_files(path)[0]) as reader:
+        assert reader.created == 1.0
+        for since, expected in (
+            (0, timestamps),
+            (2, timestamps[1:]),
+            (2.5, timestamps[5:]),
+            (5, timestamps[7:]),
+            (6, []),
+        ):
+            assert [frame.timestamp for frame in reader.frames(since)] == expected
+
+
+def test_truncated_and_invalid(tmp_path: Path) -> None:
+    """Test a cut off frame ends iteration and invalid files are rejected."""
+    path = tmp_path / "bus.knxcap"
+    recorder = CaptureRecorder(path)
+    recorder.record(RAW_CEMI, TelegramDirection.INCOMING)
+    recorder.record(RAW_CEMI, TelegramDirection.INCOMING)
+    asyncio.run(recorder.close())
+    file = capture_files(path)[0]
+    file.write_bytes(file.read_bytes()[:-1])
+    with CaptureReader(file) as reader:
+        assert len(list(reader)) == 1
+
+    empty = tmp_path / "empty.knxcap"
+    empty.touch()
+    with pytest.raises(ValueError):
+        CaptureReader(empty)
+    invalid = tmp_path / "invalid.knxcap"
+    invalid.write_bytes(b"\x00" * 40)
+    with pytest.raises(ValueError):
+        CaptureReader(invalid)
+
+
+async def test_cemi_handler_recorder() -> None:
+    """Test CEMIHandler records incoming and outgoing raw cEMI frames."""
+    xknx = XKNX()
+    xknx.knxip_interface = AsyncMock()
+    xknx.cemi_handler.recorder = recorder = MagicMock()
+
+    xknx.cemi_handler.handle_raw_cemi(RAW_CEMI)
+    recorder.record.assert_called_once_with(RAW_CEMI, TelegramDirection.INCOMING)
+    recorder.reset_mock()
+
+    telegram = Telegram(
+        destination_address=GroupAddress(1),
+        payload=apci.GroupValueWrite(DPTArray((1,))),
+    )
+    task = asyncio.create_task(xknx.cemi_handler.send_telegram(telegram))
+    await asyncio.sleep(0)
+    cemi = CEMIFrame(
+        code=CEMIMessageCode.L_DATA_REQ,
+        data=CEMILData.init_from_telegram(telegram, src_addr=xknx.current_address),
+    )
+    recorder.record.assert_called_once_with(cemi.to_knx(), TelegramDirection.OUTGOING)
+    xknx.cemi_handler._l_data_confirmation_event.set()
+    await task
+
+
+async def test_capture_frames(tmp_path: Path) -> None:
+    """Test frames of all files of a capture are read in order."""
+    path = tmp_path / "bus.knxcap"
+    recorder = CaptureRecorder(path, max_file_size=1, batch_size=1)
+    with patch("time.time", side_effect=[1.0, 2.0, 3.0]):
+        for _ in range(3):
+            recorder.record(RAW_CEMI, TelegramDirection.INCOMING)
+    await recorder.close()
+    assert len(capture_files(path)) == 3
+
+    assert [frame.timestamp for frame in capture_frames(path)] == [1.0, 2.0, 3.0]
+    assert [frame.timestamp for frame in capture_frames(path, since=2)] == [2.0, 3.0]
+    assert [frame.timestamp for frame in capture_frames(capture_files(path)[1])] == [
+        2.0
+    ]
+
+
+async def test_recorder_closed_on_stop(tmp_path: Path) -> None:
+    """Test pending frames are written when XKNX is stopped."""
+    path = tmp_path / "bus.knxcap"
+    xknx = XKNX()
+    xknx.knxip_interface = AsyncMock(
+        connection_config=xknx.knxip_interface.connection_config
+    )
+    xknx.cemi_handler.recorder = CaptureRecorder(path)
+    await xknx.start()
+    xknx.cemi_handler.handle_raw_cemi(RAW_CEMI)
+
+    await xknx.stop()
+    assert [frame.raw for frame in capture_frames(path)] == [RAW_CEMI]
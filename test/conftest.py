@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from xknx import XKNX
+from xknx.io import GatewayScanner
 
 
 class EventLoopClockAdvancer:
@@ -48,6 +49,12 @@ class EventLoopClockAdvancer:
             await self._exhaust_callbacks()
 
 
+@pytest.fixture(autouse=True)
+def clear_gateway_scan_cache() -> None:
+    """Forget gateways found by scans of previous tests."""
+    GatewayScanner.clear_cache()
+
+
 @pytest.fixture
 async def time_travel() -> EventLoopClockAdvancer:
     """Advance loop time and run callbacks."""
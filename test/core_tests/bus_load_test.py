@@ -0,0 +1,135 @@
+"""Unit test for BusLoadController."""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from xknx import XKNX
+from xknx.core.bus_load import (
+    ADJUST_INTERVAL,
+    LOAD_WINDOW,
+    BusLoadController,
+    tp_frame_duration,
+)
+
+
+@pytest.fixture
+def time_mock() -> Iterator[Mock]:
+    """Patch the clock of BusLoadController."""
+    with patch("xknx.core.bus_load.time") as _time_mock:
+        _time_mock.monotonic.return_value = 1000.0
+        yield _time_mock
+
+
+def test_tp_frame_duration() -> None:
+    """Test bus time of TP1 frames."""
+    # GroupValueWrite with 1 bit payload - 9 octets frame
+    assert tp_frame_duration(9) == pytest.approx((50 + 15 + 13 + 9 * 13) / 9600)
+
+
+def test_load(time_mock: Mock) -> None:
+    """Test load estimation in moving time window."""
+    bus_load = BusLoadController()
+    assert bus_load.load == 0
+    for _ in range(10):
+        bus_load.frame_transmitted(9)
+    assert bus_load.load == pytest.approx(10 * tp_frame_duration(9) / LOAD_WINDOW)
+    time_mock.monotonic.return_value += LOAD_WINDOW / 2
+    bus_load.frame_transmitted(9)
+    assert bus_load.load == pytest.approx(11 * tp_frame_duration(9) / LOAD_WINDOW)
+    time_mock.monotonic.return_value += LOAD_WINDOW / 2 + 0.1
+    assert bus_load.load == pytest.approx(tp_frame_duration(9) / LOAD_WINDOW)
+    time_mock.monotonic.return_value += LOAD_WINDOW
+    assert bus_load.load == 0
+
+
+async def test_adjust_parallel_reads(time_mock: Mock) -> None:
+    """Test raising and lowering parallel reads."""
+    bus_load = BusLoadController(target_load=0.4, parallel_reads=2)
+    # idle bus - raise by one per ADJUST_INTERVAL
+    async with bus_load.read_slot():
+        pass
+    assert bus_load.parallel_reads == 3
+    async with bus_load.read_slot():
+        pass
+    assert bus_load.parallel_reads == 3
+    time_mock.monotonic.return_value += ADJUST_INTERVAL
+    async with bus_load.read_slot():
+        pass
+    assert bus_load.parallel_reads == 4
+    # busy bus - halve
+    time_mock.monotonic.return_value += ADJUST_INTERVAL
+    for _ in range(100):
+        bus_load.frame_transmitted(9)
+    assert bus_load.load > 0.4
+    async with bus_load.read_slot():
+        pass
+    assert bus_load.parallel_reads == 2
+    # load between target / 2 and target - hold
+    time_mock.monotonic.return_value += LOAD_WINDOW + 0.1
+    for _ in range(30):
+        bus_load.frame_transmitted(9)
+    assert 0.2 < bus_load.load < 0.4
+    async with bus_load.read_slot():
+        pass
+    assert bus_load.parallel_reads == 2
+    # late confirmations - halve
+    time_mock.monotonic.return_value += LOAD_WINDOW + 0.1
+    for _ in range(20):
+        bus_load.confirmation_received(3)
+    async with bus_load.read_slot():
+        pass
+    assert bus_load.parallel_reads == 1
+
+
+async def test_routing_busy(time_mock: Mock) -> None:
+    """Test RoutingBusy falls back to a single read."""
+    bus_load = BusLoadController(parallel_reads=4)
+    bus_load.routing_busy(wait_time_ms=100)
+    assert bus_load.parallel_reads == 1
+    # not raised while waiting
+    async with bus_load.read_slot():
+        pass
+    assert bus_load.parallel_reads == 1
+    time_mock.monotonic.return_value += ADJUST_INTERVAL
+    async with bus_load.read_slot():
+        pass
+    assert bus_load.parallel_reads == 2
+
+
+async def test_read_slot_limits_parallel_reads(time_mock: Mock) -> None:
+    """Test read_slot only allows parallel_reads concurrent reads."""
+    bus_load = BusLoadController(parallel_reads=2, max_parallel_reads=2)
+    release = asyncio.Event()
+    active = 0
+    max_active = 0
+
+    async def read() -> None:
+        nonlocal active, max_active
+        async with bus_load.read_slot():
+            active += 1
+            max_active = max(max_active, active)
+            await release.wait()
+            active -= 1
+
+    tasks = [asyncio.create_task(read()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert active == 2
+    # cancelled waiter doesn't block others
+    tasks[3].cancel()
+    release.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert max_active == 2
+    assert active == 0
+    assert bus_load._active_reads == 0
+
+
+async def test_cemi_handler_feeds_bus_load(time_mock: Mock) -> None:
+    """Test incoming L_Data frames are counted for the bus load."""
+    xknx = XKNX()
+    # L_DATA_IND GroupValueWrite 1 bit - 9 octets TP1 frame
+    raw = bytes.fromhex("2900bcd011010a03010081")
+    xknx.cemi_handler.handle_raw_cemi(raw)
+    assert xknx.bus_load.load == pytest.approx(tp_frame_duration(9) / LOAD_WINDOW)
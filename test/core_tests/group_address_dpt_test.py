@@ -3,8 +3,15 @@
 from unittest.mock import Mock, patch
 
 from xknx import XKNX
-from xknx.dpt import DPTArray, DPTHumidity, DPTScaling, DPTTemperature
+from xknx.dpt import (
+    DPT1BitBoolean,
+    DPTArray,
+    DPTHumidity,
+    DPTScaling,
+    DPTTemperature,
+)
 from xknx.telegram import GroupAddress, Telegram, TelegramDirection, apci
+from xknx.telegram.address import InternalGroupAddress
 
 
 async def test_group_address_dpt_in_telegram_queue(xknx_no_interface: XKNX) -> None:
@@ -98,12 +105,29 @@ def test_set(xknx_no_interface: XKNX) -> None:
             "i-internal": "9.007",
         }
     )
-    assert xknx.group_address_dpt._ga_dpts == {
-        2563: DPTScaling,
-        1: DPTTemperature,
-        "i-internal": DPTHumidity,
-    }
+    assert len(xknx.group_address_dpt) == 3
+    assert xknx.group_address_dpt.get(GroupAddress("1/2/3")) is DPTScaling
     assert xknx.group_address_dpt.get(GroupAddress("0/0/1")) is DPTTemperature
+    assert xknx.group_address_dpt.get(InternalGroupAddress("i-internal")) is DPTHumidity
+    assert xknx.group_address_dpt.get(GroupAddress("0/0/2")) is None
+    assert xknx.group_address_dpt.get(InternalGroupAddress("i-other")) is None
+
+
+def test_set_bulk(xknx_no_interface: XKNX) -> None:
+    """Test bulk loading xknxproject group address data."""
+    xknx = xknx_no_interface
+    dpts = [{"main": 9, "sub": 1}, {"main": 1}, {"main": 5, "sub": 1}]
+    project_data = {
+        str(GroupAddress(raw)): dpts[raw % len(dpts)] for raw in range(1, 50001)
+    }
+    xknx.group_address_dpt.set(project_data)
+    assert len(xknx.group_address_dpt) == 50000
+    assert xknx.group_address_dpt.get(GroupAddress(1)) is DPT1BitBoolean
+    assert xknx.group_address_dpt.get(GroupAddress(3)) is DPTTemperature
+    assert xknx.group_address_dpt.get(GroupAddress(50000)) is DPTScaling
+    assert xknx.group_address_dpt.get(GroupAddress(50001)) is None
+    # only distinct transcoders are stored
+    assert len(xknx.group_address_dpt._transcoders) == 4
 
 
 @patch("logging.Logger.warning")
@@ -124,7 +148,7 @@ def test_set_invalid(
     assert "Invalid group address" in logger_warning_mock.call_args[0][0]
     assert logger_debug_mock.call_count == 1
     assert "No transcoder found for DPTs" in logger_debug_mock.call_args[0][0]
-    assert not xknx.group_address_dpt._ga_dpts
+    assert len(xknx.group_address_dpt) == 0
 
 
 def test_clear(xknx_no_interface: XKNX) -> None:
@@ -136,6 +160,6 @@ def test_clear(xknx_no_interface: XKNX) -> None:
             1: "temperature",
         }
     )
-    assert len(xknx.group_address_dpt._ga_dpts) == 2
+    assert len(xknx.group_address_dpt) == 2
     xknx.group_address_dpt.clear()
-    assert len(xknx.group_address_dpt._ga_dpts) == 0
+    assert len(xknx.group_address_dpt) == 0
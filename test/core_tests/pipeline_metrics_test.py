@@ -0,0 +1,174 @@
+"""Unit test for pipeline metrics."""
+
+from xknx import XKNX
+from xknx.core import LatencyHistogram, PipelineMetrics, PipelineStage
+from xknx.core.pipeline_metrics import (
+    BUCKET_COUNT,
+    PROMETHEUS_EXPONENTS,
+    SUB_BUCKETS,
+    _bucket_index,
+    _bucket_upper_bound,
+)
+from xknx.devices import Switch
+from xknx.dpt import DPTBinary
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+from xknx.telegram.address import InternalGroupAddress
+from xknx.telegram.apci import GroupValueWrite
+
+# L_DATA_IND GroupValueWrite 1 from 1.1.2 to 1/2/3
+RAW_CEMI = bytes.fromhex("2900bce011020a03010081")
+
+
+class TestLatencyHistogram:
+    """Test class for latency histograms."""
+
+    def test_buckets(self) -> None:
+        """Test buckets are contiguous and values fall into their bounds."""
+        lower = 0
+        for index in range(BUCKET_COUNT - 1):
+            upper = _bucket_upper_bound(index)
+            assert upper > lower
+            assert _bucket_index(lower) == index
+            assert _bucket_index(upper - 1) == index
+            lower = upper
+        assert _bucket_index(lower) == BUCKET_COUNT - 1
+
+    def test_percentile(self) -> None:
+        """Test percentiles are within the relative error of the buckets."""
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) == 0.0
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+        assert histogram.count == 1000
+        assert histogram.total == 500_500_000
+        assert histogram.max == 1_000_000
+        for percentile, expected in ((50, 500e-6), (99, 990e-6), (100, 1e-3)):
+            assert (
+                expected
+                <= histogram.percentile(percentile)
+                <= expected * (1 + 1 / SUB_BUCKETS)
+            )
+        assert histogram.as_dict()["p99.9"] == 1e-3
+
+    def test_overflow(self) -> None:
+        """Test latencies above the range are kept out of the Prometheus buckets."""
+        histogram = LatencyHistogram()
+        histogram.record(10)
+        histogram.record(1 << 40)
+        assert histogram.percentile(100) == (1 << 40) / 1e9
+        counts = histogram.cumulative_counts()
+        assert len(counts) == len(PROMETHEUS_EXPONENTS)
+        assert counts[0] == ((1 << 10) / 1e9, 1)
+        assert counts[-1][1] == 1
+
+
+class TestPipelineMetrics:
+    """Test class for pipeline metrics."""
+
+    async def test_incoming(self) -> None:
+        """Test stages of incoming telegrams are recorded."""
+        xknx = XKNX()
+        assert xknx.metrics is None
+        metrics = PipelineMetrics(xknx)
+        assert xknx.metrics is metrics
+        switch = Switch(xknx, "switch", group_address="1/2/3")
+        xknx.devices.async_add(switch)
+        received: list[Telegram] = []
+        xknx.telegram_queue.register_telegram_received_cb(received.append)
+
+        xknx.cemi_handler.handle_raw_cemi(RAW_CEMI)
+        xknx.cemi_handler.handle_raw_cemi(b"\x29\x00")
+        assert metrics.max_queue_depth == 0
+        await xknx.telegram_queue.start()
+        await xknx.join()
+        await xknx.telegram_queue.stop()
+
+        assert received
+        assert switch.state is True
+        counts = {
+            stage: histogram.count for stage, histogram in metrics.histograms.items()
+        }
+        assert counts == {
+            PipelineStage.PARSE: 1,
+            PipelineStage.DATA_SECURE: 0,
+            PipelineStage.QUEUE_WAIT: 1,
+            PipelineStage.DPT_DECODE: 1,
+            PipelineStage.DEVICES: 1,
+            PipelineStage.CALLBACKS: 1,
+            PipelineStage.SEND: 0,
+        }
+        assert metrics.telegrams == {(TelegramDirection.INCOMING, "GroupValueWrite"): 1}
+        assert metrics.max_queue_depth == 1
+
+        snapshot = metrics.snapshot()
+        assert snapshot["stages"]["parse"]["count"] == 1
+        assert snapshot["telegrams"] == {"incoming.GroupValueWrite": 1}
+        assert snapshot["telegram_queue_depth"] == 0
+        assert snapshot["cemi_incoming"] == 1
+        assert snapshot["cemi_incoming_error"] == 1
+
+        text = metrics.prometheus()
+        assert "# TYPE xknx_pipeline_latency_seconds histogram\n" in text
+        assert 'xknx_pipeline_latency_seconds_bucket{stage="parse",le="+Inf"} 1\n' in (
+            text
+        )
+        assert 'xknx_pipeline_latency_seconds_count{stage="send"} 0\n' in text
+        assert (
+            'xknx_telegrams_total{direction="incoming",service="GroupValueWrite"} 1\n'
+            in text
+        )
+        assert "xknx_telegram_queue_max_depth 1\n" in text
+        assert "# TYPE xknx_telegram_queue_max_depth gauge\n" in text
+        assert "# TYPE xknx_cemi_incoming_error_total counter\n" in text
+        assert "xknx_cemi_incoming_error_total 1\n" in text
+
+        metrics.reset()
+        assert metrics.histograms[PipelineStage.PARSE].count == 0
+        assert not metrics.telegrams
+        metrics.close()
+        assert xknx.metrics is None
+
+    async def test_outgoing(self) -> None:
+        """Test stages of outgoing telegrams are recorded."""
+        xknx = XKNX()
+        metrics = PipelineMetrics(xknx)
+        await xknx.telegram_queue.process_telegram_outgoing(
+            Telegram(
+                destination_address=InternalGroupAddress("i-test"),
+                payload=GroupValueWrite(DPTBinary(1)),
+            )
+        )
+        assert metrics.histograms[PipelineStage.SEND].count == 0
+        assert metrics.histograms[PipelineStage.DEVICES].count == 1
+        assert metrics.histograms[PipelineStage.CALLBACKS].count == 1
+
+    async def test_disabled(self) -> None:
+        """Test nothing is recorded after closing."""
+        xknx = XKNX()
+        metrics = PipelineMetrics(xknx)
+        metrics.close()
+        xknx.cemi_handler.handle_raw_cemi(RAW_CEMI)
+        await xknx.telegram_queue.process_telegram_incoming(
+            Telegram(destination_address=GroupAddress("1/2/3"))
+        )
+        assert all(not histogram.count for histogram in metrics.histograms.values())
+
+    async def test_queued_telegrams_discarded(self) -> None:
+        """Test enqueue times of telegrams not processed by the consumer are dropped."""
+        xknx = XKNX()
+        metrics = PipelineMetrics(xknx)
+        xknx.cemi_handler.handle_raw_cemi(RAW_CEMI)
+        assert len(metrics._queued) == 1
+        # dropped without being processed
+        xknx.telegrams.get_nowait()
+        xknx.telegrams.task_done()
+        xknx.cemi_handler.handle_raw_cemi(RAW_CEMI)
+        await xknx.telegram_queue._process_all_telegrams()
+        # the stale entry is cleared once the queue is empty
+        assert not metrics._queued
+        assert metrics.histograms[PipelineStage.QUEUE_WAIT].count == 1
+
+        xknx.cemi_handler.handle_raw_cemi(RAW_CEMI)
+        await xknx.telegram_queue.start()
+        await xknx.telegram_queue.stop()
+        assert not metrics._queued
@@ -1,5 +1,6 @@
 """Unit test for StateUpdater."""
 
+import asyncio
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -7,10 +8,20 @@ import pytest
 
 from xknx import XKNX
 from xknx.core import XknxConnectionState
-from xknx.core.state_updater import StateTrackerType, _StateTracker
+from xknx.core.state_updater import (
+    StateTrackerInfo,
+    StateTrackerType,
+    StateUpdater,
+    TrackerOptions,
+    _AdaptiveStateTracker,
+    _StateTracker,
+)
+from xknx.dpt import DPTBinary
 from xknx.remote_value import RemoteValue
 from xknx.telegram import GroupAddress
 
+from ..conftest import EventLoopClockAdvancer
+
 
 @patch.multiple(RemoteValue, __abstractmethods__=set())
 class TestStateUpdater:
@@ -244,3 +255,108 @@ class TestStateUpdater:
             xknx.state_updater._workers[id(remote_value)].tracker_type
             == expected_tracker_type
         )
+
+
+def test_parallel_reads_deprecated() -> None:
+    """Test `parallel_reads` is forwarded to the bus load controller."""
+    xknx = XKNX()
+    with pytest.warns(DeprecationWarning, match="parallel_reads"):
+        StateUpdater(xknx, default_tracker_option=True, parallel_reads=3)
+    assert xknx.bus_load.parallel_reads == 3
+    assert xknx.bus_load.max_parallel_reads == 3
+
+
+@patch.multiple(RemoteValue, __abstractmethods__=set())
+def test_tracker_parser_adaptive() -> None:
+    """Test parsing adaptive tracker options."""
+    xknx = XKNX()
+    remote_value: RemoteValue[Any] = RemoteValue(
+        xknx, sync_state="adaptive 5 30", group_address_state=GroupAddress("1/1/1")
+    )
+    remote_value.register_state_updater()
+    tracker = xknx.state_updater._workers[id(remote_value)]
+    assert isinstance(tracker, _AdaptiveStateTracker)
+    assert tracker.tracker_type == StateTrackerType.ADAPTIVE
+    assert tracker.update_interval == 5 * 60
+    assert tracker.update_interval_min == 5 * 60
+    assert tracker.update_interval_max == 30 * 60
+    assert xknx.state_updater.tracker_info() == [
+        StateTrackerInfo(
+            group_address=GroupAddress("1/1/1"),
+            tracker_type=StateTrackerType.ADAPTIVE,
+            update_interval=5 * 60,
+            polls=0,
+            changed_polls=0,
+            spontaneous_updates=0,
+        )
+    ]
+    remote_value.unregister_state_updater()
+    # upper bound defaults to maximum
+    assert xknx.state_updater.parse_tracker_options("adaptive", "test") == (
+        TrackerOptions(StateTrackerType.ADAPTIVE, 60, 1440)
+    )
+    # upper bound shorter than lower bound
+    with patch("logging.Logger.warning") as logging_warning_mock:
+        assert xknx.state_updater.parse_tracker_options("adaptive 20 10", "test") == (
+            TrackerOptions(StateTrackerType.ADAPTIVE, 20, 20)
+        )
+        logging_warning_mock.assert_called_once()
+
+
+async def test_adaptive_tracker(time_travel: EventLoopClockAdvancer) -> None:
+    """Test adaptive tracker stretching and shortening its interval."""
+    payload: DPTBinary | None = None
+    responses: list[DPTBinary] = []
+
+    def respond() -> None:
+        nonlocal payload
+        payload = responses.pop(0)
+        tracker.update_received()
+
+    async def read_state() -> None:
+        asyncio.get_running_loop().call_soon(respond)
+        await asyncio.sleep(2)  # waiting for response - canceled by update_received()
+
+    tracker = _AdaptiveStateTracker(
+        read_state_awaitable=read_state,
+        tracker_options=TrackerOptions(StateTrackerType.ADAPTIVE, 1, 8),
+        last_payload=lambda: payload,
+        group_address=GroupAddress("1/1/1"),
+    )
+    # initial read doesn't adapt interval
+    responses.append(DPTBinary(0))
+    tracker.start()
+    await time_travel(0)
+    assert tracker.polls == 1
+    assert tracker.update_interval == 60
+    # unchanged value - stretch
+    responses.append(DPTBinary(0))
+    await time_travel(60)
+    assert tracker.polls == 2
+    assert tracker.update_interval == 120
+    # changed value - shorten
+    responses.append(DPTBinary(1))
+    await time_travel(60)
+    assert tracker.polls == 2  # timer was restarted by last response
+    await time_travel(60)
+    assert tracker.polls == 3
+    assert tracker.changed_polls == 1
+    assert tracker.update_interval == 60
+    # pushed by the bus - stretch and restart timer
+    for _ in range(4):
+        payload = DPTBinary(0)
+        tracker.update_received()
+    assert tracker.spontaneous_updates == 4
+    assert tracker.update_interval == 8 * 60  # upper bound
+    await time_travel(7 * 60)
+    assert tracker.polls == 3
+
+    assert tracker.info() == StateTrackerInfo(
+        group_address=GroupAddress("1/1/1"),
+        tracker_type=StateTrackerType.ADAPTIVE,
+        update_interval=8 * 60,
+        polls=3,
+        changed_polls=1,
+        spontaneous_updates=4,
+    )
+    tracker.stop()
@@ -0,0 +1,164 @@
+"""Unit test for telegram history."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from xknx import XKNX
+from xknx.core import TelegramHistory
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.telegram import (
+    AddressFilter,
+    GroupAddress,
+    IndividualAddress,
+    Telegram,
+    TelegramDirection,
+)
+from xknx.telegram.address import InternalGroupAddress
+from xknx.telegram.apci import GroupValueRead, GroupValueWrite, MemoryRead
+
+
+def _telegram(
+    destination: str,
+    source: str = "1.1.1",
+    payload: object = None,
+    direction: TelegramDirection = TelegramDirection.INCOMING,
+) -> Telegram:
+    return Telegram(
+        destination_address=GroupAddress(destination),
+        source_address=IndividualAddress(source),
+        direction=direction,
+        payload=payload or GroupValueWrite(DPTBinary(1)),
+    )
+
+
+class TestTelegramHistory:
+    """Test class for telegram history."""
+
+    async def test_record(self) -> None:
+        """Test telegrams passing the queue are recorded."""
+        xknx = XKNX()
+        xknx.cemi_handler = AsyncMock()
+        history = TelegramHistory(xknx, size=10)
+        telegram = _telegram("1/2/3", payload=GroupValueWrite(DPTArray((0x0C, 0x1A))))
+        telegram.data_secure = True
+        await xknx.telegram_queue.process_telegram_incoming(telegram)
+        await xknx.telegram_queue.process_telegram_outgoing(
+            _telegram(
+                "1/2/4", payload=GroupValueRead(), direction=TelegramDirection.OUTGOING
+            )
+        )
+        # not recorded
+        await xknx.telegram_queue.process_telegram_incoming(
+            Telegram(
+                destination_address=InternalGroupAddress("i-test"),
+                payload=GroupValueWrite(DPTBinary(1)),
+            )
+        )
+        await xknx.telegram_queue.process_telegram_incoming(
+            Telegram(
+                destination_address=IndividualAddress("1.1.2"),
+                payload=MemoryRead(address=0x1234),
+            )
+        )
+
+        assert len(history) == 2
+        first, second = history
+        assert first.destination_address == GroupAddress("1/2/3")
+        assert first.source_address == IndividualAddress("1.1.1")
+        assert first.direction is TelegramDirection.INCOMING
+        assert first.payload() == GroupValueWrite(DPTArray((0x0C, 0x1A)))
+        assert first.data_secure
+        assert not second.data_secure
+        assert second.direction is TelegramDirection.OUTGOING
+        assert second.payload() == GroupValueRead()
+        assert second.timestamp >= first.timestamp
+
+        history.close()
+        assert not xknx.telegram_queue.telegram_received_cbs
+        history.record(_telegram("1/2/5"))
+        assert len(history) == 3
+
+    def test_ring_buffer(self) -> None:
+        """Test the oldest records are overwritten and removed from the indexes."""
+        history = TelegramHistory(XKNX(), size=3)
+        for index in range(5):
+            history.record(_telegram(f"1/2/{index % 2}", source=f"1.1.{index}"))
+
+        assert len(history) == 3
+        assert history.oldest_sequence == 2
+        assert [record.sequence for record in history] == [2, 3, 4]
+        assert history.find(group_address=GroupAddress("1/2/0")) == [2, 4]
+        assert history.find(group_address=GroupAddress("1/2/1")) == [3]
+        assert history.find(source_address=IndividualAddress("1.1.0")) == []
+        assert history.find(source_address=IndividualAddress("1.1.3")) == [3]
+        with pytest.raises(IndexError):
+            history.get(1)
+
+    def test_find(self) -> None:
+        """Test combining query criteria."""
+        history = TelegramHistory(XKNX())
+        with (
+            patch("time.monotonic", side_effect=range(10, 16)),
+            patch("time.time", side_effect=range(100, 106)),
+        ):
+            history.record(_telegram("2/1/1", source="1.1.1"))
+            history.record(_telegram("2/1/2", source="1.1.2"))
+            history.record(_telegram("2/2/1", source="1.1.1"))
+            history.record(_telegram("2/1/1", source="1.1.2"))
+            history.record(_telegram("2/1/2", source="1.1.1"))
+            history.record(_telegram("2/1/1", source="1.1.1"))
+
+        assert history.find() == [0, 1, 2, 3, 4, 5]
+        assert history.find(address_filter=AddressFilter("2/1/*")) == [0, 1, 3, 4, 5]
+        assert history.find(
+            address_filter=AddressFilter("2/1/*"),
+            source_address=IndividualAddress("1.1.2"),
+        ) == [1, 3]
+        assert history.find(
+            group_address=GroupAddress("2/1/1"),
+            source_address=IndividualAddress("1.1.1"),
+        ) == [0, 5]
+        with patch("time.monotonic", return_value=20):
+            assert history.find(max_age=8, min_age=6) == [2, 3, 4]
+            assert history.find(group_address=GroupAddress("2/1/1"), max_age=9) == [
+                3,
+                5,
+            ]
+            assert history.find(
+                source_address=IndividualAddress("1.1.1"), min_age=9
+            ) == [0]
+        assert history.find(group_address=GroupAddress("3/3/3")) == []
+
+    def test_find_clock_adjusted(self) -> None:
+        """Test ages are independent of the system clock being set back."""
+        history = TelegramHistory(XKNX())
+        with (
+            patch("time.monotonic", side_effect=range(10, 16)),
+            # set back by 60 seconds after the third telegram
+            patch("time.time", side_effect=[100, 101, 102, 43, 44, 45]),
+        ):
+            for _ in range(6):
+                history.record(_telegram("2/1/1"))
+
+        assert [record.timestamp for record in history] == [100, 101, 102, 43, 44, 45]
+        with patch("time.monotonic", return_value=16):
+            # the last 3 seconds
+            assert history.find(max_age=3) == [3, 4, 5]
+            assert history.find(max_age=6, min_age=5) == [0, 1]
+
+    def test_truncated(self) -> None:
+        """Test long APDUs are stored truncated."""
+        history = TelegramHistory(XKNX())
+        history.record(
+            _telegram("1/2/3", payload=GroupValueWrite(DPTArray(tuple(range(20)))))
+        )
+        record = history.get(0)
+        assert record.truncated
+        assert len(record.apdu) == 16
+        assert record.payload() is None
+
+    def test_invalid_size(self) -> None:
+        """Test size must be positive."""
+        with pytest.raises(ValueError):
+            TelegramHistory(XKNX(), size=0)
@@ -7,10 +7,13 @@ import pytest
 
 from xknx import XKNX
 from xknx.core import ValueReader
+from xknx.core.value_reader import READ_TIMEOUT
 from xknx.dpt import DPTBinary
 from xknx.telegram import GroupAddress, Telegram, TelegramDirection
 from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWrite
 
+from ..conftest import EventLoopClockAdvancer
+
 
 class TestValueReader:
     """Test class for value reader."""
@@ -139,3 +142,51 @@ class TestValueReader:
         value_reader.telegram_received(expected_telegram_2)
         assert value_reader.received_telegram == expected_telegram_2
         assert value_reader.response_received_event.is_set()
+
+    async def test_value_reader_in_flight(
+        self, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test value readers of the same group address share a read."""
+        xknx = XKNX()
+        test_group_address = GroupAddress("0/0/1")
+        response_telegram = Telegram(
+            destination_address=test_group_address,
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueResponse(DPTBinary(1)),
+        )
+        reads = [
+            asyncio.create_task(ValueReader(xknx, test_group_address).read())
+            for _ in range(2)
+        ]
+        other_read = asyncio.create_task(
+            ValueReader(xknx, GroupAddress("0/0/2")).read()
+        )
+        await time_travel(0)
+        # one GroupValueRead per group address and one callback for all readers
+        assert xknx.telegrams.qsize() == 2
+        assert len(xknx.telegram_queue.telegram_received_cbs) == 1
+
+        await xknx.telegram_queue.process_telegram_incoming(response_telegram)
+        assert await reads[0] == response_telegram
+        assert await reads[1] == response_telegram
+        # a read after the response was received is sent again
+        late_read = asyncio.create_task(ValueReader(xknx, test_group_address).read())
+        await time_travel(0)
+        assert xknx.telegrams.qsize() == 3
+
+        await time_travel(2)
+        assert await late_read is None
+        assert await other_read is None
+        assert not xknx.telegram_queue.telegram_received_cbs
+
+    async def test_read_multiplexer_default_timeout(
+        self, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test the default timeout covers sending all reads at the rate limit."""
+        xknx = XKNX(rate_limit=10)
+        group_addresses = [GroupAddress(f"0/0/{index}") for index in range(1, 6)]
+        task = asyncio.create_task(xknx.read_multiplexer.read(group_addresses))
+        await time_travel(READ_TIMEOUT + 0.4)
+        assert not task.done()
+        await time_travel(0.1)
+        assert await task == dict.fromkeys(group_addresses)
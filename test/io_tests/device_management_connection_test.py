@@ -42,7 +42,11 @@ from xknx.knxip import (
     KNXIPFrame,
 )
 from xknx.knxip.knxip_enum import ConnectRequestType
-from xknx.profile.const import ResourceKNXNETIPPropertyId, ResourceObjectType
+from xknx.profile.const import (
+    ResourceGenericPropertyId,
+    ResourceKNXNETIPPropertyId,
+    ResourceObjectType,
+)
 
 from ..conftest import EventLoopClockAdvancer
 
@@ -51,12 +55,14 @@ REMOTE_ADDR = ("192.168.1.2", 3671)
 CHANNEL = 23
 
 DEVICE_STATE = ResourceKNXNETIPPropertyId.PID_KNXNETIP_DEVICE_STATE
+FRIENDLY_NAME = ResourceKNXNETIPPropertyId.PID_FRIENDLY_NAME
 
 
 def prop_read_con(
     data: bytes,
     number_of_elements: int = 1,
     property_id: ResourceKNXNETIPPropertyId | int = DEVICE_STATE,
+    start_index: int = 1,
 ) -> bytes:
     """Return a M_PropRead.con for a property of the KNXnet/IP parameter object."""
     return CEMIFrame(
@@ -66,6 +72,7 @@ def prop_read_con(
                 object_type=ResourceObjectType.OBJECT_KNXNETIP_PARAMETER,
                 property_id=property_id,
                 number_of_elements=number_of_elements,
+                start_index=start_index,
             ),
             data=data,
         ),
@@ -500,6 +507,41 @@ class TestUDPDeviceManagementConnection:
 
         assert await task == b"\x01"
 
+    @patch("xknx.io.transport.udp_transport.UDPTransport.send")
+    async def test_requests_in_flight(
+        self, send_mock: Mock, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test that a request is sent once the previous one is acknowledged."""
+        await self._connect(send_mock, time_travel)
+
+        first = asyncio.create_task(
+            self.connection.read_property(
+                object_type=ResourceObjectType.OBJECT_KNXNETIP_PARAMETER,
+                property_id=DEVICE_STATE,
+            )
+        )
+        second = asyncio.create_task(
+            self.connection.read_property(
+                object_type=ResourceObjectType.OBJECT_KNXNETIP_PARAMETER,
+                property_id=0x34,
+            )
+        )
+        await time_travel(0)
+        assert send_mock.call_count == 1
+        self._ack_last_request()
+        await time_travel(0)
+        # sent before the first request is answered
+        assert send_mock.call_count == 2
+        assert send_mock.call_args[0][0].body.sequence_counter == 1
+        self._ack_last_request(sequence_counter=1)
+        self._server_sends(prop_read_con(b"\x02", property_id=0x34))
+        self._server_sends(prop_read_con(b"\x01"), sequence_counter=1)
+        await time_travel(0)
+
+        assert await first == b"\x01"
+        assert await second == b"\x02"
+        assert not self.connection._pending
+
     @patch("xknx.io.transport.udp_transport.UDPTransport.send")
     async def test_sequence_number_wraps(
         self, send_mock: Mock, time_travel: EventLoopClockAdvancer
@@ -1220,6 +1262,183 @@ class TestTCPDeviceManagementConnection:
         with pytest.raises(CommunicationError):
             await self.connection._send_request(cemi)
 
+    @patch("xknx.io.transport.tcp_transport.TCPTransport.send")
+    async def test_read_properties(
+        self, send_mock: Mock, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test that a batch read keeps its requests in flight together."""
+        await self._connect(send_mock, time_travel)
+
+        task = asyncio.create_task(
+            self.connection.read_properties(
+                object_type=ResourceObjectType.OBJECT_KNXNETIP_PARAMETER,
+                property_ids=[DEVICE_STATE, 0x34, 0xF0],
+                window=2,
+            )
+        )
+        await time_travel(0)
+        assert send_mock.call_count == 2
+        self._server_sends(prop_read_con(b"\x11\x01", property_id=0x34))
+        await time_travel(0)
+        # the window moved on
+        assert send_mock.call_count == 3
+        self._server_sends(
+            prop_read_con(
+                bytes((CEMIErrorCode.CEMI_ERROR_VOID_DP.value,)),
+                number_of_elements=0,
+                property_id=0xF0,
+            )
+        )
+        self._server_sends(prop_read_con(b"\x01"))
+        await time_travel(0)
+
+        assert await task == {DEVICE_STATE: b"\x01", 0x34: b"\x11\x01", 0xF0: None}
+
+    @patch("xknx.io.transport.tcp_transport.TCPTransport.send")
+    async def test_read_properties_timeout(
+        self, send_mock: Mock, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test that an unanswered request of a batch read raises CommunicationError."""
+        await self._connect(send_mock, time_travel)
+
+        task = asyncio.create_task(
+            self.connection.read_properties(
+                object_type=ResourceObjectType.OBJECT_KNXNETIP_PARAMETER,
+                property_ids=[DEVICE_STATE, 0x34, 0xF0],
+                window=2,
+            )
+        )
+        await time_travel(0)
+        self._server_sends(prop_read_con(b"\x11\x01", property_id=0x34))
+        await time_travel(0)
+        # DEVICE_STATE and 0xF0 are in flight and never answered
+        await time_travel(DEVICE_CONFIGURATION_REQUEST_TIMEOUT)
+
+        with pytest.raises(CommunicationError):
+            await task
+        assert not self.connection._pending
+
+    def _serve_properties(
+        self, send_mock: Mock, properties: dict[int, tuple[bytes, ...]]
+    ) -> list[CEMIMPropInfo]:
+        """Answer property reads from `properties` - elements of each property."""
+        requests: list[CEMIMPropInfo] = []
+
+        def send(knxipframe: KNXIPFrame) -> None:
+            info = CEMIFrame.from_knx(knxipframe.body.raw_cemi).data.property_info
+            requests.append(info)
+            elements = properties.get(info.property_id)
+            if elements is None:
+                raw_cemi = prop_read_con(
+                    bytes((CEMIErrorCode.CEMI_ERROR_VOID_DP.value,)),
+                    number_of_elements=0,
+                    property_id=info.property_id,
+                    start_index=info.start_index,
+                )
+            else:
+                raw_cemi = prop_read_con(
+                    len(elements).to_bytes(2, "big")
+                    if info.start_index == 0
+                    else b"".join(
+                        elements[
+                            info.start_index - 1 : info.start_index
+                            - 1
+                            + info.number_of_elements
+                        ]
+                    ),
+                    number_of_elements=info.number_of_elements,
+                    property_id=info.property_id,
+                    start_index=info.start_index,
+                )
+            asyncio.get_running_loop().call_soon(self._server_sends, raw_cemi)
+
+        send_mock.side_effect = send
+        return requests
+
+    @patch("xknx.io.transport.tcp_transport.TCPTransport.send")
+    async def test_read_property_elements(
+        self, send_mock: Mock, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test reading a multi-element property in element ranges."""
+        await self._connect(send_mock, time_travel)
+        name = tuple(bytes((char,)) for char in b"A friendly KNXnet/IP server")
+        requests = self._serve_properties(send_mock, {FRIENDLY_NAME: name})
+
+        data = await self.connection.read_property_elements(
+            object_type=ResourceObjectType.OBJECT_KNXNETIP_PARAMETER,
+            property_id=FRIENDLY_NAME,
+        )
+        assert data == b"A friendly KNXnet/IP server"
+        assert [(info.start_index, info.number_of_elements) for info in requests] == [
+            (0, 1),
+            (1, 15),
+            (16, 12),
+        ]
+
+        with pytest.raises(CommunicationError):
+            await self.connection.read_property_elements(
+                object_type=ResourceObjectType.OBJECT_KNXNETIP_PARAMETER,
+                property_id=0xF0,
+            )
+
+    @patch("xknx.io.transport.tcp_transport.TCPTransport.send")
+    async def test_dump_properties(
+        self, send_mock: Mock, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test reading every property of an object in one call."""
+        await self._connect(send_mock, time_travel)
+        requests = self._serve_properties(
+            send_mock,
+            {
+                ResourceGenericPropertyId.PID_OBJECT_TYPE: (b"\x00\x0b",),
+                DEVICE_STATE: (b"\x01",),
+                ResourceKNXNETIPPropertyId.PID_ADDITIONAL_INDIVIDUAL_ADDRESSES: (),
+            },
+        )
+
+        assert await self.connection.dump_properties(
+            ResourceObjectType.OBJECT_KNXNETIP_PARAMETER
+        ) == {
+            ResourceGenericPropertyId.PID_OBJECT_TYPE: b"\x00\x0b",
+            DEVICE_STATE: b"\x01",
+            ResourceKNXNETIPPropertyId.PID_ADDITIONAL_INDIVIDUAL_ADDRESSES: b"",
+        }
+        # the number of elements of every property, then the present elements
+        assert len(requests) == (
+            len(ResourceGenericPropertyId) + len(ResourceKNXNETIPPropertyId) + 2
+        )
+        assert not self.connection._pending
+
+    @patch("xknx.io.transport.tcp_transport.TCPTransport.send")
+    async def test_dump_properties_timeout(
+        self, send_mock: Mock, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test that an unanswered element range raises CommunicationError."""
+        await self._connect(send_mock, time_travel)
+        name = tuple(bytes((char,)) for char in b"A friendly KNXnet/IP server")
+        self._serve_properties(send_mock, {FRIENDLY_NAME: name})
+        serve = send_mock.side_effect
+
+        def send(knxipframe: KNXIPFrame) -> None:
+            info = CEMIFrame.from_knx(knxipframe.body.raw_cemi).data.property_info
+            # the second element range is lost
+            if info.start_index != 16:
+                serve(knxipframe)
+
+        send_mock.side_effect = send
+        task = asyncio.create_task(
+            self.connection.dump_properties(
+                ResourceObjectType.OBJECT_KNXNETIP_PARAMETER,
+                property_ids=[DEVICE_STATE, FRIENDLY_NAME],
+            )
+        )
+        await time_travel(0)
+        await time_travel(DEVICE_CONFIGURATION_REQUEST_TIMEOUT)
+
+        with pytest.raises(CommunicationError):
+            await task
+        assert not self.connection._pending
+
 
 class TestSecureDeviceManagementConnection:
     """Test class for KNX/IP device management connections over IP Secure."""
@@ -2,8 +2,9 @@
 
 import asyncio
 from typing import Any
-from unittest.mock import Mock, create_autospec, patch
+from unittest.mock import AsyncMock, Mock, create_autospec, patch
 
+import ifaddr
 import pytest
 
 from xknx import XKNX
@@ -504,6 +505,142 @@ class TestGatewayScanner:
         assert isinstance(frame_2.body, SearchRequest)
         assert frame_1.body.discovery_endpoint == HPAI(ip_addr="10.1.1.2", port=56789)
 
+    @staticmethod
+    def _respond(
+        responses: dict[str, float], delay: float = 0.1
+    ) -> tuple[Any, list[str]]:
+        """Patch UDPTransport to answer search requests on `responses` local IPs."""
+        searched: list[str] = []
+
+        def send(
+            transport: UDPTransport, knxipframe: KNXIPFrame, addr: Any = None
+        ) -> None:
+            local_ip = transport.local_addr[0]
+            if isinstance(knxipframe.body, SearchRequest):
+                searched.append(local_ip)
+            if local_ip in responses and isinstance(knxipframe.body, SearchRequest):
+                asyncio.get_running_loop().call_later(
+                    responses[local_ip],
+                    transport.handle_knxipframe,
+                    fake_router_search_response(),
+                    HPAI("192.168.42.10", 3671),
+                )
+
+        def getsockname(transport: UDPTransport) -> tuple[str, int]:
+            return transport.local_addr[0], 56789
+
+        return (
+            patch.multiple(
+                UDPTransport,
+                connect=AsyncMock(),
+                send=send,
+                getsockname=getsockname,
+            ),
+            searched,
+        )
+
+    async def test_time_to_first_gateway(
+        self, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test the scan ends once `stop_on_found` gateways are found."""
+        xknx = XKNX()
+        responder, _ = self._respond({"10.1.1.2": 0.1})
+        with (
+            responder,
+            patch("xknx.io.util.get_default_local_ip", return_value="10.1.1.2"),
+        ):
+            start = asyncio.get_running_loop().time()
+            task = asyncio.create_task(GatewayScanner(xknx, stop_on_found=1).scan())
+            await time_travel(0.1)
+            assert task.done()
+            assert asyncio.get_running_loop().time() - start == pytest.approx(
+                0.1, abs=0.01
+            )
+            assert [str(gateway) for gateway in await task] == [
+                str(self.gateway_desc_both)
+            ]
+
+    async def test_scan_all_interfaces(
+        self, time_travel: EventLoopClockAdvancer
+    ) -> None:
+        """Test searching on every interface at once, merging duplicate responses."""
+        xknx = XKNX()
+        local_ips = [
+            ifaddr.IP("127.0.0.1", 8, "lo"),
+            ifaddr.IP("10.1.1.2", 24, "en0"),
+            ifaddr.IP("192.168.42.50", 24, "en1"),
+        ]
+        # the gateway answers on both interfaces
+        responder, searched = self._respond({"10.1.1.2": 0.2, "192.168.42.50": 0.1})
+        with responder, patch("xknx.io.util.get_local_ips", return_value=local_ips):
+            gateway_scanner = GatewayScanner(xknx, all_interfaces=True)
+            gateways = []
+
+            async def collect() -> None:
+                async for gateway in gateway_scanner.async_scan():
+                    gateways.append(gateway)
+
+            task = asyncio.create_task(collect())
+            await time_travel(0)
+            assert sorted(searched) == ["10.1.1.2", "192.168.42.50"]
+            # yielded with the first response
+            await time_travel(0.1)
+            assert len(gateways) == 1
+            await time_travel(0.1)
+            await time_travel(gateway_scanner.timeout_in_seconds)
+            await task
+
+        assert len(gateways) == 1
+        assert gateways[0].local_ip == "192.168.42.50"
+        assert gateways[0].local_interface == "en1"
+        assert list(gateway_scanner.found_gateways.values()) == gateways
+
+    async def test_scan_cache(self, time_travel: EventLoopClockAdvancer) -> None:
+        """Test results of a previous scan are reused within the cache TTL."""
+        xknx = XKNX()
+        responder, searched = self._respond({"10.1.1.2": 0.1})
+        with (
+            responder,
+            patch("xknx.io.util.get_default_local_ip", return_value="10.1.1.2"),
+        ):
+            # not stored without `cache_ttl`
+            task = asyncio.create_task(GatewayScanner(xknx).scan())
+            await time_travel(3)
+            assert len(await task) == 1
+            task = asyncio.create_task(GatewayScanner(xknx, cache_ttl=60).scan())
+            await time_travel(3)
+            assert len(await task) == 1
+            assert len(searched) == 2
+
+            # a complete scan is used by scan() without searching
+            assert [
+                str(gateway)
+                for gateway in await GatewayScanner(xknx, cache_ttl=60).scan()
+            ] == [str(self.gateway_desc_both)]
+            assert (
+                await GatewayScanner(
+                    xknx, cache_ttl=60, scan_filter=GatewayScanFilter(name="other")
+                ).scan()
+                == []
+            )
+            # async_scan() yields it first and only searches when asked for more
+            async_scan = GatewayScanner(xknx, cache_ttl=60).async_scan()
+            assert str(await anext(async_scan)) == str(self.gateway_desc_both)
+            assert len(searched) == 2
+            task = asyncio.create_task(anext(async_scan, None))
+            await time_travel(0)
+            assert len(searched) == 3
+            # the gateway found again is not yielded twice
+            await time_travel(3)
+            assert await task is None
+
+            # expired
+            await time_travel(61)
+            task = asyncio.create_task(GatewayScanner(xknx, cache_ttl=60).scan())
+            await time_travel(3)
+            assert len(await task) == 1
+            assert len(searched) == 4
+
     def test_gateway_scan_filter_compare(self) -> None:
         """Test GatewayScanFilter comparison."""
         assert GatewayScanFilter() == GatewayScanFilter()
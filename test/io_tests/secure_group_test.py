@@ -531,6 +531,39 @@ class TestSecureGroup:
                 KNXIPFrame.init_from_body(RoutingIndication(raw_cemi=raw_test_cemi))
             )
 
+    @patch("xknx.io.ip_secure.SecureSequenceTimer._notify_timer_expired")
+    @patch("xknx.io.ip_secure.SecureSequenceTimer._monotonic_ms")
+    async def test_decrypt_raw_frame(
+        self,
+        mock_monotonic_ms: Mock,
+        _mock_notify_timer_expired: Mock,
+        mock_super_send: Mock,
+        mock_super_connect: Mock,
+    ) -> None:
+        """Test decrypting received and locally created SecureWrapper frames."""
+        mock_monotonic_ms.return_value = 1000
+        secure_group = SecureGroup(
+            local_addr=self.mock_addr,
+            remote_addr=(DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT),
+            backbone_key=self.mock_backbone_key,
+            latency_ms=1000,
+        )
+        plain_frame = KNXIPFrame.init_from_body(
+            RoutingIndication(raw_cemi=bytes.fromhex("2900bcd011010a03010081"))
+        )
+        encrypted_frame = secure_group.encrypt_frame(plain_frame)
+        assert encrypted_frame.raw is None
+        assert secure_group.decrypt_frame(encrypted_frame) == plain_frame
+
+        received_frame, _ = KNXIPFrame.from_knx(encrypted_frame.to_knx())
+        assert received_frame.raw is not None
+        assert secure_group.decrypt_frame(received_frame) == plain_frame
+
+        tampered = bytearray(received_frame.raw)
+        tampered[25] ^= 0x01  # encrypted data
+        with pytest.raises(KNXSecureValidationError):
+            secure_group.decrypt_frame(KNXIPFrame.from_knx(bytes(tampered))[0])
+
     async def test_receive_plain_frames(
         self,
         mock_super_send: Mock,
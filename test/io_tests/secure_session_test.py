@@ -233,14 +233,17 @@ class TestSecureSession:
         "xknx.io.ip_secure.generate_ecdh_key_pair",
         return_value=(mock_private_key, mock_public_key),
     )
+    @pytest.mark.parametrize("pregenerate_key_pair", [False, True])
     async def test_invalid_frames(
         self,
         _mock_generate: Mock,
         mock_super_send: Mock,
         mock_super_connect: Mock,
+        pregenerate_key_pair: bool,
         time_travel: EventLoopClockAdvancer,
     ) -> None:
         """Test handling invalid frames."""
+        self.session.pregenerate_key_pair = pregenerate_key_pair
         callback_mock = Mock()
         self.session.register_callback(callback_mock)
         # setup session
@@ -277,6 +280,13 @@ class TestSecureSession:
         assert self.session.initialized
         callback_mock.assert_called_once()
         callback_mock.reset_mock()
+        # key pair of the next session is generated after connecting
+        await time_travel(0)
+        assert self.session._next_key_pair == (
+            (self.mock_private_key, self.mock_public_key)
+            if pregenerate_key_pair
+            else None
+        )
 
         # receive sequence_information 0 again
         self.session.handle_knxipframe(
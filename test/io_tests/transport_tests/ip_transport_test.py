@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from xknx.io.transport import KNXIPTransport
 from xknx.knxip import (
     HPAI,
@@ -19,7 +21,6 @@ class TestKNXIPTransport:
     def test_callback(self) -> None:
         """Test if callback is called correctly."""
         transport = KNXIPTransport()
-        transport.callbacks = []
         callback_mock = Mock()
         # Registering callback
         callback_instance = transport.register_callback(
@@ -52,3 +53,57 @@ class TestKNXIPTransport:
         callback_mock.assert_called_once_with(
             correct_service_type_frame, HPAI(), transport
         )
+
+    @patch.multiple(KNXIPTransport, __abstractmethods__=set())
+    def test_callback_order(self) -> None:
+        """Test callbacks are called in registration order and may unregister."""
+        transport = KNXIPTransport()
+        calls = []
+        frame = KNXIPFrame.init_from_body(ConnectionStateResponse())
+
+        def unregister_self(*_: object) -> None:
+            calls.append("once")
+            transport.unregister_callback(once)
+
+        transport.register_callback(lambda *_: calls.append("any"))
+        once = transport.register_callback(
+            unregister_self, [KNXIPServiceType.CONNECTIONSTATE_RESPONSE]
+        )
+        transport.register_callback(
+            lambda *_: calls.append("other"),
+            [
+                KNXIPServiceType.CONNECTIONSTATE_REQUEST,
+                KNXIPServiceType.CONNECTIONSTATE_RESPONSE,
+            ],
+        )
+        transport.handle_knxipframe(frame, HPAI())
+        assert calls == ["any", "once", "other"]
+        assert len(transport.callbacks) == 2
+
+        calls.clear()
+        transport.handle_knxipframe(frame, HPAI())
+        assert calls == ["any", "other"]
+        calls.clear()
+        transport.handle_knxipframe(
+            KNXIPFrame.init_from_body(ConnectionStateRequest()), HPAI()
+        )
+        assert calls == ["any", "other"]
+
+    @patch.multiple(KNXIPTransport, __abstractmethods__=set())
+    def test_unregister_during_dispatch(self) -> None:
+        """Test a callback unregistered by a previous one is not called."""
+        transport = KNXIPTransport()
+        later_mock = Mock()
+
+        def unregister_later(*_: object) -> None:
+            transport.unregister_callback(later)
+
+        transport.register_callback(unregister_later)
+        later = transport.register_callback(later_mock)
+        transport.handle_knxipframe(
+            KNXIPFrame.init_from_body(ConnectionStateResponse()), HPAI()
+        )
+        later_mock.assert_not_called()
+        # unregistering an unknown callback
+        with pytest.raises(ValueError):
+            transport.unregister_callback(later)
@@ -693,3 +693,90 @@ class TestTCPTunnel:
         await time_travel(0)
         # third retry had an error - tunnel lost
         mock_tunnel_lost.assert_called_once()
+
+    @patch("xknx.io.tunnel.random.uniform", return_value=1.0)
+    @patch("xknx.io.transport.tcp_transport.TCPTransport.connect")
+    @patch("xknx.io.transport.tcp_transport.TCPTransport.send")
+    @patch("xknx.io.transport.tcp_transport.TCPTransport.stop")
+    async def test_tunnel_fast_reconnect(
+        self,
+        mock_transport_stop: MagicMock,
+        mock_transport_send: MagicMock,
+        mock_transport_connect: MagicMock,
+        mock_uniform: MagicMock,
+        time_travel: EventLoopClockAdvancer,
+    ) -> None:
+        """Test fast reconnect requesting the address of the lost tunnel."""
+        remote_hpai = HPAI(
+            ip_addr="192.168.1.2", port=3671, protocol=HostProtocol.IPV4_TCP
+        )
+        tunnel = TCPTunnel(
+            self.xknx,
+            gateway_ip="192.168.1.2",
+            gateway_port=3671,
+            cemi_received_callback=self.cemi_received_mock,
+            auto_reconnect=True,
+            auto_reconnect_wait=3,
+            fast_reconnect=True,
+        )
+
+        def connect_response(
+            status_code: ErrorCode = ErrorCode.E_NO_ERROR,
+        ) -> KNXIPFrame:
+            return KNXIPFrame.init_from_body(
+                ConnectResponse(
+                    communication_channel=23,
+                    status_code=status_code,
+                    data_endpoint=HPAI(protocol=HostProtocol.IPV4_TCP),
+                    crd=ConnectResponseData(
+                        individual_address=IndividualAddress("1.1.7")
+                    ),
+                )
+            )
+
+        connection_task = asyncio.create_task(tunnel.connect())
+        await time_travel(0)
+        tunnel.transport.handle_knxipframe(connect_response(), remote_hpai)
+        await connection_task
+        assert self.xknx.current_address == IndividualAddress("1.1.7")
+        mock_transport_send.reset_mock()
+
+        # connection lost - the server won't answer the DisconnectRequest
+        tunnel.transport.transport = Mock()
+        tunnel._tunnel_lost()
+        await time_travel(0)
+        disconnect_request, connect_request = (
+            call.args[0].body for call in mock_transport_send.call_args_list
+        )
+        assert isinstance(disconnect_request, DisconnectRequest)
+        assert isinstance(connect_request, ConnectRequest)
+        assert connect_request.cri.individual_address == IndividualAddress("1.1.7")
+        # the address is not free yet
+        tunnel.transport.handle_knxipframe(
+            connect_response(ErrorCode.E_NO_MORE_UNIQUE_CONNECTIONS), remote_hpai
+        )
+        await time_travel(0)
+        mock_transport_send.reset_mock()
+
+        # second attempt after the initial wait, without requesting an address
+        await time_travel(0.25)
+        connect_request = mock_transport_send.call_args[0][0].body
+        assert isinstance(connect_request, ConnectRequest)
+        assert connect_request.cri.individual_address is None
+        tunnel.transport.handle_knxipframe(connect_response(), remote_hpai)
+        await time_travel(0)
+
+        assert tunnel._reconnect_task is None
+        assert tunnel.communication_channel == 23
+        assert self.xknx.connection_manager.last_reconnect_duration == pytest.approx(
+            0.25, abs=0.05
+        )
+        # the waits grow exponentially up to `auto_reconnect_wait`
+        assert [tunnel._reconnect_wait(attempt) for attempt in range(1, 7)] == [
+            0.25,
+            0.5,
+            1,
+            2,
+            3,
+            3,
+        ]
@@ -36,3 +36,23 @@ class TestKNXIPFrame:
         raw = bytes.fromhex("06 10 02 07 00 10 15 00 08 01 C0 A8 C8 0C C3")
         with pytest.raises(IncompleteKNXIPFrame):
             KNXIPFrame.from_knx(raw)
+
+    def test_raw(self) -> None:
+        """Test parsed frames keep a view of the received data."""
+        raw = bytes.fromhex(
+            "06 10 04 20 00 15 04 02 51 00 29 00 bc e0 10 fa"
+            "09 2d 01 00 80"
+            "06 10"  # start of next frame
+        )
+        knxipframe, rest = KNXIPFrame.from_knx(raw)
+        assert isinstance(knxipframe.raw, memoryview)
+        assert knxipframe.raw.obj is raw
+        assert knxipframe.raw == raw[:21]
+        assert knxipframe.header.raw == raw[:6]
+        assert rest == raw[21:]
+        # raw data is not compared
+        created_frame = KNXIPFrame.init_from_body(knxipframe.body)
+        assert created_frame.raw is None
+        assert created_frame.header.raw is None
+        assert created_frame == knxipframe
+        assert created_frame.to_knx() == knxipframe.raw
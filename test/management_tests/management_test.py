@@ -322,3 +322,136 @@ async def test_p2p_rate_limit(
     send_responses(1)
 
     await task
+
+
+async def test_connection_pool(time_travel: EventLoopClockAdvancer) -> None:
+    """Test reusing pooled connections and closing them when idle."""
+    xknx = XKNX()
+    xknx.cemi_handler = AsyncMock()
+    xknx.management.connection_idle_timeout = 4
+    ia_1 = IndividualAddress("4.0.1")
+
+    def sent_tpci() -> list[type[tpci.TPCI]]:
+        return [
+            type(sent.args[0].tpci)
+            for sent in xknx.cemi_handler.send_telegram.call_args_list
+        ]
+
+    async with xknx.management.connection(ia_1) as conn_1:
+        pass
+    await time_travel(3)
+    async with xknx.management.connection(ia_1, rate_limit=0) as conn_2:
+        assert conn_2 is conn_1
+        assert conn_2.rate_limit == 0
+    assert sent_tpci() == [tpci.TConnect]
+
+    # idle timeout restarts after every use
+    await time_travel(3)
+    assert sent_tpci() == [tpci.TConnect]
+    await time_travel(1)
+    assert sent_tpci() == [tpci.TConnect, tpci.TDisconnect]
+    assert not xknx.management._connections
+    assert not xknx.management._pool
+
+    # peer disconnected while idle
+    async with xknx.management.connection(ia_1) as conn_1:
+        pass
+    xknx.management.process(
+        Telegram(
+            source_address=ia_1,
+            destination_address=xknx.current_address,
+            direction=TelegramDirection.INCOMING,
+            tpci=tpci.TDisconnect(),
+        )
+    )
+    async with xknx.management.connection(ia_1) as conn_2:
+        assert conn_2 is not conn_1
+        assert conn_2.connected
+
+    # not reusable connections and connections used when an exception occurred are closed
+    xknx.cemi_handler.send_telegram.reset_mock()
+    async with xknx.management.connection(ia_1) as conn_1:
+        conn_1.reusable = False
+    assert sent_tpci() == [tpci.TDisconnect]
+    with pytest.raises(ManagementConnectionTimeout):
+        async with xknx.management.connection(ia_1):
+            raise ManagementConnectionTimeout
+    assert sent_tpci() == [tpci.TDisconnect, tpci.TConnect, tpci.TDisconnect]
+    assert not xknx.management._pool
+
+    async with xknx.management.connection(ia_1):
+        pass
+    await xknx.stop()
+    assert sent_tpci()[-1] == tpci.TDisconnect
+    assert not xknx.management._connections
+    assert not xknx.management._pool
+
+
+async def test_connection_pool_serialized() -> None:
+    """Test pooled connections are used by one task at a time per device."""
+    xknx = XKNX()
+    xknx.cemi_handler = AsyncMock()
+    xknx.management.connection_idle_timeout = 4
+    ia_1 = IndividualAddress("4.0.1")
+    ia_2 = IndividualAddress("4.0.2")
+    release = asyncio.Event()
+    active: list[IndividualAddress] = []
+
+    async def use(address: IndividualAddress) -> None:
+        async with xknx.management.connection(address):
+            active.append(address)
+            await release.wait()
+            active.remove(address)
+
+    tasks = [asyncio.create_task(use(ia)) for ia in (ia_1, ia_1, ia_2)]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert active == [ia_1, ia_2]
+    release.set()
+    await asyncio.gather(*tasks)
+    assert not active
+    # one connection per device
+    assert xknx.cemi_handler.send_telegram.call_count == 2
+    await xknx.management.stop()
+
+
+async def test_connection_pool_borrow_while_closing(
+    time_travel: EventLoopClockAdvancer,
+) -> None:
+    """Test a borrower arriving while an idle connection is closed waits for it."""
+    xknx = XKNX()
+    xknx.cemi_handler = AsyncMock()
+    xknx.management.connection_idle_timeout = 4
+    ia_1 = IndividualAddress("4.0.1")
+    disconnect_sent = asyncio.Event()
+    release_disconnect = asyncio.Event()
+
+    async def send_telegram(telegram: Telegram) -> None:
+        if isinstance(telegram.tpci, tpci.TDisconnect):
+            disconnect_sent.set()
+            await release_disconnect.wait()
+
+    xknx.cemi_handler.send_telegram.side_effect = send_telegram
+
+    async with xknx.management.connection(ia_1) as conn_1:
+        pass
+    await time_travel(4)
+    await disconnect_sent.wait()
+
+    async def borrow() -> None:
+        async with xknx.management.connection(ia_1) as conn_2:
+            assert conn_2 is not conn_1
+            assert conn_2.connected
+
+    task = asyncio.create_task(borrow())
+    await asyncio.sleep(0)
+    assert not task.done()
+    release_disconnect.set()
+    await task
+    assert [
+        type(sent.args[0].tpci)
+        for sent in xknx.cemi_handler.send_telegram.call_args_list
+    ] == [tpci.TConnect, tpci.TDisconnect, tpci.TConnect]
+    assert ia_1 in xknx.management._pool
+    await xknx.management.stop()
+    assert not xknx.management._pool
@@ -0,0 +1,85 @@
+"""Conftest for management procedures."""
+
+import asyncio
+from collections.abc import Callable, Iterable, Mapping
+from unittest.mock import AsyncMock
+
+from xknx import XKNX
+from xknx.exceptions import ConfirmationError
+from xknx.telegram import IndividualAddress, Telegram, TelegramDirection, apci, tpci
+
+DeviceResponder = Callable[[apci.APCI], apci.APCI | None]
+
+
+class FakeBus:
+    """Answer management connections like devices on the bus."""
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        devices: Mapping[str | IndividualAddress, DeviceResponder | None],
+        silent: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize FakeBus.
+
+        Devices return the response to a request - or None to only ACK it. Devices
+        set to None refuse connections. Silent addresses confirm T_Connect but don't
+        answer, other addresses don't confirm T_Connect.
+        """
+        self.xknx = xknx
+        self.devices = {IndividualAddress(ia): device for ia, device in devices.items()}
+        self.silent = {IndividualAddress(ia) for ia in silent}
+        self.connected: list[IndividualAddress] = []
+        self.requests: list[tuple[IndividualAddress, apci.APCI]] = []
+        # sequence number of the next response - counted independent of requests
+        self._sequence_numbers: dict[IndividualAddress, int] = {}
+        xknx.cemi_handler = AsyncMock()
+        xknx.cemi_handler.send_telegram.side_effect = self.send_telegram
+
+    def _incoming(
+        self,
+        address: IndividualAddress,
+        tpdu: tpci.TPCI,
+        payload: apci.APCI | None = None,
+    ) -> None:
+        self.xknx.management.process(
+            Telegram(
+                source_address=address,
+                destination_address=IndividualAddress(0),
+                direction=TelegramDirection.INCOMING,
+                tpci=tpdu,
+                payload=payload,
+            )
+        )
+
+    async def send_telegram(self, telegram: Telegram) -> None:
+        """Send telegram to the fake bus."""
+        address = telegram.destination_address
+        assert isinstance(address, IndividualAddress)
+        if isinstance(telegram.tpci, tpci.TConnect):
+            self.connected.append(address)
+            if address not in self.devices and address not in self.silent:
+                raise ConfirmationError("No acknowledge")
+            self._sequence_numbers[address] = 0
+            return
+        if not isinstance(telegram.tpci, tpci.TDataConnected) or address in self.silent:
+            return
+        assert telegram.payload is not None
+        self.requests.append((address, telegram.payload))
+        ack = tpci.TAck(telegram.tpci.sequence_number)
+        loop = asyncio.get_running_loop()
+        if (device := self.devices[address]) is None:
+            loop.call_soon(self._incoming, address, tpci.TDisconnect())
+            loop.call_soon(self._incoming, address, ack)
+            return
+        loop.call_soon(self._incoming, address, ack)
+        if (response := device(telegram.payload)) is not None:
+            sequence_number = self._sequence_numbers[address]
+            loop.call_soon(
+                self._incoming,
+                address,
+                tpci.TDataConnected(sequence_number),
+                response,
+            )
+            self._sequence_numbers[address] = sequence_number + 1 & 0xF
@@ -0,0 +1,204 @@
+"""Tests for dm_memory_read — KNX v02.01.02 - Management Procedures 03.05.02 - DM_MemRead."""
+
+import asyncio
+from unittest.mock import Mock, call
+
+import pytest
+
+from xknx import XKNX
+from xknx.exceptions import ManagementConnectionError
+from xknx.management.management import MANAGAMENT_CONNECTION_TIMEOUT
+from xknx.management.procedures import (
+    dm_memory_read,
+    dm_memory_read_conn,
+    dmp_max_apdu_length_read_r_co,
+)
+from xknx.telegram import IndividualAddress, apci
+
+from ....conftest import EventLoopClockAdvancer
+from ..conftest import FakeBus
+
+DEVICE_ADDRESS = IndividualAddress("4.0.10")
+
+
+class FakeDevice:
+    """Answer memory and property reads like a device with a maximum APDU length."""
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        memory: bytes,
+        max_apdu_length: int | None = 15,
+        extended: bool = True,
+        extended_return_code: int = 0,
+    ) -> None:
+        """Initialize FakeDevice - max_apdu_length None has no PID_MAX_APDU_LENGTH."""
+        self.memory = memory
+        self.max_apdu_length = max_apdu_length
+        self.extended = extended
+        self.extended_return_code = extended_return_code
+        self.bus = FakeBus(xknx, {DEVICE_ADDRESS: self})
+
+    @property
+    def requests(self) -> list[apci.APCI]:
+        """Return the requests sent to the device."""
+        return [payload for _, payload in self.bus.requests]
+
+    def __call__(self, payload: apci.APCI) -> apci.APCI | None:
+        """Return the response to a request."""
+        max_apdu_length = self.max_apdu_length or 15
+        if isinstance(payload, apci.PropertyValueRead):
+            if self.max_apdu_length is None:
+                return apci.PropertyValueResponse(
+                    object_index=0, property_id=56, count=0, start_index=1
+                )
+            return apci.PropertyValueResponse(
+                object_index=0,
+                property_id=56,
+                count=1,
+                start_index=1,
+                data=self.max_apdu_length.to_bytes(2, "big"),
+            )
+        if isinstance(payload, apci.MemoryRead):
+            response = apci.MemoryResponse(
+                address=payload.address,
+                data=self.memory[payload.address : payload.address + payload.count],
+            )
+            if response.calculated_length() > max_apdu_length:
+                return apci.MemoryResponse(address=payload.address, data=b"")
+            return response
+        if isinstance(payload, apci.MemoryExtendedRead) and self.extended:
+            if self.extended_return_code:
+                return apci.MemoryExtendedReadResponse(
+                    return_code=self.extended_return_code, address=payload.address
+                )
+            response = apci.MemoryExtendedReadResponse(
+                return_code=0,
+                address=payload.address,
+                data=self.memory[payload.address : payload.address + payload.count],
+            )
+            if response.calculated_length() > max_apdu_length:
+                return apci.MemoryExtendedReadResponse(
+                    return_code=apci.ReturnCode.E_LENGTH_EXCEEDS_MAX_APDU_LENGTH.value,
+                    address=payload.address,
+                )
+            return response
+        return None
+
+
+MEMORY = bytes(range(256)) * 4
+
+
+@pytest.mark.parametrize(
+    ("max_apdu_length", "extended", "requests"),
+    [
+        # A_Memory_Read - 12 bytes per request
+        (15, False, 1 + 84),
+        # A_MemoryExtended_Read - 10 bytes per request
+        (15, True, 1 + 100),
+        # A_Memory_Read limited to 63 bytes per request
+        (254, False, 1 + 16),
+        # A_MemoryExtended_Read - 249 bytes per request
+        (254, None, 1 + 5),
+    ],
+)
+async def test_dm_memory_read_chunks(
+    max_apdu_length: int, extended: bool | None, requests: int
+) -> None:
+    """Test reading memory in chunks of the maximum APDU length."""
+    xknx = XKNX()
+    device = FakeDevice(xknx, MEMORY, max_apdu_length=max_apdu_length)
+    progress = Mock()
+
+    async with xknx.management.connection(DEVICE_ADDRESS, rate_limit=0) as conn:
+        data = await dm_memory_read_conn(
+            conn, start=0, length=1000, extended=extended, progress=progress
+        )
+
+    assert data == MEMORY[:1000]
+    assert len(device.requests) == requests
+    assert progress.call_count == requests - 1
+    assert progress.call_args == call(1000, 1000)
+    expected_read = (
+        apci.MemoryExtendedRead if extended is not False else apci.MemoryRead
+    )
+    assert all(isinstance(request, expected_read) for request in device.requests[1:])
+
+
+async def test_dm_memory_read() -> None:
+    """Test dm_memory_read opens its own connection and reads above 64 KiB extended."""
+    xknx = XKNX()
+    device = FakeDevice(xknx, bytes(0x10000) + MEMORY, max_apdu_length=None)
+
+    data = await dm_memory_read(
+        xknx, DEVICE_ADDRESS, start=0x10000 - 4, length=24, max_apdu_length=None
+    )
+    assert data == bytes(4) + MEMORY[:20]
+    assert device.requests == [
+        apci.PropertyValueRead(object_index=0, property_id=56, count=1, start_index=1),
+        apci.MemoryExtendedRead(address=0xFFFC, count=10),
+        apci.MemoryExtendedRead(address=0x10006, count=10),
+        apci.MemoryExtendedRead(address=0x10010, count=4),
+    ]
+    assert not xknx.management._connections
+
+
+async def test_dm_memory_read_extended_fallback(
+    time_travel: EventLoopClockAdvancer,
+) -> None:
+    """Test falling back to A_Memory_Read if A_MemoryExtended_Read is not supported."""
+    xknx = XKNX()
+    # no answer to A_MemoryExtended_Read
+    device = FakeDevice(xknx, MEMORY, max_apdu_length=254, extended=False)
+
+    async with xknx.management.connection(DEVICE_ADDRESS, rate_limit=0) as conn:
+        task = asyncio.create_task(dm_memory_read_conn(conn, start=0, length=100))
+        await time_travel(MANAGAMENT_CONNECTION_TIMEOUT)
+        assert await task == MEMORY[:100]
+    assert device.requests[1:] == [
+        apci.MemoryExtendedRead(address=0, count=100),
+        apci.MemoryRead(address=0, count=63),
+        apci.MemoryRead(address=63, count=37),
+    ]
+
+    # negative return code
+    device = FakeDevice(
+        xknx,
+        MEMORY,
+        max_apdu_length=254,
+        extended_return_code=apci.ReturnCode.E_COMMAND_INVALID.value,
+    )
+    async with xknx.management.connection(DEVICE_ADDRESS, rate_limit=0) as conn:
+        assert await dm_memory_read_conn(conn, start=0, length=100) == MEMORY[:100]
+        assert len(device.requests) == 4
+        # no fallback if A_MemoryExtended_Read is requested explicitly
+        with pytest.raises(ManagementConnectionError, match="E_COMMAND_INVALID"):
+            await dm_memory_read_conn(
+                conn, start=0, length=100, max_apdu_length=254, extended=True
+            )
+
+
+async def test_dm_memory_read_errors() -> None:
+    """Test failed reads raise ManagementConnectionError."""
+    xknx = XKNX()
+    device = FakeDevice(xknx, MEMORY, max_apdu_length=15)
+
+    async with xknx.management.connection(DEVICE_ADDRESS, rate_limit=0) as conn:
+        assert await dmp_max_apdu_length_read_r_co(conn) == 15
+        # device answers A_Memory_Read with count 0
+        with pytest.raises(ManagementConnectionError, match="Could not read 20 bytes"):
+            await dm_memory_read_conn(
+                conn, start=0, length=20, max_apdu_length=30, extended=False
+            )
+        # device answers with a negative return code
+        with pytest.raises(
+            ManagementConnectionError, match="E_LENGTH_EXCEEDS_MAX_APDU_LENGTH"
+        ):
+            await dm_memory_read_conn(
+                conn, start=0, length=20, max_apdu_length=30, extended=True
+            )
+        with pytest.raises(ValueError):
+            await dm_memory_read_conn(
+                conn, start=0xFFFF, length=2, max_apdu_length=15, extended=False
+            )
+    assert len(device.requests) == 3
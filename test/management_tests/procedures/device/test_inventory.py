@@ -0,0 +1,140 @@
+"""Tests for the device inventory."""
+
+import asyncio
+from pathlib import Path
+
+from xknx import XKNX
+from xknx.exceptions import ManagementConnectionError
+from xknx.management.procedures import (
+    DeviceInfo,
+    DeviceInventory,
+    dmp_device_info_read_r_co,
+)
+from xknx.telegram import IndividualAddress, apci
+
+from ....conftest import EventLoopClockAdvancer
+from ..conftest import DeviceResponder, FakeBus
+
+SERIAL_NUMBER = bytes.fromhex("00fa12345678")
+PROPERTIES = {
+    11: SERIAL_NUMBER,
+    12: bytes.fromhex("00fa"),
+    13: bytes.fromhex("00fa012345"),
+    15: bytes.fromhex("0000000000000000abcd"),
+}
+
+
+def _device(properties: dict[int, bytes] | None) -> DeviceResponder:
+    """Return a device answering its properties - None doesn't answer PropertyValueRead."""
+
+    def respond(payload: apci.APCI) -> apci.APCI | None:
+        if isinstance(payload, apci.DeviceDescriptorRead):
+            return apci.DeviceDescriptorResponse(descriptor=0, value=0x07B0)
+        if isinstance(payload, apci.PropertyValueRead) and properties is not None:
+            if (data := properties.get(payload.property_id)) is None:
+                return apci.PropertyValueResponse(
+                    object_index=0,
+                    property_id=payload.property_id,
+                    count=0,
+                    start_index=1,
+                )
+            return apci.PropertyValueResponse(
+                object_index=0,
+                property_id=payload.property_id,
+                count=1,
+                start_index=1,
+                data=data,
+            )
+        return None
+
+    return respond
+
+
+async def test_collect_and_resume(tmp_path: Path) -> None:
+    """Test collecting device info and resuming from the inventory file."""
+    path = tmp_path / "inventory.jsonl"
+    xknx = XKNX()
+    xknx.bus_load.parallel_reads = 8
+    bus = FakeBus(xknx, {"1.1.1": _device(PROPERTIES), "1.1.2": _device({})})
+    inventory = DeviceInventory(xknx, path=path)
+
+    infos = {
+        info.individual_address: info
+        async for info in inventory.collect(["1.1.1", "1.1.2", "1.1.3"])
+    }
+    assert infos[IndividualAddress("1.1.1")] == DeviceInfo(
+        individual_address=IndividualAddress("1.1.1"),
+        device_descriptor=0x07B0,
+        serial_number=SERIAL_NUMBER,
+        manufacturer_id=0xFA,
+        program_version=bytes.fromhex("00fa012345"),
+        order_info=bytes.fromhex("0000000000000000abcd"),
+        timestamp=infos[IndividualAddress("1.1.1")].timestamp,
+    )
+    assert infos[IndividualAddress("1.1.2")] == DeviceInfo(
+        individual_address=IndividualAddress("1.1.2"),
+        device_descriptor=0x07B0,
+        serial_number=None,
+        manufacturer_id=None,
+        program_version=None,
+        order_info=None,
+        timestamp=infos[IndividualAddress("1.1.2")].timestamp,
+    )
+    assert len(infos) == 2
+    assert len(bus.requests) == 10  # 5 requests per device
+    assert isinstance(
+        inventory.errors[IndividualAddress("1.1.3")], ManagementConnectionError
+    )
+
+    # resume - only the failed device is read again
+    bus.devices[IndividualAddress("1.1.3")] = _device(PROPERTIES)
+    bus.requests.clear()
+    resumed = DeviceInventory(xknx, path=path)
+    assert resumed.devices == inventory.devices
+    resumed_infos = [
+        info async for info in resumed.collect(["1.1.1", "1.1.2", "1.1.3"])
+    ]
+    assert sorted(resumed_infos[:2]) == sorted(infos.values())
+    assert {address for address, _ in bus.requests} == {IndividualAddress("1.1.3")}
+    # device with the same serial number is found in the cache after its serial number
+    assert len(bus.requests) == 2
+    assert resumed_infos[2] == infos[IndividualAddress("1.1.1")]._replace(
+        individual_address=IndividualAddress("1.1.3")
+    )
+    assert not resumed.errors
+
+
+async def test_collect_ttl(tmp_path: Path) -> None:
+    """Test expired results are read again and a cut off line is ignored."""
+    path = tmp_path / "inventory.jsonl"
+    xknx = XKNX()
+    bus = FakeBus(xknx, {"1.1.1": _device(PROPERTIES)})
+    inventory = DeviceInventory(xknx, path=path, ttl=0)
+    info = await anext(inventory.collect(["1.1.1"]))
+    with path.open("a") as file:
+        file.write('{"individual_address": "1.1.')
+
+    expired = DeviceInventory(xknx, path=path, ttl=0)
+    assert expired.devices == {IndividualAddress("1.1.1"): info}
+    bus.requests.clear()
+    assert await anext(expired.collect(["1.1.1"])) != info
+    assert len(bus.requests) == 5
+
+
+async def test_property_read_not_answered(time_travel: EventLoopClockAdvancer) -> None:
+    """Test properties of a device not answering PropertyValueRead are None."""
+    xknx = XKNX()
+    bus = FakeBus(xknx, {"1.1.1": _device(None)})
+
+    async with xknx.management.connection(
+        IndividualAddress("1.1.1"), rate_limit=0
+    ) as conn:
+        task = asyncio.create_task(dmp_device_info_read_r_co(conn))
+        await time_travel(0)
+        await time_travel(6)
+        info = await task
+    assert info.device_descriptor == 0x07B0
+    assert info.serial_number is None
+    assert info.order_info is None
+    # no further property read after the first timed out
+    assert len(bus.requests) == 2
@@ -0,0 +1,127 @@
+"""Tests for the concurrent line and area scan."""
+
+import asyncio
+
+from xknx import XKNX
+from xknx.core import XknxConnectionState
+from xknx.devices import NumericValue
+from xknx.management.procedures import (
+    ScanResult,
+    scan_area,
+    scan_individual_addresses,
+    scan_line,
+)
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, apci
+
+from ....conftest import EventLoopClockAdvancer
+from ..conftest import DeviceResponder, FakeBus
+
+
+def _line(devices: dict[str, int | None]) -> dict[str, DeviceResponder | None]:
+    """Return devices answering DeviceDescriptorRead - None refuses connections."""
+
+    def device(device_descriptor: int) -> DeviceResponder:
+        return lambda _: apci.DeviceDescriptorResponse(
+            descriptor=0, value=device_descriptor
+        )
+
+    return {
+        address: None if device_descriptor is None else device(device_descriptor)
+        for address, device_descriptor in devices.items()
+    }
+
+
+async def test_scan_line() -> None:
+    """Test scanning a line with present, refusing and absent devices."""
+    xknx = XKNX()
+    xknx.bus_load.parallel_reads = 8
+    bus = FakeBus(xknx, _line({"1.1.1": 0x07B0, "1.1.4": None, "1.1.5": 0x0705}))
+
+    results = [
+        result async for result in scan_line(xknx, "1.1.0", devices=range(8), window=3)
+    ]
+
+    assert sorted(results) == [
+        ScanResult(IndividualAddress("1.1.1"), 0x07B0),
+        ScanResult(IndividualAddress("1.1.4"), None),
+        ScanResult(IndividualAddress("1.1.5"), 0x0705),
+    ]
+    assert bus.connected == [IndividualAddress(f"1.1.{device}") for device in range(8)]
+    assert not xknx.management._connections
+
+
+async def test_scan_timeout_and_stop(time_travel: EventLoopClockAdvancer) -> None:
+    """Test silent addresses time out and pending probes are cancelled on stop."""
+    xknx = XKNX()
+    xknx.bus_load.parallel_reads = 8
+    FakeBus(xknx, _line({"1.1.3": 0x07B0}), silent=("1.1.1", "1.1.2"))
+
+    scan = scan_individual_addresses(xknx, ["1.1.1", "1.1.2", "1.1.3"], window=3)
+    scan_task = asyncio.create_task(anext(scan))
+    await time_travel(0)
+    assert await scan_task == ScanResult(IndividualAddress("1.1.3"), 0x07B0)
+    # silent devices are still probed
+    assert len(xknx.management._connections) == 2
+
+    await scan.aclose()
+    assert not xknx.management._connections
+
+    scan = scan_individual_addresses(xknx, ["1.1.1", "1.1.2"], window=3)
+    scan_task = asyncio.create_task(anext(scan, None))
+    await time_travel(3)  # no ACK for telegram
+    await time_travel(3)  # no ACK for repeated telegram
+    assert await scan_task is None
+    assert not xknx.management._connections
+
+
+async def test_scan_releases_read_slots(time_travel: EventLoopClockAdvancer) -> None:
+    """Test StateUpdater reads are not blocked by probes waiting for timeouts."""
+    xknx = XKNX()
+    xknx.bus_load.parallel_reads = 2
+    FakeBus(xknx, {}, silent=[f"1.1.{device}" for device in range(1, 9)])
+    scan = scan_line(xknx, "1.1.0", devices=range(1, 9), window=8)
+    scan_task = asyncio.create_task(anext(scan, None))
+    await time_travel(0)
+    # all probes are waiting for an ACK
+    assert len(xknx.management._connections) == 8
+
+    sensor = NumericValue(
+        xknx,
+        "sensor",
+        group_address_state="1/2/3",
+        sync_state="init",
+        value_type="percentU8",
+    )
+    xknx.devices.async_add(sensor)
+    xknx.connection_manager._state = XknxConnectionState.CONNECTED
+    xknx.state_updater.start()
+    await time_travel(0)
+    assert xknx.telegrams.get_nowait() == Telegram(
+        destination_address=GroupAddress("1/2/3"), payload=apci.GroupValueRead()
+    )
+
+    xknx.state_updater.stop()
+    await time_travel(3)  # no ACK for telegram
+    await time_travel(3)  # no ACK for repeated telegram
+    assert await scan_task is None
+    assert not xknx.management._connections
+
+
+async def test_scan_area() -> None:
+    """Test scanning an area skips lines without a responding coupler."""
+    xknx = XKNX()
+    xknx.bus_load.parallel_reads = 8
+    bus = FakeBus(xknx, _line({"1.0.0": 0x091A, "1.2.0": 0x091A, "1.2.7": 0x07B0}))
+
+    results = [result async for result in scan_area(xknx, 1)]
+
+    assert results[0] == ScanResult(IndividualAddress("1.2.0"), 0x091A)
+    assert sorted(results[1:]) == [
+        ScanResult(IndividualAddress("1.0.0"), 0x091A),
+        ScanResult(IndividualAddress("1.2.7"), 0x07B0),
+    ]
+    assert bus.connected == [
+        *(IndividualAddress(f"1.{line}.0") for line in range(1, 16)),
+        *(IndividualAddress(f"1.0.{device}") for device in range(256)),
+        *(IndividualAddress(f"1.2.{device}") for device in range(1, 256)),
+    ]
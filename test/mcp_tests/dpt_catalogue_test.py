@@ -0,0 +1,78 @@
+"""Tests for the DPT catalogue of the xknx MCP tools."""
+
+import pytest
+
+from xknx.dpt import DPTBase
+from xknx.mcp import DptFilter, describe_dpt, list_dpts
+from xknx.mcp.dpt_catalogue import (
+    DptCatalogue,
+    _dpt_haystack,
+    _summarize_dpt,
+    dpt_catalogue,
+)
+
+
+def test_catalogue_built_once() -> None:
+    """The catalogue is built on first use and reused."""
+    assert dpt_catalogue() is dpt_catalogue()
+    assert len(dpt_catalogue().summaries) == len(list(DPTBase.dpt_class_tree()))
+
+
+def test_describe_resolves_like_get_dpt() -> None:
+    """Every value type and DPT number resolves to the transcoder get_dpt() returns."""
+    catalogue = DptCatalogue.build()
+    for dpt in DPTBase.dpt_class_tree():
+        for name in (dpt.value_type, dpt.dpt_number_str()):
+            if not name:
+                continue
+            assert catalogue.describe(name) == _summarize_dpt(DPTBase.get_dpt(name))
+    assert catalogue.describe("DPT-9.001") == catalogue.describe("temperature")
+    assert catalogue.describe(" 9.001 ") == catalogue.describe("temperature")
+    assert catalogue.describe("no-such-dpt") is None
+
+
+@pytest.mark.parametrize(
+    ("main", "text"),
+    [
+        (None, None),
+        (9, None),
+        (None, "temperature"),
+        (None, "TEMP"),
+        (None, "°c"),
+        (None, "9."),
+        (5, "percent"),
+        (14, "e"),
+        (None, "no such text"),
+        (999, None),
+    ],
+)
+def test_search_matches_scan(main: int | None, text: str | None) -> None:
+    """Indexed search returns what filtering every transcoder returns."""
+    needle = text.lower() if text else None
+    expected = sorted(
+        (
+            dpt
+            for dpt in DPTBase.dpt_class_tree()
+            if (main is None or dpt.dpt_main_number == main)
+            and (needle is None or needle in _dpt_haystack(dpt))
+        ),
+        key=lambda dpt: (dpt.dpt_main_number or 0, dpt.dpt_sub_number or -1),
+    )
+    assert dpt_catalogue().search(main=main, text=text) == tuple(
+        map(_summarize_dpt, expected)
+    )
+
+
+async def test_summaries_are_copies() -> None:
+    """Changing a handed out summary doesn't change the catalogue."""
+    switch = (await describe_dpt("1.001")).dpt
+    assert switch is not None and switch.options is not None
+    switch.options.append("dimmed")
+    controlled = (await list_dpts(DptFilter(main=2, text="switch_control"))).dpts[0]
+    assert controlled.schema is not None
+    controlled.schema[0]["name"] = "changed"
+
+    assert dpt_catalogue().describe("1.001") == _summarize_dpt(DPTBase.get_dpt("1.001"))
+    assert dpt_catalogue().search(main=2, text="switch_control")[0] == _summarize_dpt(
+        DPTBase.get_dpt(controlled.dpt)
+    )
@@ -1,31 +1,55 @@
 """Tests for the host-agnostic xknx MCP tool functions."""
 
+import asyncio
+from dataclasses import asdict
 from enum import Enum
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from xknx import XKNX
+from xknx.core import TelegramHistory
 from xknx.dpt import DPTArray, DPTBinary
 from xknx.exceptions import CouldNotParseAddress
 from xknx.mcp import (
     DecodeDptPayloadInput,
     DptFilter,
     EncodeDptPayloadInput,
+    GroupAddressBatchInput,
     GroupAddressInput,
+    GroupValueCache,
+    GroupValueReadBatchInput,
     GroupValueReadInput,
+    GroupValueReadItem,
+    GroupValueWriteBatchInput,
     GroupValueWriteInput,
+    SendResult,
+    TelegramHistoryEntry,
+    TelegramHistoryQueryInput,
     decode_dpt_payload,
     describe_dpt,
     encode_dpt_payload,
     get_connection_status,
     list_dpts,
+    query_telegram_history,
     read_group_value,
+    read_group_values,
     send_group_value_read,
+    send_group_value_reads,
     send_group_value_write,
+    send_group_value_writes,
 )
 from xknx.mcp.tools import _jsonify
-from xknx.telegram import GroupAddress, Telegram, TelegramDirection, apci
+from xknx.telegram import (
+    GroupAddress,
+    IndividualAddress,
+    Telegram,
+    TelegramDirection,
+    apci,
+)
+
+from ..conftest import EventLoopClockAdvancer
 
 
 async def test_list_dpts_unfiltered() -> None:
@@ -256,3 +280,174 @@ async def test_decode_dpt_payload() -> None:
     # An empty payload for a 6-bit (DPTBinary) DPT is rejected.
     with pytest.raises(ValueError, match="Empty payload"):
         await decode_dpt_payload(DecodeDptPayloadInput(payload=[], value_type="1.001"))
+
+
+async def test_read_group_values(time_travel: EventLoopClockAdvancer) -> None:
+    """Batch reads run under one deadline and report a status per item."""
+    xknx = XKNX()
+    cache = GroupValueCache(xknx)
+    await xknx.telegram_queue.process_telegram_incoming(
+        Telegram(
+            destination_address=GroupAddress("1/2/1"),
+            direction=TelegramDirection.INCOMING,
+            payload=apci.GroupValueWrite(DPTBinary(1)),
+        )
+    )
+    request = GroupValueReadBatchInput(
+        reads=[
+            GroupValueReadInput(group_address="1/2/1"),
+            GroupValueReadInput(group_address="1/2/3", value_type="percent"),
+            GroupValueReadInput(group_address="1/2/3"),
+            GroupValueReadInput(group_address="1/2/4"),
+            GroupValueReadInput(group_address="1/2/5", value_type="temperature"),
+            GroupValueReadInput(group_address="1/2/3/4"),
+            GroupValueReadInput(group_address="1/2/6", value_type="no-such-dpt"),
+        ],
+        timeout=3,
+        max_age=10,
+    )
+    task = asyncio.create_task(read_group_values(xknx, request, cache=cache))
+    await time_travel(0)
+    # 1/2/1 is answered from the cache, 1/2/3 is read once
+    assert [xknx.telegrams.get_nowait().destination_address for _ in range(3)] == [
+        GroupAddress("1/2/3"),
+        GroupAddress("1/2/4"),
+        GroupAddress("1/2/5"),
+    ]
+    for group_address, value in (
+        ("1/2/3", DPTArray((0x80,))),
+        ("1/2/5", DPTArray((0x80,))),  # invalid length for DPT 9
+    ):
+        await xknx.telegram_queue.process_telegram_incoming(
+            Telegram(
+                destination_address=GroupAddress(group_address),
+                direction=TelegramDirection.INCOMING,
+                payload=apci.GroupValueResponse(value),
+            )
+        )
+    await time_travel(3)
+    results = task.result().results
+    assert results[0].age is not None
+    assert results[0] == GroupValueReadItem(
+        group_address="1/2/1",
+        value_type=None,
+        status="cached",
+        value=1,
+        age=results[0].age,
+    )
+    assert results[1] == GroupValueReadItem(
+        group_address="1/2/3", value_type="percent", status="ok", value=50
+    )
+    assert results[2] == GroupValueReadItem(
+        group_address="1/2/3", value_type=None, status="ok", value=[0x80]
+    )
+    assert results[3] == GroupValueReadItem(
+        group_address="1/2/4", value_type=None, status="no_response"
+    )
+    assert [item.status for item in results[4:]] == ["error"] * 3
+    assert all(item.error for item in results[4:])
+    json.dumps(asdict(task.result()))
+
+    # values older than max_age are read again
+    cache.close()
+    task = asyncio.create_task(
+        read_group_values(
+            xknx,
+            GroupValueReadBatchInput(
+                reads=[GroupValueReadInput(group_address="1/2/1")],
+                timeout=1,
+                max_age=0,
+            ),
+            cache=cache,
+        )
+    )
+    await time_travel(1)
+    assert task.result().results[0].status == "no_response"
+    assert xknx.telegrams.qsize() == 1
+    assert not xknx.telegram_queue.telegram_received_cbs
+
+
+async def test_send_group_value_batches() -> None:
+    """Batch sends queue every valid telegram and report the invalid ones."""
+    xknx = XKNX()
+    result = await send_group_value_reads(
+        xknx, GroupAddressBatchInput(group_addresses=["1/2/3", "1/2/3/4"])
+    )
+    assert result.results[0] == SendResult(group_address="1/2/3", apci="GroupValueRead")
+    assert not result.results[1].queued
+    assert result.results[1].error
+
+    result = await send_group_value_writes(
+        xknx,
+        GroupValueWriteBatchInput(
+            writes=[
+                GroupValueWriteInput(
+                    group_address="1/2/4", value=50, value_type="percent"
+                ),
+                GroupValueWriteInput(
+                    group_address="1/2/5", value=500, value_type="percent"
+                ),
+                GroupValueWriteInput(group_address="1/2/6", value=1, value_type="x"),
+            ]
+        ),
+    )
+    assert [item.queued for item in result.results] == [True, False, False]
+    assert xknx.telegrams.qsize() == 2
+    json.dumps(asdict(result))
+
+
+async def test_query_telegram_history() -> None:
+    """History queries are paginated newest first with decoded payloads."""
+    xknx = XKNX()
+    history = TelegramHistory(xknx)
+    for index in range(5):
+        history.record(
+            Telegram(
+                destination_address=GroupAddress(f"2/1/{index}"),
+                source_address=IndividualAddress("1.1.5"),
+                direction=TelegramDirection.INCOMING,
+                payload=apci.GroupValueWrite(DPTArray((index, 0x1A))),
+            )
+        )
+    history.record(
+        Telegram(
+            destination_address=GroupAddress("2/2/1"),
+            direction=TelegramDirection.OUTGOING,
+            payload=apci.GroupValueRead(),
+        )
+    )
+
+    result = await query_telegram_history(
+        history, TelegramHistoryQueryInput(address_filter="2/1/*", limit=2)
+    )
+    assert result.total_count == 5
+    assert result.limit_reached
+    assert result.next_offset == 2
+    assert [entry.destination_address for entry in result.telegrams] == [
+        "2/1/4",
+        "2/1/3",
+    ]
+    assert result.telegrams[0] == TelegramHistoryEntry(
+        timestamp=result.telegrams[0].timestamp,
+        source_address="1.1.5",
+        destination_address="2/1/4",
+        direction="Incoming",
+        apci="GroupValueWrite",
+        payload=[4, 0x1A],
+        data_secure=False,
+    )
+    json.dumps(asdict(result))
+
+    result = await query_telegram_history(
+        history, TelegramHistoryQueryInput(group_address="2/2/1", max_age=60)
+    )
+    assert [(entry.apci, entry.payload) for entry in result.telegrams] == [
+        ("GroupValueRead", None)
+    ]
+    assert not result.limit_reached
+    assert result.next_offset is None
+
+    with pytest.raises(CouldNotParseAddress):
+        await query_telegram_history(
+            history, TelegramHistoryQueryInput(source_address="1/2/3")
+        )
@@ -8,8 +8,11 @@ from xknx.mcp import (
     DecodeDptPayloadInput,
     DptFilter,
     EncodeDptPayloadInput,
+    GroupAddressBatchInput,
     GroupAddressInput,
+    GroupValueReadBatchInput,
     GroupValueReadInput,
+    GroupValueWriteBatchInput,
     GroupValueWriteInput,
 )
 
@@ -20,8 +23,11 @@ from xknx.mcp import (
         DecodeDptPayloadInput,
         DptFilter,
         EncodeDptPayloadInput,
+        GroupAddressBatchInput,
         GroupAddressInput,
+        GroupValueReadBatchInput,
         GroupValueReadInput,
+        GroupValueWriteBatchInput,
         GroupValueWriteInput,
     ],
 )
@@ -3,6 +3,7 @@
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
 
 from xknx.secure.security_primitives import (
+    AESCipher,
     calculate_message_authentication_code_cbc,
     decrypt_ctr,
     derive_device_authentication_password,
@@ -90,3 +91,42 @@ class TestIPSecure:
         private_key_2, public_key_bytes_2 = generate_ecdh_key_pair()
         assert private_key != private_key_2
         assert public_key_bytes != public_key_bytes_2
+
+    def test_aes_cipher(self) -> None:
+        """Test AESCipher reusing cipher contexts yields same results as functions."""
+        # RoutingIndication from example in KNX specification AN159v06
+        key = bytes.fromhex("00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f")
+        additional_data = bytes.fromhex("06 10 09 50 00 37 00 00")
+        payload = bytes.fromhex("06 10 05 30 00 11 29 00 bc d0 11 59 0a de 01 00 81")
+        block_0 = bytes.fromhex("c0 c1 c2 c3 c4 c5 00 fa 12 34 56 78 af fe 00 11")
+        counter_0 = bytes.fromhex("c0 c1 c2 c3 c4 c5 00 fa 12 34 56 78 af fe ff 00")
+        cipher = AESCipher(key)
+        for _ in range(3):
+            mac_cbc = cipher.calculate_message_authentication_code_cbc(
+                additional_data=additional_data,
+                payload=payload,
+                block_0=block_0,
+            )
+            assert mac_cbc == calculate_message_authentication_code_cbc(
+                key=key,
+                additional_data=additional_data,
+                payload=payload,
+                block_0=block_0,
+            )
+            encrypted_data, mac = cipher.encrypt_data_ctr(
+                counter_0=counter_0, mac_cbc=mac_cbc, payload=payload
+            )
+            assert (encrypted_data, mac) == encrypt_data_ctr(
+                key=key, counter_0=counter_0, mac_cbc=mac_cbc, payload=payload
+            )
+            assert cipher.decrypt_ctr(
+                counter_0=counter_0, mac=mac, payload=encrypted_data
+            ) == (payload, mac_cbc)
+        # short MAC (Data Secure) and counter wrap around
+        counter_max = bytes.fromhex("ff" * 16)
+        encrypted_data, mac = cipher.encrypt_data_ctr(
+            counter_0=counter_max, mac_cbc=mac_cbc[:4], payload=payload
+        )
+        assert (encrypted_data, mac) == encrypt_data_ctr(
+            key=key, counter_0=counter_max, mac_cbc=mac_cbc[:4], payload=payload
+        )
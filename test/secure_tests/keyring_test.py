@@ -1,6 +1,7 @@
 """Unit test for keyring reader."""
 
 from pathlib import Path
+from xml.dom.minidom import parse
 
 import pytest
 
@@ -128,6 +129,22 @@ class TestKeyRing:
         assert verify_keyring_signature(self.testcase_file, "password")
         assert verify_keyring_signature(self.special_chars_file, "test")
 
+    def test_unsigned_keyring(self, tmp_path: Path) -> None:
+        """Test a keyring without signature is not verified."""
+        unsigned_file = tmp_path / "unsigned.knxkeys"
+        unsigned_file.write_text(
+            self.testcase_file.read_text(encoding="utf-8-sig").replace(
+                ' Signature="h5Ita0GubfkRagLGNpvOnw=="', ""
+            ),
+            encoding="utf-8",
+        )
+        assert not verify_keyring_signature(unsigned_file, "password")
+        with pytest.raises(InvalidSecureConfiguration):
+            sync_load_keyring(unsigned_file, "password")
+        keyring = sync_load_keyring(unsigned_file, "password", validate_signature=False)
+        assert keyring.signature is None
+        assert keyring.interfaces
+
     def test_invalid_signature(self) -> None:
         """Test invalid signature throws error."""
         with pytest.raises(InvalidSecureConfiguration):
@@ -219,3 +236,40 @@ class TestKeyRing:
         assert keyring.created_by == "ETS 5.7.7 (Build 1428)"
         assert keyring.created == "2023-02-06T21:17:09"
         assert keyring.xmlns == "http://knx.org/xml/keyring/1"
+
+    def test_lazy_decryption(self) -> None:
+        """Test attributes are decrypted on first access."""
+        keyring = sync_load_keyring(self.data_secure_ip, "test")
+        xml_ga = keyring.group_addresses[0]
+        assert "decrypted_key" not in vars(xml_ga)
+        key = xml_ga.decrypted_key
+        assert key is not None
+        assert vars(xml_ga)["decrypted_key"] == key
+        # a new password drops decrypted values
+        keyring.decrypt("wrong_password")
+        assert "decrypted_key" not in vars(xml_ga)
+        assert xml_ga.decrypted_key != key
+
+    def test_parse_xml(self) -> None:
+        """Test parsing a minidom document yields the same as loading the file."""
+        keyring = sync_load_keyring(self.keyring_test_file, "pwd")
+        dom_keyring = Keyring()
+        with self.keyring_test_file.open(encoding="utf-8") as file:
+            dom_keyring.parse_xml(parse(file).getElementsByTagName("Keyring")[0])
+        dom_keyring.decrypt("pwd")
+
+        assert dom_keyring.signature == keyring.signature
+        assert dom_keyring.backbone.decrypted_key == keyring.backbone.decrypted_key
+        assert [
+            (interface.individual_address, interface.decrypted_password)
+            for interface in dom_keyring.interfaces
+        ] == [
+            (interface.individual_address, interface.decrypted_password)
+            for interface in keyring.interfaces
+        ]
+        assert dom_keyring.get_data_secure_group_keys() == (
+            keyring.get_data_secure_group_keys()
+        )
+        assert dom_keyring.get_data_secure_senders() == (
+            keyring.get_data_secure_senders()
+        )
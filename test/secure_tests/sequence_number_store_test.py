@@ -0,0 +1,151 @@
+"""Unit test for Data Secure sequence number persistence."""
+
+import asyncio
+import json
+from pathlib import Path
+import threading
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from xknx.exceptions import DataSecureError
+from xknx.secure.data_secure import SEQUENCE_NUMBER_RESERVATION_BLOCK, DataSecure
+from xknx.secure.sequence_number_store import FileSequenceNumberStore
+from xknx.telegram import GroupAddress, IndividualAddress
+
+from ..conftest import EventLoopClockAdvancer
+
+
+def test_file_store_roundtrip(tmp_path: Path) -> None:
+    """Test storing and loading sequence numbers."""
+    path = tmp_path / "sequence_numbers.json"
+    store = FileSequenceNumberStore(path)
+    assert store.load() == (None, {})
+
+    store.reserve_sending(1000)
+    # without running event loop updates are written immediately
+    store.update_received(IndividualAddress("1.0.1"), 20)
+    store.update_received(IndividualAddress("1.0.2"), 30)
+
+    state = FileSequenceNumberStore(path).load()
+    assert state.sequence_number_sending == 1000
+    assert state.individual_address_table == {
+        IndividualAddress("1.0.1"): 20,
+        IndividualAddress("1.0.2"): 30,
+    }
+    assert not (tmp_path / "sequence_numbers.json.tmp").exists()
+
+
+def test_file_store_invalid_file(tmp_path: Path) -> None:
+    """Test invalid files are ignored."""
+    path = tmp_path / "sequence_numbers.json"
+    path.write_text("{invalid", encoding="utf-8")
+    assert FileSequenceNumberStore(path).load() == (None, {})
+    path.write_text(json.dumps({"version": 99}), encoding="utf-8")
+    assert FileSequenceNumberStore(path).load() == (None, {})
+
+
+def test_file_store_reserve_error(tmp_path: Path) -> None:
+    """Test failing to reserve sequence numbers raises."""
+    store = FileSequenceNumberStore(tmp_path / "missing_dir" / "sequence_numbers.json")
+    with pytest.raises(DataSecureError):
+        store.reserve_sending(1000)
+
+
+async def test_file_store_batching(
+    tmp_path: Path, time_travel: EventLoopClockAdvancer
+) -> None:
+    """Test received sequence numbers are written in batches by the writer thread."""
+    path = tmp_path / "sequence_numbers.json"
+    store = FileSequenceNumberStore(path, flush_delay=1)
+    write_threads: list[threading.Thread] = []
+    original_write = FileSequenceNumberStore._write
+
+    def write(*args: Any) -> None:
+        write_threads.append(threading.current_thread())
+        original_write(*args)
+
+    with patch.object(
+        FileSequenceNumberStore, "_write", autospec=True, side_effect=write
+    ) as write_mock:
+        for sequence_number in range(1, 11):
+            store.update_received(IndividualAddress("1.0.1"), sequence_number)
+        write_mock.assert_not_called()
+        await time_travel(1)
+        assert store._executor is not None
+        await asyncio.wrap_future(store._executor.submit(lambda: None))
+        write_mock.assert_called_once()
+        assert write_threads[0] is not threading.current_thread()
+        assert FileSequenceNumberStore(path).load().individual_address_table == {
+            IndividualAddress("1.0.1"): 10
+        }
+        # close writes pending updates
+        store.update_received(IndividualAddress("1.0.1"), 11)
+        store.close()
+        assert write_mock.call_count == 2
+        await time_travel(1)
+        assert write_mock.call_count == 2
+    assert FileSequenceNumberStore(path).load().individual_address_table == {
+        IndividualAddress("1.0.1"): 11
+    }
+
+
+def test_data_secure_restart(tmp_path: Path) -> None:
+    """Test DataSecure resumes sequence numbers after a restart."""
+    path = tmp_path / "sequence_numbers.json"
+    sender = IndividualAddress("1.0.1")
+
+    def init_data_secure() -> DataSecure:
+        return DataSecure(
+            group_key_table={GroupAddress("1/0/0"): bytes(16)},
+            # from keyring
+            individual_address_table={sender: 5},
+            last_sequence_number_sending=100,
+            sequence_number_store=FileSequenceNumberStore(path),
+        )
+
+    data_secure = init_data_secure()
+    assert data_secure.get_sequence_number() == 100
+    assert data_secure.get_sequence_number() == 101
+    with data_secure.check_sequence_number(sender, 50):
+        pass
+    data_secure.close()
+
+    data_secure = init_data_secure()
+    # used sequence numbers are skipped
+    assert data_secure.get_sequence_number() == 100 + SEQUENCE_NUMBER_RESERVATION_BLOCK
+    with (
+        pytest.raises(DataSecureError, match="Sequence number too low"),
+        data_secure.check_sequence_number(sender, 50),
+    ):
+        pass
+    # unknown senders from the store are not accepted
+    path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "sequence_number_sending": 5000,
+                "individual_address_table": {"1.0.1": 60, "1.0.9": 1},
+            }
+        ),
+        encoding="utf-8",
+    )
+    data_secure = init_data_secure()
+    assert data_secure._individual_address_table == {sender: 60}
+    assert data_secure.get_sequence_number() == 5000
+
+
+def test_file_store_stale_write(tmp_path: Path) -> None:
+    """Test an older state doesn't replace a newer reservation."""
+    path = tmp_path / "sequence_numbers.json"
+    store = FileSequenceNumberStore(path)
+    store.update_received(IndividualAddress("1.0.1"), 20)
+    # taken for the writer thread, but written after the reservation
+    stale = store._snapshot()
+    store.reserve_sending(1000)
+    store._write(*stale)
+
+    state = FileSequenceNumberStore(path).load()
+    assert state.sequence_number_sending == 1000
+    assert state.individual_address_table == {IndividualAddress("1.0.1"): 20}
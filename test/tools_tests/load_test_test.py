@@ -0,0 +1,59 @@
+"""Test the end-to-end load test."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from xknx import XKNX
+from xknx.tools import run_load_test
+
+
+async def test_run_load_test() -> None:
+    """Test traffic is processed and measured."""
+    xknx = XKNX()
+    report = await run_load_test(
+        xknx, incoming_rate=200, outgoing_rate=50, duration=0.2, devices=10
+    )
+    assert not xknx.started.is_set()
+    assert report.incoming_sent == report.incoming_processed == 40
+    assert report.outgoing_sent == 10
+    # responses to the read requests of every 5th incoming telegram
+    assert report.outgoing_processed == 10 + 8
+    # sensor values are 2 of every 5 incoming telegrams
+    assert len(report.incoming_latencies) == 16
+    assert len(report.outgoing_latencies) == 10
+    assert report.incoming_latencies == sorted(report.incoming_latencies)
+    assert report.duration >= 0.19
+    assert report.queue_depths
+
+    result = json.loads(json.dumps(report.as_dict()))
+    assert result["version"] == xknx.version
+    assert result["incoming"]["processed"] == 40
+    assert result["incoming"]["throughput"] == pytest.approx(40 / report.duration)
+    assert (
+        0
+        < result["incoming"]["latency"]["p50"]
+        <= (result["incoming"]["latency"]["p99"])
+    )
+    assert result["outgoing"]["latency"]["p100"] == report.outgoing_latencies[-1]
+    assert set(result["queue_depth"]) == {"telegrams", "outgoing", "samples"}
+
+
+async def test_run_load_test_devices() -> None:
+    """Test the number of devices is validated."""
+    with pytest.raises(ValueError):
+        await run_load_test(XKNX(), devices=1)
+
+
+async def test_run_load_test_error() -> None:
+    """Test the queue sampler is stopped when sending fails."""
+    xknx = XKNX()
+    with (
+        patch("xknx.tools.load_test._pace", side_effect=RuntimeError),
+        pytest.raises(RuntimeError),
+    ):
+        await run_load_test(xknx, duration=0.1)
+    assert not xknx.started.is_set()
+    assert asyncio.all_tasks() == {asyncio.current_task()}
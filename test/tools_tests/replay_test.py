@@ -0,0 +1,152 @@
+"""Test replay of captured bus traffic."""
+
+import asyncio
+from itertools import pairwise
+import json
+from unittest.mock import MagicMock
+
+from xknx import XKNX
+from xknx.cemi import CapturedFrame, CEMIFrame, CEMILData, CEMIMessageCode
+from xknx.devices import NumericValue
+from xknx.dpt import DPTArray
+from xknx.telegram import (
+    GroupAddress,
+    IndividualAddress,
+    Telegram,
+    TelegramDirection,
+    apci,
+)
+from xknx.tools import ReplayInterface, VirtualClock, replay
+
+
+def _frame(
+    timestamp: float,
+    value: int,
+    direction: TelegramDirection = TelegramDirection.INCOMING,
+) -> CapturedFrame:
+    cemi = CEMIFrame(
+        code=CEMIMessageCode.L_DATA_IND,
+        data=CEMILData.init_from_telegram(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                payload=apci.GroupValueWrite(DPTArray((value,))),
+            ),
+            src_addr=IndividualAddress("1.1.5"),
+        ),
+    )
+    return CapturedFrame(timestamp, direction, cemi.to_knx())
+
+
+async def test_replay() -> None:
+    """Test frames are processed on a virtual clock following the capture."""
+    xknx = XKNX()
+    sensor = NumericValue(xknx, "sensor", group_address="1/2/3", value_type="percentU8")
+    xknx.devices.async_add(sensor)
+    received: list[tuple[int, float]] = []
+    loop = asyncio.get_running_loop()
+
+    def telegram_received(telegram: Telegram) -> None:
+        received.append((telegram.payload.value.value[0], loop.time()))
+
+    xknx.telegram_queue.register_telegram_received_cb(telegram_received)
+    ticks: list[float] = []
+
+    async def ticker() -> None:
+        while True:
+            await asyncio.sleep(1)
+            ticks.append(loop.time())
+
+    start = loop.time()
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    report = await replay(
+        xknx,
+        [
+            _frame(1000.0, 10),
+            _frame(1002.5, 20, TelegramDirection.OUTGOING),
+            _frame(1010.0, 30),
+        ],
+    )
+    task.cancel()
+
+    assert [value for value, _ in received] == [10, 30]
+    # virtual time - the capture spans 10 seconds
+    assert received[1][1] - received[0][1] == 10.0
+    assert report.virtual_duration == 10.0
+    assert report.duration < 5
+    assert len(ticks) == 10
+    assert ticks[-1] <= received[1][1]
+    assert {round(b - a, 9) for a, b in pairwise(ticks)} == {1.0}
+    assert sensor.resolve_state() == 30
+    # the clock is restored
+    assert loop.time() - start < 5
+
+    assert report.frames == 2
+    assert len(report.latencies) == 2
+    assert report.latency(0) <= report.latency(50) <= report.latency(100)
+    cost = report.callback_costs[telegram_received.__qualname__]
+    assert cost.calls == 2
+    assert cost.mean_time > 0
+    # callbacks are restored
+    assert xknx.telegram_queue.telegram_received_cbs[0].callback is telegram_received
+    json.dumps(report.as_dict())
+
+
+async def test_replay_speed() -> None:
+    """Test replaying at a multiple of the original speed."""
+    xknx = XKNX()
+    report = await replay(
+        xknx, [_frame(0.0, 1), _frame(1.0, 2), _frame(2.0, 3)], speed=20
+    )
+    assert report.frames == 3
+    assert report.virtual_duration == 2.0
+    assert report.duration >= 0.1
+    assert report.throughput > 0
+
+
+async def test_replay_interface() -> None:
+    """Test frames fed to the ReplayTransport of a ReplayInterface reach devices."""
+    xknx = XKNX()
+    interface = ReplayInterface(xknx)
+    assert xknx.knxip_interface is interface
+    sensor = NumericValue(xknx, "sensor", group_address="1/2/3", value_type="percentU8")
+    xknx.devices.async_add(sensor)
+    telegram_received = MagicMock(__qualname__="telegram_received")
+    xknx.telegram_queue.register_telegram_received_cb(telegram_received)
+    await interface.start()
+    assert xknx.connection_manager.connected.is_set()
+
+    report = await replay(
+        xknx, [_frame(0.0, 1), _frame(1.0, 2)], target=interface.transport.feed
+    )
+    assert sensor.resolve_state() == 2
+    assert report.frames == 2
+    assert report.callback_costs["telegram_received"].calls == 2
+    received = telegram_received.call_args.args[0]
+    assert received.source_address == IndividualAddress("1.1.5")
+    # frames sent to the bus are discarded
+    await sensor.sync()
+    await xknx.telegram_queue._process_all_telegrams()
+    await interface.stop()
+
+
+async def test_virtual_clock() -> None:
+    """Test timers fire in order when the clock is advanced."""
+    loop = asyncio.get_running_loop()
+    clock = VirtualClock()
+    clock.install()
+    fired: list[tuple[str, float]] = []
+    loop.call_later(2, lambda: fired.append(("b", loop.time())))
+    loop.call_later(1, lambda: fired.append(("a", loop.time())))
+    cancelled = loop.call_later(1.5, lambda: fired.append(("c", loop.time())))
+    cancelled.cancel()
+    start = clock.now
+    try:
+        await clock.advance_to(start + 1.5)
+        assert fired == [("a", start + 1)]
+        await clock.advance_to(start + 10)
+        assert fired == [("a", start + 1), ("b", start + 2)]
+        assert loop.time() == start + 10
+    finally:
+        clock.uninstall()
+    assert loop.time() < start + 10
@@ -0,0 +1,263 @@
+"""Test the KNXnet/IP server simulator."""
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from xknx import XKNX
+from xknx.cemi import CEMIFrame, CEMILData, CEMIMessageCode
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.exceptions import CommunicationError
+from xknx.io import ConnectionConfig, ConnectionType
+from xknx.io.transport import UDPTransport
+from xknx.knxip import (
+    HPAI,
+    ConnectionStateRequest,
+    ConnectionStateResponse,
+    ConnectRequest,
+    ConnectRequestInformation,
+    ConnectResponse,
+    HostProtocol,
+    KNXIPFrame,
+    KNXIPServiceType,
+    RoutingBusy,
+    RoutingIndication,
+)
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, apci
+from xknx.tools import KNXIPServerSimulator, LoopbackTransport, read_group_value
+
+
+def _xknx(simulator: KNXIPServerSimulator, tcp: bool = False, **kwargs: Any) -> XKNX:
+    return XKNX(
+        connection_config=ConnectionConfig(
+            connection_type=(
+                ConnectionType.TUNNELING_TCP if tcp else ConnectionType.TUNNELING
+            ),
+            gateway_ip=simulator.host,
+            gateway_port=simulator.tcp_port if tcp else simulator.udp_port,
+            local_ip="127.0.0.1",
+            auto_reconnect=False,
+            **kwargs,
+        )
+    )
+
+
+async def _routing_client(
+    simulator: KNXIPServerSimulator,
+) -> tuple[UDPTransport, asyncio.Queue[KNXIPFrame]]:
+    transport = UDPTransport(
+        local_addr=("127.0.0.1", 0), remote_addr=(simulator.host, simulator.udp_port)
+    )
+    received: asyncio.Queue[KNXIPFrame] = asyncio.Queue()
+    transport.register_callback(
+        lambda frame, _source, _transport: received.put_nowait(frame)
+    )
+    await transport.connect()
+    return transport, received
+
+
+def _routing_indication(telegram: Telegram) -> KNXIPFrame:
+    return KNXIPFrame.init_from_body(
+        RoutingIndication(
+            raw_cemi=CEMIFrame(
+                code=CEMIMessageCode.L_DATA_IND,
+                data=CEMILData.init_from_telegram(telegram),
+            ).to_knx()
+        )
+    )
+
+
+@pytest.mark.parametrize("tcp", [False, True])
+async def test_tunnel(tcp: bool) -> None:
+    """Test a tunnel reading from and writing to a simulated device."""
+    async with KNXIPServerSimulator() as simulator:
+        device = simulator.add_device(
+            "1.1.10", {GroupAddress("1/2/3"): DPTArray((0x12,))}
+        )
+        xknx = _xknx(simulator, tcp=tcp)
+        await xknx.start()
+        try:
+            assert xknx.current_address == IndividualAddress("1.1.1")
+            assert await read_group_value(xknx, "1/2/3") == (0x12,)
+            # L_DATA_CON was received - otherwise sending would time out
+            await xknx.cemi_handler.send_telegram(
+                Telegram(
+                    destination_address=GroupAddress("1/2/3"),
+                    payload=apci.GroupValueWrite(DPTArray((0x34,))),
+                )
+            )
+            assert device.group_values[GroupAddress("1/2/3")] == DPTArray((0x34,))
+            assert len(simulator.tunnels) == 1
+        finally:
+            await xknx.stop()
+        # DisconnectRequest - TCP tunnels close with the connection
+        await asyncio.sleep(0.01)
+        assert not simulator.tunnels
+
+
+async def test_tunnel_slots() -> None:
+    """Test tunnels are limited to the configured slots."""
+    async with KNXIPServerSimulator(tunnel_slots=2) as simulator:
+        requested = _xknx(simulator, tcp=True, individual_address="1.1.2")
+        first = _xknx(simulator)
+        third = _xknx(simulator)
+        await requested.start()
+        await first.start()
+        try:
+            assert requested.current_address == IndividualAddress("1.1.2")
+            assert first.current_address == IndividualAddress("1.1.1")
+            with pytest.raises(CommunicationError):
+                await third.start()
+
+            # telegrams are forwarded between tunnels
+            received: asyncio.Queue[Telegram] = asyncio.Queue()
+            first.telegram_queue.register_telegram_received_cb(received.put_nowait)
+            await requested.cemi_handler.send_telegram(
+                Telegram(
+                    destination_address=GroupAddress("2/0/0"),
+                    payload=apci.GroupValueWrite(DPTBinary(1)),
+                )
+            )
+            telegram = await asyncio.wait_for(received.get(), 1)
+            assert telegram.source_address == IndividualAddress("1.1.2")
+            assert telegram.payload == apci.GroupValueWrite(DPTBinary(1))
+        finally:
+            await requested.stop()
+            await first.stop()
+
+
+async def test_routing() -> None:
+    """Test routing clients, forwarding and busy injection."""
+    async with KNXIPServerSimulator(busy_every=2) as simulator:
+        simulator.add_device("1.1.10", {GroupAddress("1/2/3"): DPTBinary(1)})
+        first, first_received = await _routing_client(simulator)
+        second, second_received = await _routing_client(simulator)
+        try:
+            second.send(
+                _routing_indication(
+                    Telegram(
+                        destination_address=GroupAddress("0/0/1"),
+                        payload=apci.GroupValueWrite(DPTBinary(0)),
+                        source_address=IndividualAddress("1.1.20"),
+                    )
+                )
+            )
+            await asyncio.sleep(0.05)
+            first.send(
+                _routing_indication(
+                    Telegram(
+                        destination_address=GroupAddress("1/2/3"),
+                        payload=apci.GroupValueRead(),
+                        source_address=IndividualAddress("1.1.21"),
+                    )
+                )
+            )
+            # busy after 2 indications, forwarded read, response of the device
+            frames = [
+                await asyncio.wait_for(second_received.get(), 1) for _ in range(3)
+            ]
+            assert isinstance(frames[0].body, RoutingBusy)
+            telegrams = [
+                CEMIFrame.from_knx(frame.body.raw_cemi).data.telegram()
+                for frame in frames[1:]
+            ]
+            assert telegrams[0].payload == apci.GroupValueRead()
+            assert telegrams[1].payload == apci.GroupValueResponse(DPTBinary(1))
+            assert telegrams[1].source_address == IndividualAddress("1.1.10")
+
+            # the sender only receives busy and the response
+            assert isinstance(
+                (await asyncio.wait_for(first_received.get(), 1)).body, RoutingBusy
+            )
+            response = await asyncio.wait_for(first_received.get(), 1)
+            assert response.header.service_type_ident is (
+                KNXIPServiceType.ROUTING_INDICATION
+            )
+
+            simulator.inject_busy(wait_time=20)
+            for received in (first_received, second_received):
+                busy = await asyncio.wait_for(received.get(), 1)
+                assert busy.body.wait_time == 20
+
+            simulator.inject_telegram(
+                Telegram(
+                    destination_address=GroupAddress("1/2/3"),
+                    payload=apci.GroupValueWrite(DPTBinary(0)),
+                    source_address=IndividualAddress("1.1.30"),
+                )
+            )
+            assert isinstance(
+                (await asyncio.wait_for(second_received.get(), 1)).body,
+                RoutingIndication,
+            )
+            assert simulator.devices[0].group_values[GroupAddress("1/2/3")] == (
+                DPTBinary(0)
+            )
+        finally:
+            first.stop()
+            second.stop()
+
+
+async def test_latency_and_loss() -> None:
+    """Test sent frames are delayed and received frames are lost."""
+    async with KNXIPServerSimulator(latency=0.05, loss=0.5, seed=1) as simulator:
+        client, received = await _routing_client(simulator)
+        request = KNXIPFrame.init_from_body(
+            ConnectionStateRequest(communication_channel_id=1, control_endpoint=HPAI())
+        )
+        try:
+            start = time.monotonic()
+            for _ in range(20):
+                client.send(request)
+            response = await asyncio.wait_for(received.get(), 1)
+            assert time.monotonic() - start >= 0.05
+            assert isinstance(response.body, ConnectionStateResponse)
+            await asyncio.sleep(0.1)
+            assert 0 < simulator.lost_frames < 20
+            assert received.qsize() + 1 == 20 - simulator.lost_frames
+        finally:
+            client.stop()
+
+
+async def test_loopback_transport() -> None:
+    """Test a transport connected in memory to a simulator that isn't started."""
+    simulator = KNXIPServerSimulator()
+    lost: list[None] = []
+    transport = LoopbackTransport(
+        simulator, connection_lost_cb=lambda: lost.append(None)
+    )
+    received: asyncio.Queue[KNXIPFrame] = asyncio.Queue()
+    transport.register_callback(
+        lambda frame, _source, _transport: received.put_nowait(frame)
+    )
+    await transport.connect()
+    transport.send(
+        KNXIPFrame.init_from_body(
+            ConnectRequest(
+                control_endpoint=HPAI(protocol=HostProtocol.IPV4_TCP),
+                data_endpoint=HPAI(protocol=HostProtocol.IPV4_TCP),
+                cri=ConnectRequestInformation(),
+            )
+        )
+    )
+    response = await asyncio.wait_for(received.get(), 1)
+    assert isinstance(response.body, ConnectResponse)
+    assert response.body.crd.individual_address == IndividualAddress("1.1.1")
+    assert len(simulator.tunnels) == 1
+
+    # closed by the simulator
+    await simulator.stop()
+    await asyncio.sleep(0)
+    assert lost == [None]
+    assert transport.transport is None
+    with pytest.raises(CommunicationError):
+        transport.send(response)
+
+    # closed by the client
+    await transport.connect()
+    transport.stop()
+    await asyncio.sleep(0)
+    assert lost == [None]
+    assert not simulator.connections
@@ -1,5 +1,6 @@
 """Test xknx tools package."""
 
+import asyncio
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -15,8 +16,11 @@ from xknx.tools import (
     group_value_response,
     group_value_write,
     read_group_value,
+    read_group_values,
 )
 
+from ..conftest import EventLoopClockAdvancer
+
 
 def test_group_value_read() -> None:
     """Test group_value_read."""
@@ -151,3 +155,34 @@ async def test_tools_with_internal_addresses(xknx_no_interface: XKNX) -> None:
     )
     assert response_value == 1
     await xknx.stop()
+
+
+async def test_read_group_values(time_travel: EventLoopClockAdvancer) -> None:
+    """Test read_group_values."""
+    xknx = XKNX()
+    task = asyncio.create_task(
+        read_group_values(
+            xknx, {"1/2/3": "percent", "1/2/4": None, "1/2/5": None}, timeout=3
+        )
+    )
+    await time_travel(0)
+    assert xknx.telegrams.qsize() == 3
+    assert len(xknx.telegram_queue.telegram_received_cbs) == 1
+
+    for group_address, value in (("1/2/3", DPTArray((0x80,))), ("1/2/4", DPTBinary(1))):
+        await xknx.telegram_queue.process_telegram_incoming(
+            Telegram(
+                destination_address=GroupAddress(group_address),
+                direction=TelegramDirection.INCOMING,
+                payload=apci.GroupValueResponse(value),
+            )
+        )
+    await time_travel(2.9)
+    assert not task.done()
+    await time_travel(0.1)
+    assert task.result() == {
+        GroupAddress("1/2/3"): 50,
+        GroupAddress("1/2/4"): 1,
+        GroupAddress("1/2/5"): None,
+    }
+    assert not xknx.telegram_queue.telegram_received_cbs
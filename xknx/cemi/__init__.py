@@ -1,6 +1,13 @@
 """Module for handling CEMI Frames."""
 
 # ruff: noqa: F401
+from .capture import (
+    CapturedFrame,
+    CaptureReader,
+    CaptureRecorder,
+    capture_files,
+    capture_frames,
+)
 from .cemi_frame import (
     CEMIFrame,
     CEMILData,
@@ -0,0 +1,341 @@
+"""
+Binary capture of raw cEMI frames.
+
+A capture file starts with a header followed by frames, each a timestamp, the
+direction and the length-prefixed raw cEMI frame - so it can be written by
+appending and read back without parsing text. :class:`CaptureRecorder` is set as
+`xknx.cemi_handler.recorder` to record every cEMI frame received from and sent to
+the KNX interface. Frames are written in batches by a background thread, to files
+rotated by size or age. :class:`CaptureReader` memory-maps a capture file and
+iterates its frames lazily.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+import glob
+import logging
+import mmap
+import os
+from pathlib import Path
+import struct
+import time
+from types import TracebackType
+from typing import IO, Any, Final, NamedTuple
+
+from xknx.telegram import TelegramDirection
+
+logger = logging.getLogger("xknx.cemi")
+
+FILE_MAGIC: Final = b"XKNXCEMI"
+FILE_FORMAT_VERSION: Final = 1
+DEFAULT_BATCH_SIZE: Final = 64 * 1024
+DEFAULT_FLUSH_DELAY: Final = 1.0
+# frames between entries of the index used to seek by time
+INDEX_INTERVAL: Final = 256
+
+# magic, format version, time.time() of the first frame
+_FILE_HEADER: Final = struct.Struct("<8sH6xd")
+# time.time(), direction (0 incoming, 1 outgoing), length of the cEMI frame
+_FRAME_HEADER: Final = struct.Struct("<dBH")
+
+
+class CapturedFrame(NamedTuple):
+    """A cEMI frame read from a capture file."""
+
+    timestamp: float
+    direction: TelegramDirection
+    raw: bytes
+
+
+def _indexed_capture_files(path: Path) -> list[tuple[int, Path]]:
+    """Return index and path of the files written by a CaptureRecorder for `path`."""
+    files: list[tuple[int, Path]] = []
+    for file in path.parent.glob(
+        f"{glob.escape(path.stem)}.*{glob.escape(path.suffix)}"
+    ):
+        index = file.name[len(path.stem) + 1 : len(file.name) - len(path.suffix)]
+        if index.isdigit():
+            files.append((int(index), file))
+    return sorted(files)
+
+
+def capture_files(path: str | os.PathLike[Any]) -> list[Path]:
+    """Return the files written by a CaptureRecorder for `path`, oldest first."""
+    return [file for _, file in _indexed_capture_files(Path(path))]
+
+
+def capture_frames(
+    path: str | os.PathLike[Any], since: float | None = None
+) -> Iterator[CapturedFrame]:
+    """
+    Iterate over the frames of a capture - starting with the first recorded at or after `since`.
+
+    `path` is a capture file or the path a CaptureRecorder was given - then the
+    frames of all its files are read, oldest first.
+    """
+    path = Path(path)
+    files = [path] if path.is_file() else capture_files(path)
+    for file in files:
+        with CaptureReader(file) as reader:
+            yield from reader.frames(since)
+
+
+class CaptureRecorder:
+    """
+    Record raw cEMI frames to capture files.
+
+    Files are named after `path` with an index before the suffix - eg.
+    `bus.0001.knxcap` for `bus.knxcap` - continuing after existing files. A new file is
+    started when a batch would grow the current one beyond `max_file_size` bytes or
+    was recorded `max_file_age` seconds after the first frame of the current one.
+    Frames are written at most `flush_delay` seconds after being recorded, or as soon
+    as `batch_size` bytes are pending.
+    """
+
+    __slots__ = (
+        "_executor",
+        "_file",
+        "_file_created",
+        "_file_index",
+        "_file_size",
+        "_flush_handle",
+        "_pending",
+        "_pending_since",
+        "_pending_size",
+        "batch_size",
+        "flush_delay",
+        "max_file_age",
+        "max_file_size",
+        "path",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[Any],
+        max_file_size: int | None = None,
+        max_file_age: float | None = None,
+        flush_delay: float = DEFAULT_FLUSH_DELAY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize CaptureRecorder class."""
+        self.path = Path(path)
+        self.max_file_size = max_file_size
+        self.max_file_age = max_file_age
+        self.flush_delay = flush_delay
+        self.batch_size = batch_size
+        self._pending: list[bytes] = []
+        # timestamp of the first pending frame
+        self._pending_since = 0.0
+        self._pending_size = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # a single thread keeps batches in order - files are only used from it
+        self._executor: ThreadPoolExecutor | None = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="xknx_capture"
+        )
+        self._file: IO[bytes] | None = None
+        self._file_created = 0.0
+        self._file_index: int | None = None
+        self._file_size = 0
+
+    def record(self, raw_cemi: bytes, direction: TelegramDirection) -> None:
+        """Record a raw cEMI frame."""
+        if self._executor is None:
+            return
+        timestamp = time.time()
+        if not self._pending:
+            self._pending_since = timestamp
+        self._pending.append(
+            _FRAME_HEADER.pack(
+                timestamp,
+                direction is TelegramDirection.OUTGOING,
+                len(raw_cemi),
+            )
+        )
+        self._pending.append(bytes(raw_cemi))
+        self._pending_size += _FRAME_HEADER.size + len(raw_cemi)
+        if self._pending_size >= self.batch_size:
+            self.flush()
+            return
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(self.flush_delay, self.flush)
+
+    def flush(self) -> None:
+        """Hand pending frames to the writer thread."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending or self._executor is None:
+            return
+        batch = b"".join(self._pending)
+        self._pending.clear()
+        self._pending_size = 0
+        self._executor.submit(self._write, batch, self._pending_since)
+
+    async def close(self) -> None:
+        """Write pending frames and close the current file."""
+        self.flush()
+        if (executor := self._executor) is None:
+            return
+        self._executor = None
+        await asyncio.wrap_future(executor.submit(self._close_file))
+        executor.shutdown()
+
+    def _write(self, batch: bytes, timestamp: float) -> None:
+        """Append a batch of frames - rotating the file if due. Runs in the writer thread."""
+        try:
+            if self._file is not None and self._rotation_due(len(batch), timestamp):
+                self._close_file()
+            if self._file is None:
+                self._open_file(timestamp)
+                assert self._file is not None
+            self._file.write(batch)
+            self._file.flush()
+            self._file_size += len(batch)
+        except OSError as err:
+            logger.error("Could not write capture file for %s: %s", self.path, err)
+
+    def _rotation_due(self, batch_size: int, timestamp: float) -> bool:
+        """Return if a batch recorded from `timestamp` has to be written to a new file."""
+        if (
+            self.max_file_size is not None
+            and self._file_size > _FILE_HEADER.size
+            and self._file_size + batch_size > self.max_file_size
+        ):
+            return True
+        return (
+            self.max_file_age is not None
+            and timestamp - self._file_created >= self.max_file_age
+        )
+
+    def _open_file(self, timestamp: float) -> None:
+        """Start the next capture file with a batch recorded from `timestamp`."""
+        if self._file_index is None:
+            existing = _indexed_capture_files(self.path)
+            self._file_index = existing[-1][0] if existing else 0
+        self._file_index += 1
+        file_path = self.path.with_name(
+            f"{self.path.stem}.{self._file_index:04d}{self.path.suffix}"
+        )
+        self._file_created = timestamp
+        self._file = file_path.open("xb")
+        self._file.write(
+            _FILE_HEADER.pack(FILE_MAGIC, FILE_FORMAT_VERSION, self._file_created)
+        )
+        self._file_size = _FILE_HEADER.size
+        logger.debug("Writing capture file %s", file_path)
+
+    def _close_file(self) -> None:
+        """Close the current capture file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class CaptureReader:
+    """
+    Read frames of a capture file.
+
+    The file is memory-mapped and frames are parsed when iterated. A frame cut off
+    by an interrupted write ends the iteration. Frames written after the file was
+    opened are not read.
+    """
+
+    __slots__ = ("_file", "_index_offsets", "_index_timestamps", "_mmap", "created")
+
+    def __init__(self, path: str | os.PathLike[Any]) -> None:
+        """Initialize CaptureReader class. Raise ValueError for invalid files."""
+        self._file = Path(path).open("rb")  # noqa: SIM115 - closed by close()
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap of an empty file
+            self._file.close()
+            raise ValueError(f"Empty capture file {path}") from None
+        magic, version, created = (
+            _FILE_HEADER.unpack_from(self._mmap)
+            if len(self._mmap) >= _FILE_HEADER.size
+            else (b"", 0, 0.0)
+        )
+        if magic != FILE_MAGIC or version != FILE_FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported capture file {path}")
+        # time.time() of the first frame written to the file
+        self.created: float = created
+        self._index_timestamps: list[float] | None = None
+        self._index_offsets: list[int] = []
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> CaptureReader:
+        """Return self for use as context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the file."""
+        self.close()
+
+    def __iter__(self) -> Iterator[CapturedFrame]:
+        """Iterate over all frames."""
+        return self.frames()
+
+    def _frame_offsets(self, offset: int) -> Iterator[tuple[int, float, int]]:
+        """Yield offset, timestamp and cEMI length of complete frames from `offset`."""
+        end = len(self._mmap)
+        while offset + _FRAME_HEADER.size <= end:
+            timestamp, _, length = _FRAME_HEADER.unpack_from(self._mmap, offset)
+            if offset + _FRAME_HEADER.size + length > end:
+                return
+            yield offset, timestamp, length
+            offset += _FRAME_HEADER.size + length
+
+    def seek(self, timestamp: float) -> int:
+        """Return the offset of the first frame recorded at or after `timestamp`."""
+        if self._index_timestamps is None:
+            # header-only pass indexing every INDEX_INTERVAL'th frame
+            self._index_timestamps = []
+            for number, (offset, frame_timestamp, _) in enumerate(
+                self._frame_offsets(_FILE_HEADER.size)
+            ):
+                if number % INDEX_INTERVAL == 0:
+                    self._index_timestamps.append(frame_timestamp)
+                    self._index_offsets.append(offset)
+        # scan from the last indexed frame recorded before `timestamp`
+        position = bisect_left(self._index_timestamps, timestamp) - 1
+        start = self._index_offsets[position] if position >= 0 else _FILE_HEADER.size
+        for offset, frame_timestamp, _ in self._frame_offsets(start):
+            if frame_timestamp >= timestamp:
+                return offset
+        return len(self._mmap)
+
+    def frames(self, since: float | None = None) -> Iterator[CapturedFrame]:
+        """Iterate over frames - starting with the first recorded at or after `since`."""
+        start = _FILE_HEADER.size if since is None else self.seek(since)
+        for offset, timestamp, length in self._frame_offsets(start):
+            data_start = offset + _FRAME_HEADER.size
+            yield CapturedFrame(
+                timestamp=timestamp,
+                direction=(
+                    TelegramDirection.OUTGOING
+                    if self._mmap[offset + 8]
+                    else TelegramDirection.INCOMING
+                ),
+                raw=self._mmap[data_start : data_start + length],
+            )
@@ -10,8 +10,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING
 
+from xknx.core.pipeline_metrics import PipelineStage
 from xknx.exceptions import (
     CommunicationError,
     ConfirmationError,
@@ -22,6 +24,7 @@ from xknx.exceptions import (
 )
 from xknx.secure.data_secure import DataSecure, is_data_secure
 from xknx.secure.keyring import Keyring
+from xknx.secure.sequence_number_store import SequenceNumberStore
 from xknx.telegram import IndividualAddress, Telegram, TelegramDirection, tpci
 
 from .cemi_frame import CEMIFrame, CEMILData
@@ -30,6 +33,8 @@ from .const import CEMIMessageCode
 if TYPE_CHECKING:
     from xknx.xknx import XKNX
 
+    from .capture import CaptureRecorder
+
 logger = logging.getLogger("xknx.cemi")
 data_secure_logger = logging.getLogger("xknx.data_secure")
 
@@ -40,20 +45,37 @@ REQUEST_TO_CONFIRMATION_TIMEOUT = 3
 class CEMIHandler:
     """Class for handling CEMI frames from/to the TelegramQueue."""
 
-    __slots__ = ("_l_data_confirmation_event", "data_secure", "xknx")
+    __slots__ = ("_l_data_confirmation_event", "data_secure", "recorder", "xknx")
 
     def __init__(self, xknx: XKNX) -> None:
         """Initialize CEMIHandler class."""
         self.xknx = xknx
         self.data_secure: DataSecure | None = None
+        # records raw cEMI frames received from and sent to the interface
+        self.recorder: CaptureRecorder | None = None
         self._l_data_confirmation_event = asyncio.Event()
 
-    def data_secure_init(self, keyring: Keyring | None) -> None:
+    def data_secure_init(
+        self,
+        keyring: Keyring | None,
+        sequence_number_store: SequenceNumberStore | None = None,
+    ) -> None:
         """Initialize DataSecure."""
+        if self.data_secure is not None:
+            self.data_secure.close()
         if keyring is None:
             self.data_secure = None
         else:
-            self.data_secure = DataSecure.init_from_keyring(keyring)
+            self.data_secure = DataSecure.init_from_keyring(
+                keyring, sequence_number_store=sequence_number_store
+            )
+
+    async def stop(self) -> None:
+        """Stop CEMIHandler. Persist pending Data Secure sequence numbers and close the recorder."""
+        if self.data_secure is not None:
+            self.data_secure.close()
+        if self.recorder is not None:
+            await self.recorder.close()
 
     async def send_telegram(self, telegram: Telegram) -> None:
         """Create a CEMIFrame from a Telegram and send it to the CEMI Server."""
@@ -76,25 +98,34 @@ class CEMIHandler:
             telegram.data_secure = False
 
         self._l_data_confirmation_event.clear()
+        send_time = time.monotonic()
         try:
             await self.xknx.knxip_interface.send_cemi(cemi)
         except (ConversionError, CommunicationError) as ex:
             logger.warning("Could not send CEMI frame: %s for %s", ex, cemi)
             self.xknx.connection_manager.cemi_count_outgoing_error += 1
             raise ex
+        if self.recorder is not None:
+            self.recorder.record(cemi.to_knx(), TelegramDirection.OUTGOING)
 
         try:
             async with asyncio.timeout(REQUEST_TO_CONFIRMATION_TIMEOUT):
                 await self._l_data_confirmation_event.wait()
         except TimeoutError:
+            self.xknx.bus_load.confirmation_received(REQUEST_TO_CONFIRMATION_TIMEOUT)
             self.xknx.connection_manager.cemi_count_outgoing_error += 1
             raise ConfirmationError(
                 f"L_DATA_CON Data Link Layer confirmation timed out for {cemi}"
             ) from None
+        self.xknx.bus_load.confirmation_received(time.monotonic() - send_time)
         self.xknx.connection_manager.cemi_count_outgoing += 1
 
     def handle_raw_cemi(self, raw_cemi: bytes) -> None:
         """Parse and handle incoming raw CEMI Frames."""
+        if self.recorder is not None:
+            self.recorder.record(raw_cemi, TelegramDirection.INCOMING)
+        metrics = self.xknx.metrics
+        start = time.perf_counter_ns() if metrics is not None else 0
         try:
             cemi = CEMIFrame.from_knx(raw_cemi)
         except CouldNotParseCEMI as cemi_parse_err:
@@ -113,6 +144,14 @@ class CEMIHandler:
             logger.exception("Unexpected error parsing CEMI frame: %s", raw_cemi.hex())
             self.xknx.connection_manager.cemi_count_incoming_error += 1
             return
+        if metrics is not None:
+            metrics.record(PipelineStage.PARSE, start)
+        if (
+            isinstance(cemi.data, CEMILData)
+            and cemi.code is not CEMIMessageCode.L_DATA_REQ
+        ):
+            # without message code and additional info cEMI L_Data has TP1 frame length
+            self.xknx.bus_load.frame_transmitted(len(raw_cemi) - 2 - raw_cemi[1])
         self.handle_cemi_frame(cemi)
 
     def handle_cemi_frame(self, cemi: CEMIFrame) -> None:
@@ -144,6 +183,8 @@ class CEMIHandler:
                 self.handle_data_secure_key_issue(cemi.data, _cemi_data_is_data_secure)
                 return
         else:
+            metrics = self.xknx.metrics
+            start = time.perf_counter_ns() if metrics is not None else 0
             try:
                 cemi.data = self.data_secure.received_cemi(cemi_data=cemi.data)
             except DataSecureError as err:
@@ -154,6 +195,8 @@ class CEMIHandler:
                 )
                 self.handle_data_secure_key_issue(cemi.data, _cemi_data_is_data_secure)
                 return
+            if metrics is not None and _cemi_data_is_data_secure:
+                metrics.record(PipelineStage.DATA_SECURE, start)
 
         telegram = cemi.data.telegram()
         telegram.direction = TelegramDirection.INCOMING
@@ -163,6 +206,8 @@ class CEMIHandler:
     def telegram_received(self, telegram: Telegram) -> None:
         """Forward Telegram to upper layer."""
         if isinstance(telegram.tpci, tpci.TDataGroup):
+            if self.xknx.metrics is not None:
+                self.xknx.metrics.telegram_queued(telegram)
             self.xknx.telegrams.put_nowait(telegram)
             return
         if (
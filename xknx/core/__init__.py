@@ -1,10 +1,13 @@
 """Module for the automations and business logic of XKNX."""
 
 # ruff: noqa: F401
+from .bus_load import BusLoadController
 from .connection_manager import ConnectionManager
 from .connection_state import XknxConnectionState, XknxConnectionType
 from .group_address_dpt import GroupAddressDPT
+from .pipeline_metrics import LatencyHistogram, PipelineMetrics, PipelineStage
 from .state_updater import StateUpdater
 from .task_registry import Task, TaskRegistry
+from .telegram_history import TelegramHistory, TelegramRecord
 from .telegram_queue import TelegramQueue
-from .value_reader import ValueReader
+from .value_reader import ReadMultiplexer, ValueReader
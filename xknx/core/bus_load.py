@@ -0,0 +1,175 @@
+"""
+Module for pacing state reads by the load of the KNX bus.
+
+The load of a TP1 line is estimated from the frames seen by the interface. Reading
+states from the bus - by StateUpdater or `Devices.sync()` - is limited to a number of
+parallel reads. This number is raised while the bus has capacity left and lowered when
+the load exceeds the target, L_DATA_CON confirmations are late or a RoutingBusy was
+received, so startup syncs don't starve live traffic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+import time
+from typing import Final
+
+logger = logging.getLogger("xknx.bus_load")
+
+# KNX TP1 - 9600 bit/s
+TP_BIT_TIME: Final = 1 / 9600
+# every octet takes 13 bit times: start, 8 data, parity and stop bit + 2 bit pause
+TP_OCTET_BITS: Final = 13
+# 50 bit times line idle before a frame; 15 bit times pause + 1 octet for the acknowledge
+TP_FRAME_OVERHEAD_BITS: Final = 50 + 15 + TP_OCTET_BITS
+
+DEFAULT_TARGET_LOAD: Final = 0.4  # leave room for live traffic
+DEFAULT_PARALLEL_READS: Final = 2
+DEFAULT_MAX_PARALLEL_READS: Final = 8
+# L_DATA_CON confirmation latency considered as congested interface or bus
+CONFIRMATION_LATENCY_LIMIT: Final = 0.5
+# time window used to estimate the bus load in seconds
+LOAD_WINDOW: Final = 2.0
+# minimum time between two changes of the parallel reads in seconds
+ADJUST_INTERVAL: Final = 1.0
+# smoothing factor for the moving average of the confirmation latency
+LATENCY_SMOOTHING: Final = 0.2
+
+
+def tp_frame_duration(octets: int) -> float:
+    """Return the time in seconds a TP1 frame of `octets` length occupies the bus."""
+    return (TP_FRAME_OVERHEAD_BITS + octets * TP_OCTET_BITS) * TP_BIT_TIME
+
+
+class BusLoadController:
+    """Class for estimating the bus load and pacing state reads accordingly."""
+
+    __slots__ = (
+        "_active_reads",
+        "_busy_until",
+        "_frames",
+        "_frames_duration",
+        "_last_adjust",
+        "_waiters",
+        "confirmation_latency",
+        "max_parallel_reads",
+        "parallel_reads",
+        "target_load",
+    )
+
+    def __init__(
+        self,
+        target_load: float = DEFAULT_TARGET_LOAD,
+        parallel_reads: int = DEFAULT_PARALLEL_READS,
+        max_parallel_reads: int = DEFAULT_MAX_PARALLEL_READS,
+    ) -> None:
+        """Initialize BusLoadController class."""
+        self.target_load = target_load
+        self.parallel_reads = parallel_reads
+        self.max_parallel_reads = max(max_parallel_reads, parallel_reads)
+        self.confirmation_latency: float = 0.0
+
+        self._active_reads = 0
+        self._busy_until: float = 0.0
+        # (timestamp, bus time) of frames within LOAD_WINDOW
+        self._frames: deque[tuple[float, float]] = deque()
+        self._frames_duration: float = 0.0
+        self._last_adjust: float = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def load(self) -> float:
+        """Return estimated bus load as fraction of the bus capacity."""
+        self._expire_frames(time.monotonic())
+        return self._frames_duration / LOAD_WINDOW
+
+    def frame_transmitted(self, octets: int) -> None:
+        """Record a frame of `octets` TP1 frame length seen on the bus."""
+        now = time.monotonic()
+        duration = tp_frame_duration(octets)
+        self._frames.append((now, duration))
+        self._frames_duration += duration
+        self._expire_frames(now)
+
+    def confirmation_received(self, latency: float) -> None:
+        """Record the time between sending a frame and its L_DATA_CON confirmation."""
+        self.confirmation_latency += LATENCY_SMOOTHING * (
+            latency - self.confirmation_latency
+        )
+
+    def routing_busy(self, wait_time_ms: int) -> None:
+        """Fall back to a single read when the router signals a full queue."""
+        self._busy_until = time.monotonic() + wait_time_ms / 1000
+        if self.parallel_reads > 1:
+            logger.debug("RoutingBusy received - pausing parallel reads")
+        self.parallel_reads = 1
+
+    def _expire_frames(self, now: float) -> None:
+        """Drop frames older than LOAD_WINDOW."""
+        while self._frames and self._frames[0][0] < now - LOAD_WINDOW:
+            self._frames_duration -= self._frames.popleft()[1]
+        if not self._frames:
+            self._frames_duration = 0.0  # prevent float drift
+
+    def _adjust(self) -> None:
+        """Raise or lower the number of parallel reads to hold the target load."""
+        now = time.monotonic()
+        if now - self._last_adjust < ADJUST_INTERVAL:
+            return
+        self._last_adjust = now
+        load = self.load
+        if (
+            now < self._busy_until
+            or load > self.target_load
+            or self.confirmation_latency > CONFIRMATION_LATENCY_LIMIT
+        ):
+            parallel_reads = max(self.parallel_reads // 2, 1)
+        elif load < self.target_load / 2:
+            parallel_reads = min(self.parallel_reads + 1, self.max_parallel_reads)
+        else:
+            return
+        if parallel_reads != self.parallel_reads:
+            logger.debug(
+                "Bus load %.0f %%, confirmation latency %.0f ms - parallel reads %s",
+                load * 100,
+                self.confirmation_latency * 1000,
+                parallel_reads,
+            )
+            self.parallel_reads = parallel_reads
+            self._wake_up_waiters()
+
+    def _wake_up_waiters(self) -> None:
+        """Wake up as many waiting reads as there are free slots."""
+        free_slots = self.parallel_reads - self._active_reads
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+    @asynccontextmanager
+    async def read_slot(self) -> AsyncIterator[None]:
+        """Context manager to wait for a free slot to read from the bus."""
+        self._adjust()
+        while self._active_reads >= self.parallel_reads:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # pass the slot on if it was just given to this waiter
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_up_waiters()
+                raise
+            self._adjust()
+        self._active_reads += 1
+        try:
+            yield
+        finally:
+            self._active_reads -= 1
+            self._adjust()
+            self._wake_up_waiters()
@@ -28,6 +28,7 @@ class ConnectionManager:
         "connected",
         "connected_since",
         "connection_type",
+        "last_reconnect_duration",
         "undecoded_data_secure",
     )
 
@@ -45,6 +46,8 @@ class ConnectionManager:
         self.cemi_count_outgoing_error: int = 0
         self.undecoded_data_secure: int = 0
         self.connected_since: datetime | None = None
+        # seconds from losing a tunnel until it was connected again
+        self.last_reconnect_duration: float | None = None
         self.connection_type: XknxConnectionType = XknxConnectionType.NOT_CONNECTED
 
     async def register_loop(self) -> None:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from array import array
+from collections.abc import Hashable, Mapping
 import logging
 
 from xknx.dpt.dpt import DPTBase
@@ -20,23 +21,43 @@ from xknx.typing import DPTParsable
 
 _GA_DPT_LOGGER = logging.getLogger("xknx.ga_dpt")
 
+# transcoder id 0 marks a group address without transcoder
+_NO_TRANSCODER = 0
+
 
 class GroupAddressDPT:
     """Class for mapping group addresses to data point types for eager decoding."""
 
-    __slots__ = ("_ga_dpts", "ga_decoding_error")
+    __slots__ = (
+        "_ga_transcoder_ids",
+        "_internal_ga_dpts",
+        "_transcoder_ids",
+        "_transcoders",
+        "ga_decoding_error",
+    )
 
     def __init__(self) -> None:
         """Initialize GADataTypes class."""
-        # using dict[int | str] instead of dict[DeviceGroupAddress] is faster.
-        self._ga_dpts: dict[int | str, type[DPTBase]] = {}
+        # transcoder ids are indices into `_transcoders`
+        self._transcoders: list[type[DPTBase] | None] = [None]
+        self._transcoder_ids: dict[type[DPTBase], int] = {}
+        # transcoder id of every GroupAddress, indexed by its 16 bit raw value
+        self._ga_transcoder_ids = array("H", [_NO_TRANSCODER]) * 65536
+        self._internal_ga_dpts: dict[str, type[DPTBase]] = {}
         self.ga_decoding_error: set[GroupAddress | InternalGroupAddress] = set()
 
     def set(
         self,
         ga_dpt: Mapping[DeviceAddressableType, DPTParsable],
     ) -> None:
-        """Assign decoders to group addresses."""
+        """
+        Assign decoders to group addresses.
+
+        Accepts the group address mapping of xknxproject data
+        eg. `{"1/2/3": {"main": 9, "sub": 1}}` for bulk loading.
+        """
+        # resolving a transcoder walks the DPT class tree - do it once per distinct DPT
+        resolved: dict[Hashable, type[DPTBase] | None] = {}
         unknown_dpts = set()
         for addr, dpt in ga_dpt.items():
             try:
@@ -44,20 +65,48 @@ class GroupAddressDPT:
             except CouldNotParseAddress as err:
                 _GA_DPT_LOGGER.warning("Invalid group address %s: %s", addr, err)
                 continue
-            if (transcoder := DPTBase.parse_transcoder(dpt)) is None:
+            if (cache_key := _dpt_cache_key(dpt)) in resolved:
+                transcoder = resolved[cache_key]
+            else:
+                transcoder = DPTBase.parse_transcoder(dpt)
+                if cache_key is not None:
+                    resolved[cache_key] = transcoder
+            if transcoder is None:
                 unknown_dpts.add(repr(dpt))  # prevent unhashable types (dict)
                 continue
-            self._ga_dpts[address.raw] = transcoder
+            if isinstance(address, GroupAddress):
+                self._ga_transcoder_ids[address.raw] = self._transcoder_id(transcoder)
+            else:
+                self._internal_ga_dpts[address.raw] = transcoder
         if unknown_dpts:
             _GA_DPT_LOGGER.debug("No transcoder found for DPTs: %s", unknown_dpts)
 
+    def _transcoder_id(self, transcoder: type[DPTBase]) -> int:
+        """Return id of a transcoder. Register it if it is not known yet."""
+        if (transcoder_id := self._transcoder_ids.get(transcoder)) is None:
+            transcoder_id = len(self._transcoders)
+            self._transcoders.append(transcoder)
+            self._transcoder_ids[transcoder] = transcoder_id
+        return transcoder_id
+
     def get(self, address: DeviceGroupAddress) -> type[DPTBase] | None:
         """Return transcoder for group address."""
-        return self._ga_dpts.get(address.raw)
+        if isinstance(address, GroupAddress):
+            return self._transcoders[self._ga_transcoder_ids[address.raw]]
+        return self._internal_ga_dpts.get(address.raw)
 
     def clear(self) -> None:
         """Clear all group addresses."""
-        self._ga_dpts = {}
+        self._ga_transcoder_ids = array("H", [_NO_TRANSCODER]) * 65536
+        self._internal_ga_dpts = {}
+
+    def __len__(self) -> int:
+        """Return number of group addresses with assigned transcoder."""
+        return (
+            65536
+            - self._ga_transcoder_ids.count(_NO_TRANSCODER)
+            + len(self._internal_ga_dpts)
+        )
 
     def set_decoded_data(self, telegram: Telegram) -> None:
         """Update telegram data with decoded value."""
@@ -88,3 +137,17 @@ class GroupAddressDPT:
             )
             return
         telegram.decoded_data = TelegramDecodedData(transcoder, value)
+
+
+def _dpt_cache_key(dpt: DPTParsable) -> Hashable | None:
+    """Return a hashable key for a DPTParsable. `None` if it can't be cached."""
+    key: Hashable
+    if isinstance(dpt, Mapping):
+        key = ("mapping", dpt.get("main"), dpt.get("sub"))
+    else:
+        key = (type(dpt), dpt)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
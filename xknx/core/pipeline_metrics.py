@@ -0,0 +1,272 @@
+"""
+Module for opt-in latency instrumentation of the telegram pipeline.
+
+Creating :class:`PipelineMetrics` for an XKNX instance enables recording the time
+spent in every stage a telegram passes - see :class:`PipelineStage` - in
+:class:`LatencyHistogram` instances, counting telegrams by direction and APCI service
+and tracking the depth of the telegram queues. While disabled, the pipeline only
+checks `xknx.metrics` for None.
+
+`snapshot()` returns all values as dict, `prometheus()` formats them in the
+Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+from xknx.telegram import Telegram, TelegramDirection
+
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
+# every power of two is split in 2**SUB_BUCKET_BITS buckets - max. 6.25 % error
+SUB_BUCKET_BITS: Final = 4
+SUB_BUCKETS: Final = 1 << SUB_BUCKET_BITS
+# latencies are recorded in nanoseconds - longer ones (~69 s) in an overflow bucket
+MAX_EXPONENT: Final = 36
+BUCKET_COUNT: Final = (MAX_EXPONENT - SUB_BUCKET_BITS + 1) * SUB_BUCKETS + 1
+# upper bounds of the exported Prometheus buckets - powers of 4 from ~1 µs
+PROMETHEUS_EXPONENTS: Final = tuple(range(10, MAX_EXPONENT + 1, 2))
+
+_METRIC_PREFIX: Final = "xknx_"
+
+
+class PipelineStage(Enum):
+    """Stage of the telegram pipeline."""
+
+    # parsing received cEMI frames in CEMIHandler
+    PARSE = "parse"
+    # decrypting received DataSecure frames
+    DATA_SECURE = "data_secure"
+    # incoming telegrams waiting in `xknx.telegrams`
+    QUEUE_WAIT = "queue_wait"
+    # decoding values by GroupAddressDPT
+    DPT_DECODE = "dpt_decode"
+    # `Devices.process()`
+    DEVICES = "devices"
+    # telegram received callbacks
+    CALLBACKS = "callbacks"
+    # sending outgoing telegrams until the L_DATA_CON confirmation
+    SEND = "send"
+
+
+def _bucket_index(value: int) -> int:
+    """Return the bucket of a value in nanoseconds."""
+    bits = value.bit_length()
+    if bits <= SUB_BUCKET_BITS + 1:
+        return value
+    shift = bits - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Return the exclusive upper bound of a bucket in nanoseconds."""
+    if index < 2 * SUB_BUCKETS:
+        return index + 1
+    shift = index // SUB_BUCKETS - 1
+    return (SUB_BUCKETS + index % SUB_BUCKETS + 1) << shift
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies with HDR-style buckets.
+
+    Every power of two of nanoseconds is divided in SUB_BUCKETS linear buckets, so
+    the relative error of a percentile is constant over the whole range.
+    """
+
+    __slots__ = ("count", "counts", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize LatencyHistogram class."""
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        # nanoseconds
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """Record a latency in nanoseconds."""
+        self.counts[min(_bucket_index(value), BUCKET_COUNT - 1)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percentile: float) -> float:
+        """Return the latency of a percentile in seconds - upper bound of its bucket."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(percentile / 100 * self.count))
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank and index < BUCKET_COUNT - 1:
+                return min(_bucket_upper_bound(index), self.max) / 1e9
+        # overflow bucket
+        return self.max / 1e9
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """Return the number of latencies below the Prometheus bucket bounds in seconds."""
+        result: list[tuple[float, int]] = []
+        cumulative = 0
+        index = 0
+        for exponent in PROMETHEUS_EXPONENTS:
+            # powers of two are the lower bound of a bucket
+            end = min(_bucket_index(1 << exponent), BUCKET_COUNT)
+            cumulative += sum(self.counts[index:end])
+            index = end
+            result.append(((1 << exponent) / 1e9, cumulative))
+        return result
+
+    def as_dict(self) -> dict[str, float]:
+        """Return count, sum, max and percentiles in seconds."""
+        return {
+            "count": self.count,
+            "sum": self.total / 1e9,
+            "max": self.max / 1e9,
+            **{
+                f"p{percentile}": self.percentile(percentile)
+                for percentile in (50, 90, 99, 99.9)
+            },
+        }
+
+
+class PipelineMetrics:
+    """Class for recording latencies, counters and queue depths of the pipeline."""
+
+    __slots__ = ("_queued", "histograms", "max_queue_depth", "telegrams", "xknx")
+
+    def __init__(self, xknx: XKNX) -> None:
+        """Initialize PipelineMetrics class and enable instrumentation of `xknx`."""
+        self.xknx = xknx
+        self.histograms = {stage: LatencyHistogram() for stage in PipelineStage}
+        # by direction and APCI service name
+        self.telegrams: dict[tuple[TelegramDirection, str], int] = {}
+        # highest number of telegrams in `xknx.telegrams`
+        self.max_queue_depth = 0
+        # incoming telegrams in the queue with perf_counter_ns() by id - the reference
+        # keeps the id from being reused while the entry exists
+        self._queued: dict[int, tuple[Telegram, int]] = {}
+        xknx.metrics = self
+
+    def close(self) -> None:
+        """Disable instrumentation. Recorded values are kept."""
+        if self.xknx.metrics is self:
+            self.xknx.metrics = None
+        self.discard_queued()
+
+    def record(self, stage: PipelineStage, start: int) -> int:
+        """Record a stage started at `start` from perf_counter_ns(). Return the end."""
+        end = time.perf_counter_ns()
+        self.histograms[stage].record(end - start)
+        return end
+
+    def telegram_queued(self, telegram: Telegram) -> None:
+        """Store the time an incoming telegram is put into `xknx.telegrams`."""
+        self._queued[id(telegram)] = (telegram, time.perf_counter_ns())
+
+    def telegram_dequeued(self, telegram: Telegram) -> None:
+        """Record queue wait, service counter and queue depth of a telegram."""
+        if (queued := self._queued.pop(id(telegram), None)) is not None:
+            self.record(PipelineStage.QUEUE_WAIT, queued[1])
+        if self._queued and self.xknx.telegrams.empty():
+            # no telegram is queued - entries left are stale
+            self._queued.clear()
+        key = (
+            telegram.direction,
+            type(
+                telegram.payload if telegram.payload is not None else telegram.tpci
+            ).__name__,
+        )
+        self.telegrams[key] = self.telegrams.get(key, 0) + 1
+        # including the current telegram
+        self.max_queue_depth = max(
+            self.max_queue_depth, self.xknx.telegrams.qsize() + 1
+        )
+
+    def discard_queued(self) -> None:
+        """Forget the enqueue times of telegrams left in the queue."""
+        self._queued.clear()
+
+    def reset(self) -> None:
+        """Reset all values."""
+        self.histograms = {stage: LatencyHistogram() for stage in PipelineStage}
+        self.telegrams = {}
+        self.max_queue_depth = 0
+
+    def _telegram_counts(self) -> list[tuple[str, str, int]]:
+        """Return direction, service and count of processed telegrams - sorted."""
+        return sorted(
+            (direction.value.lower(), service, count)
+            for (direction, service), count in self.telegrams.items()
+        )
+
+    def _gauges(self) -> dict[str, int]:
+        """Return current and maximum queue depths."""
+        return {
+            "telegram_queue_depth": self.xknx.telegrams.qsize(),
+            "outgoing_queue_depth": self.xknx.telegram_queue.outgoing_queue.qsize(),
+            "telegram_queue_max_depth": self.max_queue_depth,
+        }
+
+    def _counters(self) -> dict[str, int]:
+        """Return the counters of ConnectionManager - reset when connecting."""
+        connection_manager = self.xknx.connection_manager
+        return {
+            "cemi_incoming": connection_manager.cemi_count_incoming,
+            "cemi_incoming_error": connection_manager.cemi_count_incoming_error,
+            "cemi_outgoing": connection_manager.cemi_count_outgoing,
+            "cemi_outgoing_error": connection_manager.cemi_count_outgoing_error,
+            "undecoded_data_secure": connection_manager.undecoded_data_secure,
+        }
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all values as JSON serializable dict. Times are in seconds."""
+        return {
+            "stages": {
+                stage.value: histogram.as_dict()
+                for stage, histogram in self.histograms.items()
+            },
+            "telegrams": {
+                f"{direction}.{service}": count
+                for direction, service, count in self._telegram_counts()
+            },
+            **self._gauges(),
+            **self._counters(),
+        }
+
+    def prometheus(self) -> str:
+        """Return all values in the Prometheus text exposition format."""
+        name = f"{_METRIC_PREFIX}pipeline_latency_seconds"
+        lines = [
+            f"# HELP {name} Time spent in stages of the telegram pipeline.",
+            f"# TYPE {name} histogram",
+        ]
+        for stage, histogram in self.histograms.items():
+            label = f'stage="{stage.value}"'
+            for bound, count in histogram.cumulative_counts():
+                lines.append(f'{name}_bucket{{{label},le="{bound!r}"}} {count}')
+            lines.append(f'{name}_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{label}}} {histogram.total / 1e9!r}")
+            lines.append(f"{name}_count{{{label}}} {histogram.count}")
+
+        name = f"{_METRIC_PREFIX}telegrams_total"
+        lines += [
+            f"# HELP {name} Telegrams processed by the telegram queue.",
+            f"# TYPE {name} counter",
+        ]
+        for direction, service, count in self._telegram_counts():
+            lines.append(
+                f'{name}{{direction="{direction}",service="{service}"}} {count}'
+            )
+
+        for gauge, value in self._gauges().items():
+            name = f"{_METRIC_PREFIX}{gauge}"
+            lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+        for counter, value in self._counters().items():
+            name = f"{_METRIC_PREFIX}{counter}_total"
+            lines += [f"# TYPE {name} counter", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
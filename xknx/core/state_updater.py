@@ -7,11 +7,14 @@ from collections.abc import Awaitable, Callable
 from enum import Enum
 import logging
 from typing import TYPE_CHECKING, Any, NamedTuple
+import warnings
 
 from xknx.core import XknxConnectionState
 from xknx.remote_value import RemoteValue
 
 if TYPE_CHECKING:
+    from xknx.dpt import DPTArray, DPTBinary
+    from xknx.telegram.address import DeviceGroupAddress
     from xknx.xknx import XKNX
 
 
@@ -19,13 +22,32 @@ logger = logging.getLogger("xknx.state_updater")
 
 DEFAULT_UPDATE_INTERVAL = 60
 MAX_UPDATE_INTERVAL = 1440
+# factor an ADAPTIVE trackers interval is stretched or shortened by
+ADAPTIVE_INTERVAL_FACTOR = 2
 
 
 class TrackerOptions(NamedTuple):
-    """Options for the state tracker."""
+    """
+    Options for the state tracker.
+
+    `update_interval_max` is only used by `StateTrackerType.ADAPTIVE` where
+    `update_interval_min` is the shortest interval it may poll with.
+    """
 
     tracker_type: StateTrackerType
     update_interval_min: int | float
+    update_interval_max: int | float = MAX_UPDATE_INTERVAL
+
+
+class StateTrackerInfo(NamedTuple):
+    """Current state of a state tracker for inspection."""
+
+    group_address: DeviceGroupAddress | None
+    tracker_type: StateTrackerType
+    update_interval: int | float  # seconds
+    polls: int
+    changed_polls: int
+    spontaneous_updates: int
 
 
 TrackerOptionType = bool | int | float | str | TrackerOptions
@@ -36,7 +58,6 @@ class StateUpdater:
 
     __slots__ = (
         "_default_tracker_option",
-        "_semaphore",
         "_workers",
         "default_use_updater",
         "started",
@@ -47,13 +68,21 @@ class StateUpdater:
         self,
         xknx: XKNX,
         default_tracker_option: TrackerOptionType,
-        parallel_reads: int = 2,
+        parallel_reads: int | None = None,
     ) -> None:
         """Initialize StateUpdater class."""
+        if parallel_reads is not None:
+            warnings.warn(
+                "StateUpdater `parallel_reads` is deprecated - the number of parallel "
+                "reads is controlled by `xknx.bus_load`.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            xknx.bus_load.parallel_reads = parallel_reads
+            xknx.bus_load.max_parallel_reads = parallel_reads
         self.xknx = xknx
         self.started = False
         self._workers: dict[int, _StateTracker] = {}
-        self._semaphore = asyncio.Semaphore(value=parallel_reads)
 
         # used to determine if a RemoteValue shall register a tracker by default
         self.default_use_updater = bool(default_tracker_option)
@@ -93,11 +122,30 @@ class StateUpdater:
                 return 1
             return update_interval
 
+        def check_interval_bounds(
+            update_interval_min: int | float, update_interval_max: int | float
+        ) -> int | float:
+            """Return valid upper bound for ADAPTIVE update interval."""
+            update_interval_max = check_update_interval(update_interval_max)
+            if update_interval_max < update_interval_min:
+                logger.warning(
+                    "StateUpdater maximum interval of %s shorter than minimum for %s. Using %s minutes",
+                    tracker_options,
+                    tracker_name,
+                    update_interval_min,
+                )
+                return update_interval_min
+            return update_interval_max
+
         if isinstance(tracker_options, TrackerOptions):
+            update_interval_min = check_update_interval(
+                tracker_options.update_interval_min
+            )
             return TrackerOptions(
                 tracker_type=tracker_options.tracker_type,
-                update_interval_min=check_update_interval(
-                    tracker_options.update_interval_min
+                update_interval_min=update_interval_min,
+                update_interval_max=check_interval_bounds(
+                    update_interval_min, tracker_options.update_interval_max
                 ),
             )
         if isinstance(tracker_options, bool):
@@ -117,6 +165,8 @@ class StateUpdater:
                 tracker_type = StateTrackerType.EXPIRE
             elif _options[0].upper() == "EVERY":
                 tracker_type = StateTrackerType.PERIODICALLY
+            elif _options[0].upper() == "ADAPTIVE":
+                tracker_type = StateTrackerType.ADAPTIVE
             else:
                 logger.warning(
                     'Could not parse StateUpdater tracker_options "%s" for %s. Using default %s %s minutes.',
@@ -129,10 +179,20 @@ class StateUpdater:
             try:
                 if _options[1].isdigit():
                     update_interval = check_update_interval(int(_options[1]))
+                if tracker_type is StateTrackerType.ADAPTIVE and _options[2].isdigit():
+                    return TrackerOptions(
+                        tracker_type,
+                        update_interval,
+                        check_interval_bounds(update_interval, int(_options[2])),
+                    )
             except IndexError:
-                pass  # No time given (no _options[1])
+                pass  # No time given (no _options[1] or _options[2])
 
-        return TrackerOptions(tracker_type, update_interval)
+        return TrackerOptions(
+            tracker_type,
+            update_interval,
+            max(update_interval, self._default_tracker_option.update_interval_max),
+        )
 
     def register_remote_value(
         self,
@@ -142,8 +202,8 @@ class StateUpdater:
         """Register a RemoteValue to initialize its state and/or track for expiration."""
 
         async def read_state_mutex() -> None:
-            """Schedule to read the state from the KNX bus - one at a time."""
-            async with self._semaphore:
+            """Schedule to read the state from the KNX bus - paced by bus load."""
+            async with self.xknx.bus_load.read_slot():
                 # wait until there is nothing else to send to the bus
                 await self.xknx.telegram_queue.outgoing_queue.join()
                 logger.debug(
@@ -157,10 +217,20 @@ class StateUpdater:
                 await asyncio.shield(remote_value.read_state(wait_for_result=True))
 
         tracker_options = self.parse_tracker_options(tracker_options, str(remote_value))
-        tracker = _StateTracker(
-            read_state_awaitable=read_state_mutex,
-            tracker_options=tracker_options,
-        )
+        tracker: _StateTracker
+        if tracker_options.tracker_type is StateTrackerType.ADAPTIVE:
+            tracker = _AdaptiveStateTracker(
+                read_state_awaitable=read_state_mutex,
+                tracker_options=tracker_options,
+                group_address=remote_value.group_address_state,
+                last_payload=lambda: remote_value.last_payload,
+            )
+        else:
+            tracker = _StateTracker(
+                read_state_awaitable=read_state_mutex,
+                tracker_options=tracker_options,
+                group_address=remote_value.group_address_state,
+            )
         self._workers[id(remote_value)] = tracker
 
         logger.debug(
@@ -181,6 +251,10 @@ class StateUpdater:
         if self.started and id(remote_value) in self._workers:
             self._workers[id(remote_value)].update_received()
 
+    def tracker_info(self) -> list[StateTrackerInfo]:
+        """Return the current polling state of all registered trackers."""
+        return [worker.info() for worker in self._workers.values()]
+
     def _start(self) -> None:
         """Start internal StateUpdater. Initialize states."""
         logger.debug("StateUpdater initializing values")
@@ -227,21 +301,32 @@ class StateTrackerType(Enum):
     INIT = 1
     EXPIRE = 2
     PERIODICALLY = 3
+    ADAPTIVE = 4
 
 
 class _StateTracker:
     """Keeps track of the age of the state from one RemoteValue."""
 
-    __slots__ = ("_read_state", "_task", "tracker_type", "update_interval")
+    __slots__ = (
+        "_read_state",
+        "_task",
+        "group_address",
+        "polls",
+        "tracker_type",
+        "update_interval",
+    )
 
     def __init__(
         self,
         read_state_awaitable: Callable[[], Awaitable[None]],
         tracker_options: TrackerOptions,
+        group_address: DeviceGroupAddress | None = None,
     ) -> None:
         """Initialize StateTracker class."""
+        self.group_address = group_address
         self.tracker_type = tracker_options.tracker_type
         self.update_interval = tracker_options.update_interval_min * 60
+        self.polls = 0
         self._read_state = read_state_awaitable
         self._task: asyncio.Task[None] | None = None
 
@@ -252,7 +337,7 @@ class _StateTracker:
 
     async def _start_init(self) -> None:
         """Initialize state, start update loop if appropriate."""
-        await self._read_state()
+        await self._poll()
         if self.tracker_type is not StateTrackerType.INIT:
             self.reset()
 
@@ -279,4 +364,104 @@ class _StateTracker:
         #   when no telegram was received it will try again endlessly
         while True:
             await asyncio.sleep(self.update_interval)
-            await self._read_state()
+            await self._poll()
+
+    async def _poll(self) -> None:
+        """Read the state from the KNX bus."""
+        self.polls += 1
+        await self._read_state()
+
+    def info(self) -> StateTrackerInfo:
+        """Return current state of the tracker."""
+        return StateTrackerInfo(
+            group_address=self.group_address,
+            tracker_type=self.tracker_type,
+            update_interval=self.update_interval,
+            polls=self.polls,
+            changed_polls=0,
+            spontaneous_updates=0,
+        )
+
+
+class _AdaptiveStateTracker(_StateTracker):
+    """
+    State tracker adapting its interval to how the state changes.
+
+    Like EXPIRE, every received update restarts the timer. Updates received
+    while not polling are pushed by the bus and stretch the interval - so do
+    polls returning an unchanged value. Polls returning a changed value
+    shorten it. The interval is kept within the configured bounds.
+    """
+
+    __slots__ = (
+        "_known_payload",
+        "_last_payload",
+        "_polling",
+        "changed_polls",
+        "spontaneous_updates",
+        "update_interval_max",
+        "update_interval_min",
+    )
+
+    def __init__(
+        self,
+        read_state_awaitable: Callable[[], Awaitable[None]],
+        tracker_options: TrackerOptions,
+        last_payload: Callable[[], DPTArray | DPTBinary | None],
+        group_address: DeviceGroupAddress | None = None,
+    ) -> None:
+        """Initialize AdaptiveStateTracker class."""
+        super().__init__(read_state_awaitable, tracker_options, group_address)
+        self.update_interval_min = tracker_options.update_interval_min * 60
+        self.update_interval_max = tracker_options.update_interval_max * 60
+        self.changed_polls = 0
+        self.spontaneous_updates = 0
+        self._last_payload = last_payload
+        self._known_payload = last_payload()
+        self._polling = False
+
+    async def _poll(self) -> None:
+        """Read the state from the KNX bus. Mark updates received meanwhile as response."""
+        self._polling = True
+        try:
+            await super()._poll()
+        finally:
+            self._polling = False
+
+    def update_received(self) -> None:
+        """Adapt the interval and restart the timer."""
+        payload = self._last_payload()
+        if not self._polling:
+            self.spontaneous_updates += 1
+            self._stretch_interval()
+        elif self._known_payload is not None:  # ignore initial read
+            if payload != self._known_payload:
+                self.changed_polls += 1
+                self._shorten_interval()
+            else:
+                self._stretch_interval()
+        self._known_payload = payload
+        self.reset()
+
+    def _stretch_interval(self) -> None:
+        """Poll less often."""
+        self.update_interval = min(
+            self.update_interval * ADAPTIVE_INTERVAL_FACTOR, self.update_interval_max
+        )
+
+    def _shorten_interval(self) -> None:
+        """Poll more often."""
+        self.update_interval = max(
+            self.update_interval / ADAPTIVE_INTERVAL_FACTOR, self.update_interval_min
+        )
+
+    def info(self) -> StateTrackerInfo:
+        """Return current state of the tracker."""
+        return (
+            super()
+            .info()
+            ._replace(
+                changed_polls=self.changed_polls,
+                spontaneous_updates=self.spontaneous_updates,
+            )
+        )
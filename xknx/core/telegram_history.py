@@ -0,0 +1,274 @@
+"""
+Module for keeping a history of group telegrams.
+
+Every telegram to a group address passing the telegram queue - incoming and
+outgoing - is stored as fixed-size record in a preallocated ring buffer. When the
+buffer is full, the oldest record is overwritten. Records are indexed by
+destination and source address, so queries for a group address don't scan the
+whole history. Records carry the monotonic clock of recording for time range
+queries and the wall clock time for display.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Iterable, Iterator
+import heapq
+import struct
+import time
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from xknx.telegram import AddressFilter, Telegram, TelegramDirection
+from xknx.telegram.address import GroupAddress, IndividualAddress
+from xknx.telegram.apci import APCI
+
+if TYPE_CHECKING:
+    from xknx.core.telegram_queue import TelegramQueue
+    from xknx.xknx import XKNX
+
+DEFAULT_HISTORY_SIZE: Final = 10_000
+# APDUs of standard frames fit completely - longer ones are truncated
+MAX_APDU_LENGTH: Final = 16
+
+# time.monotonic(), time.time(), source, destination, APCI service code, flags,
+# APDU length, APDU
+_RECORD: Final = struct.Struct(f"<ddHHHBB{MAX_APDU_LENGTH}s")
+_MONOTONIC: Final = struct.Struct("<d")
+_ADDRESSES: Final = struct.Struct("<16xHH")
+
+FLAG_OUTGOING: Final = 0x01
+FLAG_DATA_SECURE: Final = 0x02
+
+
+class TelegramRecord(NamedTuple):
+    """A telegram of the history."""
+
+    sequence: int
+    timestamp: float
+    source_address: IndividualAddress
+    destination_address: GroupAddress
+    direction: TelegramDirection
+    apci_code: int
+    # the APDU without TPCI - truncated to MAX_APDU_LENGTH octets
+    apdu: bytes
+    truncated: bool
+    data_secure: bool
+
+    def payload(self) -> APCI | None:
+        """Return the parsed APDU - None if it was truncated."""
+        if self.truncated:
+            return None
+        return APCI.from_knx(self.apdu)
+
+
+class TelegramHistory:
+    """Class for recording group telegrams in a ring buffer."""
+
+    __slots__ = (
+        "_buffer",
+        "_by_destination",
+        "_by_source",
+        "_callback",
+        "_next_sequence",
+        "size",
+        "xknx",
+    )
+
+    def __init__(self, xknx: XKNX, size: int = DEFAULT_HISTORY_SIZE) -> None:
+        """Initialize TelegramHistory class and start recording telegrams."""
+        if size < 1:
+            raise ValueError("TelegramHistory size must be at least 1")
+        self.xknx = xknx
+        self.size = size
+        self._buffer = bytearray(_RECORD.size * size)
+        # sequence number of the next record - record `n` is stored in slot `n % size`
+        self._next_sequence = 0
+        # sequence numbers of the stored records by raw address, oldest first
+        self._by_destination: dict[int, deque[int]] = {}
+        self._by_source: dict[int, deque[int]] = {}
+        self._callback: TelegramQueue.Callback | None = (
+            xknx.telegram_queue.register_telegram_received_cb(
+                self.record, match_for_outgoing=True
+            )
+        )
+
+    def close(self) -> None:
+        """Stop recording telegrams. Recorded telegrams are kept."""
+        if self._callback is not None:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(self._callback)
+            self._callback = None
+
+    def __len__(self) -> int:
+        """Return the number of stored records."""
+        return min(self._next_sequence, self.size)
+
+    @property
+    def oldest_sequence(self) -> int:
+        """Return the sequence number of the oldest stored record."""
+        return max(self._next_sequence - self.size, 0)
+
+    def record(self, telegram: Telegram) -> None:
+        """Store a telegram to a group address."""
+        if telegram.payload is None or not isinstance(
+            telegram.destination_address, GroupAddress
+        ):
+            return
+        sequence = self._next_sequence
+        offset = (sequence % self.size) * _RECORD.size
+        if sequence >= self.size:
+            self._evict(offset)
+        apdu = telegram.payload.to_knx()
+        flags = 0
+        if telegram.direction is TelegramDirection.OUTGOING:
+            flags |= FLAG_OUTGOING
+        if telegram.data_secure:
+            flags |= FLAG_DATA_SECURE
+        _RECORD.pack_into(
+            self._buffer,
+            offset,
+            time.monotonic(),
+            time.time(),
+            telegram.source_address.raw,
+            telegram.destination_address.raw,
+            telegram.payload.CODE.value,
+            flags,
+            min(len(apdu), 0xFF),
+            bytes(apdu[:MAX_APDU_LENGTH]),
+        )
+        self._by_destination.setdefault(
+            telegram.destination_address.raw, deque()
+        ).append(sequence)
+        self._by_source.setdefault(telegram.source_address.raw, deque()).append(
+            sequence
+        )
+        self._next_sequence = sequence + 1
+
+    def _evict(self, offset: int) -> None:
+        """Remove the record at `offset` from the indexes."""
+        source, destination = _ADDRESSES.unpack_from(self._buffer, offset)
+        for index, address in (
+            (self._by_destination, destination),
+            (self._by_source, source),
+        ):
+            sequences = index[address]
+            # the oldest record is always the first of its address
+            sequences.popleft()
+            if not sequences:
+                del index[address]
+
+    def _monotonic(self, sequence: int) -> float:
+        """Return the monotonic time of a stored record."""
+        offset = (sequence % self.size) * _RECORD.size
+        return float(_MONOTONIC.unpack_from(self._buffer, offset)[0])
+
+    def get(self, sequence: int) -> TelegramRecord:
+        """Return a stored record by its sequence number."""
+        if not self.oldest_sequence <= sequence < self._next_sequence:
+            raise IndexError(f"Record {sequence} is not stored")
+        (
+            _,
+            timestamp,
+            source,
+            destination,
+            apci_code,
+            flags,
+            length,
+            apdu,
+        ) = _RECORD.unpack_from(self._buffer, (sequence % self.size) * _RECORD.size)
+        return TelegramRecord(
+            sequence=sequence,
+            timestamp=timestamp,
+            source_address=IndividualAddress(source),
+            destination_address=GroupAddress(destination),
+            direction=(
+                TelegramDirection.OUTGOING
+                if flags & FLAG_OUTGOING
+                else TelegramDirection.INCOMING
+            ),
+            apci_code=apci_code,
+            apdu=apdu[: min(length, MAX_APDU_LENGTH)],
+            truncated=length > MAX_APDU_LENGTH,
+            data_secure=bool(flags & FLAG_DATA_SECURE),
+        )
+
+    def find(
+        self,
+        group_address: GroupAddress | None = None,
+        address_filter: AddressFilter | None = None,
+        source_address: IndividualAddress | None = None,
+        max_age: float | None = None,
+        min_age: float | None = None,
+    ) -> list[int]:
+        """
+        Return sequence numbers of stored records matching all given criteria, oldest first.
+
+        :param group_address: destination of the telegrams
+        :param address_filter: pattern the destination matches, eg. `AddressFilter("2/1/*")`
+        :param source_address: sender of the telegrams
+        :param max_age: seconds the telegrams were recorded before now at most
+        :param min_age: seconds the telegrams were recorded before now at least
+
+        Ages are measured on the monotonic clock, so adjusting the system clock
+        doesn't change which records they select.
+        """
+        # records are stored in monotonic time order - find the sequence range by it
+        now = time.monotonic()
+        stored = range(self.oldest_sequence, self._next_sequence)
+        first = (
+            stored.start
+            if max_age is None
+            else bisect_left(stored, now - max_age, key=self._monotonic) + stored.start
+        )
+        end = (
+            stored.stop
+            if min_age is None
+            else bisect_right(stored, now - min_age, key=self._monotonic) + stored.start
+        )
+
+        candidates: Iterable[int]
+        if group_address is not None:
+            candidates = self._by_destination.get(group_address.raw, ())
+        elif source_address is not None:
+            candidates = self._by_source.get(source_address.raw, ())
+        elif address_filter is not None:
+            candidates = heapq.merge(
+                *(
+                    sequences
+                    for destination, sequences in self._by_destination.items()
+                    if address_filter.match(GroupAddress(destination))
+                )
+            )
+        else:
+            return list(range(first, end))
+
+        return [
+            sequence
+            for sequence in candidates
+            if first <= sequence < end
+            and self._matches(sequence, group_address, address_filter, source_address)
+        ]
+
+    def _matches(
+        self,
+        sequence: int,
+        group_address: GroupAddress | None,
+        address_filter: AddressFilter | None,
+        source_address: IndividualAddress | None,
+    ) -> bool:
+        """Test the criteria not used to select candidates."""
+        if address_filter is None and (group_address is None or source_address is None):
+            return True
+        source, destination = _ADDRESSES.unpack_from(
+            self._buffer, (sequence % self.size) * _RECORD.size
+        )
+        if source_address is not None and source != source_address.raw:
+            return False
+        if group_address is not None and destination != group_address.raw:
+            return False
+        return address_filter is None or address_filter.match(GroupAddress(destination))
+
+    def __iter__(self) -> Iterator[TelegramRecord]:
+        """Iterate over stored records, oldest first."""
+        for sequence in range(self.oldest_sequence, self._next_sequence):
+            yield self.get(sequence)
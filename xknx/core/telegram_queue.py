@@ -15,6 +15,7 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from functools import partial
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from xknx.exceptions import CommunicationError, XKNXException
@@ -22,6 +23,8 @@ from xknx.telegram import AddressFilter, Telegram, TelegramDirection
 from xknx.telegram.address import GroupAddress, InternalGroupAddress
 from xknx.typing import TelegramCallbackType
 
+from .pipeline_metrics import PipelineStage
+
 if TYPE_CHECKING:
     from xknx.xknx import XKNX
 
@@ -132,6 +135,8 @@ class TelegramQueue:
         self.xknx.telegrams.put_nowait(None)
         if self._consumer_task is not None:
             await self._consumer_task
+        if self.xknx.metrics is not None:
+            self.xknx.metrics.discard_queued()
 
     async def _telegram_consumer(self) -> None:
         """Endless loop for processing telegrams."""
@@ -144,7 +149,13 @@ class TelegramQueue:
                 self.xknx.telegrams.task_done()
                 break
 
+            metrics = self.xknx.metrics
+            if metrics is not None:
+                metrics.telegram_dequeued(telegram)
+            start = time.perf_counter_ns() if metrics is not None else 0
             self.xknx.group_address_dpt.set_decoded_data(telegram)
+            if metrics is not None:
+                metrics.record(PipelineStage.DPT_DECODE, start)
 
             if telegram.direction == TelegramDirection.INCOMING:
                 try:
@@ -210,6 +221,8 @@ class TelegramQueue:
                 telegram = self.xknx.telegrams.get_nowait()
                 if telegram is None:
                     return
+                if self.xknx.metrics is not None:
+                    self.xknx.metrics.telegram_dequeued(telegram)
                 if telegram.direction == TelegramDirection.INCOMING:
                     await self.process_telegram_incoming(telegram)
                 elif telegram.direction == TelegramDirection.OUTGOING:
@@ -222,18 +235,32 @@ class TelegramQueue:
     async def process_telegram_outgoing(self, telegram: Telegram) -> None:
         """Process outgoing telegram."""
         telegram_logger.debug(telegram)
+        metrics = self.xknx.metrics
+        start = time.perf_counter_ns() if metrics is not None else 0
         if not isinstance(telegram.destination_address, InternalGroupAddress):
             # raises CommunicationError when interface is not connected
             await self.xknx.cemi_handler.send_telegram(telegram)
+            if metrics is not None:
+                start = metrics.record(PipelineStage.SEND, start)
 
         self.xknx.devices.process(telegram)
+        if metrics is not None:
+            start = metrics.record(PipelineStage.DEVICES, start)
         self._run_telegram_received_cbs(telegram)
+        if metrics is not None:
+            metrics.record(PipelineStage.CALLBACKS, start)
 
     async def process_telegram_incoming(self, telegram: Telegram) -> None:
         """Process incoming telegram."""
         telegram_logger.debug(telegram)
+        metrics = self.xknx.metrics
+        start = time.perf_counter_ns() if metrics is not None else 0
         self._run_telegram_received_cbs(telegram)
+        if metrics is not None:
+            start = metrics.record(PipelineStage.CALLBACKS, start)
         self.xknx.devices.process(telegram)
+        if metrics is not None:
+            metrics.record(PipelineStage.DEVICES, start)
 
     def _run_telegram_received_cbs(self, telegram: Telegram) -> None:
         """Run registered callbacks. Don't propagate exceptions."""
@@ -3,26 +3,37 @@ Module for reading the value of a specific KNX group address from KNX bus.
 
 The module will
 * ... send a group_read to the selected group address.
-* ... register a callback for receiving telegrams within telegram queue.
+* ... register a callback for receiving telegrams within the read multiplexer.
 * ... check if received telegrams have the correct group address.
 * ... store the received telegram for further processing.
+
+The read multiplexer registers a single callback within telegram queue for all
+pending reads and passes received telegrams to the readers of their group address.
+A GroupValueRead is only sent if no read of the group address is in flight.
 """
 
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
+from functools import partial
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from xknx.telegram import Telegram
 from xknx.telegram.address import GroupAddress, InternalGroupAddress
 from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWrite
+from xknx.typing import TelegramCallbackType
 
 if TYPE_CHECKING:
+    from xknx.core.telegram_queue import TelegramQueue
     from xknx.xknx import XKNX
 
 logger = logging.getLogger("xknx.log")
 
+# time to wait for responses after the last GroupValueRead is sent
+READ_TIMEOUT: Final = 2.0
+
 
 class ValueReader:
     """Class for reading the value of a specific KNX group address from KNX bus."""
@@ -50,12 +61,10 @@ class ValueReader:
 
     async def read(self) -> Telegram | None:
         """Send group read and wait for response."""
-        cb_obj = self.xknx.telegram_queue.register_telegram_received_cb(
-            self.telegram_received,
-            group_addresses=[self.group_address],
-            match_for_outgoing=True,
-        )
-        self.send_group_read()
+        if self.xknx.read_multiplexer.add_reader(
+            self.group_address, self.telegram_received
+        ):
+            self.send_group_read()
 
         try:
             async with asyncio.timeout(self.timeout_in_seconds):
@@ -70,18 +79,15 @@ class ValueReader:
             return self.received_telegram
         finally:
             # cleanup to not leave callbacks (for asyncio.CancelledError)
-            self.xknx.telegram_queue.unregister_telegram_received_cb(cb_obj)
+            self.xknx.read_multiplexer.remove_reader(
+                self.group_address, self.telegram_received
+            )
 
         return None
 
     def send_group_read(self) -> None:
         """Send group read."""
-        telegram = Telegram(
-            destination_address=self.group_address,
-            payload=GroupValueRead(),
-            source_address=self.xknx.current_address,
-        )
-        self.xknx.telegrams.put_nowait(telegram)
+        send_group_read(self.xknx, self.group_address)
 
     def telegram_received(self, telegram: Telegram) -> None:
         """Test if telegram has correct group address and trigger event."""
@@ -90,3 +96,137 @@ class ValueReader:
         ):
             self.received_telegram = telegram
             self.response_received_event.set()
+
+
+def send_group_read(
+    xknx: XKNX, group_address: GroupAddress | InternalGroupAddress
+) -> None:
+    """Queue a GroupValueRead telegram."""
+    telegram = Telegram(
+        destination_address=group_address,
+        payload=GroupValueRead(),
+        source_address=xknx.current_address,
+    )
+    xknx.telegrams.put_nowait(telegram)
+
+
+class ReadMultiplexer:
+    """Class for dispatching responses of group reads to their readers."""
+
+    __slots__ = ("_in_flight", "_queue_callback", "_readers", "xknx")
+
+    def __init__(self, xknx: XKNX) -> None:
+        """Initialize ReadMultiplexer class."""
+        self.xknx = xknx
+        # dicts are used as ordered sets for constant time removal
+        self._readers: dict[
+            GroupAddress | InternalGroupAddress, dict[TelegramCallbackType, None]
+        ] = {}
+        # group addresses a GroupValueRead was sent to and not answered yet
+        self._in_flight: set[GroupAddress | InternalGroupAddress] = set()
+        self._queue_callback: TelegramQueue.Callback | None = None
+
+    def add_reader(
+        self,
+        group_address: GroupAddress | InternalGroupAddress,
+        callback: TelegramCallbackType,
+    ) -> bool:
+        """
+        Register `callback` for responses and writes to `group_address`.
+
+        Return True if no read of the group address is in flight - the caller
+        shall send a GroupValueRead then.
+        """
+        if self._queue_callback is None:
+            self._queue_callback = (
+                self.xknx.telegram_queue.register_telegram_received_cb(
+                    self.telegram_received, match_for_outgoing=True
+                )
+            )
+        self._readers.setdefault(group_address, {})[callback] = None
+        if group_address in self._in_flight:
+            return False
+        self._in_flight.add(group_address)
+        return True
+
+    def remove_reader(
+        self,
+        group_address: GroupAddress | InternalGroupAddress,
+        callback: TelegramCallbackType,
+    ) -> None:
+        """Unregister a callback registered with `add_reader()`."""
+        readers = self._readers[group_address]
+        del readers[callback]
+        if not readers:
+            # the read was answered or all its readers timed out
+            del self._readers[group_address]
+            self._in_flight.discard(group_address)
+        if not self._readers and self._queue_callback is not None:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(
+                self._queue_callback
+            )
+            self._queue_callback = None
+
+    def telegram_received(self, telegram: Telegram) -> None:
+        """Pass a response or write to the readers of its group address."""
+        group_address = telegram.destination_address
+        if not isinstance(
+            group_address, GroupAddress | InternalGroupAddress
+        ) or not isinstance(telegram.payload, GroupValueResponse | GroupValueWrite):
+            return
+        if (readers := self._readers.get(group_address)) is None:
+            return
+        # readers joining from now on wait for a new response
+        self._in_flight.discard(group_address)
+        # copy - readers may be removed when called
+        for callback in tuple(readers):
+            callback(telegram)
+
+    def default_timeout(self, reads: int) -> float:
+        """Return the time it takes to send `reads` reads at the rate limit plus READ_TIMEOUT."""
+        if self.xknx.rate_limit:
+            return READ_TIMEOUT + reads / self.xknx.rate_limit
+        return READ_TIMEOUT
+
+    async def read(
+        self,
+        group_addresses: Iterable[GroupAddress | InternalGroupAddress],
+        timeout_in_seconds: float | None = None,
+    ) -> dict[GroupAddress | InternalGroupAddress, Telegram | None]:
+        """
+        Read several group addresses at once.
+
+        GroupValueRead telegrams are queued at once and sent at the rate limit of
+        the telegram queue. Return the received telegram of every group address when
+        all of them are answered or `timeout_in_seconds` passed - None for group
+        addresses not answered in time. The timeout defaults to `default_timeout()`.
+        """
+        loop = asyncio.get_running_loop()
+        futures: dict[
+            GroupAddress | InternalGroupAddress, asyncio.Future[Telegram]
+        ] = {}
+        callbacks: dict[GroupAddress | InternalGroupAddress, TelegramCallbackType] = {}
+
+        def set_result(future: asyncio.Future[Telegram], telegram: Telegram) -> None:
+            if not future.done():
+                future.set_result(telegram)
+
+        try:
+            for group_address in group_addresses:
+                if group_address in futures:
+                    continue
+                future = futures[group_address] = loop.create_future()
+                callback = callbacks[group_address] = partial(set_result, future)
+                if self.add_reader(group_address, callback):
+                    send_group_read(self.xknx, group_address)
+            if timeout_in_seconds is None:
+                timeout_in_seconds = self.default_timeout(len(futures))
+            if futures:
+                await asyncio.wait(futures.values(), timeout=timeout_in_seconds)
+        finally:
+            for group_address, reader in callbacks.items():
+                self.remove_reader(group_address, reader)
+        return {
+            group_address: future.result() if future.done() else None
+            for group_address, future in futures.items()
+        }
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
 from xknx.telegram import Telegram
 from xknx.telegram.address import DeviceGroupAddress, GroupAddress, InternalGroupAddress
@@ -15,15 +16,19 @@ from xknx.typing import DeviceCallbackType
 
 from .device import Device
 
+if TYPE_CHECKING:
+    from xknx.core import BusLoadController
+
 
 class Devices:
     """Class for handling a vector/array of devices."""
 
-    __slots__ = ("__devices", "__index", "device_updated_cbs", "started")
+    __slots__ = ("__devices", "__index", "bus_load", "device_updated_cbs", "started")
 
-    def __init__(self, started: asyncio.Event) -> None:
+    def __init__(self, started: asyncio.Event, bus_load: BusLoadController) -> None:
         """Initialize Devices class."""
         self.started = started  # xknx.started
+        self.bus_load = bus_load  # xknx.bus_load
         self.__devices: list[Device] = []
         # group address index of registered devices; a devices group addresses are
         # fixed when its RemoteValues are created, so this can not go stale
@@ -111,5 +116,10 @@ class Devices:
                 device.process(telegram)
 
     async def sync(self) -> None:
-        """Read state of devices from KNX bus."""
-        await asyncio.gather(*[device.sync() for device in self.__devices])
+        """Read state of devices from KNX bus - paced by bus load."""
+
+        async def sync_device(device: Device) -> None:
+            async with self.bus_load.read_slot():
+                await device.sync(wait_for_result=True)
+
+        await asyncio.gather(*[sync_device(device) for device in self.__devices])
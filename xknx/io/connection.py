@@ -6,7 +6,7 @@ from enum import Enum, auto
 import os
 from typing import Any
 
-from xknx.secure import Keyring
+from xknx.secure import Keyring, SequenceNumberStore
 from xknx.telegram.address import IndividualAddress, IndividualAddressableType
 
 from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
@@ -49,6 +49,9 @@ class ConnectionConfig:
     * multicast_port: Multicast port for KNXnet/IP routing.
     * auto_reconnect: Auto reconnect to KNX/IP tunneling device if open connection was lost.
     * auto_reconnect_wait: Delay in seconds before attempting subsequent reconnects after an initial reconnect attempt fails.
+    * fast_reconnect: Reconnect tunnels without waiting for the DisconnectResponse of the lost
+        connection, request its individual address again (TCP) and repeat failed attempts after a
+        jittered, exponentially growing delay up to `auto_reconnect_wait`.
     * scan_filter: For AUTOMATIC connection, limit scan with the given filter
     * threaded: Run connection logic in separate thread to avoid concurrency issues in HA
     * secure_config: KNX Secure config to use
@@ -68,6 +71,7 @@ class ConnectionConfig:
         multicast_port: int = DEFAULT_MCAST_PORT,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        fast_reconnect: bool = False,
         scan_filter: GatewayScanFilter | None = None,
         threaded: bool = False,
         secure_config: SecureConfig | None = None,
@@ -86,6 +90,7 @@ class ConnectionConfig:
         self.multicast_port = multicast_port
         self.auto_reconnect = auto_reconnect
         self.auto_reconnect_wait = auto_reconnect_wait
+        self.fast_reconnect = fast_reconnect
         self.scan_filter = scan_filter or GatewayScanFilter()
         self.threaded = threaded
         self.secure_config = secure_config
@@ -108,6 +113,8 @@ class SecureConfig:
     * knxkeys_file_path: Full path to the knxkeys file including the file name.
     * knxkeys_password: Password to decrypt the knxkeys file.
     * keyring: Already-loaded keyring if it shouldn't be read from the knxkeys file.
+    * sequence_number_store: Persistence backend for Data Secure sequence numbers,
+      eg. `FileSequenceNumberStore`. Sequence numbers are only kept in memory if None.
     """
 
     def __init__(
@@ -121,6 +128,7 @@ class SecureConfig:
         knxkeys_file_path: str | os.PathLike[Any] | None = None,
         knxkeys_password: str | None = None,
         keyring: Keyring | None = None,
+        sequence_number_store: SequenceNumberStore | None = None,
     ) -> None:
         """Initialize SecureConfig class."""
         self.backbone_key = bytes.fromhex(backbone_key) if backbone_key else None
@@ -131,6 +139,7 @@ class SecureConfig:
         self.knxkeys_file_path = knxkeys_file_path
         self.knxkeys_password = knxkeys_password
         self.keyring = keyring
+        self.sequence_number_store = sequence_number_store
 
     def __eq__(self, other: object) -> bool:
         """Equality for SecureConfig class (used in unit tests)."""
@@ -12,10 +12,19 @@ CONNECTION_ALIVE_TIME: Final = 120
 CONNECTIONSTATE_REQUEST_TIMEOUT: Final = 10
 HEARTBEAT_RATE: Final = CONNECTION_ALIVE_TIME - (CONNECTIONSTATE_REQUEST_TIMEOUT * 5)
 
+# First wait between failed reconnect attempts of a tunnel with `fast_reconnect`.
+# It doubles with every attempt, up to `auto_reconnect_wait`.
+FAST_RECONNECT_INITIAL_WAIT: Final = 0.25
+
 # A DeviceConfigurationRequest that stays unacknowledged for this long is
 # repeated this many times, after which the connection is terminated.
 DEVICE_CONFIGURATION_REQUEST_TIMEOUT: Final = 10
 DEVICE_CONFIGURATION_REQUEST_REPETITIONS: Final = 3
+# Property requests a batch read keeps waiting for answers at the same time.
+DEVICE_CONFIGURATION_REQUEST_WINDOW: Final = 4
+
+# Gateways found by a scan are reused by automatic connections for this long.
+GATEWAY_SCAN_CACHE_TTL: Final = 300
 
 # Maximum time an authenticated secure session may remain unused (without
 # any communication over this session) until the session will be dropped.
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine, Iterable
 import logging
-from typing import Self
+from typing import Any, Final, Self, TypeVar
 
 from xknx.cemi import (
     CEMIErrorCode,
@@ -36,11 +36,20 @@ from xknx.knxip import (
     KNXIPServiceType,
 )
 from xknx.knxip.knxip_enum import ConnectRequestType
-from xknx.profile.const import ResourceObjectType, ResourcePropertyId
+from xknx.profile.const import (
+    ResourceCEMIServerPropertyId,
+    ResourceDevicePropertyId,
+    ResourceGenericPropertyId,
+    ResourceKNXNETIPPropertyId,
+    ResourceObjectType,
+    ResourcePropertyId,
+    ResourceSecureInterfacePropertyId,
+)
 
 from .const import (
     DEVICE_CONFIGURATION_REQUEST_REPETITIONS,
     DEVICE_CONFIGURATION_REQUEST_TIMEOUT,
+    DEVICE_CONFIGURATION_REQUEST_WINDOW,
 )
 from .data_connection import ConnectionHeartbeat
 from .device_management import DeviceManagement
@@ -50,6 +59,19 @@ from .transport import KNXIPTransport, TCPTransport, UDPTransport
 
 logger = logging.getLogger("xknx.log")
 
+_T = TypeVar("_T")
+
+# The number of elements of a property info is a 4 bit field.
+MAX_ELEMENTS_PER_REQUEST: Final = 15
+# Properties `dump_properties()` reads if not told otherwise - the generic ones
+# and those specific to the Interface Objects a KNXnet/IP server may have.
+_OBJECT_PROPERTY_IDS: Final[dict[ResourceObjectType, type[ResourcePropertyId]]] = {
+    ResourceObjectType.OBJECT_DEVICE: ResourceDevicePropertyId,
+    ResourceObjectType.OBJECT_CEMI_SERVER: ResourceCEMIServerPropertyId,
+    ResourceObjectType.OBJECT_KNXNETIP_PARAMETER: ResourceKNXNETIPPropertyId,
+    ResourceObjectType.OBJECT_SECURITY: ResourceSecureInterfacePropertyId,
+}
+
 
 def _same_property(one: CEMIMPropInfo, other: CEMIMPropInfo) -> bool:
     """Tell whether two property infos address the same Property."""
@@ -60,6 +82,12 @@ def _same_property(one: CEMIMPropInfo, other: CEMIMPropInfo) -> bool:
     )
 
 
+def _same_element_range(one: CEMIMPropInfo, other: CEMIMPropInfo) -> bool:
+    """Tell whether two property infos address the same elements of a Property."""
+    # A negative answer has no elements, so only the start index is compared.
+    return _same_property(one, other) and one.start_index == other.start_index
+
+
 def _format_error_code(error_code: CEMIErrorCode | int) -> str:
     """Return a readable form of an error code, defined by the spec or not."""
     if isinstance(error_code, CEMIErrorCode):
@@ -67,6 +95,24 @@ def _format_error_code(error_code: CEMIErrorCode | int) -> str:
     return f"0x{error_code:02x}"
 
 
+async def _run_concurrently(coroutines: Iterable[Coroutine[Any, Any, _T]]) -> list[_T]:
+    """
+    Run coroutines in a TaskGroup and return their results in order.
+
+    The first failure cancels the others. A CommunicationError is raised as is
+    instead of wrapped in an ExceptionGroup.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coroutine) for coroutine in coroutines]
+    except ExceptionGroup as ex_group:
+        for exception in ex_group.exceptions:
+            if isinstance(exception, CommunicationError):
+                raise exception from None
+        raise
+    return [task.result() for task in tasks]
+
+
 class _DeviceManagementConnection(ABC):
     """
     A KNXnet/IP device management connection to one server.
@@ -80,10 +126,13 @@ class _DeviceManagementConnection(ABC):
     manager.
 
     Requests are answered by the server with a cEMI frame of its own, so the
-    connection tracks which request is outstanding and returns the matching
-    answer. Frames the server sends unprompted - `M_PropInfo.ind` for the
-    evented device state, and the cEMI Transport Layer indications - go to
-    `indication_callback` instead.
+    connection tracks which requests are outstanding and returns each the
+    matching answer. Requests are sent one after another, but their answers
+    are awaited at the same time - the batch reads keep several requests in
+    flight this way instead of waiting a round trip for every one. Frames the
+    server sends unprompted - `M_PropInfo.ind` for the evented device state,
+    and the cEMI Transport Layer indications - go to `indication_callback`
+    instead.
 
     The connection is supervised: a heartbeat keeps it alive and closes it
     when the server stops answering, and a DisconnectRequest of the server
@@ -95,7 +144,7 @@ class _DeviceManagementConnection(ABC):
         "_disconnect_callback",
         "_heartbeat",
         "_pending",
-        "_request_lock",
+        "_send_lock",
         "communication_channel",
         "gateway_ip",
         "gateway_port",
@@ -123,8 +172,11 @@ class _DeviceManagementConnection(ABC):
         self.sequence_number = 0
         self._data_endpoint_addr: tuple[str, int] | None = None
         self._disconnect_callback: KNXIPTransport.Callback | None = None
-        self._pending: asyncio.Future[CEMIFrame] | None = None
-        self._request_lock = asyncio.Lock()
+        # requests awaiting an answer, in the order they were sent
+        self._pending: dict[
+            asyncio.Future[CEMIFrame], Callable[[CEMIFrame], bool] | None
+        ] = {}
+        self._send_lock = asyncio.Lock()
         self._heartbeat = ConnectionHeartbeat(
             name="Device management connection",
             send_connectionstate=self._connectionstate_request,
@@ -152,8 +204,14 @@ class _DeviceManagementConnection(ABC):
         """Stop handling DeviceConfigurationRequests the server sends."""
 
     @abstractmethod
-    async def _send_request(self, cemi: CEMIFrame) -> None:
-        """Send a request. Raise CommunicationError when that fails."""
+    async def _send_request(
+        self, cemi: CEMIFrame, answer: asyncio.Future[CEMIFrame] | None = None
+    ) -> None:
+        """
+        Send a request. Raise CommunicationError when that fails.
+
+        `answer` is the future the answer to this request is set on.
+        """
 
     async def __aenter__(self) -> Self:
         """Connect on entering a context."""
@@ -246,9 +304,9 @@ class _DeviceManagementConnection(ABC):
         if self._disconnect_callback is not None:
             self.transport.unregister_callback(self._disconnect_callback)
             self._disconnect_callback = None
-        if self._pending is not None and not self._pending.done():
-            # Fail a request waiting for an answer instead of timing it out.
-            self._pending.cancel()
+        for pending in self._pending:
+            # Fail requests waiting for an answer instead of timing them out.
+            pending.cancel()
 
     def _connection_lost(self) -> None:
         """Tear the connection state down without a Disconnect exchange."""
@@ -310,56 +368,49 @@ class _DeviceManagementConnection(ABC):
 
         `matches` tells whether a received frame is the awaited answer;
         frames it rejects - e.g. the late answer to an earlier, timed out
-        request for another property - are discarded. A retry of the very
-        same request is indistinguishable from its predecessor, so a stale
-        answer can still satisfy that. Without `matches`, the first frame
-        that is not an indication is returned. Note that xknx only parses
-        the Property service message codes, so e.g. a M_FuncProp request
-        cannot see its answer - and M_Reset.req has none at all.
+        request for another property - are left to other requests or
+        discarded. A retry of the very same request is indistinguishable from
+        its predecessor, so a stale answer can still satisfy that. Without
+        `matches`, the first frame that is not an indication and no request
+        sent earlier accepts is returned. Note that xknx only parses the
+        Property service message codes, so e.g. a M_FuncProp request cannot
+        see its answer - and M_Reset.req has none at all.
+
+        Concurrent requests are sent one after another, each once the
+        previous one is acknowledged, and wait for their answers together.
 
         Raise CommunicationError when the request is not acknowledged or the
         server does not answer it.
         """
-        # A device management connection carries one request at a time, and
-        # the sequence counter and the pending answer are shared state.
-        async with self._request_lock:
-            if self.communication_channel is None:
-                raise CommunicationError("No active device management connection.")
-            pending: asyncio.Future[CEMIFrame] = (
-                asyncio.get_running_loop().create_future()
-            )
-            self._pending = pending
-            try:
-                await self._send_request(cemi)
-                # The spec defines this timeout for the acknowledgement only;
-                # reusing it as the answer deadline is merely a sensible choice.
-                async with asyncio.timeout(DEVICE_CONFIGURATION_REQUEST_TIMEOUT):
-                    while True:
-                        answer = await pending
-                        if matches is None or matches(answer):
-                            return answer
-                        logger.debug(
-                            "Discarding cEMI frame not answering the request: %s",
-                            answer,
-                        )
-                        pending = asyncio.get_running_loop().create_future()
-                        self._pending = pending
-            except TimeoutError:
+        pending: asyncio.Future[CEMIFrame] = asyncio.get_running_loop().create_future()
+        try:
+            # The sequence counter is shared state, and over UDP a request is
+            # only sent once the previous one is acknowledged.
+            async with self._send_lock:
+                if self.communication_channel is None:
+                    raise CommunicationError("No active device management connection.")
+                self._pending[pending] = matches
+                await self._send_request(cemi, pending)
+            # The spec defines this timeout for the acknowledgement only;
+            # reusing it as the answer deadline is merely a sensible choice.
+            async with asyncio.timeout(DEVICE_CONFIGURATION_REQUEST_TIMEOUT):
+                return await pending
+        except TimeoutError:
+            raise CommunicationError(
+                f"No answer to {cemi.code} within "
+                f"{DEVICE_CONFIGURATION_REQUEST_TIMEOUT} seconds."
+            ) from None
+        except asyncio.CancelledError:
+            # A cancelled task cancels the future it awaits as well, so
+            # only a closed connection tells that `_stop()` was the one
+            # failing the request; everything else is task cancellation.
+            if pending.cancelled() and self.communication_channel is None:
                 raise CommunicationError(
-                    f"No answer to {cemi.code} within "
-                    f"{DEVICE_CONFIGURATION_REQUEST_TIMEOUT} seconds."
+                    "Device management connection was closed."
                 ) from None
-            except asyncio.CancelledError:
-                # A cancelled task cancels the future it awaits as well, so
-                # only a closed connection tells that `_stop()` was the one
-                # failing the request; everything else is task cancellation.
-                if pending.cancelled() and self.communication_channel is None:
-                    raise CommunicationError(
-                        "Device management connection was closed."
-                    ) from None
-                raise
-            finally:
-                self._pending = None
+            raise
+        finally:
+            self._pending.pop(pending, None)
 
     def _cemi_received(self, raw_cemi: bytes) -> None:
         """Handle a cEMI frame the server sent."""
@@ -384,9 +435,12 @@ class _DeviceManagementConnection(ABC):
                 except Exception:  # pylint: disable=broad-exception-caught
                     logger.exception("Unexpected error in indication_callback")
             return
-        if self._pending is not None and not self._pending.done():
-            self._pending.set_result(cemi)
-            return
+        # A server answers in order, so the earliest request accepting the
+        # frame is the one it answers.
+        for pending, matches in self._pending.items():
+            if not pending.done() and (matches is None or matches(cemi)):
+                pending.set_result(cemi)
+                return
         logger.debug("Received an unexpected cEMI frame: %s", cemi)
 
     ####################
@@ -395,6 +449,24 @@ class _DeviceManagementConnection(ABC):
     #
     ####################
 
+    async def _read_property_answer(
+        self, property_info: CEMIMPropInfo
+    ) -> CEMIMPropReadResponse:
+        """Send a M_PropRead.req and return its answer, positive or negative."""
+        answer = await self.request(
+            CEMIFrame(
+                code=CEMIMessageCode.M_PROP_READ_REQ,
+                data=CEMIMPropReadRequest(property_info=property_info),
+            ),
+            matches=lambda frame: (
+                isinstance(frame.data, CEMIMPropReadResponse)
+                and _same_element_range(frame.data.property_info, property_info)
+            ),
+        )
+        # `matches` only accepts a CEMIMPropReadResponse for these elements
+        assert isinstance(answer.data, CEMIMPropReadResponse)
+        return answer.data
+
     async def read_property(
         self,
         object_type: ResourceObjectType,
@@ -408,30 +480,152 @@ class _DeviceManagementConnection(ABC):
 
         Raise CommunicationError when the server reports an error instead.
         """
-        property_info = CEMIMPropInfo(
-            object_type=object_type,
-            object_instance=object_instance,
-            property_id=property_id,
-            number_of_elements=number_of_elements,
-            start_index=start_index,
-        )
-        answer = await self.request(
-            CEMIFrame(
-                code=CEMIMessageCode.M_PROP_READ_REQ,
-                data=CEMIMPropReadRequest(property_info=property_info),
-            ),
-            matches=lambda frame: (
-                isinstance(frame.data, CEMIMPropReadResponse)
-                and _same_property(frame.data.property_info, property_info)
-            ),
+        answer = await self._read_property_answer(
+            CEMIMPropInfo(
+                object_type=object_type,
+                object_instance=object_instance,
+                property_id=property_id,
+                number_of_elements=number_of_elements,
+                start_index=start_index,
+            )
         )
-        # `matches` only accepts a CEMIMPropReadResponse for this property
-        assert isinstance(answer.data, CEMIMPropReadResponse)
-        if (error_code := answer.data.error_code) is not None:
+        if (error_code := answer.error_code) is not None:
             raise CommunicationError(
                 f"Reading the property failed: {_format_error_code(error_code)}"
             )
-        return answer.data.data
+        return answer.data
+
+    async def read_properties(
+        self,
+        object_type: ResourceObjectType,
+        property_ids: Iterable[ResourcePropertyId | int],
+        object_instance: int = 1,
+        window: int = DEVICE_CONFIGURATION_REQUEST_WINDOW,
+    ) -> dict[ResourcePropertyId | int, bytes | None]:
+        """
+        Read the first element of several Properties of an Interface Object.
+
+        Up to `window` requests are in flight at the same time. A Property the
+        server reports an error for - e.g. one the object doesn't have - maps
+        to None. Raise CommunicationError when a request is not answered.
+        """
+        semaphore = asyncio.Semaphore(window)
+
+        async def read(property_id: ResourcePropertyId | int) -> bytes | None:
+            async with semaphore:
+                answer = await self._read_property_answer(
+                    CEMIMPropInfo(
+                        object_type=object_type,
+                        object_instance=object_instance,
+                        property_id=property_id,
+                    )
+                )
+            return answer.data if answer.error_code is None else None
+
+        property_ids = list(property_ids)
+        results = await _run_concurrently(
+            read(property_id) for property_id in property_ids
+        )
+        return dict(zip(property_ids, results, strict=True))
+
+    async def _read_elements(
+        self,
+        object_type: ResourceObjectType,
+        property_id: ResourcePropertyId | int,
+        object_instance: int,
+        semaphore: asyncio.Semaphore,
+    ) -> bytes | None:
+        """Read all elements of a Property. Return None if the server reports an error."""
+
+        async def read(number_of_elements: int, start_index: int) -> bytes | None:
+            async with semaphore:
+                answer = await self._read_property_answer(
+                    CEMIMPropInfo(
+                        object_type=object_type,
+                        object_instance=object_instance,
+                        property_id=property_id,
+                        number_of_elements=number_of_elements,
+                        start_index=start_index,
+                    )
+                )
+            if (error_code := answer.error_code) is not None:
+                logger.debug(
+                    "Reading property %s failed: %s",
+                    property_id,
+                    _format_error_code(error_code),
+                )
+                return None
+            return answer.data
+
+        # Element 0 holds the current number of elements.
+        if (current := await read(number_of_elements=1, start_index=0)) is None:
+            return None
+        count = int.from_bytes(current, "big")
+        chunks = await _run_concurrently(
+            read(
+                number_of_elements=min(MAX_ELEMENTS_PER_REQUEST, count + 1 - start),
+                start_index=start,
+            )
+            for start in range(1, count + 1, MAX_ELEMENTS_PER_REQUEST)
+        )
+        if None in chunks:
+            return None
+        return b"".join(chunk for chunk in chunks if chunk is not None)
+
+    async def read_property_elements(
+        self,
+        object_type: ResourceObjectType,
+        property_id: ResourcePropertyId | int,
+        object_instance: int = 1,
+        window: int = DEVICE_CONFIGURATION_REQUEST_WINDOW,
+    ) -> bytes:
+        """
+        Read all elements of a Property of one of the server's Interface Objects.
+
+        The number of elements is read first, then the elements in ranges of
+        up to MAX_ELEMENTS_PER_REQUEST (15) - as many a request can carry -
+        with up to `window` requests in flight.
+
+        Raise CommunicationError when the server reports an error instead.
+        """
+        data = await self._read_elements(
+            object_type, property_id, object_instance, asyncio.Semaphore(window)
+        )
+        if data is None:
+            raise CommunicationError(f"Reading property {property_id} failed.")
+        return data
+
+    async def dump_properties(
+        self,
+        object_type: ResourceObjectType,
+        object_instance: int = 1,
+        property_ids: Iterable[ResourcePropertyId | int] | None = None,
+        window: int = DEVICE_CONFIGURATION_REQUEST_WINDOW,
+    ) -> dict[ResourcePropertyId | int, bytes]:
+        """
+        Read all elements of every Property of an Interface Object.
+
+        `property_ids` default to the generic Property IDs and those specific
+        to `object_type`. Properties the server reports an error for are left
+        out. All reads share a window of `window` requests in flight.
+
+        Raise CommunicationError when a request is not answered.
+        """
+        if property_ids is None:
+            property_ids = [*ResourceGenericPropertyId]
+            if (specific := _OBJECT_PROPERTY_IDS.get(object_type)) is not None:
+                property_ids += [*specific]
+        property_ids = list(property_ids)
+        semaphore = asyncio.Semaphore(window)
+        results = await _run_concurrently(
+            self._read_elements(object_type, property_id, object_instance, semaphore)
+            for property_id in property_ids
+        )
+        return {
+            property_id: data
+            for property_id, data in zip(property_ids, results, strict=True)
+            if data is not None
+        }
 
     async def write_property(
         self,
@@ -461,7 +655,7 @@ class _DeviceManagementConnection(ABC):
             ),
             matches=lambda frame: (
                 isinstance(frame.data, CEMIMPropWriteResponse)
-                and _same_property(frame.data.property_info, property_info)
+                and _same_element_range(frame.data.property_info, property_info)
             ),
         )
         # `matches` only accepts a CEMIMPropWriteResponse for this property
@@ -547,7 +741,9 @@ class UDPDeviceManagementConnection(_DeviceManagementConnection):
             self._device_management.stop()
             self._device_management = None
 
-    async def _send_request(self, cemi: CEMIFrame) -> None:
+    async def _send_request(
+        self, cemi: CEMIFrame, answer: asyncio.Future[CEMIFrame] | None = None
+    ) -> None:
         """Send a request, repeating it while it stays unacknowledged."""
         if (channel := self.communication_channel) is None:
             raise CommunicationError("No active device management connection.")
@@ -574,9 +770,7 @@ class UDPDeviceManagementConnection(_DeviceManagementConnection):
                 acknowledged = (
                     # The acknowledgement went missing, but the answer arrived -
                     # so the server did accept the request.
-                    self._pending is not None
-                    and self._pending.done()
-                    and not self._pending.cancelled()
+                    answer is not None and answer.done() and not answer.cancelled()
                 )
             if acknowledged:
                 self.sequence_number = self.sequence_number + 1 & 0xFF
@@ -673,7 +867,9 @@ class TCPDeviceManagementConnection(_DeviceManagementConnection):
         # No acknowledgement, and the sequence counter is not evaluated.
         self._cemi_received(knxipframe.body.raw_cemi)
 
-    async def _send_request(self, cemi: CEMIFrame) -> None:
+    async def _send_request(
+        self, cemi: CEMIFrame, answer: asyncio.Future[CEMIFrame] | None = None
+    ) -> None:
         """Send a request. TCP is reliable, so it is not acknowledged."""
         if (channel := self.communication_channel) is None:
             raise CommunicationError("No active device management connection.")
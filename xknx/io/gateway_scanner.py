@@ -1,8 +1,8 @@
 """
 GatewayScanner is an abstraction for searching for KNX/IP devices on the local network.
 
-It walks through all network interfaces and sends UDP multicast
-SearchRequest and SearchRequestExtended frames.
+It sends UDP multicast SearchRequest and SearchRequestExtended frames on the
+default network interface - or on all of them at once.
 """
 
 from __future__ import annotations
@@ -10,8 +10,9 @@ from __future__ import annotations
 import asyncio
 from collections.abc import AsyncGenerator
 from functools import partial
+import ipaddress
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 from xknx.exceptions import XKNXException
 from xknx.io import util
@@ -45,6 +46,21 @@ if TYPE_CHECKING:
 logger = logging.getLogger("xknx.log")
 
 
+class _CachedScan(NamedTuple):
+    """Gateways found by a scan."""
+
+    # loop time the scan ended
+    timestamp: float
+    # False if the scan was stopped before its timeout
+    complete: bool
+    # every gateway that responded - unfiltered
+    gateways: list[GatewayDescriptor]
+
+
+# Results of previous scans by local_ip, all_interfaces, multicast group and port
+_scan_cache: dict[tuple[str | None, bool, str, int], _CachedScan] = {}
+
+
 class GatewayDescriptor:
     """Used to return information about the discovered gateways."""
 
@@ -208,7 +224,19 @@ class GatewayScanFilter:
 
 
 class GatewayScanner:
-    """Class for searching KNX/IP devices."""
+    """
+    Class for searching KNX/IP devices.
+
+    Search requests are sent on the interface of `local_ip`, the default one if
+    None, or on every local IPv4 interface at once if `all_interfaces` is set.
+    The scan ends after `timeout_in_seconds` or as soon as `stop_on_found`
+    gateways matching `scan_filter` are found.
+
+    If `cache_ttl` is set, the gateways that responded are stored and results up
+    to this many seconds old are reused: `scan()` returns them without searching
+    if that scan ran to its timeout, `async_scan()` yields them first and only
+    searches when asked for more.
+    """
 
     def __init__(
         self,
@@ -217,6 +245,8 @@ class GatewayScanner:
         timeout_in_seconds: float = 3.0,
         stop_on_found: int | None = None,
         scan_filter: GatewayScanFilter | None = None,
+        all_interfaces: bool = False,
+        cache_ttl: float = 0,
     ) -> None:
         """Initialize GatewayScanner class."""
         self.xknx = xknx
@@ -224,16 +254,79 @@ class GatewayScanner:
         self.timeout_in_seconds = timeout_in_seconds
         self.stop_on_found = stop_on_found
         self.scan_filter = scan_filter or GatewayScanFilter()
+        self.all_interfaces = all_interfaces
+        self.cache_ttl = cache_ttl
         self.found_gateways: dict[HPAI, GatewayDescriptor] = {}
+        # every gateway that responded - responses of the same gateway are merged
+        self._responses: dict[HPAI, GatewayDescriptor] = {}
         self._response_received_event = asyncio.Event()
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget the results of previous scans."""
+        _scan_cache.clear()
+
+    @property
+    def _cache_key(self) -> tuple[str | None, bool, str, int]:
+        """Return the key of this scanners results in the cache."""
+        return (
+            self.local_ip,
+            self.all_interfaces,
+            self.xknx.multicast_group,
+            self.xknx.multicast_port,
+        )
+
+    def _cached_scan(self) -> _CachedScan | None:
+        """Return the results of a previous scan younger than `cache_ttl`."""
+        if self.cache_ttl <= 0 or (cached := _scan_cache.get(self._cache_key)) is None:
+            return None
+        if asyncio.get_running_loop().time() - cached.timestamp > self.cache_ttl:
+            return None
+        return cached
+
+    def _store_scan(self, complete: bool) -> None:
+        """Store the results of this scan, unless a fresh complete one is stored."""
+        if self.cache_ttl <= 0:
+            return
+        previous = _scan_cache.get(self._cache_key)
+        now = asyncio.get_running_loop().time()
+        if (
+            not complete
+            and previous is not None
+            and previous.complete
+            and now - previous.timestamp <= self.cache_ttl
+        ):
+            return
+        _scan_cache[self._cache_key] = _CachedScan(
+            timestamp=now, complete=complete, gateways=list(self._responses.values())
+        )
+
     async def scan(self) -> list[GatewayDescriptor]:
         """Scan and return a list of GatewayDescriptors on success."""
+        if (cached := self._cached_scan()) is not None and cached.complete:
+            logger.debug("Using %s cached gateways", len(cached.gateways))
+            for gateway in cached.gateways:
+                if self.scan_filter.match(gateway):
+                    self.found_gateways[HPAI(gateway.ip_addr, gateway.port)] = gateway
+                if self._enough_found():
+                    break
+            return list(self.found_gateways.values())
         await self._scan()
         return list(self.found_gateways.values())
 
     async def async_scan(self) -> AsyncGenerator[GatewayDescriptor, None]:
-        """Search and yield found gateways."""
+        """Search and yield found gateways - those of a cached scan first."""
+        if (cached := self._cached_scan()) is not None:
+            for cached_gateway in cached.gateways:
+                if not self.scan_filter.match(cached_gateway):
+                    continue
+                self.found_gateways[
+                    HPAI(cached_gateway.ip_addr, cached_gateway.port)
+                ] = cached_gateway
+                yield cached_gateway
+                if self._enough_found():
+                    return
+            logger.debug("No cached gateway used. Scanning.")
         queue: asyncio.Queue[GatewayDescriptor | None] = asyncio.Queue()
         scan_task = asyncio.create_task(self._scan(queue=queue))
         try:
@@ -248,42 +341,85 @@ class GatewayScanner:
                 scan_task.cancel()
             await scan_task  # to bubble up exceptions
 
-    async def _scan(
-        self, queue: asyncio.Queue[GatewayDescriptor | None] | None = None
-    ) -> None:
-        """Scan for gateways."""
+    def _enough_found(self) -> bool:
+        """Return True if `stop_on_found` gateways are found."""
+        return bool(
+            self.stop_on_found and len(self.found_gateways) >= self.stop_on_found
+        )
+
+    async def _local_ips(self) -> list[str]:
+        """Return the local IPs to search on."""
+        if self.local_ip is None and self.all_interfaces:
+            return [
+                cast(str, link.ip)
+                for link in util.get_local_ips()
+                if not ipaddress.IPv4Address(link.ip).is_loopback
+            ]
         _local_ip = self.local_ip or await util.get_default_local_ip(
             remote_ip=self.xknx.multicast_group
         )
         if _local_ip is None:
+            return []
+        return [await util.validate_ip(_local_ip)]
+
+    async def _scan(
+        self, queue: asyncio.Queue[GatewayDescriptor | None] | None = None
+    ) -> None:
+        """Scan for gateways on all interfaces at once."""
+        try:
+            local_ips = await self._local_ips()
+        except XKNXException:
+            if queue is not None:
+                queue.put_nowait(None)
+            raise
+        if not local_ips:
             if queue is not None:
                 queue.put_nowait(None)
             raise XKNXException("No usable network interface found.")
-        local_ip = await util.validate_ip(_local_ip)
-        interface_name = util.get_local_interface_name(local_ip=local_ip)
-        logger.debug("Searching on %s / %s", interface_name, local_ip)
 
-        udp_transport = UDPTransport(
-            local_addr=(local_ip, 0),
-            remote_addr=(self.xknx.multicast_group, self.xknx.multicast_port),
-        )
-        udp_transport.register_callback(
-            partial(self._response_rec_callback, interface=interface_name, queue=queue),
-            [
-                KNXIPServiceType.SEARCH_RESPONSE,
-                KNXIPServiceType.SEARCH_RESPONSE_EXTENDED,
-            ],
-        )
+        udp_transports: list[UDPTransport] = []
+        for local_ip in local_ips:
+            interface_name = util.get_local_interface_name(local_ip=local_ip)
+            logger.debug("Searching on %s / %s", interface_name, local_ip)
+            udp_transport = UDPTransport(
+                local_addr=(local_ip, 0),
+                remote_addr=(self.xknx.multicast_group, self.xknx.multicast_port),
+            )
+            udp_transport.register_callback(
+                partial(
+                    self._response_rec_callback, interface=interface_name, queue=queue
+                ),
+                [
+                    KNXIPServiceType.SEARCH_RESPONSE,
+                    KNXIPServiceType.SEARCH_RESPONSE_EXTENDED,
+                ],
+            )
+            udp_transports.append(udp_transport)
+        complete = False
         try:
-            await self._send_search_requests(udp_transport=udp_transport)
+            results = await asyncio.gather(
+                *(
+                    self._send_search_requests(udp_transport=udp_transport)
+                    for udp_transport in udp_transports
+                ),
+                return_exceptions=True,
+            )
+            errors = [result for result in results if isinstance(result, Exception)]
+            if len(errors) == len(results):
+                raise errors[0]
+            for local_ip, result in zip(local_ips, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.warning("Could not search on %s: %s", local_ip, result)
             async with asyncio.timeout(self.timeout_in_seconds):
                 await self._response_received_event.wait()
         except TimeoutError:
-            pass
+            complete = True
         except asyncio.CancelledError:
             pass
         finally:
-            udp_transport.stop()
+            for udp_transport in udp_transports:
+                udp_transport.stop()
+            self._store_scan(complete=complete)
             if queue is not None:
                 queue.put_nowait(None)
 
@@ -338,18 +474,27 @@ class GatewayScanner:
                     logger.debug("Skipping SearchResponse for Core-V2 device")
                     return
 
-        gateway = GatewayDescriptor(
-            ip_addr=knx_ip_frame.body.control_endpoint.ip_addr,
-            port=knx_ip_frame.body.control_endpoint.port,
-            local_ip=udp_transport.local_addr[0],
-            local_interface=interface,
-        )
+        control_endpoint = knx_ip_frame.body.control_endpoint
+        if (gateway := self._responses.get(control_endpoint)) is None:
+            gateway = GatewayDescriptor(
+                ip_addr=control_endpoint.ip_addr,
+                port=control_endpoint.port,
+                local_ip=udp_transport.local_addr[0],
+                local_interface=interface,
+            )
+            self._responses[control_endpoint] = gateway
+        # a gateway answering on several interfaces, or with several
+        # responses, is merged into one descriptor
         gateway.parse_dibs(knx_ip_frame.body.dibs)
 
         logger.debug("Found KNX/IP device at %s: %s", source, repr(gateway))
         if self.scan_filter.match(gateway):
-            self.found_gateways[knx_ip_frame.body.control_endpoint] = gateway
-            if queue is not None:
+            if self.found_gateways.get(control_endpoint) is gateway:
+                return
+            # yielded from cache before - keep the fresh descriptor only
+            known = control_endpoint in self.found_gateways
+            self.found_gateways[control_endpoint] = gateway
+            if queue is not None and not known:
                 queue.put_nowait(gateway)
-            if self.stop_on_found and len(self.found_gateways) >= self.stop_on_found:
+            if self._enough_found():
                 self._response_received_event.set()
@@ -22,6 +22,7 @@ from xknx.exceptions import (
 from xknx.knxip import (
     HPAI,
     KNXIPFrame,
+    KNXIPHeader,
     KNXIPServiceType,
     SecureWrapper,
     SessionRequest,
@@ -30,7 +31,12 @@ from xknx.knxip import (
     TimerNotify,
 )
 from xknx.knxip.knxip_enum import SecureSessionStatusCode
+from xknx.knxip.secure_wrapper import (
+    MESSAGE_AUTHENTICATION_CODE_LENGTH,
+    SECURITY_INFORMATION_LENGTH,
+)
 from xknx.secure.security_primitives import (
+    AESCipher,
     calculate_message_authentication_code_cbc,
     decrypt_ctr,
     derive_device_authentication_password,
@@ -53,6 +59,13 @@ COUNTER_0_HANDSHAKE = (  # used in SessionResponse and SessionAuthenticate
     b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00"
 )
 MESSAGE_TAG_TUNNELLING = bytes.fromhex("00 00")  # use 0x00 0x00 for tunneling
+# offsets in SecureWrapper frames: KNX/IP header and 2 octets secure session id are
+# the additional data of the MAC, followed by sequence information, serial number and
+# message tag, encrypted data and MAC
+WRAPPER_ADDITIONAL_DATA_LENGTH: Final = KNXIPHeader.HEADERLENGTH + 2
+WRAPPER_ENCRYPTED_DATA_START: Final = (
+    KNXIPHeader.HEADERLENGTH + SECURITY_INFORMATION_LENGTH
+)
 
 # Discovery and self description are never secured
 # KNX v01.01.02 - KNX IP Secure 03.08.09 - §2.6.2 and §2.2.1.4.2
@@ -87,7 +100,7 @@ class _IPSecureTransportLayer(ABC):
     __slots__ = ()
 
     session_id: int
-    _key: bytes
+    _cipher: AESCipher  # cipher contexts of the session key
 
     @abstractmethod
     def get_sequence_information(self) -> bytes:
@@ -99,36 +112,33 @@ class _IPSecureTransportLayer(ABC):
 
     def decrypt_frame(self, encrypted_frame: KNXIPFrame) -> KNXIPFrame:
         """Unwrap and verify KNX/IP frame from SecureWrapper."""
-        # TODO: get raw data from KNXIPFrame class directly instead of recalculating it with to_knx()
         # TODO: refactor so assert isn't needed (maybe subclass SecureWrapper from KNXIPFrame instead of being an attribute)
         assert isinstance(encrypted_frame.body, SecureWrapper)
         if encrypted_frame.body.secure_session_id != self.session_id:
             raise KNXSecureValidationError("Invalid secure session id")
-
-        session_id_bytes = encrypted_frame.body.secure_session_id.to_bytes(2, "big")
-        wrapper_header = encrypted_frame.header.to_knx()
-
-        dec_frame, mac_tr = decrypt_ctr(
-            key=self._key,
-            counter_0=(
-                encrypted_frame.body.sequence_information
-                + encrypted_frame.body.serial_number
-                + encrypted_frame.body.message_tag
-                + b"\xff\x00"
-            ),
-            mac=encrypted_frame.body.message_authentication_code,
-            payload=encrypted_frame.body.encrypted_data,
-        )
-        mac_cbc = calculate_message_authentication_code_cbc(
-            key=self._key,
-            additional_data=wrapper_header + session_id_bytes,
+        # use the received data - frames not parsed from raw data are serialized
+        raw = (
+            encrypted_frame.raw
+            if encrypted_frame.raw is not None
+            else memoryview(encrypted_frame.to_knx())
+        )
+        # sequence information, serial number and message tag
+        security_information = bytes(
+            raw[WRAPPER_ADDITIONAL_DATA_LENGTH:WRAPPER_ENCRYPTED_DATA_START]
+        )
+
+        dec_frame, mac_tr = self._cipher.decrypt_ctr(
+            counter_0=security_information + b"\xff\x00",
+            mac=raw[-MESSAGE_AUTHENTICATION_CODE_LENGTH:],
+            payload=raw[
+                WRAPPER_ENCRYPTED_DATA_START:-MESSAGE_AUTHENTICATION_CODE_LENGTH
+            ],
+        )
+        mac_cbc = self._cipher.calculate_message_authentication_code_cbc(
+            # KNX/IP header and secure session id
+            additional_data=raw[:WRAPPER_ADDITIONAL_DATA_LENGTH],
             payload=dec_frame,
-            block_0=(
-                encrypted_frame.body.sequence_information
-                + encrypted_frame.body.serial_number
-                + encrypted_frame.body.message_tag
-                + len(dec_frame).to_bytes(2, "big")
-            ),
+            block_0=security_information + len(dec_frame).to_bytes(2, "big"),
         )
         if mac_cbc != mac_tr:
             raise KNXSecureValidationError(
@@ -162,8 +172,7 @@ class _IPSecureTransportLayer(ABC):
         # TODO: get header data and total_length from SecureWrapper class
         wrapper_header = bytes.fromhex("06 10 09 50") + total_length.to_bytes(2, "big")
 
-        mac_cbc = calculate_message_authentication_code_cbc(
-            key=self._key,
+        mac_cbc = self._cipher.calculate_message_authentication_code_cbc(
             additional_data=wrapper_header + self.session_id.to_bytes(2, "big"),
             payload=plain_payload,
             block_0=(
@@ -173,8 +182,7 @@ class _IPSecureTransportLayer(ABC):
                 + payload_length.to_bytes(2, "big")
             ),
         )
-        encrypted_data, mac = encrypt_data_ctr(
-            key=self._key,
+        encrypted_data, mac = self._cipher.encrypt_data_ctr(
             counter_0=(
                 sequence_information + XKNX_SERIAL_NUMBER + message_tag + b"\xff\x00"
             ),
@@ -197,9 +205,10 @@ class SecureSession(TCPTransport, _IPSecureTransportLayer):
     """Class for handling a KNXnet/IP Secure tunnelling session."""
 
     __slots__ = (
+        "_cipher",
         "_device_authentication_code",
         "_keepalive_task",
-        "_key",
+        "_next_key_pair",
         "_peer_public_key",
         "_private_key",
         "_sequence_number",
@@ -207,6 +216,7 @@ class SecureSession(TCPTransport, _IPSecureTransportLayer):
         "_session_status_handler",
         "_user_password",
         "initialized",
+        "pregenerate_key_pair",
         "public_key",
         "session_id",
         "user_id",
@@ -219,6 +229,7 @@ class SecureSession(TCPTransport, _IPSecureTransportLayer):
         user_password: str,
         device_authentication_password: str | None = None,
         connection_lost_cb: Callable[[], None] | None = None,
+        pregenerate_key_pair: bool = False,
     ) -> None:
         """Initialize SecureSession class."""
         super().__init__(
@@ -232,11 +243,14 @@ class SecureSession(TCPTransport, _IPSecureTransportLayer):
         )
         self.user_id = user_id
         self._user_password = derive_user_password(user_password)
+        self.pregenerate_key_pair = pregenerate_key_pair
 
         self._private_key: X25519PrivateKey
         self.public_key: bytes
+        # generated after a session is established - for the next one
+        self._next_key_pair: tuple[X25519PrivateKey, bytes] | None = None
         self._peer_public_key: X25519PublicKey
-        self._key: bytes  # Session Key
+        self._cipher: AESCipher  # Session Key
         self.session_id: int
 
         self._sequence_number: int = 0
@@ -248,7 +262,11 @@ class SecureSession(TCPTransport, _IPSecureTransportLayer):
     async def connect(self) -> None:
         """Connect transport."""
         await super().connect()
-        self._private_key, self.public_key = generate_ecdh_key_pair()
+        self._private_key, self.public_key = (
+            self._next_key_pair or generate_ecdh_key_pair()
+        )
+        # a key pair is never used for two sessions
+        self._next_key_pair = None
         self._sequence_number = 0
         self._sequence_number_received = -1
         request_session = Session(
@@ -278,6 +296,15 @@ class SecureSession(TCPTransport, _IPSecureTransportLayer):
         self._session_status_handler = self.register_callback(
             self._handle_session_status, [KNXIPServiceType.SESSION_STATUS]
         )
+        if self.pregenerate_key_pair:
+            # a fast reconnect doesn't need to generate a key pair before its
+            # SessionRequest - generating one takes well below a millisecond
+            asyncio.get_running_loop().call_soon(self._generate_next_key_pair)
+
+    def _generate_next_key_pair(self) -> None:
+        """Generate the key pair for the next session."""
+        if self._next_key_pair is None:
+            self._next_key_pair = generate_ecdh_key_pair()
 
     def handshake(self, session_response: SessionResponse) -> bytes:
         """
@@ -312,7 +339,8 @@ class SecureSession(TCPTransport, _IPSecureTransportLayer):
                 raise IPSecureError("SessionResponse MAC verification failed.")
         # calculate session key
         ecdh_shared_secret = self._private_key.exchange(self._peer_public_key)
-        self._key = sha256_hash(ecdh_shared_secret)[:16]
+        # a new session key for every handshake
+        self._cipher = AESCipher(sha256_hash(ecdh_shared_secret)[:16])
         # generate SessionAuthenticate MAC
         authenticate_header_data = bytes.fromhex("06 10 09 53 00 18")
         authenticate_mac_cbc = calculate_message_authentication_code_cbc(
@@ -450,7 +478,7 @@ class SecureSession(TCPTransport, _IPSecureTransportLayer):
 class SecureGroup(UDPTransport, _IPSecureTransportLayer):
     """Class for secure KNXnet/IP multicast communication."""
 
-    __slots__ = ("_key", "secure_timer")
+    __slots__ = ("_cipher", "secure_timer")
     session_id = 0  # Routing uses fixed session id 0
 
     def __init__(
@@ -466,7 +494,7 @@ class SecureGroup(UDPTransport, _IPSecureTransportLayer):
             remote_addr=remote_addr,
             multicast=True,
         )
-        self._key = backbone_key
+        self._cipher = AESCipher(backbone_key)
         self.secure_timer = SecureSequenceTimer(
             backbone_key=backbone_key,
             latency_ms=latency_ms,
@@ -550,7 +578,7 @@ class SecureSequenceTimer:
     """
 
     __slots__ = (
-        "_backbone_key",
+        "_backbone_cipher",
         "_clock_difference",
         "_expected_notify_handler",
         "_loop",
@@ -582,7 +610,7 @@ class SecureSequenceTimer:
         transport_send: Callable[[KNXIPFrame, tuple[str, int] | None], None],
     ) -> None:
         """Initialize SecureSequenceTimer class."""
-        self._backbone_key = backbone_key
+        self._backbone_cipher = AESCipher(backbone_key)
         self._clock_difference: int = 0
         self._expected_notify_handler: (
             tuple[bytes, asyncio.Future[int]]  # message_tag, synchronization future
@@ -699,14 +727,12 @@ class SecureSequenceTimer:
         b_0 = timer_bytes + serial_number + _message_tag + b"\x00\x00"
         # TODO: get header data and total_length from TimerNotify class
         #       or handle mac calculation in TimerNotify class directly
-        mac_cbc = calculate_message_authentication_code_cbc(
-            key=self._backbone_key,
+        mac_cbc = self._backbone_cipher.calculate_message_authentication_code_cbc(
             additional_data=self.TIMER_NOTIFY_HEADER,
             block_0=b_0,
         )
         c_0 = timer_bytes + serial_number + _message_tag + b"\xff\x00"
-        _, mac = encrypt_data_ctr(
-            key=self._backbone_key,
+        _, mac = self._backbone_cipher.encrypt_data_ctr(
             counter_0=c_0,
             mac_cbc=mac_cbc,
         )
@@ -737,13 +763,11 @@ class SecureSequenceTimer:
             + timer_notify.message_tag
             + b"\xff\x00"
         )
-        _, mac_tr = decrypt_ctr(
-            key=self._backbone_key,
+        _, mac_tr = self._backbone_cipher.decrypt_ctr(
             counter_0=c_0,
             mac=timer_notify.message_authentication_code,
         )
-        mac_cbc = calculate_message_authentication_code_cbc(
-            key=self._backbone_key,
+        mac_cbc = self._backbone_cipher.calculate_message_authentication_code_cbc(
             additional_data=self.TIMER_NOTIFY_HEADER,
             block_0=b_0,
         )
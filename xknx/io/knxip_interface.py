@@ -23,10 +23,11 @@ from xknx.exceptions import (
 )
 from xknx.io import util
 from xknx.secure.keyring import InterfaceType, Keyring, XMLInterface, load_keyring
+from xknx.secure.sequence_number_store import SequenceNumberStore
 from xknx.telegram import IndividualAddress
 
 from .connection import ConnectionConfig, ConnectionType
-from .const import DEFAULT_INDIVIDUAL_ADDRESS
+from .const import DEFAULT_INDIVIDUAL_ADDRESS, GATEWAY_SCAN_CACHE_TTL
 from .gateway_scanner import GatewayDescriptor, GatewayScanner
 from .routing import Routing, SecureRouting
 from .self_description import request_description
@@ -81,7 +82,9 @@ class KNXIPInterface:
         if local_ip := self.connection_config.local_ip:
             local_ip = await util.validate_ip(local_ip, address_name="Local IP")
         keyring: Keyring | None = None
+        sequence_number_store: SequenceNumberStore | None = None
         if secure_config := self.connection_config.secure_config:
+            sequence_number_store = secure_config.sequence_number_store
             if secure_config.keyring is not None:
                 keyring = secure_config.keyring
             elif (
@@ -92,7 +95,9 @@ class KNXIPInterface:
                     secure_config.knxkeys_file_path,
                     secure_config.knxkeys_password,
                 )
-        self.xknx.cemi_handler.data_secure_init(keyring=keyring)
+        self.xknx.cemi_handler.data_secure_init(
+            keyring=keyring, sequence_number_store=sequence_number_store
+        )
 
         if self.connection_config.connection_type == ConnectionType.ROUTING:
             await self._start_routing(local_ip=local_ip)
@@ -156,6 +161,8 @@ class KNXIPInterface:
             self.xknx,
             local_ip=local_ip,
             scan_filter=self.connection_config.scan_filter,
+            # gateways found shortly before are tried before searching again
+            cache_ttl=GATEWAY_SCAN_CACHE_TTL,
         ).async_scan():
             if (
                 keyring_host_filter
@@ -228,6 +235,7 @@ class KNXIPInterface:
             cemi_received_callback=self.cemi_received,
             auto_reconnect=self.connection_config.auto_reconnect,
             auto_reconnect_wait=self.connection_config.auto_reconnect_wait,
+            fast_reconnect=self.connection_config.fast_reconnect,
         )
         await self._interface.connect()
 
@@ -287,6 +295,7 @@ class KNXIPInterface:
             gateway_port=gateway_port,
             auto_reconnect=self.connection_config.auto_reconnect,
             auto_reconnect_wait=self.connection_config.auto_reconnect_wait,
+            fast_reconnect=self.connection_config.fast_reconnect,
             user_id=user_id,
             user_password=user_password,
             device_authentication_password=device_authentication_password,
@@ -382,6 +391,7 @@ class KNXIPInterface:
             cemi_received_callback=self.cemi_received,
             auto_reconnect=self.connection_config.auto_reconnect,
             auto_reconnect_wait=self.connection_config.auto_reconnect_wait,
+            fast_reconnect=self.connection_config.fast_reconnect,
         )
         await self._interface.connect()
 
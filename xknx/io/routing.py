@@ -268,6 +268,7 @@ class Routing(Interface):
             self._handle_routing_indication(knxipframe.body)
         elif isinstance(knxipframe.body, RoutingBusy):
             self._flow_control.handle_routing_busy(knxipframe.body)
+            self.xknx.bus_load.routing_busy(knxipframe.body.wait_time)
         elif isinstance(knxipframe.body, RoutingLostMessage):
             logger.warning(
                 "RoutingLostMessage received from %s - %s lost messages.",
@@ -24,9 +24,14 @@ knx_logger = logging.getLogger("xknx.knx")
 class KNXIPTransport(ABC):
     """Abstract base class for KNX/IP transports."""
 
-    __slots__ = ("callbacks", "local_hpai", "remote_addr", "transport")
+    __slots__ = (
+        "_callbacks",
+        "_service_callbacks",
+        "local_hpai",
+        "remote_addr",
+        "transport",
+    )
 
-    callbacks: list[KNXIPTransport.Callback]
     local_hpai: HPAI
     remote_addr: tuple[str, int]
     transport: asyncio.BaseTransport | None
@@ -49,36 +54,57 @@ class KNXIPTransport(ABC):
             """Test if callback is listening for given service type."""
             return not self.service_types or service_type in self.service_types
 
+    def __init__(self) -> None:
+        """Initialize KNXIPTransport class."""
+        # dicts are used as ordered sets - callbacks are called in the order
+        # they were registered and are removed in constant time
+        self._callbacks: dict[KNXIPTransport.Callback, None] = {}
+        # callbacks for any service type are stored for every service type
+        self._service_callbacks: dict[
+            KNXIPServiceType, dict[KNXIPTransport.Callback, None]
+        ] = {}
+
+    @property
+    def callbacks(self) -> list[KNXIPTransport.Callback]:
+        """Return registered callbacks."""
+        return list(self._callbacks)
+
     def register_callback(
         self,
         callback: TransportCallbackType,
         service_types: list[KNXIPServiceType] | None = None,
     ) -> KNXIPTransport.Callback:
         """Register callback."""
-        if service_types is None:
-            service_types = []
-
         callb = KNXIPTransport.Callback(callback, service_types)
-        self.callbacks.append(callb)
+        self._callbacks[callb] = None
+        for service_type in callb.service_types or KNXIPServiceType:
+            self._service_callbacks.setdefault(service_type, {})[callb] = None
         return callb
 
     def unregister_callback(self, callb: KNXIPTransport.Callback) -> None:
         """Unregister callback."""
-        self.callbacks.remove(callb)
+        try:
+            del self._callbacks[callb]
+        except KeyError:
+            raise ValueError(f"Callback not registered: {callb}") from None
+        for service_type in callb.service_types or KNXIPServiceType:
+            del self._service_callbacks[service_type][callb]
 
     def handle_knxipframe(self, knxipframe: KNXIPFrame, source: HPAI) -> None:
         """Handle KNXIP Frame and call all callbacks matching the service type ident."""
-        handled = False
-        for callback in self.callbacks:
-            if callback.has_service(knxipframe.header.service_type_ident):
-                callback.callback(knxipframe, source, self)
-                handled = True
-        if not handled:
+        callbacks = self._service_callbacks.get(knxipframe.header.service_type_ident)
+        if not callbacks:
             knx_logger.debug(
                 "Unhandled: %s from: %s",
                 knxipframe.header.service_type_ident,
                 source,
             )
+            return
+        # copy - callbacks may register or unregister callbacks when called
+        for callback in tuple(callbacks):
+            # skip callbacks unregistered by a previous one
+            if callback in callbacks:
+                callback.callback(knxipframe, source, self)
 
     @abstractmethod
     async def connect(self) -> None:
@@ -76,7 +76,7 @@ class TCPTransport(KNXIPTransport):
         self.remote_addr = remote_addr
         self.remote_hpai = HPAI(*remote_addr, protocol=HostProtocol.IPV4_TCP)
 
-        self.callbacks = []
+        super().__init__()
         self._connection_lost_cb = connection_lost_cb
         self.transport: asyncio.Transport | None = None
         self._buffer = b""
@@ -77,7 +77,7 @@ class UDPTransport(KNXIPTransport):
         self.remote_addr = remote_addr
         self.multicast = multicast
 
-        self.callbacks = []
+        super().__init__()
         self.local_addr_assigned: tuple[str, int] | None = None
         self.transport: asyncio.DatagramTransport | None = None
         self.multicast_listener: asyncio.DatagramTransport | None = None
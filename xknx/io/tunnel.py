@@ -11,6 +11,7 @@ import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 import logging
+import random
 from typing import TYPE_CHECKING
 
 from xknx.cemi import CEMIFrame
@@ -33,6 +34,7 @@ from xknx.knxip import (
 )
 from xknx.telegram import IndividualAddress
 
+from .const import FAST_RECONNECT_INITIAL_WAIT
 from .data_connection import (
     ConnectionHeartbeat,
     IncomingSequenceCounter,
@@ -57,6 +59,7 @@ class _Tunnel(Interface):
     __slots__ = (
         "_data_endpoint_addr",
         "_heartbeat",
+        "_reconnect_address",
         "_reconnect_task",
         "_requested_address",
         "_send_lock",
@@ -65,6 +68,7 @@ class _Tunnel(Interface):
         "auto_reconnect_wait",
         "cemi_received_callback",
         "communication_channel",
+        "fast_reconnect",
         "local_hpai",
         "sequence_number",
         "xknx",
@@ -79,11 +83,13 @@ class _Tunnel(Interface):
         cemi_received_callback: CEMIBytesCallbackType,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        fast_reconnect: bool = False,
     ) -> None:
         """Initialize Tunnel class."""
         self.xknx = xknx
         self.auto_reconnect = auto_reconnect
         self.auto_reconnect_wait = auto_reconnect_wait
+        self.fast_reconnect = fast_reconnect
 
         self.communication_channel: int | None = None
         self.local_hpai: HPAI = HPAI()
@@ -97,6 +103,8 @@ class _Tunnel(Interface):
         )
         self._reconnect_task: asyncio.Task[None] | None = None
         self._requested_address: IndividualAddress | None = None
+        # address of the lost tunnel requested again by a fast reconnect
+        self._reconnect_address: IndividualAddress | None = None
         self._src_address = IndividualAddress(0)
         self._send_lock = asyncio.Lock()
 
@@ -183,24 +191,34 @@ class _Tunnel(Interface):
         # no reconnect - clean up, close transport, raise
         self._prepare_disconnect()
         if self.transport.transport:
-            if self.communication_channel is not None:
-                # Don't wait for DisconnectResponse (no async here anyway)
-                disconnect_request = DisconnectRequest(
-                    communication_channel_id=self.communication_channel,
-                    control_endpoint=self.local_hpai,
-                )
-                self.transport.send(KNXIPFrame.init_from_body(disconnect_request))
+            self._send_disconnect_request()
             self.transport.stop()
         logger.warning("Tunnel connection closed. auto_reconnect is disabled.")
 
     async def _reconnect(self) -> None:
-        """Reconnect to tunnel device."""
+        """
+        Reconnect to tunnel device.
+
+        With `fast_reconnect` the DisconnectResponse for the lost tunnel is not
+        awaited, the individual address of the lost tunnel is requested again if
+        the tunnel supports that, and failed attempts are repeated after a
+        jittered, exponentially growing wait up to `auto_reconnect_wait`.
+        """
+        loop = asyncio.get_running_loop()
+        lost_at = loop.time()
         self._prepare_disconnect()
         if self.transport.transport:
-            # when server issued DisconnectRequest communication_channel is already None so this is a no-op
-            await self._disconnect_request()
+            if self.fast_reconnect:
+                # the server may be gone - don't wait for its DisconnectResponse
+                self._send_disconnect_request()
+                self.communication_channel = None
+            else:
+                # when server issued DisconnectRequest communication_channel is already None so this is a no-op
+                await self._disconnect_request()
             self._data_endpoint_addr = None
             self.transport.stop()
+        if self.fast_reconnect:
+            self._reconnect_address = self._address_to_reconnect()
 
         attempt = 1
         while True:
@@ -208,16 +226,47 @@ class _Tunnel(Interface):
                 logger.debug("Reconnecting to KNX bus... (attempt %s)", attempt)
                 await self.connect()
             except CommunicationError:
+                # the address of the lost tunnel may not be free yet
+                self._reconnect_address = None
+                wait = self._reconnect_wait(attempt)
                 attempt += 1
                 logger.debug(
                     "Reconnection to KNX bus failed. Trying again in %s seconds.",
-                    self.auto_reconnect_wait,
+                    round(wait, 2),
                 )
-                await asyncio.sleep(self.auto_reconnect_wait)
+                await asyncio.sleep(wait)
             else:
-                logger.info("Successfully reconnected to KNX bus.")
+                self._reconnect_address = None
+                duration = loop.time() - lost_at
+                self.xknx.connection_manager.last_reconnect_duration = duration
+                logger.info(
+                    "Successfully reconnected to KNX bus in %.2f seconds.", duration
+                )
                 break
 
+    def _reconnect_wait(self, attempt: int) -> float:
+        """Return the time to wait after the failed reconnect `attempt`."""
+        if not self.fast_reconnect:
+            return self.auto_reconnect_wait
+        wait = min(
+            FAST_RECONNECT_INITIAL_WAIT * 2.0 ** (attempt - 1), self.auto_reconnect_wait
+        )
+        # spread reconnects of many clients after a gateway restart
+        return wait * random.uniform(0.5, 1.0)
+
+    def _address_to_reconnect(self) -> IndividualAddress | None:
+        """Return the individual address to request on a fast reconnect."""
+        return None
+
+    def _send_disconnect_request(self) -> None:
+        """Send a DisconnectRequest without waiting for the DisconnectResponse."""
+        if self.communication_channel is not None:
+            disconnect_request = DisconnectRequest(
+                communication_channel_id=self.communication_channel,
+                control_endpoint=self.local_hpai,
+            )
+            self.transport.send(KNXIPFrame.init_from_body(disconnect_request))
+
     def _prepare_disconnect(self) -> None:
         """Prepare for disconnect. Stop tunnel related tasks and set connection state."""
         self.stop_heartbeat()
@@ -250,7 +299,9 @@ class _Tunnel(Interface):
         connect = Connect(
             transport=self.transport,
             local_hpai=self.local_hpai,
-            cri=ConnectRequestInformation(individual_address=self._requested_address),
+            cri=ConnectRequestInformation(
+                individual_address=self._requested_address or self._reconnect_address
+            ),
         )
         response = await connect.request()
         self.communication_channel = response.communication_channel
@@ -450,6 +501,7 @@ class UDPTunnel(_Tunnel):
         route_back: bool = False,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        fast_reconnect: bool = False,
     ) -> None:
         """Initialize Tunnel class."""
         self.gateway_ip = gateway_ip
@@ -462,6 +514,7 @@ class UDPTunnel(_Tunnel):
             cemi_received_callback=cemi_received_callback,
             auto_reconnect=auto_reconnect,
             auto_reconnect_wait=auto_reconnect_wait,
+            fast_reconnect=fast_reconnect,
         )
         self._sequence = IncomingSequenceCounter()
         self._invalid_sequence_number_reconnect_task: asyncio.Task[None] | None = None
@@ -681,6 +734,7 @@ class TCPTunnel(_Tunnel):
         individual_address: IndividualAddress | None = None,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        fast_reconnect: bool = False,
     ) -> None:
         """Initialize Tunnel class."""
         self.gateway_ip = gateway_ip
@@ -690,6 +744,7 @@ class TCPTunnel(_Tunnel):
             cemi_received_callback=cemi_received_callback,
             auto_reconnect=auto_reconnect,
             auto_reconnect_wait=auto_reconnect_wait,
+            fast_reconnect=fast_reconnect,
         )
         # TCP always uses 0.0.0.0:0
         self.local_hpai = HPAI(protocol=HostProtocol.IPV4_TCP)
@@ -705,6 +760,12 @@ class TCPTunnel(_Tunnel):
     async def setup_tunnel(self) -> None:
         """Set up tunnel before sending a ConnectionRequest."""
 
+    def _address_to_reconnect(self) -> IndividualAddress | None:
+        """Return the individual address of the lost tunnel - requestable over TCP."""
+        if self._src_address.raw == 0:
+            return None
+        return self._src_address
+
     async def _send_tunnelling_request(self, frame: TunnellingRequest) -> None:
         """Send Telegram to tunnelling device."""
         self.transport.send(KNXIPFrame.init_from_body(frame))
@@ -729,6 +790,7 @@ class SecureTunnel(TCPTunnel):
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
         device_authentication_password: str | None = None,
+        fast_reconnect: bool = False,
     ) -> None:
         """Initialize SecureTunnel class."""
         self._device_authentication_password = device_authentication_password
@@ -741,8 +803,13 @@ class SecureTunnel(TCPTunnel):
             gateway_port=gateway_port,
             auto_reconnect=auto_reconnect,
             auto_reconnect_wait=auto_reconnect_wait,
+            fast_reconnect=fast_reconnect,
         )
 
+    def _address_to_reconnect(self) -> IndividualAddress | None:
+        """Return None - the address of a secure tunnel is bound to its user_id."""
+        return None
+
     def _init_transport(self) -> None:
         """Initialize transport transport."""
         self.transport = SecureSession(
@@ -751,4 +818,5 @@ class SecureTunnel(TCPTunnel):
             user_password=self._user_password,
             device_authentication_password=self._device_authentication_password,
             connection_lost_cb=self._tunnel_lost,
+            pregenerate_key_pair=self.fast_reconnect,
         )
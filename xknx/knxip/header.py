@@ -20,6 +20,8 @@ class KNXIPHeader:
         """Initialize KNXIPHeader class."""
         self.service_type_ident = KNXIPServiceType.ROUTING_INDICATION
         self.total_length = 0  # to be set later
+        # received data of the header - None if the header was not parsed from raw data
+        self.raw: memoryview | None = None
 
     def from_knx(self, data: bytes) -> int:
         """Parse/deserialize from KNX/IP raw data."""
@@ -38,6 +40,7 @@ class KNXIPHeader:
             raise CouldNotParseKNXIP(
                 f"KNXIPServiceType unknown: 0x{data[2:4].hex()}"
             ) from None
+        self.raw = memoryview(data)[: KNXIPHeader.HEADERLENGTH]
         return KNXIPHeader.HEADERLENGTH
 
     def set_length(self, body: KNXIPBody) -> None:
@@ -65,5 +68,9 @@ class KNXIPHeader:
         )
 
     def __eq__(self, other: object) -> bool:
-        """Equal operator."""
-        return self.__dict__ == other.__dict__
+        """Equal operator. Received raw data is not compared."""
+        return (
+            isinstance(other, KNXIPHeader)
+            and self.service_type_ident == other.service_type_ident
+            and self.total_length == other.total_length
+        )
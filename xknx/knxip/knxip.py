@@ -48,10 +48,14 @@ from .tunnelling_request import TunnellingRequest
 class KNXIPFrame:
     """Class for KNX/IP Frames."""
 
-    def __init__(self, header: KNXIPHeader, body: KNXIPBody) -> None:
+    def __init__(
+        self, header: KNXIPHeader, body: KNXIPBody, raw: memoryview | None = None
+    ) -> None:
         """Initialize object."""
         self.header = header
         self.body = body
+        # received data of the frame - None if the frame was not parsed from raw data
+        self.raw = raw
 
     @staticmethod
     def init_from_body(knxip_body: KNXIPBody) -> KNXIPFrame:
@@ -75,6 +79,8 @@ class KNXIPFrame:
         pos_body = header.from_knx(data)
         if len(data) < header.total_length:
             raise IncompleteKNXIPFrame("Incomplete data for KNXIPFrame")
+        # view of the received data - not copied
+        raw = memoryview(data)[: header.total_length]
         # limit data to self.header.total_length for streaming socket data
         raw_body = data[pos_body : header.total_length]
 
@@ -147,7 +153,8 @@ class KNXIPFrame:
                 f"KNXIPServiceType not implemented: {header.service_type_ident.name}"
             )
         body.from_knx(raw_body)
-        return KNXIPFrame(header=header, body=body), data[header.total_length :]
+        knxipframe = KNXIPFrame(header=header, body=body, raw=raw)
+        return knxipframe, data[header.total_length :]
 
     def to_knx(self) -> bytes:
         """Serialize to KNX/IP raw data."""
@@ -158,5 +165,9 @@ class KNXIPFrame:
         return f'<KNXIPFrame {self.header} body="{self.body}" />'
 
     def __eq__(self, other: object) -> bool:
-        """Equal operator."""
-        return self.__dict__ == other.__dict__
+        """Equal operator. Received raw data is not compared."""
+        return (
+            isinstance(other, KNXIPFrame)
+            and self.header == other.header
+            and self.body == other.body
+        )
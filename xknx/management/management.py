@@ -33,18 +33,51 @@ logger = logging.getLogger("xknx.management")
 
 MANAGAMENT_ACK_TIMEOUT = 3
 MANAGAMENT_CONNECTION_TIMEOUT = 6
+# devices close transport layer connections after 6 seconds without telegrams
+MANAGEMENT_CONNECTION_IDLE_TIMEOUT = 4
+
+
+class _PooledConnection:
+    """A point-to-point connection kept open between uses."""
+
+    __slots__ = ("connection", "idle_handle", "lock", "users")
+
+    def __init__(self) -> None:
+        """Initialize _PooledConnection class."""
+        self.connection: P2PConnection | None = None
+        self.idle_handle: asyncio.TimerHandle | None = None
+        # serializes requests - a transport layer connection has one telegram in flight
+        self.lock = asyncio.Lock()
+        # borrowers holding or waiting for the lock
+        self.users = 0
 
 
 class Management:
     """Class for management procedures as described in KNX-Standard 3.5.2."""
 
-    __slots__ = ("_broadcast_contexts", "_connections", "xknx")
+    __slots__ = (
+        "_broadcast_contexts",
+        "_connections",
+        "_pool",
+        "connection_idle_timeout",
+        "xknx",
+    )
+
+    def __init__(self, xknx: XKNX, connection_idle_timeout: float = 0) -> None:
+        """
+        Initialize Management class.
 
-    def __init__(self, xknx: XKNX) -> None:
-        """Initialize Management class."""
+        If `connection_idle_timeout` is set, connections provided by `connection()` are
+        kept open for this many seconds after their use, so following procedures for
+        the same device don't have to connect again. It should be shorter than
+        the transport layer connection timeout of the devices (6 seconds) - see
+        MANAGEMENT_CONNECTION_IDLE_TIMEOUT.
+        """
         self.xknx = xknx
+        self.connection_idle_timeout = connection_idle_timeout
         self._connections: dict[IndividualAddress, P2PConnection] = {}
         self._broadcast_contexts: set[BroadcastContext] = set()
+        self._pool: dict[IndividualAddress, _PooledConnection] = {}
 
     def process(self, telegram: Telegram) -> None:
         """Process incoming telegrams."""
@@ -126,12 +159,92 @@ class Management:
     async def connection(
         self, address: IndividualAddress, rate_limit: int = 20
     ) -> AsyncIterator[P2PConnection]:
-        """Provide a point-to-point connection to a KNX device."""
-        conn = await self.connect(address, rate_limit)
+        """
+        Provide a point-to-point connection to a KNX device.
+
+        With `connection_idle_timeout` set, the connection is borrowed from a pool:
+        users of the same device wait for each other, different devices are used in
+        parallel. The connection is closed when it was idle for the timeout, the
+        peer disconnected, it was marked not `reusable` or an exception occurred.
+        """
+        if not self.connection_idle_timeout:
+            conn = await self.connect(address, rate_limit)
+            try:
+                yield conn
+            finally:
+                await self.disconnect(address)
+            return
+
+        pooled = self._pool.get(address)
+        if pooled is None:
+            pooled = self._pool[address] = _PooledConnection()
+        pooled.users += 1
         try:
-            yield conn
+            async with pooled.lock:
+                if pooled.idle_handle is not None:
+                    pooled.idle_handle.cancel()
+                    pooled.idle_handle = None
+                if pooled.connection is not None and not pooled.connection.connected:
+                    # peer disconnected while idle
+                    pooled.connection = None
+                    self._connections.pop(address, None)
+                if pooled.connection is None:
+                    pooled.connection = await self.connect(address, rate_limit)
+                conn = pooled.connection
+                conn.rate_limit = rate_limit
+                reuse = False
+                try:
+                    yield conn
+                    reuse = conn.connected and conn.reusable
+                finally:
+                    if reuse:
+                        pooled.idle_handle = asyncio.get_running_loop().call_later(
+                            self.connection_idle_timeout, self._evict, address
+                        )
+                    else:
+                        pooled.connection = None
+                        await self.disconnect(address)
         finally:
-            await self.disconnect(address)
+            pooled.users -= 1
+            if (
+                pooled.users == 0
+                and pooled.connection is None
+                and self._pool.get(address) is pooled
+            ):
+                del self._pool[address]
+
+    def _evict(self, address: IndividualAddress) -> None:
+        """Close an idle pooled connection."""
+        pooled = self._pool.get(address)
+        if pooled is None or pooled.users:
+            return
+        pooled.idle_handle = None
+        self.xknx.task_registry.background(self._close_pooled(address))
+
+    async def _close_pooled(self, address: IndividualAddress) -> None:
+        """Close a pooled connection unless it is in use."""
+        pooled = self._pool.get(address)
+        if pooled is None or pooled.users or pooled.connection is None:
+            return
+        if pooled.idle_handle is not None:
+            pooled.idle_handle.cancel()
+            pooled.idle_handle = None
+        # the entry stays in the pool while closing - borrowers arriving meanwhile
+        # wait for the lock and connect again
+        async with pooled.lock:
+            pooled.connection = None
+            logger.debug("Closing idle connection to %s", address)
+            try:
+                await self.disconnect(address)
+            except ManagementConnectionError as exc:
+                logger.debug("Closing idle connection to %s failed: %s", address, exc)
+        if not pooled.users and self._pool.get(address) is pooled:
+            del self._pool[address]
+
+    async def stop(self) -> None:
+        """Close connections kept open by the pool."""
+        for address in list(self._pool):
+            await self._close_pooled(address)
 
     async def send_broadcast(self, payload: APCI) -> None:
         """Send a broadcast message."""
@@ -191,6 +304,7 @@ class P2PConnection:
         "address",
         "disconnect_hook",
         "rate_limit",
+        "reusable",
         "sequence_number",
         "xknx",
     )
@@ -203,6 +317,8 @@ class P2PConnection:
         self.address = address
         self.disconnect_hook: Callable[[], None]
         self.rate_limit = rate_limit
+        # False if the connection can't be kept open for later use - eg. after a restart
+        self.reusable = True
 
         self.sequence_number = self._sequence_number_generator()
         self._expected_sequence_number = 0
@@ -215,6 +331,11 @@ class P2PConnection:
             asyncio.get_event_loop().create_future()
         )
 
+    @property
+    def connected(self) -> bool:
+        """Return if the connection is established and not disconnected by the peer."""
+        return self._connected
+
     @staticmethod
     def _sequence_number_generator() -> Generator[int, None, None]:
         """Generate sequence numbers."""
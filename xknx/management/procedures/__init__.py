@@ -39,17 +39,27 @@ When adding a new procedure follow the workflow:
 # ruff: noqa: F401
 from .device import (
     FREE_ACCESS_KEY,
+    DeviceInfo,
+    DeviceInventory,
+    dm_memory_read,
+    dm_memory_read_conn,
     dm_restart,
     dm_restart_r_co,
     dmp_authorize2_r_co,
     dmp_authorize_r_co,
     dmp_connect_r_co,
+    dmp_device_info_read_r_co,
+    dmp_max_apdu_length_read_r_co,
 )
 from .network import (
+    ScanResult,
     nm_individual_address_check,
     nm_individual_address_check_conn,
     nm_individual_address_read,
     nm_individual_address_serial_number_read,
     nm_individual_address_serial_number_write,
     nm_individual_address_write,
+    scan_area,
+    scan_individual_addresses,
+    scan_line,
 )
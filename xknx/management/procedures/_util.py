@@ -0,0 +1,42 @@
+"""Helpers shared by management procedures."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+async def run_windowed(
+    function: Callable[[_T], Coroutine[Any, Any, _R]],
+    items: Iterable[_T],
+    window: int,
+) -> AsyncGenerator[_R, None]:
+    """
+    Run `function` for every item with at most `window` calls at the same time.
+
+    Results are yielded in the order the calls complete. Pending calls are
+    cancelled when the iteration is stopped early.
+    """
+    items_iter = iter(items)
+    pending: set[asyncio.Task[_R]] = set()
+    try:
+        while True:
+            for item in items_iter:
+                pending.add(asyncio.create_task(function(item)))
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
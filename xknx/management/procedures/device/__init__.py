@@ -3,4 +3,10 @@
 # ruff: noqa: F401
 from .dm_authorize import FREE_ACCESS_KEY, dmp_authorize2_r_co, dmp_authorize_r_co
 from .dm_connect_r_co import dmp_connect_r_co
+from .dm_memory_read import (
+    dm_memory_read,
+    dm_memory_read_conn,
+    dmp_max_apdu_length_read_r_co,
+)
 from .dm_restart_r_co import dm_restart, dm_restart_r_co
+from .inventory import DeviceInfo, DeviceInventory, dmp_device_info_read_r_co
@@ -0,0 +1,218 @@
+"""DM_MemRead — KNX v02.01.02 - Management Procedures 03.05.02 - Device Management."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import TYPE_CHECKING, Final
+
+from xknx.exceptions import ManagementConnectionError, ManagementConnectionTimeout
+from xknx.management.management import P2PConnection
+from xknx.profile.const import ResourceDevicePropertyId
+from xknx.telegram import apci
+from xknx.telegram.address import IndividualAddress, IndividualAddressableType
+
+if TYPE_CHECKING:
+    from xknx import XKNX
+
+logger = logging.getLogger("xknx.management.procedures")
+
+__all__ = [
+    "dm_memory_read",
+    "dm_memory_read_conn",
+    "dmp_max_apdu_length_read_r_co",
+]
+
+# APDU length of a standard frame - supported by every device
+DEFAULT_MAX_APDU_LENGTH: Final = 15
+# octets of A_Memory_Response / A_MemoryExtended_Read_Response APDUs besides the data
+MEMORY_RESPONSE_OVERHEAD: Final = 3
+MEMORY_EXTENDED_RESPONSE_OVERHEAD: Final = 5
+MEMORY_READ_MAX_COUNT: Final = 0x3F
+MEMORY_EXTENDED_READ_MAX_COUNT: Final = 250
+MEMORY_READ_MAX_ADDRESS: Final = 0xFFFF
+MEMORY_EXTENDED_READ_MAX_ADDRESS: Final = 0xFFFFFF
+
+
+class _NegativeReturnCodeError(ManagementConnectionError):
+    """A_MemoryExtended_Read was answered with a negative return code."""
+
+
+async def dmp_max_apdu_length_read_r_co(conn: P2PConnection) -> int:
+    """
+    Read the maximum APDU length of a device from its Device Object.
+
+    Returns DEFAULT_MAX_APDU_LENGTH if the device doesn't provide
+    PID_MAX_APDU_LENGTH or doesn't answer PropertyValueRead.
+
+    :param conn: an established P2P connection to the device
+    """
+    try:
+        response = await conn.request(
+            payload=apci.PropertyValueRead(
+                # the Device Object is always at index 0
+                object_index=0,
+                property_id=ResourceDevicePropertyId.PID_MAX_APDU_LENGTH,
+                count=1,
+                start_index=1,
+            )
+        )
+    except ManagementConnectionTimeout as ex:
+        logger.debug("%s: no answer to PropertyValueRead. %s", conn.address, ex)
+        return DEFAULT_MAX_APDU_LENGTH
+    if response.payload.count == 0 or len(response.payload.data) != 2:
+        logger.debug("%s: PID_MAX_APDU_LENGTH not available.", conn.address)
+        return DEFAULT_MAX_APDU_LENGTH
+    return max(int.from_bytes(response.payload.data, "big"), DEFAULT_MAX_APDU_LENGTH)
+
+
+async def dm_memory_read_conn(
+    conn: P2PConnection,
+    start: int,
+    length: int,
+    max_apdu_length: int | None = None,
+    extended: bool | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> bytearray:
+    """
+    Read a memory range of a device on an already-open connection.
+
+    The range is read in chunks as large as the maximum APDU length of the
+    device allows. A transport layer connection has only one telegram in
+    flight, so fewer and larger chunks are what makes long reads fast.
+
+    :param conn: an established P2P connection to the device
+    :param start: first memory address to read
+    :param length: number of bytes to read
+    :param max_apdu_length: maximum APDU length supported by the device -
+        read from its Device Object if None
+    :param extended: use A_MemoryExtended_Read instead of A_Memory_Read. If None,
+        it is used when the range exceeds 64 KiB or the device supports chunks
+        larger than A_Memory_Read can carry (63 bytes). In the latter case reading
+        falls back to A_Memory_Read if the device doesn't answer the first
+        A_MemoryExtended_Read or answers it with a negative return code.
+    :param progress: called with the number of bytes read so far and `length`
+        after every chunk
+    :return: the memory content
+    """
+    if max_apdu_length is None:
+        max_apdu_length = await dmp_max_apdu_length_read_r_co(conn)
+    memory_read_chunk = min(
+        max_apdu_length - MEMORY_RESPONSE_OVERHEAD, MEMORY_READ_MAX_COUNT
+    )
+    extended_read_chunk = min(
+        max_apdu_length - MEMORY_EXTENDED_RESPONSE_OVERHEAD,
+        MEMORY_EXTENDED_READ_MAX_COUNT,
+    )
+    end = start + length
+    # fall back to A_Memory_Read if the first A_MemoryExtended_Read fails
+    fallback = False
+    if extended is None:
+        extended = (
+            end - 1 > MEMORY_READ_MAX_ADDRESS or extended_read_chunk > memory_read_chunk
+        )
+        # large frames don't imply the device supports A_MemoryExtended_Read
+        fallback = extended and end - 1 <= MEMORY_READ_MAX_ADDRESS
+    max_address = (
+        MEMORY_EXTENDED_READ_MAX_ADDRESS if extended else MEMORY_READ_MAX_ADDRESS
+    )
+    if start < 0 or length < 0 or end - 1 > max_address:
+        raise ValueError(
+            f"Memory range {start:#x} - {end:#x} out of range (0..{max_address:#x})"
+        )
+    chunk_size = extended_read_chunk if extended else memory_read_chunk
+    logger.debug(
+        "%s: reading %s bytes at %#x in chunks of %s bytes using %s",
+        conn.address,
+        length,
+        start,
+        chunk_size,
+        "A_MemoryExtended_Read" if extended else "A_Memory_Read",
+    )
+
+    data = bytearray()
+    address = start
+    while address < end:
+        count = min(chunk_size, end - address)
+        if extended:
+            try:
+                data += await _memory_extended_read(conn, address, count)
+            except (ManagementConnectionTimeout, _NegativeReturnCodeError) as ex:
+                if not fallback:
+                    raise
+                logger.debug(
+                    "%s: A_MemoryExtended_Read failed, using A_Memory_Read. %s",
+                    conn.address,
+                    ex,
+                )
+                extended = fallback = False
+                chunk_size = memory_read_chunk
+                continue
+            fallback = False
+        else:
+            data += await _memory_read(conn, address, count)
+        address += count
+        if progress is not None:
+            progress(len(data), length)
+    return data
+
+
+async def _memory_read(conn: P2PConnection, address: int, count: int) -> bytes:
+    """Read a chunk with A_Memory_Read."""
+    response = await conn.request(payload=apci.MemoryRead(address=address, count=count))
+    if response.payload.address != address or len(response.payload.data) != count:
+        # a count of 0 signals missing access rights or an invalid range
+        raise ManagementConnectionError(
+            f"Could not read {count} bytes of memory at {address:#x} from {conn.address}"
+        )
+    return response.payload.data
+
+
+async def _memory_extended_read(conn: P2PConnection, address: int, count: int) -> bytes:
+    """Read a chunk with A_MemoryExtended_Read."""
+    response = await conn.request(
+        payload=apci.MemoryExtendedRead(address=address, count=count)
+    )
+    if response.payload.return_code != apci.ReturnCode.E_SUCCESS.value:
+        try:
+            return_code = apci.ReturnCode(response.payload.return_code).name
+        except ValueError:
+            return_code = hex(response.payload.return_code)
+        raise _NegativeReturnCodeError(
+            f"Could not read {count} bytes of memory at {address:#x} from {conn.address}: {return_code}"
+        )
+    if response.payload.address != address or len(response.payload.data) != count:
+        raise ManagementConnectionError(
+            f"Could not read {count} bytes of memory at {address:#x} from {conn.address}"
+        )
+    return response.payload.data
+
+
+async def dm_memory_read(
+    xknx: XKNX,
+    individual_address: IndividualAddressableType,
+    start: int,
+    length: int,
+    max_apdu_length: int | None = None,
+    extended: bool | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> bytearray:
+    """
+    Read a memory range of a device, opening and closing a connection to it.
+
+    See `dm_memory_read_conn` for the parameters.
+
+    :param xknx: the XKNX object
+    :param individual_address: address of the device to read from
+    """
+    async with xknx.management.connection(
+        IndividualAddress(individual_address)
+    ) as conn:
+        return await dm_memory_read_conn(
+            conn,
+            start,
+            length,
+            max_apdu_length=max_apdu_length,
+            extended=extended,
+            progress=progress,
+        )
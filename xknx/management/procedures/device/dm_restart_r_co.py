@@ -22,6 +22,8 @@ async def dm_restart_r_co(conn: P2PConnection) -> None:
     :param conn: an established P2P connection to the device
     """
     logger.debug("Requesting a Basic Restart of %s.", conn.address)
+    # the device drops its transport layer connection when restarting
+    conn.reusable = False
     await conn.send_data(apci.Restart(), wait_for_ack=False)
 
 
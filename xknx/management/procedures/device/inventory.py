@@ -0,0 +1,298 @@
+"""
+Device inventory collected over management connections.
+
+Not a procedure of the KNX specification: the device descriptor and the identification
+properties of the Device Object are read from many devices - each in a single
+connection, several devices at once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Callable, Iterable
+from contextlib import aclosing
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+from xknx.exceptions import ManagementConnectionError, ManagementConnectionTimeout
+from xknx.management.management import P2PConnection
+from xknx.management.procedures._util import run_windowed
+from xknx.management.procedures.device.dm_connect_r_co import dmp_connect_r_co
+from xknx.profile.const import ResourceGenericPropertyId
+from xknx.telegram import apci
+from xknx.telegram.address import IndividualAddress, IndividualAddressableType
+
+if TYPE_CHECKING:
+    from xknx import XKNX
+
+logger = logging.getLogger("xknx.management.procedures")
+
+__all__ = ["DeviceInfo", "DeviceInventory", "dmp_device_info_read_r_co"]
+
+DEFAULT_INVENTORY_TTL: Final = 24 * 60 * 60
+DEFAULT_INVENTORY_WINDOW: Final = 8
+
+
+class DeviceInfo(NamedTuple):
+    """Identification of a device."""
+
+    individual_address: IndividualAddress
+    # Device Descriptor Type 0 (mask version)
+    device_descriptor: int
+    # properties of the Device Object - None if not provided by the device
+    serial_number: bytes | None
+    manufacturer_id: int | None
+    program_version: bytes | None
+    order_info: bytes | None
+    # time.time() when the device was read
+    timestamp: float
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable dict."""
+        return {
+            "individual_address": str(self.individual_address),
+            "device_descriptor": self.device_descriptor,
+            "serial_number": _hex_or_none(self.serial_number),
+            "manufacturer_id": self.manufacturer_id,
+            "program_version": _hex_or_none(self.program_version),
+            "order_info": _hex_or_none(self.order_info),
+            "timestamp": self.timestamp,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DeviceInfo:
+        """Parse from a dict returned by `as_dict()`."""
+        return cls(
+            individual_address=IndividualAddress(data["individual_address"]),
+            device_descriptor=int(data["device_descriptor"]),
+            serial_number=_bytes_or_none(data["serial_number"]),
+            manufacturer_id=data["manufacturer_id"],
+            program_version=_bytes_or_none(data["program_version"]),
+            order_info=_bytes_or_none(data["order_info"]),
+            timestamp=float(data["timestamp"]),
+        )
+
+
+def _hex_or_none(value: bytes | None) -> str | None:
+    return None if value is None else value.hex()
+
+
+def _bytes_or_none(value: str | None) -> bytes | None:
+    return None if value is None else bytes.fromhex(value)
+
+
+class _PropertyNotSupported(Exception):
+    """Device doesn't answer PropertyValueRead at all."""
+
+
+async def _device_object_property_read(
+    conn: P2PConnection, property_id: ResourceGenericPropertyId
+) -> bytes | None:
+    """Read a property of the Device Object. Return None if not available."""
+    try:
+        response = await conn.request(
+            payload=apci.PropertyValueRead(
+                # the Device Object is always at index 0
+                object_index=0,
+                property_id=property_id,
+                count=1,
+                start_index=1,
+            )
+        )
+    except ManagementConnectionTimeout as ex:
+        raise _PropertyNotSupported from ex
+    if response.payload.count == 0:
+        return None
+    return response.payload.data
+
+
+async def dmp_device_info_read_r_co(
+    conn: P2PConnection,
+    known_device: Callable[[bytes, int], DeviceInfo | None] | None = None,
+) -> DeviceInfo:
+    """
+    Read device descriptor and identification properties on an open connection.
+
+    Devices without interface objects don't answer PropertyValueRead - their
+    properties are None after the first read timed out.
+
+    :param conn: an established P2P connection to the device
+    :param known_device: called with the serial number and device descriptor
+        after reading them - if it returns a DeviceInfo, the remaining
+        properties are not read again
+    :return: DeviceInfo of the device
+    """
+    device_descriptor = await dmp_connect_r_co(conn)
+    timestamp = time.time()
+    serial_number = manufacturer_id = program_version = order_info = None
+    try:
+        serial_number = await _device_object_property_read(
+            conn, ResourceGenericPropertyId.PID_SERIAL_NUMBER
+        )
+        if (
+            serial_number is not None
+            and known_device is not None
+            and (info := known_device(serial_number, device_descriptor)) is not None
+        ):
+            logger.debug("%s: using cached device info", conn.address)
+            return info._replace(individual_address=conn.address)
+        if manufacturer := await _device_object_property_read(
+            conn, ResourceGenericPropertyId.PID_MANUFACTURER_ID
+        ):
+            manufacturer_id = int.from_bytes(manufacturer, "big")
+        program_version = await _device_object_property_read(
+            conn, ResourceGenericPropertyId.PID_PROGRAM_VERSION
+        )
+        order_info = await _device_object_property_read(
+            conn, ResourceGenericPropertyId.PID_ORDER_INFO
+        )
+    except _PropertyNotSupported:
+        logger.debug("%s: PropertyValueRead not answered", conn.address)
+    return DeviceInfo(
+        individual_address=conn.address,
+        device_descriptor=device_descriptor,
+        serial_number=serial_number,
+        manufacturer_id=manufacturer_id,
+        program_version=program_version,
+        order_info=order_info,
+        timestamp=timestamp,
+    )
+
+
+class DeviceInventory:
+    """
+    Collect DeviceInfo of many devices.
+
+    Devices are read in parallel sessions - at most `window` at once, each waiting
+    for a read slot of `xknx.bus_load`. Results are kept for `ttl` seconds: a device
+    read within this time isn't read again, a device found at another address by its
+    serial number only has its serial number read. If `path` is given, every result
+    is appended to this file as JSON line and loaded on initialization, so an
+    interrupted collection resumes where it stopped.
+    """
+
+    __slots__ = (
+        "_by_serial_number",
+        "devices",
+        "errors",
+        "path",
+        "ttl",
+        "window",
+        "xknx",
+    )
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        path: str | os.PathLike[Any] | None = None,
+        ttl: float = DEFAULT_INVENTORY_TTL,
+        window: int = DEFAULT_INVENTORY_WINDOW,
+    ) -> None:
+        """Initialize DeviceInventory class."""
+        self.xknx = xknx
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self.window = window
+        self.devices: dict[IndividualAddress, DeviceInfo] = {}
+        # exception of the last failed read of an address
+        self.errors: dict[IndividualAddress, ManagementConnectionError] = {}
+        self._by_serial_number: dict[bytes, DeviceInfo] = {}
+        if self.path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        """Load results of a previous collection."""
+        assert self.path is not None
+        try:
+            with self.path.open(encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        self._add(DeviceInfo.from_dict(json.loads(line)))
+                    except (ValueError, KeyError, TypeError) as err:
+                        # eg. last line cut off by an interruption
+                        logger.debug("Skipping inventory line %r: %s", line, err)
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            logger.warning("Could not read inventory file %s: %s", self.path, err)
+
+    def _add(self, info: DeviceInfo) -> None:
+        """Add a result."""
+        self.devices[info.individual_address] = info
+        self.errors.pop(info.individual_address, None)
+        if info.serial_number is not None:
+            self._by_serial_number[info.serial_number] = info
+
+    def _store(self, info: DeviceInfo) -> None:
+        """Add a result and append it to the file."""
+        self._add(info)
+        if self.path is None:
+            return
+        try:
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(json.dumps(info.as_dict()) + "\n")
+        except OSError as err:
+            logger.error("Could not write inventory file %s: %s", self.path, err)
+
+    def is_fresh(self, info: DeviceInfo) -> bool:
+        """Return if `info` was read within `ttl`."""
+        return time.time() - info.timestamp < self.ttl
+
+    def _known_device(
+        self, serial_number: bytes, device_descriptor: int
+    ) -> DeviceInfo | None:
+        """Return a fresh result of the device with this serial number."""
+        info = self._by_serial_number.get(serial_number)
+        if (
+            info is not None
+            and info.device_descriptor == device_descriptor
+            and self.is_fresh(info)
+        ):
+            return info
+        return None
+
+    async def _read(self, individual_address: IndividualAddress) -> DeviceInfo | None:
+        """Read a device in its own connection."""
+        async with self.xknx.bus_load.read_slot():
+            try:
+                async with self.xknx.management.connection(individual_address) as conn:
+                    info = await dmp_device_info_read_r_co(
+                        conn, known_device=self._known_device
+                    )
+            except ManagementConnectionError as ex:
+                logger.debug(
+                    "Reading device info of %s failed: %s", individual_address, ex
+                )
+                self.errors[individual_address] = ex
+                return None
+        self._store(info)
+        return info
+
+    async def collect(
+        self, individual_addresses: Iterable[IndividualAddressableType]
+    ) -> AsyncGenerator[DeviceInfo, None]:
+        """
+        Yield DeviceInfo of every device that could be read.
+
+        Fresh results are yielded first without reading the device again, the
+        others in the order their reads complete. Failed reads are recorded in
+        `errors` and retried on the next call.
+
+        :param individual_addresses: addresses of the devices to read
+        """
+        to_read: list[IndividualAddress] = []
+        for individual_address in map(IndividualAddress, individual_addresses):
+            info = self.devices.get(individual_address)
+            if info is not None and self.is_fresh(info):
+                yield info
+            else:
+                to_read.append(individual_address)
+        async with aclosing(
+            run_windowed(self._read, to_read, window=self.window)
+        ) as results:
+            async for result in results:
+                if result is not None:
+                    yield result
@@ -13,3 +13,9 @@ from .nm_individual_address_serial_number_write import (
     nm_individual_address_serial_number_write,
 )
 from .nm_individual_address_write import nm_individual_address_write
+from .scan import (
+    ScanResult,
+    scan_area,
+    scan_individual_addresses,
+    scan_line,
+)
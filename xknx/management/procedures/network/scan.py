@@ -0,0 +1,169 @@
+"""
+Line and area scan built on NM_IndividualAddress_Check.
+
+Not a procedure of the KNX specification: individual addresses are checked like
+NM_IndividualAddress_Check - KNX v02.01.02 - Management Procedures 03.05.02 - §2.19 -
+but several addresses are probed at once. Absent addresses are only detected by
+timeouts, so probing them one by one takes several seconds each.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Iterable
+from contextlib import AsyncExitStack, aclosing
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from xknx.exceptions import (
+    ManagementConnectionError,
+    ManagementConnectionRefused,
+    ManagementConnectionTimeout,
+)
+from xknx.management.procedures._util import run_windowed
+from xknx.management.procedures.device.dm_connect_r_co import dmp_connect_r_co
+from xknx.telegram.address import IndividualAddress, IndividualAddressableType
+
+if TYPE_CHECKING:
+    from xknx import XKNX
+
+logger = logging.getLogger("xknx.management.procedures")
+
+DEFAULT_SCAN_WINDOW: Final = 8
+
+
+class ScanResult(NamedTuple):
+    """A device found by a scan."""
+
+    individual_address: IndividualAddress
+    # Device Descriptor Type 0 (mask version) - None if the device refused the connection
+    device_descriptor: int | None
+
+
+async def _probe(
+    xknx: XKNX, individual_address: IndividualAddress
+) -> ScanResult | None:
+    """Check if a device responds and read its device descriptor in the same session."""
+    device_descriptor: int | None = None
+    try:
+        async with AsyncExitStack() as stack:
+            # pace only sending T_Connect - waiting for a confirmation of the bus
+            # interface - not the timeouts of absent devices
+            async with xknx.bus_load.read_slot():
+                conn = await stack.enter_async_context(
+                    xknx.management.connection(individual_address)
+                )
+            device_descriptor = await dmp_connect_r_co(conn)
+    except ManagementConnectionRefused:
+        # an A_Disconnect-PDU means the address is occupied - see nm_individual_address_check
+        pass
+    except ManagementConnectionTimeout:
+        return None
+    except ManagementConnectionError as ex:
+        # eg. negative L_DATA_CON - no device acknowledged the connect frame
+        logger.debug("No device found at %s: %s", individual_address, ex)
+        return None
+    logger.debug("Device found at %s", individual_address)
+    return ScanResult(individual_address, device_descriptor)
+
+
+async def scan_individual_addresses(
+    xknx: XKNX,
+    individual_addresses: Iterable[IndividualAddressableType],
+    window: int = DEFAULT_SCAN_WINDOW,
+) -> AsyncGenerator[ScanResult, None]:
+    """
+    Probe individual addresses concurrently and yield devices as they are found.
+
+    Results are yielded in the order the probes complete. Every probe waits for a
+    read slot of `xknx.bus_load` to open its connection, so probes start slower while
+    the bus is busy. The slot is released once the connection is opened. Pending probes are cancelled when the iteration
+    is stopped early.
+
+    :param xknx: the XKNX object
+    :param individual_addresses: addresses to probe
+    :param window: maximum number of addresses probed at the same time
+    """
+    async with aclosing(
+        run_windowed(
+            partial(_probe, xknx),
+            map(IndividualAddress, individual_addresses),
+            window=window,
+        )
+    ) as results:
+        async for result in results:
+            if result is not None:
+                yield result
+
+
+async def scan_line(
+    xknx: XKNX,
+    line: IndividualAddressableType,
+    devices: Iterable[int] = range(IndividualAddress.MAX_LINE + 1),
+    window: int = DEFAULT_SCAN_WINDOW,
+) -> AsyncGenerator[ScanResult, None]:
+    """
+    Scan a line for devices.
+
+    :param xknx: the XKNX object
+    :param line: address of the line - eg. "1.1.0"; the device part is ignored
+    :param devices: device parts of the addresses to probe - the coupler of the line is 0
+    :param window: maximum number of addresses probed at the same time
+    """
+    line_raw = IndividualAddress(line).raw & ~IndividualAddress.MAX_LINE
+    async with aclosing(
+        scan_individual_addresses(
+            xknx, (line_raw + device for device in devices), window=window
+        )
+    ) as results:
+        async for result in results:
+            yield result
+
+
+async def scan_area(
+    xknx: XKNX,
+    area: int,
+    window: int = DEFAULT_SCAN_WINDOW,
+) -> AsyncGenerator[ScanResult, None]:
+    """
+    Scan all lines of an area for devices.
+
+    The line couplers (x.y.0) are probed first. The main line of the area (x.0.*) and
+    lines whose coupler responds are scanned afterwards - a line can only be reached
+    through its coupler.
+
+    :param xknx: the XKNX object
+    :param area: area to scan (0..15)
+    :param window: maximum number of addresses probed at the same time
+    """
+    area_address = IndividualAddress(f"{area}.0.0")
+    lines = [area_address]
+    async with aclosing(
+        scan_individual_addresses(
+            xknx,
+            (
+                area_address.raw + (line << 8)
+                for line in range(1, IndividualAddress.MAX_MAIN + 1)
+            ),
+            window=window,
+        )
+    ) as results:
+        async for result in results:
+            lines.append(result.individual_address)
+            yield result
+    async with aclosing(
+        scan_individual_addresses(
+            xknx,
+            (
+                line.raw + device
+                for line in sorted(lines)
+                # line couplers were probed already, the main line coupler is x.0.0
+                for device in range(
+                    0 if line == area_address else 1, IndividualAddress.MAX_LINE + 1
+                )
+            ),
+            window=window,
+        )
+    ) as results:
+        async for result in results:
+            yield result
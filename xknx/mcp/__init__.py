@@ -9,18 +9,26 @@ Assistant, …) wraps them into its own MCP transport and decides which write
 tools to expose.
 
 See :mod:`xknx.mcp.tools` for the tool functions and :mod:`xknx.mcp.types` for
-the input/output models.
+the input/output models. :class:`~xknx.mcp.cache.GroupValueCache` records the
+last value of every group address for batch reads accepting a maximum age.
+:func:`~xknx.mcp.tools.query_telegram_history` queries the telegrams recorded
+by a :class:`~xknx.core.TelegramHistory`.
 """
 
+from .cache import GroupValueCache
 from .tools import (
     decode_dpt_payload,
     describe_dpt,
     encode_dpt_payload,
     get_connection_status,
     list_dpts,
+    query_telegram_history,
     read_group_value,
+    read_group_values,
     send_group_value_read,
+    send_group_value_reads,
     send_group_value_write,
+    send_group_value_writes,
 )
 from .types import (
     ConnectionStatusResult,
@@ -32,12 +40,21 @@ from .types import (
     DptSummary,
     EncodeDptPayloadInput,
     EncodeDptPayloadResult,
+    GroupAddressBatchInput,
     GroupAddressInput,
     GroupValue,
+    GroupValueReadBatchInput,
+    GroupValueReadBatchResult,
     GroupValueReadInput,
+    GroupValueReadItem,
     GroupValueReadResult,
+    GroupValueWriteBatchInput,
     GroupValueWriteInput,
+    SendBatchResult,
     SendResult,
+    TelegramHistoryEntry,
+    TelegramHistoryQueryInput,
+    TelegramHistoryResult,
 )
 
 __all__ = [
@@ -50,18 +67,32 @@ __all__ = [
     "DptSummary",
     "EncodeDptPayloadInput",
     "EncodeDptPayloadResult",
+    "GroupAddressBatchInput",
     "GroupAddressInput",
     "GroupValue",
+    "GroupValueCache",
+    "GroupValueReadBatchInput",
+    "GroupValueReadBatchResult",
     "GroupValueReadInput",
+    "GroupValueReadItem",
     "GroupValueReadResult",
+    "GroupValueWriteBatchInput",
     "GroupValueWriteInput",
+    "SendBatchResult",
     "SendResult",
+    "TelegramHistoryEntry",
+    "TelegramHistoryQueryInput",
+    "TelegramHistoryResult",
     "decode_dpt_payload",
     "describe_dpt",
     "encode_dpt_payload",
     "get_connection_status",
     "list_dpts",
+    "query_telegram_history",
     "read_group_value",
+    "read_group_values",
     "send_group_value_read",
+    "send_group_value_reads",
     "send_group_value_write",
+    "send_group_value_writes",
 ]
@@ -0,0 +1,64 @@
+"""
+Last known values of group addresses for the xknx MCP tools.
+
+A :class:`GroupValueCache` records every GroupValueWrite and GroupValueResponse
+passing the telegram queue of an :class:`~xknx.xknx.XKNX` instance - received and
+sent. Tools accepting a maximum age answer from it instead of reading the bus.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from xknx.telegram import Telegram
+from xknx.telegram.address import GroupAddress, InternalGroupAddress
+from xknx.telegram.apci import GroupValueResponse, GroupValueWrite
+
+if TYPE_CHECKING:
+    from xknx.core import TelegramQueue
+    from xknx.xknx import XKNX
+
+
+class GroupValueCache:
+    """Last GroupValueWrite or GroupValueResponse telegram of every group address."""
+
+    __slots__ = ("_callback", "_telegrams", "xknx")
+
+    def __init__(self, xknx: XKNX) -> None:
+        """Initialize GroupValueCache class and start recording telegrams."""
+        self.xknx = xknx
+        # time.monotonic() of reception and telegram
+        self._telegrams: dict[
+            GroupAddress | InternalGroupAddress, tuple[float, Telegram]
+        ] = {}
+        self._callback: TelegramQueue.Callback | None = (
+            xknx.telegram_queue.register_telegram_received_cb(
+                self._telegram_received, match_for_outgoing=True
+            )
+        )
+
+    def close(self) -> None:
+        """Stop recording telegrams. Recorded values are kept."""
+        if self._callback is not None:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(self._callback)
+            self._callback = None
+
+    def _telegram_received(self, telegram: Telegram) -> None:
+        """Record a telegram carrying a value."""
+        if isinstance(
+            telegram.destination_address, GroupAddress | InternalGroupAddress
+        ) and isinstance(telegram.payload, GroupValueWrite | GroupValueResponse):
+            self._telegrams[telegram.destination_address] = (time.monotonic(), telegram)
+
+    def get(
+        self, group_address: GroupAddress | InternalGroupAddress, max_age: float
+    ) -> tuple[Telegram, float] | None:
+        """Return the last telegram to `group_address` and its age in seconds if not older than `max_age`."""
+        if (entry := self._telegrams.get(group_address)) is None:
+            return None
+        timestamp, telegram = entry
+        age = time.monotonic() - timestamp
+        if age > max_age:
+            return None
+        return telegram, age
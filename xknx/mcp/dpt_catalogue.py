@@ -0,0 +1,193 @@
+"""
+Catalogue of the KNX data point types for the xknx MCP tools.
+
+Summaries of all transcoders, their lookup tables and a search index are built once
+on first use, so listing and describing DPTs doesn't walk the transcoder tree and
+summarize every transcoder again for each call. `summaries` and `search()` return
+the cached summaries - the tools copy their list fields with `copy_summary()` only
+for the page they hand out, so a consumer changing them doesn't change the
+catalogue. Transcoders defined after the catalogue was built are not part of it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from copy import deepcopy
+from dataclasses import replace
+from functools import cache
+from typing import Final
+
+from xknx.dpt import DPTBase, DPTBinary, DPTComplex, DPTEnum, DPTNumeric
+
+from .types import DptSummary
+
+# length of the substrings indexed for text search
+NGRAM_LENGTH: Final = 3
+
+
+def _numeric_bounds(
+    dpt: type[DPTBase],
+) -> tuple[float | None, float | None, float | None]:
+    """Return ``(value_min, value_max, resolution)`` for numeric DPTs, else ``None``s."""
+    if issubclass(dpt, DPTNumeric):
+        return (float(dpt.value_min), float(dpt.value_max), float(dpt.resolution))
+    return (None, None, None)
+
+
+def _summarize_dpt(dpt: type[DPTBase]) -> DptSummary:
+    value_min, value_max, resolution = _numeric_bounds(dpt)
+    return DptSummary(
+        dpt=dpt.dpt_number_str(),
+        value_type=dpt.value_type,
+        unit=dpt.unit,
+        value_min=value_min,
+        value_max=value_max,
+        resolution=resolution,
+        payload_type="binary" if dpt.payload_type is DPTBinary else "array",
+        payload_length=dpt.payload_length,
+        options=(
+            [member.name.lower() for member in dpt.get_valid_values()]
+            if issubclass(dpt, DPTEnum)
+            else None
+        ),
+        schema=(
+            [dict(field) for field in dpt.get_dict_schema()]
+            if issubclass(dpt, DPTComplex)
+            else None
+        ),
+    )
+
+
+def copy_summary(summary: DptSummary) -> DptSummary:
+    """Return the summary with copies of its mutable fields."""
+    if summary.options is None and summary.schema is None:
+        return summary
+    return replace(
+        summary,
+        options=list(summary.options) if summary.options is not None else None,
+        schema=deepcopy(summary.schema),
+    )
+
+
+def _dpt_haystack(dpt: type[DPTBase]) -> str:
+    """Return the lower-cased text a ``list_dpts`` text filter matches against."""
+    return f"{dpt.dpt_number_str()}\n{dpt.value_type or ''}\n{dpt.unit or ''}".lower()
+
+
+class DptCatalogue:
+    """Summaries of transcoders, sorted by DPT number, with lookup and search indexes."""
+
+    __slots__ = (
+        "_by_class",
+        "_by_main",
+        "_by_name",
+        "_haystacks",
+        "_main_views",
+        "_ngrams",
+        "_summaries",
+    )
+
+    def __init__(self, transcoders: Iterable[type[DPTBase]]) -> None:
+        """Initialize DptCatalogue class from transcoders in class tree order."""
+        tree = list(transcoders)
+        ordered = sorted(
+            tree,
+            key=lambda dpt: (dpt.dpt_main_number or 0, dpt.dpt_sub_number or -1),
+        )
+        self._summaries: tuple[DptSummary, ...] = tuple(map(_summarize_dpt, ordered))
+        self._by_class: dict[type[DPTBase], DptSummary] = dict(
+            zip(ordered, self._summaries, strict=True)
+        )
+        self._haystacks: tuple[str, ...] = tuple(map(_dpt_haystack, ordered))
+
+        by_main: dict[int, list[int]] = {}
+        ngrams: dict[str, set[int]] = {}
+        for index, dpt in enumerate(ordered):
+            if dpt.dpt_main_number is not None:
+                by_main.setdefault(dpt.dpt_main_number, []).append(index)
+            haystack = self._haystacks[index]
+            for start in range(len(haystack) - NGRAM_LENGTH + 1):
+                ngrams.setdefault(haystack[start : start + NGRAM_LENGTH], set()).add(
+                    index
+                )
+        self._by_main: dict[int, tuple[int, ...]] = {
+            main: tuple(indexes) for main, indexes in by_main.items()
+        }
+        self._main_views: dict[int, tuple[DptSummary, ...]] = {
+            main: tuple(self._summaries[index] for index in indexes)
+            for main, indexes in by_main.items()
+        }
+        self._ngrams: dict[str, frozenset[int]] = {
+            ngram: frozenset(indexes) for ngram, indexes in ngrams.items()
+        }
+
+        # names resolved like DPTBase.parse_transcoder() does - value types take
+        # precedence over DPT numbers and the first transcoder in tree order wins
+        self._by_name: dict[str, DptSummary] = {}
+        for dpt in tree:
+            if dpt.has_distinct_value_type() and dpt.value_type:
+                self._by_name.setdefault(dpt.value_type, self._by_class[dpt])
+        for dpt in tree:
+            if dpt.has_distinct_dpt_numbers() and (number := dpt.dpt_number_str()):
+                self._by_name.setdefault(number, self._by_class[dpt])
+
+    @property
+    def summaries(self) -> tuple[DptSummary, ...]:
+        """Return the cached summaries of all transcoders, sorted by DPT number."""
+        return self._summaries
+
+    @classmethod
+    def build(cls) -> DptCatalogue:
+        """Build a catalogue of all transcoders currently defined."""
+        return cls(DPTBase.dpt_class_tree())
+
+    def describe(self, dpt: str) -> DptSummary | None:
+        """Return the summary of a DPT number (``"9.001"``) or value type name."""
+        if (summary := self._by_name.get(dpt.strip())) is None:
+            # other notations accepted by get_dpt(), eg. "DPT-9.001"
+            try:
+                transcoder = DPTBase.get_dpt(dpt)
+            except ValueError:
+                return None
+            if (summary := self._by_class.get(transcoder)) is None:
+                return None
+        return copy_summary(summary)
+
+    def search(
+        self, main: int | None = None, text: str | None = None
+    ) -> tuple[DptSummary, ...]:
+        """
+        Return summaries of a DPT main number and containing `text`, sorted by DPT number.
+
+        `text` is matched case-insensitive against DPT number, value type and unit.
+        The cached summaries are returned - copy them with `copy_summary()` before
+        handing them out.
+        """
+        if not text:
+            if main is None:
+                return self._summaries
+            return self._main_views.get(main, ())
+        needle = text.lower()
+        indexes: Iterable[int] = (
+            range(len(self._summaries)) if main is None else self._by_main.get(main, ())
+        )
+        if len(needle) >= NGRAM_LENGTH:
+            # only DPTs containing every substring of the needle can contain it
+            candidates = frozenset.intersection(
+                *(
+                    self._ngrams.get(needle[start : start + NGRAM_LENGTH], frozenset())
+                    for start in range(len(needle) - NGRAM_LENGTH + 1)
+                )
+            )
+            indexes = sorted(candidates.intersection(indexes))
+        return tuple(
+            self._summaries[index]
+            for index in indexes
+            if needle in self._haystacks[index]
+        )
+
+
+@cache
+def dpt_catalogue() -> DptCatalogue:
+    """Return the catalogue of transcoders - built on first use."""
+    return DptCatalogue.build()
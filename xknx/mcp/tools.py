@@ -12,6 +12,8 @@ MCP tool libraries, even where the underlying operation is synchronous.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
 from typing import TYPE_CHECKING, TypeVar
 
 from xknx.core.connection_state import XknxConnectionState
@@ -19,18 +21,29 @@ from xknx.dpt import (
     DPTArray,
     DPTBase,
     DPTBinary,
-    DPTComplex,
     DPTComplexData,
-    DPTEnum,
     DPTEnumData,
-    DPTNumeric,
 )
+from xknx.exceptions import (
+    ConversionError,
+    CouldNotParseAddress,
+    CouldNotParseTelegram,
+)
+from xknx.telegram import AddressFilter, Telegram
+from xknx.telegram.address import (
+    GroupAddress,
+    IndividualAddress,
+    InternalGroupAddress,
+    parse_device_group_address,
+)
+from xknx.telegram.apci import GroupValueResponse, GroupValueWrite
 from xknx.tools import (
     group_value_read,
     group_value_write,
     read_group_value as _read_group_value,
 )
 
+from .dpt_catalogue import copy_summary, dpt_catalogue
 from .types import (
     ConnectionStatusResult,
     DecodeDptPayloadInput,
@@ -38,86 +51,50 @@ from .types import (
     DptDetail,
     DptFilter,
     DptListResult,
-    DptSummary,
     EncodeDptPayloadInput,
     EncodeDptPayloadResult,
+    GroupAddressBatchInput,
     GroupAddressInput,
     GroupValue,
+    GroupValueReadBatchInput,
+    GroupValueReadBatchResult,
     GroupValueReadInput,
+    GroupValueReadItem,
     GroupValueReadResult,
+    GroupValueWriteBatchInput,
     GroupValueWriteInput,
+    SendBatchResult,
     SendResult,
+    TelegramHistoryEntry,
+    TelegramHistoryQueryInput,
+    TelegramHistoryResult,
 )
 
 if TYPE_CHECKING:
+    from xknx.core.telegram_history import TelegramHistory, TelegramRecord
     from xknx.xknx import XKNX
 
+    from .cache import GroupValueCache
+
 _T = TypeVar("_T")
 
 
-def _paginate(items: list[_T], limit: int, offset: int) -> tuple[list[_T], bool]:
+def _paginate(
+    items: Sequence[_T], limit: int, offset: int
+) -> tuple[Sequence[_T], bool]:
     """Slice ``items`` by ``offset``/``limit`` and report whether the limit was hit."""
     window = items[offset : offset + limit] if limit >= 0 else items[offset:]
     limit_reached = 0 <= limit < len(items) - offset
     return window, limit_reached
 
 
-def _numeric_bounds(
-    dpt: type[DPTBase],
-) -> tuple[float | None, float | None, float | None]:
-    """Return ``(value_min, value_max, resolution)`` for numeric DPTs, else ``None``s."""
-    if issubclass(dpt, DPTNumeric):
-        return (float(dpt.value_min), float(dpt.value_max), float(dpt.resolution))
-    return (None, None, None)
-
-
-def _summarize_dpt(dpt: type[DPTBase]) -> DptSummary:
-    value_min, value_max, resolution = _numeric_bounds(dpt)
-    return DptSummary(
-        dpt=dpt.dpt_number_str(),
-        value_type=dpt.value_type,
-        unit=dpt.unit,
-        value_min=value_min,
-        value_max=value_max,
-        resolution=resolution,
-        payload_type="binary" if dpt.payload_type is DPTBinary else "array",
-        payload_length=dpt.payload_length,
-        options=(
-            [member.name.lower() for member in dpt.get_valid_values()]
-            if issubclass(dpt, DPTEnum)
-            else None
-        ),
-        schema=(
-            [dict(field) for field in dpt.get_dict_schema()]
-            if issubclass(dpt, DPTComplex)
-            else None
-        ),
-    )
-
-
-def _dpt_haystack(dpt: type[DPTBase]) -> str:
-    """Return the lower-cased text a ``list_dpts`` text filter matches against."""
-    return f"{dpt.dpt_number_str()}\n{dpt.value_type or ''}\n{dpt.unit or ''}".lower()
-
-
 async def list_dpts(filters: DptFilter | None = None) -> DptListResult:
     """List the known KNX data point types, optionally filtered."""
     filters = filters or DptFilter()
-    needle = filters.text.lower() if filters.text else None
-
-    # dpt_class_tree() already yields only concrete transcoders (each with a
-    # main number); filter, then order by DPT number.
-    matches = [
-        dpt
-        for dpt in DPTBase.dpt_class_tree()
-        if (filters.main is None or dpt.dpt_main_number == filters.main)
-        and (needle is None or needle in _dpt_haystack(dpt))
-    ]
-    matches.sort(key=lambda dpt: (dpt.dpt_main_number or 0, dpt.dpt_sub_number or -1))
-
+    matches = dpt_catalogue().search(main=filters.main, text=filters.text)
     window, limit_reached = _paginate(matches, filters.limit, filters.offset)
     return DptListResult(
-        dpts=[_summarize_dpt(dpt) for dpt in window],
+        dpts=list(map(copy_summary, window)),
         total_count=len(matches),
         offset=filters.offset,
         next_offset=filters.offset + len(window) if limit_reached else None,
@@ -127,11 +104,8 @@ async def list_dpts(filters: DptFilter | None = None) -> DptListResult:
 
 async def describe_dpt(dpt: str) -> DptDetail:
     """Resolve a DPT number (``"9.001"``) or value type name to its definition."""
-    try:
-        transcoder = DPTBase.get_dpt(dpt)
-    except ValueError:
-        return DptDetail(found=False, dpt=None)
-    return DptDetail(found=True, dpt=_summarize_dpt(transcoder))
+    summary = dpt_catalogue().describe(dpt)
+    return DptDetail(found=summary is not None, dpt=summary)
 
 
 async def get_connection_status(xknx: XKNX) -> ConnectionStatusResult:
@@ -186,6 +160,100 @@ async def read_group_value(
     )
 
 
+def _read_item(
+    read: GroupValueReadInput,
+    transcoder: type[DPTBase] | None,
+    telegram: Telegram,
+    status: str,
+    age: float | None = None,
+) -> GroupValueReadItem:
+    """Decode the value of a received telegram into a batch read result."""
+    assert isinstance(telegram.payload, GroupValueWrite | GroupValueResponse)
+    try:
+        value = (
+            transcoder.from_knx(telegram.payload.value)
+            if transcoder is not None
+            else telegram.payload.value.value
+        )
+    except (ConversionError, CouldNotParseTelegram) as err:
+        return GroupValueReadItem(
+            group_address=read.group_address,
+            value_type=read.value_type,
+            status="error",
+            error=str(err),
+        )
+    return GroupValueReadItem(
+        group_address=read.group_address,
+        value_type=read.value_type,
+        status=status,
+        value=_jsonify(value),
+        age=age,
+    )
+
+
+async def read_group_values(
+    xknx: XKNX,
+    request: GroupValueReadBatchInput,
+    cache: GroupValueCache | None = None,
+) -> GroupValueReadBatchResult:
+    """
+    Read several group addresses concurrently under one deadline.
+
+    A group address listed more than once - or already being read - is read once.
+    With ``max_age`` set, values found in ``cache`` are returned without reading
+    the group address. Invalid addresses, DPTs and payloads are reported as
+    ``"error"`` items instead of raised.
+    """
+    items: dict[int, GroupValueReadItem] = {}
+    transcoders: dict[int, type[DPTBase] | None] = {}
+    to_read: dict[GroupAddress | InternalGroupAddress, list[int]] = {}
+    for index, read in enumerate(request.reads):
+        try:
+            group_address = parse_device_group_address(read.group_address)
+            transcoders[index] = (
+                DPTBase.get_dpt(read.value_type)
+                if read.value_type is not None
+                else None
+            )
+        except (CouldNotParseAddress, ValueError) as err:
+            items[index] = GroupValueReadItem(
+                group_address=read.group_address,
+                value_type=read.value_type,
+                status="error",
+                error=str(err),
+            )
+            continue
+        if (
+            request.max_age is not None
+            and cache is not None
+            and (cached := cache.get(group_address, request.max_age)) is not None
+        ):
+            telegram, age = cached
+            items[index] = _read_item(
+                read, transcoders[index], telegram, status="cached", age=age
+            )
+            continue
+        to_read.setdefault(group_address, []).append(index)
+
+    responses = await xknx.read_multiplexer.read(to_read, request.timeout)
+    for group_address, indexes in to_read.items():
+        response = responses[group_address]
+        for index in indexes:
+            read = request.reads[index]
+            items[index] = (
+                _read_item(read, transcoders[index], response, status="ok")
+                if response is not None
+                else GroupValueReadItem(
+                    group_address=read.group_address,
+                    value_type=read.value_type,
+                    status="no_response",
+                )
+            )
+    return GroupValueReadBatchResult(
+        results=[items[index] for index in range(len(request.reads))]
+    )
+
+
 async def send_group_value_read(xknx: XKNX, request: GroupAddressInput) -> SendResult:
     """
     Queue a GroupValueRead telegram to trigger a response on the bus.
@@ -214,6 +282,124 @@ async def send_group_value_write(
     return SendResult(group_address=request.group_address, apci="GroupValueWrite")
 
 
+async def send_group_value_reads(
+    xknx: XKNX, request: GroupAddressBatchInput
+) -> SendBatchResult:
+    """
+    Queue a GroupValueRead telegram for each group address.
+
+    Invalid addresses are reported with ``queued`` ``False`` instead of raised;
+    the other telegrams are queued.
+    """
+    results = []
+    for group_address in request.group_addresses:
+        try:
+            group_value_read(xknx, group_address)
+        except CouldNotParseAddress as err:
+            results.append(
+                SendResult(
+                    group_address=group_address,
+                    apci="GroupValueRead",
+                    queued=False,
+                    error=str(err),
+                )
+            )
+        else:
+            results.append(
+                SendResult(group_address=group_address, apci="GroupValueRead")
+            )
+    return SendBatchResult(results=results)
+
+
+async def send_group_value_writes(
+    xknx: XKNX, request: GroupValueWriteBatchInput
+) -> SendBatchResult:
+    """
+    Queue a GroupValueWrite telegram for each value.
+
+    This is a **write** operation: consumers gate it behind their read-write mode.
+    Invalid addresses, DPTs and values are reported with ``queued`` ``False``
+    instead of raised; the other telegrams are queued.
+    """
+    results = []
+    for write in request.writes:
+        try:
+            group_value_write(
+                xknx, write.group_address, write.value, value_type=write.value_type
+            )
+        except (ConversionError, CouldNotParseAddress, ValueError) as err:
+            results.append(
+                SendResult(
+                    group_address=write.group_address,
+                    apci="GroupValueWrite",
+                    queued=False,
+                    error=str(err),
+                )
+            )
+        else:
+            results.append(
+                SendResult(group_address=write.group_address, apci="GroupValueWrite")
+            )
+    return SendBatchResult(results=results)
+
+
+def _history_entry(record: TelegramRecord) -> TelegramHistoryEntry:
+    """Convert a telegram history record into a JSON-serialisable entry."""
+    payload = record.payload()
+    value: list[int] | int | None = None
+    if isinstance(payload, GroupValueWrite | GroupValueResponse):
+        value = (
+            list(payload.value.value)
+            if isinstance(payload.value, DPTArray)
+            else int(payload.value.value)
+        )
+    return TelegramHistoryEntry(
+        timestamp=datetime.fromtimestamp(record.timestamp).astimezone().isoformat(),
+        source_address=str(record.source_address),
+        destination_address=str(record.destination_address),
+        direction=record.direction.value,
+        apci=type(payload).__name__ if payload is not None else "Truncated",
+        payload=value,
+        data_secure=record.data_secure,
+    )
+
+
+async def query_telegram_history(
+    history: TelegramHistory, request: TelegramHistoryQueryInput
+) -> TelegramHistoryResult:
+    """
+    Query telegrams recorded in a :class:`~xknx.core.TelegramHistory`, newest first.
+
+    Raises :exc:`~xknx.exceptions.CouldNotParseAddress` for an invalid address.
+    """
+    matches = history.find(
+        group_address=(
+            GroupAddress(request.group_address)
+            if request.group_address is not None
+            else None
+        ),
+        address_filter=(
+            AddressFilter(request.address_filter)
+            if request.address_filter is not None
+            else None
+        ),
+        source_address=(
+            IndividualAddress(request.source_address)
+            if request.source_address is not None
+            else None
+        ),
+        max_age=request.max_age,
+    )
+    window, limit_reached = _paginate(matches[::-1], request.limit, request.offset)
+    return TelegramHistoryResult(
+        telegrams=[_history_entry(history.get(sequence)) for sequence in window],
+        total_count=len(matches),
+        offset=request.offset,
+        next_offset=request.offset + len(window) if limit_reached else None,
+        limit_reached=limit_reached,
+    )
+
+
 async def encode_dpt_payload(request: EncodeDptPayloadInput) -> EncodeDptPayloadResult:
     """
     Encode a value using a specific DPT into its raw payload bytes.
@@ -133,6 +133,58 @@ class GroupValueReadResult:
     value: GroupValue
 
 
+@dataclass(frozen=True, slots=True)
+class GroupValueReadBatchInput:
+    """Input for :func:`~xknx.mcp.tools.read_group_values`."""
+
+    reads: list[GroupValueReadInput] = field(
+        metadata={"description": "Group addresses to read, each with an optional DPT."}
+    )
+    timeout: float | None = field(
+        default=None,
+        metadata={
+            "description": (
+                "Overall deadline in seconds for all reads; omit to wait 2 seconds "
+                "after the last read is sent at the rate limit."
+            )
+        },
+    )
+    max_age: float | None = field(
+        default=None,
+        metadata={
+            "description": (
+                "Accept a value received within this many seconds instead of "
+                "reading the group address; omit to read every group address."
+            )
+        },
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class GroupValueReadItem:
+    """
+    Result of a single read of :func:`~xknx.mcp.tools.read_group_values`.
+
+    ``status`` is ``"ok"`` for a response to the read, ``"cached"`` for a value
+    received ``age`` seconds ago, ``"no_response"`` when the deadline passed and
+    ``"error"`` for an invalid address, DPT or payload - described by ``error``.
+    """
+
+    group_address: str
+    value_type: str | None
+    status: str
+    value: GroupValue = None
+    age: float | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class GroupValueReadBatchResult:
+    """Result of :func:`~xknx.mcp.tools.read_group_values`, in the order of the reads."""
+
+    results: list[GroupValueReadItem]
+
+
 @dataclass(frozen=True, slots=True)
 class GroupAddressInput:
     """Input naming a single group address (e.g. for a GroupValueRead)."""
@@ -142,6 +194,15 @@ class GroupAddressInput:
     )
 
 
+@dataclass(frozen=True, slots=True)
+class GroupAddressBatchInput:
+    """Input for :func:`~xknx.mcp.tools.send_group_value_reads`."""
+
+    group_addresses: list[str] = field(
+        metadata={"description": 'Group addresses to act on, e.g. ["1/2/3", "1/2/4"].'}
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class GroupValueWriteInput:
     """Input for :func:`~xknx.mcp.tools.send_group_value_write`."""
@@ -170,6 +231,83 @@ class SendResult:
     group_address: str
     apci: str
     queued: bool = True
+    # reason the telegram was not queued - only set by batch tools
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class GroupValueWriteBatchInput:
+    """Input for :func:`~xknx.mcp.tools.send_group_value_writes`."""
+
+    writes: list[GroupValueWriteInput] = field(
+        metadata={"description": "Values to write, each with an optional DPT."}
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SendBatchResult:
+    """Result of a batch send, in the order of the input; see :class:`SendResult`."""
+
+    results: list[SendResult]
+
+
+@dataclass(frozen=True, slots=True)
+class TelegramHistoryQueryInput:
+    """Input for :func:`~xknx.mcp.tools.query_telegram_history`; all given criteria must match."""
+
+    group_address: str | None = field(
+        default=None,
+        metadata={"description": 'Destination group address, e.g. "1/2/3".'},
+    )
+    address_filter: str | None = field(
+        default=None,
+        metadata={
+            "description": 'Destination group address pattern, e.g. "2/1/*" or "1/2-4/5".'
+        },
+    )
+    source_address: str | None = field(
+        default=None,
+        metadata={"description": 'Individual address of the sender, e.g. "1.1.5".'},
+    )
+    max_age: float | None = field(
+        default=None,
+        metadata={"description": "Only telegrams of the last this many seconds."},
+    )
+    limit: int = field(
+        default=100,
+        metadata={"description": "Maximum number of telegrams to return."},
+    )
+    offset: int = field(
+        default=0,
+        metadata={"description": "Number of telegrams to skip, for pagination."},
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class TelegramHistoryEntry:
+    """A telegram recorded in the history."""
+
+    timestamp: str
+    source_address: str
+    destination_address: str
+    # "Incoming" or "Outgoing"
+    direction: str
+    apci: str
+    # as in EncodeDptPayloadResult - None for GroupValueRead or a truncated APDU
+    payload: list[int] | int | None
+    data_secure: bool
+
+
+@dataclass(frozen=True, slots=True)
+class TelegramHistoryResult:
+    """Result of :func:`~xknx.mcp.tools.query_telegram_history`, newest first."""
+
+    telegrams: list[TelegramHistoryEntry]
+    total_count: int
+    offset: int
+    # pass as ``offset`` for the next page; ``None`` when exhausted
+    next_offset: int | None
+    limit_reached: bool
 
 
 @dataclass(frozen=True, slots=True)
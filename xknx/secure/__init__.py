@@ -1,10 +1,18 @@
 """Classes for handling KNX IP Secure."""
 
 from .keyring import Keyring, load_keyring
+from .sequence_number_store import (
+    FileSequenceNumberStore,
+    SequenceNumberState,
+    SequenceNumberStore,
+)
 from .util import bytes_xor, sha256_hash
 
 __all__ = [
+    "FileSequenceNumberStore",
     "Keyring",
+    "SequenceNumberState",
+    "SequenceNumberStore",
     "bytes_xor",
     "load_keyring",
     "sha256_hash",
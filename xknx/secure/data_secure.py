@@ -21,6 +21,8 @@ from .data_secure_asdu import (
     SecurityControlField,
 )
 from .keyring import Keyring
+from .security_primitives import AESCipher
+from .sequence_number_store import SequenceNumberStore
 
 _LOGGER = logging.getLogger("xknx.data_secure")
 
@@ -29,6 +31,8 @@ _SEQUENCE_NUMBER_INIT_TIMESTAMP = datetime.fromisoformat(
     "2018-01-05T00:00:00Z"
 ).timestamp()
 _SEQUENCE_NUMBER_MAX = 0xFFFFFFFFFFFF  # 48 bit max value
+# outgoing sequence numbers reserved per write to the SequenceNumberStore
+SEQUENCE_NUMBER_RESERVATION_BLOCK = 1000
 
 
 def _initial_sequence_number() -> int:
@@ -45,9 +49,12 @@ class DataSecure:
     """Class for KNX Data Secure handling."""
 
     __slots__ = (
+        "_ciphers",
         "_group_key_table",
         "_individual_address_table",
+        "_sequence_number_reserved",
         "_sequence_number_sending",
+        "_sequence_number_store",
     )
 
     def __init__(
@@ -56,13 +63,30 @@ class DataSecure:
         group_key_table: dict[GroupAddress, bytes],
         individual_address_table: dict[IndividualAddress, int],
         last_sequence_number_sending: int | None = None,
+        sequence_number_store: SequenceNumberStore | None = None,
     ) -> None:
         """Initialize DataSecure class."""
         self._group_key_table = group_key_table
+        # cipher contexts by key - a new DataSecure is created when the keyring is reloaded
+        self._ciphers: dict[bytes, AESCipher] = {}
         self._individual_address_table = individual_address_table
+        self._sequence_number_store = sequence_number_store
+        stored_sequence_number_sending = None
+        if sequence_number_store is not None:
+            stored_sequence_number_sending, stored_table = sequence_number_store.load()
+            for address, sequence_number in stored_table.items():
+                # only known senders - the keyring defines who is allowed to send
+                if sequence_number > self._individual_address_table.get(
+                    address, sequence_number
+                ):
+                    self._individual_address_table[address] = sequence_number
         self._sequence_number_sending = (
-            last_sequence_number_sending or _initial_sequence_number()
+            max(stored_sequence_number_sending, last_sequence_number_sending or 0)
+            if stored_sequence_number_sending
+            else last_sequence_number_sending or _initial_sequence_number()
         )
+        # sequence numbers below this value are persisted as used
+        self._sequence_number_reserved = self._sequence_number_sending
         # Holds the last valid sequence number for each individual address.
         # Use sequence_number from keyfile as initial value or 0 from senders for all IAs ?
 
@@ -89,23 +113,37 @@ class DataSecure:
         )
 
     @staticmethod
-    def init_from_keyring(keyring: Keyring) -> DataSecure | None:
+    def init_from_keyring(
+        keyring: Keyring, sequence_number_store: SequenceNumberStore | None = None
+    ) -> DataSecure | None:
         """
         Initialize DataSecure from Keyring.
 
         Return None if no Data Secure information is found in the Keyring.
+        Sequence numbers persisted in `sequence_number_store` take precedence over
+        the ones of the Keyring.
         """
         ga_key_table = keyring.get_data_secure_group_keys()
         ia_seq_table = keyring.get_data_secure_senders()
-        # TODO: persist local individual_address_table and update from that file on start
-        #       to have more fresh initial sequence numbers
         if not ga_key_table:
             return None
         return DataSecure(
             group_key_table=ga_key_table,
             individual_address_table=ia_seq_table,
+            sequence_number_store=sequence_number_store,
         )
 
+    def close(self) -> None:
+        """Write pending sequence number updates to the SequenceNumberStore."""
+        if self._sequence_number_store is not None:
+            self._sequence_number_store.close()
+
+    def _cipher(self, key: bytes) -> AESCipher:
+        """Return cached cipher for key."""
+        if (cipher := self._ciphers.get(key)) is None:
+            cipher = self._ciphers[key] = AESCipher(key)
+        return cipher
+
     def get_sequence_number(self) -> int:
         """Return current sequence number sending and increment local stored value."""
         seq_nr = self._sequence_number_sending
@@ -115,6 +153,15 @@ class DataSecure:
                 "Reset your devices individual address tables and re-initialize XKNX.",
                 log_level=logging.ERROR,
             )
+        if (
+            self._sequence_number_store is not None
+            and seq_nr >= self._sequence_number_reserved
+        ):
+            reserved = min(
+                seq_nr + SEQUENCE_NUMBER_RESERVATION_BLOCK, _SEQUENCE_NUMBER_MAX + 1
+            )
+            self._sequence_number_store.reserve_sending(reserved)
+            self._sequence_number_reserved = reserved
         self._sequence_number_sending += 1
         return seq_nr
 
@@ -146,6 +193,10 @@ class DataSecure:
         yield
         # Don't increment sequence number if exception is raised while decrypting (yield)
         self._individual_address_table[source_address] = received_sequence_number
+        if self._sequence_number_store is not None:
+            self._sequence_number_store.update_received(
+                source_address, received_sequence_number
+            )
 
     def received_cemi(self, cemi_data: CEMILData) -> CEMILData:
         """Handle received CEMI frame."""
@@ -208,7 +259,7 @@ class DataSecure:
                 cemi_data.src_addr.to_knx() + cemi_data.dst_addr.to_knx()
             )
             plain_apdu_raw = s_apdu.secured_data.get_plain_apdu(
-                key=key,
+                cipher=self._cipher(key),
                 scf=s_apdu.scf,
                 address_fields_raw=_address_fields_raw,
                 address_type=cemi_data.address_type,
@@ -254,7 +305,7 @@ class DataSecure:
             # TODO: test if this is correct
             plain_apdu_raw = b""  # used in point-to-point eg. TConnect
         secure_asdu = SecureData.init_from_plain_apdu(
-            key=key,
+            cipher=self._cipher(key),
             apdu=plain_apdu_raw,
             scf=scf,
             sequence_number=self.get_sequence_number(),
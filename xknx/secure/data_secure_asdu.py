@@ -8,11 +8,7 @@ from xknx.cemi.flags import CEMIAddressType, CEMIFrameFormat
 from xknx.exceptions import DataSecureError
 from xknx.telegram.tpci import TPCI
 
-from .security_primitives import (
-    calculate_message_authentication_code_cbc,
-    decrypt_ctr,
-    encrypt_data_ctr,
-)
+from .security_primitives import AESCipher
 
 # Secure APCI is 0x03F1 - in block_0 it is used split into 2 octets
 _APCI_SEC_HIGH = 0x03
@@ -147,7 +143,7 @@ class SecureData:
 
     @staticmethod
     def init_from_plain_apdu(
-        key: bytes,
+        cipher: AESCipher,
         apdu: bytes | bytearray,
         scf: SecurityControlField,
         sequence_number: int,
@@ -160,8 +156,7 @@ class SecureData:
         sequence_number_bytes = sequence_number.to_bytes(6, "big")
 
         if scf.algorithm == SecurityAlgorithmIdentifier.CCM_AUTHENTICATION:
-            mac = calculate_message_authentication_code_cbc(
-                key=key,
+            mac = cipher.calculate_message_authentication_code_cbc(
                 additional_data=scf.to_knx() + apdu,
                 block_0=block_0(
                     sequence_number=sequence_number_bytes,
@@ -174,8 +169,7 @@ class SecureData:
             )[:4]
             secured_apdu = bytes(apdu)
         elif scf.algorithm == SecurityAlgorithmIdentifier.CCM_ENCRYPTION:
-            mac_cbc = calculate_message_authentication_code_cbc(
-                key=key,
+            mac_cbc = cipher.calculate_message_authentication_code_cbc(
                 additional_data=scf.to_knx(),
                 payload=apdu,
                 block_0=block_0(
@@ -187,8 +181,7 @@ class SecureData:
                     payload_length=len(apdu),
                 ),
             )[:4]
-            secured_apdu, mac = encrypt_data_ctr(
-                key=key,
+            secured_apdu, mac = cipher.encrypt_data_ctr(
                 counter_0=counter_0(
                     sequence_number=sequence_number_bytes,
                     address_fields_raw=address_fields_raw,
@@ -224,7 +217,7 @@ class SecureData:
 
     def get_plain_apdu(
         self,
-        key: bytes,
+        cipher: AESCipher,
         scf: SecurityControlField,
         address_fields_raw: bytes,
         address_type: CEMIAddressType,
@@ -238,8 +231,7 @@ class SecureData:
         Security Individual Address Table before calling this method.
         """
         if scf.algorithm == SecurityAlgorithmIdentifier.CCM_ENCRYPTION:
-            dec_payload, mac_tr = decrypt_ctr(
-                key=key,
+            dec_payload, mac_tr = cipher.decrypt_ctr(
                 counter_0=counter_0(
                     sequence_number=self.sequence_number_bytes,
                     address_fields_raw=address_fields_raw,
@@ -247,8 +239,7 @@ class SecureData:
                 mac=self.message_authentication_code,
                 payload=self.secured_apdu,
             )
-            mac_cbc = calculate_message_authentication_code_cbc(
-                key=key,
+            mac_cbc = cipher.calculate_message_authentication_code_cbc(
                 additional_data=scf.to_knx(),
                 payload=dec_payload,
                 block_0=block_0(
@@ -265,8 +256,7 @@ class SecureData:
             return dec_payload
 
         if scf.algorithm == SecurityAlgorithmIdentifier.CCM_AUTHENTICATION:
-            mac = calculate_message_authentication_code_cbc(
-                key=key,
+            mac = cipher.calculate_message_authentication_code_cbc(
                 additional_data=scf.to_knx() + self.secured_apdu,
                 block_0=block_0(
                     sequence_number=self.sequence_number_bytes,
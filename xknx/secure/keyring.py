@@ -6,13 +6,13 @@ from abc import ABC, abstractmethod
 import asyncio
 import base64
 import enum
+from functools import cached_property
 from itertools import chain
 import logging
 import os
 from pathlib import Path
-from typing import Any, Final
-from xml.dom.minidom import Attr, Document, Element, parse
-from xml.etree.ElementTree import ElementTree
+from typing import Any, ClassVar, Final, Protocol
+from xml.dom.minidom import Attr, Element
 import xml.sax
 from xml.sax.handler import ContentHandler
 from xml.sax.xmlreader import AttributesImpl
@@ -37,18 +37,62 @@ class InterfaceType(enum.Enum):
     USB = "USB"
 
 
+class _Attributes(Protocol):
+    """Attributes of a minidom node or of a SAX element."""
+
+    def get(self, name: str, /) -> Any:
+        """Return the attribute value or None."""
+
+
 class AttributeReader(ABC):
     """Abstract base class for modelling attribute reader capabilities."""
 
-    @abstractmethod
+    # names of `cached_property` attributes holding decrypted data
+    DECRYPTED_ATTRIBUTES: ClassVar[tuple[str, ...]] = ()
+
+    _password_hash: bytes | None = None
+    _initialization_vector: bytes | None = None
+
     def parse_xml(self, node: Element) -> None:
         """Parse all needed attributes from the given node map."""
+        self.parse_attributes(node.attributes)
+
+    @abstractmethod
+    def parse_attributes(self, attributes: _Attributes) -> None:
+        """Parse all needed attributes from the given attributes."""
 
     def decrypt_attributes(
         self, password_hash: bytes, initialization_vector: bytes
     ) -> None:
-        """Decrypt attribute data."""
-        return
+        """Set the key for attribute data. It is decrypted on first access."""
+        self._password_hash = password_hash
+        self._initialization_vector = initialization_vector
+        for name in self.DECRYPTED_ATTRIBUTES:
+            # drop values decrypted with a previous key
+            self.__dict__.pop(name, None)
+
+    def decrypt_all_attributes(self) -> None:
+        """Decrypt all attribute data now instead of on first access."""
+        for name in self.DECRYPTED_ATTRIBUTES:
+            getattr(self, name)
+
+    def _decrypt(self, data: str | None) -> bytes | None:
+        """Decrypt base64 encoded data. Return None if there is no data or key."""
+        if (
+            data is None
+            or self._password_hash is None
+            or self._initialization_vector is None
+        ):
+            return None
+        return decrypt_aes128cbc(
+            base64.b64decode(data), self._password_hash, self._initialization_vector
+        )
+
+    def _decrypt_password(self, data: str | None) -> str | None:
+        """Decrypt base64 encoded password data."""
+        if (decrypted := self._decrypt(data)) is None:
+            return None
+        return extract_password(decrypted)
 
     @staticmethod
     def get_attribute_value(attribute: Attr | Any) -> Any:
@@ -67,9 +111,8 @@ class XMLAssignedGroupAddress(AttributeReader):
     address: GroupAddress
     senders: list[IndividualAddress]
 
-    def parse_xml(self, node: Element) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
+    def parse_attributes(self, attributes: _Attributes) -> None:
+        """Parse all needed attributes from the given attributes."""
         self.address = GroupAddress(self.get_attribute_value(attributes.get("Address")))
         self.senders = [
             IndividualAddress(sender)
@@ -83,20 +126,30 @@ class XMLInterface(AttributeReader):
     """Interface in a knxkeys file."""
 
     NODE_NAME: Final = "Interface"
+    DECRYPTED_ATTRIBUTES = ("decrypted_authentication", "decrypted_password")
 
     type: InterfaceType
     individual_address: IndividualAddress
     host: IndividualAddress | None = None
     user_id: int | None = None
     password: str | None = None
-    decrypted_password: str | None = None
-    decrypted_authentication: str | None = None
     authentication: str | None = None
     group_addresses: dict[GroupAddress, list[IndividualAddress]]
 
     def parse_xml(self, node: Element) -> None:
         """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
+        self.parse_attributes(node.attributes)
+        for assigned_ga in node.childNodes:
+            if assigned_ga.nodeType != Element.ELEMENT_NODE:
+                continue
+            if assigned_ga.nodeName != XMLAssignedGroupAddress.NODE_NAME:
+                continue
+            xml_group_address: XMLAssignedGroupAddress = XMLAssignedGroupAddress()
+            xml_group_address.parse_xml(assigned_ga)
+            self.group_addresses[xml_group_address.address] = xml_group_address.senders
+
+    def parse_attributes(self, attributes: _Attributes) -> None:
+        """Parse all needed attributes from the given attributes."""
         self.type = InterfaceType(self.get_attribute_value(attributes.get("Type")))
         self.individual_address = IndividualAddress(
             self.get_attribute_value(attributes.get("IndividualAddress"))
@@ -107,60 +160,31 @@ class XMLInterface(AttributeReader):
         self.user_id = int(_user_id) if _user_id else None
         self.password = self.get_attribute_value(attributes.get("Password"))
         self.authentication = self.get_attribute_value(attributes.get("Authentication"))
-
         self.group_addresses = {}
-        for assigned_ga in node.childNodes:
-            if assigned_ga.nodeType != Element.ELEMENT_NODE:
-                continue
-            if assigned_ga.nodeName != XMLAssignedGroupAddress.NODE_NAME:
-                continue
-            xml_group_address: XMLAssignedGroupAddress = XMLAssignedGroupAddress()
-            xml_group_address.parse_xml(assigned_ga)
-            self.group_addresses[xml_group_address.address] = xml_group_address.senders
 
-    def decrypt_attributes(
-        self, password_hash: bytes, initialization_vector: bytes
-    ) -> None:
-        """Decryt attributes."""
-
-        self.decrypted_password = (
-            extract_password(
-                decrypt_aes128cbc(
-                    base64.b64decode(self.password),
-                    password_hash,
-                    initialization_vector,
-                )
-            )
-            if self.password is not None
-            else None
-        )
+    @cached_property
+    def decrypted_password(self) -> str | None:
+        """Return the decrypted password."""
+        return self._decrypt_password(self.password)
 
-        self.decrypted_authentication = (
-            extract_password(
-                decrypt_aes128cbc(
-                    base64.b64decode(self.authentication),
-                    password_hash,
-                    initialization_vector,
-                )
-            )
-            if self.authentication is not None
-            else None
-        )
+    @cached_property
+    def decrypted_authentication(self) -> str | None:
+        """Return the decrypted authentication code."""
+        return self._decrypt_password(self.authentication)
 
 
 class XMLBackbone(AttributeReader):
     """Backbone in a knxkeys file."""
 
     NODE_NAME: Final = "Backbone"
+    DECRYPTED_ATTRIBUTES = ("decrypted_key",)
 
-    decrypted_key: bytes | None = None
     key: str | None = None
     latency: int | None = None
     multicast_address: str | None = None
 
-    def parse_xml(self, node: Element) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
+    def parse_attributes(self, attributes: _Attributes) -> None:
+        """Parse all needed attributes from the given attributes."""
         self.key = self.get_attribute_value(attributes.get("Key"))
         if latency := self.get_attribute_value(attributes.get("Latency")):
             self.latency = int(latency)
@@ -168,58 +192,50 @@ class XMLBackbone(AttributeReader):
             attributes.get("MulticastAddress")
         )
 
-    def decrypt_attributes(
-        self, password_hash: bytes, initialization_vector: bytes
-    ) -> None:
-        """Decrypt attribute data."""
-        if self.key:
-            self.decrypted_key = decrypt_aes128cbc(
-                base64.b64decode(self.key), password_hash, initialization_vector
-            )
+    @cached_property
+    def decrypted_key(self) -> bytes | None:
+        """Return the decrypted backbone key."""
+        return self._decrypt(self.key) if self.key else None
 
 
 class XMLGroupAddress(AttributeReader):
     """Group Address in a knxkeys file."""
 
     NODE_NAME: Final = "Group"
+    DECRYPTED_ATTRIBUTES = ("decrypted_key",)
 
     address: GroupAddress
-    decrypted_key: bytes | None = None
     key: str
 
-    def parse_xml(self, node: Element) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
+    def parse_attributes(self, attributes: _Attributes) -> None:
+        """Parse all needed attributes from the given attributes."""
         self.address = GroupAddress(self.get_attribute_value(attributes.get("Address")))
         self.key = self.get_attribute_value(attributes.get("Key"))
 
-    def decrypt_attributes(
-        self, password_hash: bytes, initialization_vector: bytes
-    ) -> None:
-        """Decrypt attribute data."""
-        if self.key:
-            self.decrypted_key = decrypt_aes128cbc(
-                base64.b64decode(self.key), password_hash, initialization_vector
-            )
+    @cached_property
+    def decrypted_key(self) -> bytes | None:
+        """Return the decrypted group key."""
+        return self._decrypt(self.key) if self.key else None
 
 
 class XMLDevice(AttributeReader):
     """Device in a knxkeys file."""
 
     NODE_NAME: Final = "Device"
+    DECRYPTED_ATTRIBUTES = (
+        "decrypted_authentication",
+        "decrypted_management_password",
+        "decrypted_tool_key",
+    )
 
     individual_address: IndividualAddress
     tool_key: str
-    decrypted_tool_key: bytes | None = None
     management_password: str
-    decrypted_management_password: str | None = None
-    decrypted_authentication: str | None = None
     authentication: str
     sequence_number: int
 
-    def parse_xml(self, node: Element) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
+    def parse_attributes(self, attributes: _Attributes) -> None:
+        """Parse all needed attributes from the given attributes."""
         self.individual_address = IndividualAddress(
             self.get_attribute_value(attributes.get("IndividualAddress"))
         )
@@ -232,46 +248,29 @@ class XMLDevice(AttributeReader):
             self.get_attribute_value(attributes.get("SequenceNumber")) or 0
         )
 
-    def decrypt_attributes(
-        self, password_hash: bytes, initialization_vector: bytes
-    ) -> None:
-        """Decrypt attributes."""
-
-        self.decrypted_tool_key = (
-            decrypt_aes128cbc(
-                base64.b64decode(self.tool_key), password_hash, initialization_vector
-            )
-            if self.tool_key is not None
-            else None
-        )
+    @cached_property
+    def decrypted_tool_key(self) -> bytes | None:
+        """Return the decrypted tool key."""
+        return self._decrypt(self.tool_key)
 
-        self.decrypted_authentication = (
-            extract_password(
-                decrypt_aes128cbc(
-                    base64.b64decode(self.authentication),
-                    password_hash,
-                    initialization_vector,
-                )
-            )
-            if self.authentication is not None
-            else None
-        )
+    @cached_property
+    def decrypted_management_password(self) -> str | None:
+        """Return the decrypted management password."""
+        return self._decrypt_password(self.management_password)
 
-        self.decrypted_management_password = (
-            extract_password(
-                decrypt_aes128cbc(
-                    base64.b64decode(self.management_password),
-                    password_hash,
-                    initialization_vector,
-                )
-            )
-            if self.management_password is not None
-            else None
-        )
+    @cached_property
+    def decrypted_authentication(self) -> str | None:
+        """Return the decrypted authentication code."""
+        return self._decrypt_password(self.authentication)
 
 
 class Keyring(AttributeReader):
-    """Class for loading and decrypting knxkeys XML files."""
+    """
+    Class for loading and decrypting knxkeys XML files.
+
+    Lookups by address, host or user id use indexes built on first use - `interfaces`,
+    `devices` and `group_addresses` are not expected to change after loading.
+    """
 
     backbone: XMLBackbone | None = None
     interfaces: list[XMLInterface]
@@ -280,7 +279,8 @@ class Keyring(AttributeReader):
     project_name: str
     created_by: str
     created: str
-    signature: bytes
+    # None for an unsigned file
+    signature: bytes | None
     xmlns: str
 
     def __init__(self) -> None:
@@ -289,77 +289,102 @@ class Keyring(AttributeReader):
         self.devices = []
         self.group_addresses = []
 
-    def get_device_by_interface(self, interface: XMLInterface) -> XMLDevice | None:
-        """Get the device for a given interface."""
+    @cached_property
+    def _devices_by_individual_address(self) -> dict[IndividualAddress, XMLDevice]:
+        """Return index of devices by individual address."""
+        devices: dict[IndividualAddress, XMLDevice] = {}
         for device in self.devices:
-            if device.individual_address == interface.host:
-                return device
+            devices.setdefault(device.individual_address, device)
+        return devices
+
+    @cached_property
+    def _interfaces_by_individual_address(
+        self,
+    ) -> dict[IndividualAddress, XMLInterface]:
+        """Return index of interfaces of any type by individual address."""
+        interfaces: dict[IndividualAddress, XMLInterface] = {}
+        for interface in self.interfaces:
+            interfaces.setdefault(interface.individual_address, interface)
+        return interfaces
+
+    @cached_property
+    def _tunnel_interfaces_by_individual_address(
+        self,
+    ) -> dict[IndividualAddress, XMLInterface]:
+        """Return index of tunnel interfaces by individual address."""
+        tunnels: dict[IndividualAddress, XMLInterface] = {}
+        for tunnel in self.interfaces:
+            if tunnel.type is InterfaceType.TUNNELING:
+                tunnels.setdefault(tunnel.individual_address, tunnel)
+        return tunnels
+
+    @cached_property
+    def _tunnel_interfaces_by_host(
+        self,
+    ) -> dict[IndividualAddress | None, list[XMLInterface]]:
+        """Return index of tunnel interfaces by host individual address."""
+        tunnels: dict[IndividualAddress | None, list[XMLInterface]] = {}
+        for tunnel in self.interfaces:
+            if tunnel.type is InterfaceType.TUNNELING:
+                tunnels.setdefault(tunnel.host, []).append(tunnel)
+        return tunnels
+
+    @cached_property
+    def _tunnel_interfaces_by_host_and_user_id(
+        self,
+    ) -> dict[tuple[IndividualAddress | None, int | None], XMLInterface]:
+        """Return index of tunnel interfaces by host individual address and user id."""
+        tunnels: dict[tuple[IndividualAddress | None, int | None], XMLInterface] = {}
+        for tunnel in self.interfaces:
+            if tunnel.type is InterfaceType.TUNNELING:
+                tunnels.setdefault((tunnel.host, tunnel.user_id), tunnel)
+        return tunnels
+
+    @cached_property
+    def _group_addresses_by_address(self) -> dict[GroupAddress, XMLGroupAddress]:
+        """Return index of data secure group addresses by address."""
+        group_addresses: dict[GroupAddress, XMLGroupAddress] = {}
+        for group_address in self.group_addresses:
+            group_addresses.setdefault(group_address.address, group_address)
+        return group_addresses
 
-        return None
+    def get_device_by_interface(self, interface: XMLInterface) -> XMLDevice | None:
+        """Get the device for a given interface."""
+        if interface.host is None:
+            return None
+        return self._devices_by_individual_address.get(interface.host)
 
     def get_tunnel_host_by_interface(
         self, tunnelling_slot: IndividualAddress
     ) -> IndividualAddress | None:
         """Get the tunnel host for a given interface."""
-        return next(
-            (
-                interface.host
-                for interface in self.interfaces
-                if interface.type is InterfaceType.TUNNELING
-                and interface.individual_address == tunnelling_slot
-            ),
-            None,
-        )
+        if tunnel := self._tunnel_interfaces_by_individual_address.get(tunnelling_slot):
+            return tunnel.host
+        return None
 
     def get_tunnel_interfaces_by_host(
         self, host: IndividualAddress
     ) -> list[XMLInterface]:
         """Get all tunnel interfaces of a given host individual address."""
-        return [
-            tunnel
-            for tunnel in self.interfaces
-            if tunnel.type is InterfaceType.TUNNELING and tunnel.host == host
-        ]
+        return list(self._tunnel_interfaces_by_host.get(host, ()))
 
     def get_tunnel_interface_by_host_and_user_id(
         self, host: IndividualAddress, user_id: int
     ) -> XMLInterface | None:
         """Get the tunnel interface with the given host and user id."""
-        return next(
-            (
-                tunnel
-                for tunnel in self.get_tunnel_interfaces_by_host(host)
-                if tunnel.user_id == user_id
-            ),
-            None,
-        )
+        return self._tunnel_interfaces_by_host_and_user_id.get((host, user_id))
 
     def get_tunnel_interface_by_individual_address(
         self, tunnelling_slot: IndividualAddress
     ) -> XMLInterface | None:
         """Get the interface with the given tunneling address."""
-        return next(
-            (
-                tunnel
-                for tunnel in self.interfaces
-                if tunnel.type is InterfaceType.TUNNELING
-                and tunnel.individual_address == tunnelling_slot
-            ),
-            None,
-        )
+        return self._tunnel_interfaces_by_individual_address.get(tunnelling_slot)
 
     def get_interface_by_individual_address(
         self, individual_address: IndividualAddress
     ) -> XMLInterface | None:
         """Get the interface with the given individual address. Any interface type."""
-        return next(
-            (
-                interface
-                for interface in self.interfaces
-                if interface.individual_address == individual_address
-            ),
-            None,
-        )
+        return self._interfaces_by_individual_address.get(individual_address)
 
     def get_data_secure_group_keys(
         self, receiver: IndividualAddress | None = None
@@ -370,24 +395,26 @@ class Keyring(AttributeReader):
         If `receiver` is None, all data secure sending devices are returned.
         Else the result is filtered by the given receiver.
         """
-        ga_key_table = {
-            group_address.address: group_address.decrypted_key
-            for group_address in self.group_addresses
-            if group_address.decrypted_key is not None
-        }
         if receiver is None:
-            return ga_key_table
+            return {
+                group_address.address: group_address.decrypted_key
+                for group_address in self._group_addresses_by_address.values()
+                if group_address.decrypted_key is not None
+            }
 
         rcv_interface = self.get_interface_by_individual_address(
             individual_address=receiver
         )
         if rcv_interface is None:
             return {}
-        return {
-            ga: key
-            for ga, key in ga_key_table.items()
-            if ga in rcv_interface.group_addresses
-        }
+        # only decrypt keys of group addresses assigned to the receiver
+        ga_key_table: dict[GroupAddress, bytes] = {}
+        for ga in rcv_interface.group_addresses:
+            if (
+                group_address := self._group_addresses_by_address.get(ga)
+            ) is not None and group_address.decrypted_key is not None:
+                ga_key_table[ga] = group_address.decrypted_key
+        return ga_key_table
 
     def get_data_secure_senders(self) -> dict[IndividualAddress, int]:
         """
@@ -411,14 +438,7 @@ class Keyring(AttributeReader):
 
     def parse_xml(self, node: Element) -> None:
         """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
-        self.project_name = self.get_attribute_value(attributes.get("Project"))
-        self.created_by = self.get_attribute_value(attributes.get("CreatedBy"))
-        self.created = self.get_attribute_value(attributes.get("Created"))
-        self.signature = base64.b64decode(
-            self.get_attribute_value(attributes.get("Signature"))
-        )
-        self.xmlns = self.get_attribute_value(attributes.get("xmlns"))
+        self.parse_attributes(node.attributes)
 
         for sub_node in node.childNodes:
             if sub_node.nodeType != Element.ELEMENT_NODE:
@@ -451,16 +471,28 @@ class Keyring(AttributeReader):
                     xml_ga.parse_xml(ga_doc)
                     self.group_addresses.append(xml_ga)
 
+    def parse_attributes(self, attributes: _Attributes) -> None:
+        """Parse all needed attributes from the given attributes."""
+        self.project_name = self.get_attribute_value(attributes.get("Project"))
+        self.created_by = self.get_attribute_value(attributes.get("CreatedBy"))
+        self.created = self.get_attribute_value(attributes.get("Created"))
+        signature = self.get_attribute_value(attributes.get("Signature"))
+        self.signature = base64.b64decode(signature) if signature is not None else None
+        self.xmlns = self.get_attribute_value(attributes.get("xmlns"))
+
     def decrypt(self, password: str) -> None:
-        """Decrypt all data."""
-        hashed_password = hash_keyring_password(password.encode("utf-8"))
+        """Set the password for all data. It is decrypted on first access."""
+        self.decrypt_with_password_hash(hash_keyring_password(password.encode("utf-8")))
+
+    def decrypt_with_password_hash(self, password_hash: bytes) -> None:
+        """Set the hashed password for all data. It is decrypted on first access."""
         initialization_vector = sha256_hash(self.created.encode("utf-8"))[:16]
 
         for xml_element in chain(self.interfaces, self.group_addresses, self.devices):
-            xml_element.decrypt_attributes(hashed_password, initialization_vector)
+            xml_element.decrypt_attributes(password_hash, initialization_vector)
 
         if self.backbone is not None:
-            self.backbone.decrypt_attributes(hashed_password, initialization_vector)
+            self.backbone.decrypt_attributes(password_hash, initialization_vector)
 
 
 async def load_keyring(
@@ -479,28 +511,40 @@ def sync_load_keyring(
     path: str | os.PathLike[Any], password: str, validate_signature: bool = True
 ) -> Keyring:
     """Load a .knxkeys file from the given path."""
-    _path = Path(path)
-    if validate_signature and not verify_keyring_signature(_path, password):
+    handler = KeyringSAXContentHandler(password)
+    with Path(path).open(encoding="utf-8") as file:
+        try:
+            parser = xml.sax.make_parser()
+            parser.setContentHandler(handler)
+            parser.parse(file)
+        except Exception as exception:
+            logger.exception("There was an error during loading the knxkeys file.")
+            raise InvalidSecureConfiguration() from exception
+
+    if validate_signature and not handler.signature_valid():
         raise InvalidSecureConfiguration(
             "Signature verification of keyring file failed. Invalid password or malformed file content."
         )
 
-    keyring: Keyring = Keyring()
+    keyring = handler.keyring
     try:
-        with _path.open(encoding="utf-8") as file:
-            dom: Document = parse(file)
-            keyring.parse_xml(dom.getElementsByTagName("Keyring")[0])
-
-        keyring.decrypt(password)
-
-        return keyring
+        keyring.decrypt_with_password_hash(handler.hashed_password)
+        if not validate_signature:
+            # a wrong password can only be detected by failing to decode passwords
+            for xml_element in chain(keyring.interfaces, keyring.devices):
+                xml_element.decrypt_all_attributes()
     except Exception as exception:
         logger.exception("There was an error during loading the knxkeys file.")
         raise InvalidSecureConfiguration() from exception
+    return keyring
 
 
 class KeyringSAXContentHandler(ContentHandler):
-    """SAX parser for keyring signature verification."""
+    """
+    SAX parser for knxkeys files.
+
+    Creates a `Keyring` and the data for signature verification in a single pass.
+    """
 
     _attribute_blacklist = ("xmlns", "Signature")
 
@@ -508,6 +552,9 @@ class KeyringSAXContentHandler(ContentHandler):
         """Initialize."""
         self.hashed_password = hash_keyring_password(keyring_password.encode("utf-8"))
         self.output = bytearray()
+        self.keyring = Keyring()
+        self._element_path: list[str] = []
+        self._interface: XMLInterface | None = None
         super().__init__()
 
     def endDocument(self) -> None:
@@ -524,9 +571,47 @@ class KeyringSAXContentHandler(ContentHandler):
                 self.append_string(attr_name)
                 self.append_string(attr_value)
 
+        self._parse_element(name, attrs)
+        self._element_path.append(name)
+
     def endElement(self, name: str) -> None:
         """Receive notification of the end of an element."""
         self.output.append(2)
+        self._element_path.pop()
+        if name == XMLInterface.NODE_NAME:
+            self._interface = None
+
+    def _parse_element(self, name: str, attrs: AttributesImpl) -> None:
+        """Add the element to the Keyring."""
+        parent = self._element_path[-1] if self._element_path else None
+        if parent is None:
+            if name == "Keyring":
+                self.keyring.parse_attributes(attrs)
+        elif parent == "Keyring":
+            if name == XMLInterface.NODE_NAME:
+                self._interface = XMLInterface()
+                self._interface.parse_attributes(attrs)
+                self.keyring.interfaces.append(self._interface)
+            elif name == XMLBackbone.NODE_NAME:
+                self.keyring.backbone = XMLBackbone()
+                self.keyring.backbone.parse_attributes(attrs)
+        elif parent == XMLInterface.NODE_NAME:
+            if name == XMLAssignedGroupAddress.NODE_NAME and self._interface:
+                xml_group_address = XMLAssignedGroupAddress()
+                xml_group_address.parse_attributes(attrs)
+                self._interface.group_addresses[xml_group_address.address] = (
+                    xml_group_address.senders
+                )
+        elif parent == "Devices":
+            if name == XMLDevice.NODE_NAME:
+                device = XMLDevice()
+                device.parse_attributes(attrs)
+                self.keyring.devices.append(device)
+        elif parent == "GroupAddresses":
+            if name == XMLGroupAddress.NODE_NAME:
+                xml_ga = XMLGroupAddress()
+                xml_ga.parse_attributes(attrs)
+                self.keyring.group_addresses.append(xml_ga)
 
     def append_string(self, value: str | bytes) -> None:
         """Append a string to a byte array for signature verification."""
@@ -537,22 +622,22 @@ class KeyringSAXContentHandler(ContentHandler):
         self.output.append(len(value))
         self.output.extend(value)
 
+    def signature_valid(self) -> bool:
+        """Return if the signature of the parsed file is valid for the password."""
+        if self.keyring.signature is None:
+            return False
+        return sha256_hash(self.output)[:16] == self.keyring.signature
+
 
 def verify_keyring_signature(path: str | os.PathLike[Any], password: str) -> bool:
     """Verify the signature of the given knxkeys file."""
     handler = KeyringSAXContentHandler(password)
-    signature: bytes
-    _path = Path(path)
-    with _path.open(encoding="utf-8") as file:
-        element = ElementTree().parse(file)
-        signature = base64.b64decode(element.attrib.get("Signature", ""))
-
-    with _path.open(encoding="utf-8") as file:
+    with Path(path).open(encoding="utf-8") as file:
         parser = xml.sax.make_parser()
         parser.setContentHandler(handler)
         parser.parse(file)
 
-    return sha256_hash(handler.output)[:16] == signature
+    return handler.signature_valid()
 
 
 def decrypt_aes128cbc(
@@ -4,11 +4,110 @@ from __future__ import annotations
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers import (
+    Cipher,
+    CipherContext,
+    algorithms,
+    modes,
+)
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from .util import Buffer, byte_pad
 
+_COUNTER_MODULO = 1 << 128
+
+
+class AESCipher:
+    """
+    AES cipher contexts of a single key for KNX Secure CCM operations.
+
+    Creating a `Cipher` computes the AES key schedule. These contexts are created once
+    per key and reused for every frame: a CBC encryptor with zero IV for the MAC - its
+    chaining value is cancelled out of the first block of every message - and an ECB
+    encryptor generating the CTR key stream.
+    """
+
+    __slots__ = ("_cbc", "_cbc_chaining_value", "_ecb", "key")
+
+    def __init__(self, key: bytes) -> None:
+        """Initialize AESCipher class."""
+        self.key = key
+        self._cbc: CipherContext | None = None
+        self._cbc_chaining_value = 0
+        self._ecb: CipherContext | None = None
+
+    def calculate_message_authentication_code_cbc(
+        self,
+        additional_data: Buffer,
+        payload: Buffer = b"",
+        block_0: bytes = bytes(16),
+    ) -> bytes:
+        """Calculate the message authentication code (MAC) for a message with AES-CBC."""
+        if self._cbc is None:
+            self._cbc = Cipher(
+                algorithms.AES(self.key), modes.CBC(bytes(16))
+            ).encryptor()
+        # E(chaining_value ^ (block_0 ^ chaining_value)) == E(block_0 ^ 0) - zero IV
+        first_block = (
+            int.from_bytes(block_0, "big") ^ self._cbc_chaining_value
+        ).to_bytes(16, "big")
+        blocks = (
+            first_block
+            + len(additional_data).to_bytes(2, "big")
+            + additional_data
+            + payload
+        )
+        y_blocks = self._cbc.update(byte_pad(blocks, block_size=16))
+        mac = y_blocks[-16:]
+        self._cbc_chaining_value = int.from_bytes(mac, "big")
+        return mac
+
+    def _ctr_crypt(self, counter_0: bytes, data: Buffer) -> bytes:
+        """Encrypt or decrypt data with AES-CTR. First block uses counter_0."""
+        if self._ecb is None:
+            self._ecb = Cipher(algorithms.AES(self.key), modes.ECB()).encryptor()
+        counter = int.from_bytes(counter_0, "big")
+        blocks = -(-len(data) // 16)  # ceil
+        key_stream = self._ecb.update(
+            b"".join(
+                ((counter + i) % _COUNTER_MODULO).to_bytes(16, "big")
+                for i in range(blocks)
+            )
+        )
+        return (
+            int.from_bytes(data, "big") ^ int.from_bytes(key_stream[: len(data)], "big")
+        ).to_bytes(len(data), "big")
+
+    def decrypt_ctr(
+        self,
+        counter_0: bytes,
+        mac: Buffer,
+        payload: Buffer = b"",
+    ) -> tuple[bytes, bytes]:
+        """
+        Decrypt data from SecureWrapper.
+
+        MAC will be decoded first with counter 0.
+        Returns a tuple of (KNX/IP frame bytes, MAC TR for verification).
+        """
+        decrypted = self._ctr_crypt(counter_0, b"".join((mac, payload)))
+        return (decrypted[len(mac) :], decrypted[: len(mac)])
+
+    def encrypt_data_ctr(
+        self,
+        counter_0: bytes,
+        mac_cbc: bytes,
+        payload: Buffer = b"",
+    ) -> tuple[bytes, bytes]:
+        """
+        Encrypt data with AES-CTR.
+
+        MAC shall be encrypted with counter 0, payload with incremented counters.
+        Returns a tuple of encrypted data (if there is any) and encrypted MAC.
+        """
+        encrypted = self._ctr_crypt(counter_0, b"".join((mac_cbc, payload)))
+        return (encrypted[len(mac_cbc) :], encrypted[: len(mac_cbc)])
+
 
 def calculate_message_authentication_code_cbc(
     key: bytes,
@@ -16,17 +115,14 @@ def calculate_message_authentication_code_cbc(
     payload: Buffer = b"",
     block_0: bytes = bytes(16),
 ) -> bytes:
-    """Calculate the message authentication code (MAC) for a message with AES-CBC."""
-    blocks = (
-        block_0 + len(additional_data).to_bytes(2, "big") + additional_data + payload
-    )
-    y_cipher = Cipher(algorithms.AES(key), modes.CBC(bytes(16)))
-    y_encryptor = y_cipher.encryptor()
-    y_blocks = (
-        y_encryptor.update(byte_pad(blocks, block_size=16)) + y_encryptor.finalize()
+    """
+    Calculate the message authentication code (MAC) for a message with AES-CBC.
+
+    Use `AESCipher` for repeated calculations with the same key.
+    """
+    return AESCipher(key).calculate_message_authentication_code_cbc(
+        additional_data=additional_data, payload=payload, block_0=block_0
     )
-    # only calculate, no ctr encryption
-    return y_blocks[-16:]
 
 
 def decrypt_ctr(
@@ -40,13 +136,9 @@ def decrypt_ctr(
 
     MAC will be decoded first with counter 0.
     Returns a tuple of (KNX/IP frame bytes, MAC TR for verification).
+    Use `AESCipher` for repeated calculations with the same key.
     """
-    cipher = Cipher(algorithms.AES(key), modes.CTR(counter_0))
-    decryptor = cipher.decryptor()
-    mac_tr = decryptor.update(mac)  # MAC is encrypted with counter 0
-    decrypted_data = decryptor.update(payload) + decryptor.finalize()
-
-    return (decrypted_data, mac_tr)
+    return AESCipher(key).decrypt_ctr(counter_0=counter_0, mac=mac, payload=payload)
 
 
 def encrypt_data_ctr(
@@ -61,12 +153,11 @@ def encrypt_data_ctr(
     Payload is expected a full Plain KNX/IP frame with header.
     MAC shall be encrypted with counter 0, KNXnet/IP frame with incremented counters.
     Returns a tuple of encrypted data (if there is any) and encrypted MAC.
+    Use `AESCipher` for repeated calculations with the same key.
     """
-    s_cipher = Cipher(algorithms.AES(key), modes.CTR(counter_0))
-    s_encryptor = s_cipher.encryptor()
-    mac = s_encryptor.update(mac_cbc)
-    encrypted_data = s_encryptor.update(payload) + s_encryptor.finalize()
-    return (encrypted_data, mac)
+    return AESCipher(key).encrypt_data_ctr(
+        counter_0=counter_0, mac_cbc=mac_cbc, payload=payload
+    )
 
 
 def derive_device_authentication_password(device_authentication_password: str) -> bytes:
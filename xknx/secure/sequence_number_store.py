@@ -0,0 +1,240 @@
+"""
+Persistence of KNX Data Secure sequence numbers.
+
+Data Secure receivers reject frames with a sequence number not greater than the last
+valid one of the sender. Persisting the outgoing sequence number and the Security
+Individual Address Table (last valid sequence number per sender) lets a restarted
+instance continue where it stopped instead of resynchronizing with its peers.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any, Final, NamedTuple
+
+from xknx.exceptions import DataSecureError
+from xknx.telegram.address import IndividualAddress
+
+_LOGGER = logging.getLogger("xknx.data_secure")
+
+DEFAULT_FLUSH_DELAY: Final = 1.0
+_FILE_FORMAT_VERSION: Final = 1
+
+
+class SequenceNumberState(NamedTuple):
+    """Persisted Data Secure sequence numbers."""
+
+    # next sequence number to send after a restart - None if not persisted yet
+    sequence_number_sending: int | None
+    # last valid sequence number received from each sender
+    individual_address_table: dict[IndividualAddress, int]
+
+
+class SequenceNumberStore(ABC):
+    """Base class for persistence backends of Data Secure sequence numbers."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def load(self) -> SequenceNumberState:
+        """Return the persisted state."""
+
+    @abstractmethod
+    def reserve_sending(self, sequence_number: int) -> None:
+        """
+        Persist the sequence number to continue sending from after a restart.
+
+        Sequence numbers below this value may be used until the next reservation.
+        It has to be stored durably when this method returns.
+        """
+
+    @abstractmethod
+    def update_received(
+        self, source_address: IndividualAddress, sequence_number: int
+    ) -> None:
+        """Persist the last valid sequence number received from `source_address`."""
+
+    def flush(self) -> None:
+        """Write pending updates."""
+        return
+
+    def close(self) -> None:
+        """Write pending updates and release resources."""
+        self.flush()
+
+
+class FileSequenceNumberStore(SequenceNumberStore):
+    """
+    Store Data Secure sequence numbers in a JSON file.
+
+    The file is replaced atomically and synced to disk, so a crash leaves either the
+    previous or the new state. Received sequence numbers are written at most once
+    per `flush_delay` seconds - several updates share one write and fsync - in a
+    writer thread, so the event loop doesn't wait for the disk.
+    """
+
+    __slots__ = (
+        "_dirty",
+        "_executor",
+        "_flush_handle",
+        "_generation",
+        "_individual_address_table",
+        "_sequence_number_sending",
+        "_write_lock",
+        "_written_generation",
+        "flush_delay",
+        "path",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[Any],
+        flush_delay: float = DEFAULT_FLUSH_DELAY,
+    ) -> None:
+        """Initialize FileSequenceNumberStore class."""
+        self.path = Path(path)
+        self.flush_delay = flush_delay
+        self._dirty = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._individual_address_table: dict[IndividualAddress, int] = {}
+        self._sequence_number_sending: int | None = None
+        # started by the first flush in an event loop - a single thread keeps writes
+        # in order
+        self._executor: ThreadPoolExecutor | None = None
+        # states are numbered so an older one never replaces a newer file
+        self._generation = 0
+        self._written_generation = 0
+        self._write_lock = threading.Lock()
+
+    def load(self) -> SequenceNumberState:
+        """Return the state stored in the file."""
+        try:
+            with self.path.open(encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") != _FILE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported version {data.get('version')}")
+            self._sequence_number_sending = data["sequence_number_sending"]
+            self._individual_address_table = {
+                IndividualAddress(address): int(sequence_number)
+                for address, sequence_number in data["individual_address_table"].items()
+            }
+        except FileNotFoundError:
+            _LOGGER.debug("No Data Secure sequence number file found at %s", self.path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as err:
+            _LOGGER.warning(
+                "Could not read Data Secure sequence number file %s: %s", self.path, err
+            )
+        return SequenceNumberState(
+            sequence_number_sending=self._sequence_number_sending,
+            individual_address_table=self._individual_address_table.copy(),
+        )
+
+    def reserve_sending(self, sequence_number: int) -> None:
+        """Write the sequence number to continue sending from after a restart."""
+        self._sequence_number_sending = sequence_number
+        # Written synchronously: the reservation has to be durable before a sequence
+        # number of the new block is sent, else a crash could lead to reusing it. It
+        # only happens once per reserved block.
+        try:
+            self._write(*self._snapshot())
+        except OSError as err:
+            raise DataSecureError(
+                f"Could not write Data Secure sequence number file {self.path}: {err}",
+                log_level=logging.ERROR,
+            ) from err
+
+    def update_received(
+        self, source_address: IndividualAddress, sequence_number: int
+    ) -> None:
+        """Schedule writing the last valid sequence number received from `source_address`."""
+        self._individual_address_table[source_address] = sequence_number
+        self._dirty = True
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(self.flush_delay, self.flush)
+
+    def flush(self) -> None:
+        """Write pending updates - in the writer thread if an event loop is running."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._dirty:
+            return
+        snapshot = self._snapshot()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_received(*snapshot)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="xknx_sequence_numbers"
+            )
+        self._executor.submit(self._write_received, *snapshot)
+
+    def close(self) -> None:
+        """Write pending updates and wait for the writer thread."""
+        self.flush()
+        if (executor := self._executor) is not None:
+            self._executor = None
+            executor.shutdown()
+
+    def _snapshot(self) -> tuple[int, dict[str, Any]]:
+        """Return the generation and JSON data of the current state."""
+        self._generation += 1
+        self._dirty = False
+        return self._generation, {
+            "version": _FILE_FORMAT_VERSION,
+            "sequence_number_sending": self._sequence_number_sending,
+            "individual_address_table": {
+                str(address): sequence_number
+                for address, sequence_number in self._individual_address_table.items()
+            },
+        }
+
+    def _write_received(self, generation: int, data: dict[str, Any]) -> None:
+        """Write a state of received sequence numbers. Errors are logged."""
+        try:
+            self._write(generation, data)
+        except OSError as err:
+            _LOGGER.error(
+                "Could not write Data Secure sequence number file %s: %s",
+                self.path,
+                err,
+            )
+
+    def _write(self, generation: int, data: dict[str, Any]) -> None:
+        """Replace the file with a state unless a newer one was written already."""
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+            with tmp_path.open("w", encoding="utf-8") as file:
+                json.dump(data, file)
+                file.flush()
+                os.fsync(file.fileno())
+            tmp_path.replace(self.path)
+            self._written_generation = generation
+            # sync the directory entry of the replaced file - not supported on Windows
+            try:
+                dir_fd = os.open(self.path.parent, os.O_RDONLY)
+            except OSError:
+                return
+            try:
+                os.fsync(dir_fd)
+            except OSError:
+                pass
+            finally:
+                os.close(dir_fd)
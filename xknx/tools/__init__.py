@@ -5,11 +5,34 @@ from .group_communication import (
     group_value_response,
     group_value_write,
     read_group_value,
+    read_group_values,
 )
+from .load_test import LoadTestReport, run_load_test
+from .replay import (
+    CallbackCost,
+    ReplayInterface,
+    ReplayReport,
+    ReplayTransport,
+    VirtualClock,
+    replay,
+)
+from .simulator import KNXIPServerSimulator, LoopbackTransport, SimulatedDevice
 
 __all__ = [
+    "CallbackCost",
+    "KNXIPServerSimulator",
+    "LoadTestReport",
+    "LoopbackTransport",
+    "ReplayInterface",
+    "ReplayReport",
+    "ReplayTransport",
+    "SimulatedDevice",
+    "VirtualClock",
     "group_value_read",
     "group_value_response",
     "group_value_write",
     "read_group_value",
+    "read_group_values",
+    "replay",
+    "run_load_test",
 ]
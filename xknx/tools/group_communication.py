@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
 from typing import TYPE_CHECKING, Any
 
 from xknx.core.value_reader import ValueReader
 from xknx.dpt import DPTArray, DPTBase, DPTBinary
 from xknx.telegram import Telegram
-from xknx.telegram.address import DeviceAddressableType, parse_device_group_address
+from xknx.telegram.address import (
+    DeviceAddressableType,
+    GroupAddress,
+    InternalGroupAddress,
+    parse_device_group_address,
+)
 from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWrite
 from xknx.typing import DPTParsable
 
@@ -90,6 +96,51 @@ async def read_group_value(
     return None
 
 
+async def read_group_values(
+    xknx: XKNX,
+    group_addresses: Mapping[DeviceAddressableType, DPTParsable | type[DPTBase] | None],
+    timeout: float | None = None,
+) -> dict[GroupAddress | InternalGroupAddress, int | tuple[int, ...] | Any | None]:
+    """
+    Read values from several KNX group addresses at once.
+
+    GroupValueRead telegrams are sent at the rate limit of `xknx`. A read of a group
+    address already in flight - eg. by a StateUpdater - is not sent again.
+
+    :param group_addresses: value types of the group addresses to read - None
+        returns the raw value
+    :param timeout: seconds to wait for all responses - defaults to
+        `ReadMultiplexer.default_timeout()` of the group addresses
+    :return: the value of every group address - None if it was not answered
+    """
+    transcoders = {
+        parse_device_group_address(group_address): _parse_dpt(value_type)
+        for group_address, value_type in group_addresses.items()
+    }
+    if timeout is None:
+        timeout = xknx.read_multiplexer.default_timeout(len(transcoders))
+    responses = await xknx.read_multiplexer.read(transcoders, timeout)
+    values: dict[
+        GroupAddress | InternalGroupAddress, int | tuple[int, ...] | Any | None
+    ] = {}
+    for group_address, response in responses.items():
+        if response is None:
+            values[group_address] = None
+            continue
+        assert isinstance(response.payload, GroupValueWrite | GroupValueResponse)
+        transcoder = transcoders[group_address]
+        values[group_address] = (
+            transcoder.from_knx(response.payload.value)
+            if transcoder is not None
+            else response.payload.value.value
+        )
+    if missing := [
+        str(address) for address, value in responses.items() if value is None
+    ]:
+        logger.debug("No response within %s seconds from: %s", timeout, missing)
+    return values
+
+
 def _parse_dpt(value_type: DPTParsable | type[DPTBase] | None) -> type[DPTBase] | None:
     if value_type is None:
         return None
@@ -0,0 +1,369 @@
+"""
+End-to-end load test of the telegram pipeline.
+
+:func:`run_load_test` connects an :class:`~xknx.xknx.XKNX` instance over a TCP tunnel
+to a :class:`~xknx.tools.simulator.KNXIPServerSimulator` - in memory using a
+:class:`~xknx.tools.simulator.LoopbackTransport` - and pushes mixed traffic at fixed
+rates through the whole pipeline: tunnel, CEMIHandler, `telegrams` queue,
+TelegramQueue, Devices and callbacks. Outgoing telegrams are sent by devices and
+confirmed by the simulator. It measures the throughput, the depth of the telegram
+queues over time and the latency of
+
+* incoming telegrams - from being received by the interface to the device callback
+* outgoing telegrams - from `RemoteValue.set()` to `KNXIPInterface.send_cemi()`
+
+The report is JSON serializable to be tracked across releases.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+from xknx.cemi import CEMIFrame, CEMILData, CEMIMessageCode
+from xknx.devices import NumericValue, Switch
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.io import ConnectionConfig, ConnectionType, KNXIPInterface
+from xknx.io.tunnel import TCPTunnel
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, apci
+
+from .replay import nearest_rank
+from .simulator import KNXIPServerSimulator, LoopbackTransport
+
+if TYPE_CHECKING:
+    from xknx.io.tunnel import CEMIBytesCallbackType
+    from xknx.xknx import XKNX
+
+MAX_DEVICES: Final = 4096
+OUTPUT_DEVICES: Final = 16
+# main groups of the group addresses used by the load test
+_SENSOR_ADDRESS: Final = GroupAddress("1/0/0").raw
+_SWITCH_ADDRESS: Final = GroupAddress("2/0/0").raw
+_OUTPUT_ADDRESS: Final = GroupAddress("3/0/0").raw
+_UNKNOWN_ADDRESS: Final = GroupAddress("4/0/0")
+_SOURCE_ADDRESS: Final = IndividualAddress("1.2.1")
+
+
+class _LoopbackTunnel(TCPTunnel):
+    """TCP tunnel connected to a simulator over a LoopbackTransport."""
+
+    __slots__ = ("simulator",)
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        simulator: KNXIPServerSimulator,
+        cemi_received_callback: CEMIBytesCallbackType,
+    ) -> None:
+        """Initialize _LoopbackTunnel class."""
+        self.simulator = simulator
+        super().__init__(
+            xknx,
+            cemi_received_callback=cemi_received_callback,
+            gateway_ip=simulator.host,
+            gateway_port=simulator.port,
+            auto_reconnect=False,
+        )
+
+    def _init_transport(self) -> None:
+        """Initialize transport."""
+        self.transport = LoopbackTransport(
+            self.simulator, connection_lost_cb=self._tunnel_lost
+        )
+
+
+class _LoadTestInterface(KNXIPInterface):
+    """KNX/IP interface tunnelling to a simulator - recording timestamps."""
+
+    __slots__ = ("receive_times", "sent_frames", "simulator")
+
+    def __init__(self, xknx: XKNX, simulator: KNXIPServerSimulator) -> None:
+        """Initialize _LoadTestInterface class."""
+        super().__init__(
+            xknx,
+            ConnectionConfig(
+                connection_type=ConnectionType.TUNNELING_TCP, auto_reconnect=False
+            ),
+        )
+        self.simulator = simulator
+        # receive time of every L_DATA_IND
+        self.receive_times: list[float] = []
+        # frames are decoded after the load test to keep the overhead low
+        self.sent_frames: list[tuple[float, CEMIFrame]] = []
+
+    async def _start(self) -> None:
+        """Connect the tunnel to the simulator."""
+        self._interface = _LoopbackTunnel(
+            self.xknx, self.simulator, cemi_received_callback=self.cemi_received
+        )
+        await self._interface.connect()
+
+    def cemi_received(self, raw_cemi: bytes) -> None:
+        """Record the receive time of indications and pass them to CEMIHandler."""
+        if raw_cemi[0] == CEMIMessageCode.L_DATA_IND.value:
+            self.receive_times.append(time.perf_counter())
+        super().cemi_received(raw_cemi)
+
+    async def send_cemi(self, cemi: CEMIFrame) -> None:
+        """Record the time of the frame and send it."""
+        self.sent_frames.append((time.perf_counter(), cemi))
+        await super().send_cemi(cemi)
+
+
+def _queue_stats(depths: list[int]) -> dict[str, float]:
+    """Return maximum and mean of queue depth samples."""
+    return {
+        "max": max(depths, default=0),
+        "mean": sum(depths) / len(depths) if depths else 0.0,
+    }
+
+
+@dataclass(slots=True)
+class LoadTestReport:
+    """Result of a load test. Times are in seconds."""
+
+    incoming_rate: float
+    outgoing_rate: float
+    # wall time from the first telegram until all telegrams were processed
+    duration: float = 0.0
+    incoming_sent: int = 0
+    # incoming telegrams passed to telegram received callbacks
+    incoming_processed: int = 0
+    # values set to devices
+    outgoing_sent: int = 0
+    # frames passed to `send_cemi()` - including responses to read requests
+    outgoing_processed: int = 0
+    # sorted
+    incoming_latencies: list[float] = field(default_factory=list)
+    outgoing_latencies: list[float] = field(default_factory=list)
+    # time, size of `xknx.telegrams` and of the outgoing queue
+    queue_depths: list[tuple[float, int, int]] = field(default_factory=list)
+    version: str = ""
+
+    @property
+    def incoming_throughput(self) -> float:
+        """Return processed incoming telegrams per second."""
+        return self.incoming_processed / self.duration if self.duration else 0.0
+
+    @property
+    def outgoing_throughput(self) -> float:
+        """Return sent frames per second."""
+        return self.outgoing_processed / self.duration if self.duration else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable dict."""
+
+        def latency(latencies: list[float]) -> dict[str, float]:
+            return {
+                f"p{percentile}": nearest_rank(latencies, percentile)
+                for percentile in (50, 90, 99, 100)
+            }
+
+        return {
+            "version": self.version,
+            "duration": self.duration,
+            "incoming": {
+                "rate": self.incoming_rate,
+                "sent": self.incoming_sent,
+                "processed": self.incoming_processed,
+                "throughput": self.incoming_throughput,
+                "latency": latency(self.incoming_latencies),
+            },
+            "outgoing": {
+                "rate": self.outgoing_rate,
+                "sent": self.outgoing_sent,
+                "processed": self.outgoing_processed,
+                "throughput": self.outgoing_throughput,
+                "latency": latency(self.outgoing_latencies),
+            },
+            "queue_depth": {
+                "telegrams": _queue_stats([sample[1] for sample in self.queue_depths]),
+                "outgoing": _queue_stats([sample[2] for sample in self.queue_depths]),
+                "samples": [list(sample) for sample in self.queue_depths],
+            },
+        }
+
+
+async def _pace(
+    rate: float, duration: float, send: Callable[[int], Awaitable[None]]
+) -> int:
+    """Call `send` with a counter `rate` times per second for `duration` seconds."""
+    total = int(rate * duration)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    sent = 0
+    while sent < total:
+        # catch up in a batch if the loop was blocked
+        due = min(total, int((loop.time() - start) * rate) + 1)
+        while sent < due:
+            await send(sent)
+            sent += 1
+        await asyncio.sleep(max(0.0, start + sent / rate - loop.time()))
+    return sent
+
+
+async def run_load_test(
+    xknx: XKNX,
+    incoming_rate: float = 1000,
+    outgoing_rate: float = 100,
+    duration: float = 5.0,
+    devices: int = 1000,
+    latency: float = 0.0,
+    sample_interval: float = 0.05,
+) -> LoadTestReport:
+    """
+    Run a load test with an XKNX instance.
+
+    Half of `devices` are NumericValue sensors, the others Switches answering read
+    requests. Incoming traffic is a repeating mix of 5 telegrams: 2 sensor values,
+    a switch value, a read request for a switch and a telegram for a group address
+    without device. Outgoing traffic are values set to 16 NumericValue devices.
+
+    :param xknx: XKNX instance without devices - it is started and stopped
+    :param incoming_rate: telegrams per second sent by the simulator
+    :param outgoing_rate: values per second set to devices
+    :param duration: seconds to generate traffic
+    :param devices: number of sensor and switch devices - 2 to 4096
+    :param latency: delay in seconds of frames sent by the simulator
+    :param sample_interval: seconds between queue depth samples
+    :return: LoadTestReport of the load test
+    """
+    if not 2 <= devices <= MAX_DEVICES:
+        raise ValueError(f"devices shall be between 2 and {MAX_DEVICES}")
+    simulator = KNXIPServerSimulator(latency=latency)
+    interface = _LoadTestInterface(xknx, simulator)
+    xknx.knxip_interface = interface
+    report = LoadTestReport(
+        incoming_rate=incoming_rate,
+        outgoing_rate=outgoing_rate,
+        version=xknx.version,
+    )
+    receive_times = interface.receive_times
+
+    def sensor_updated(sensor: NumericValue) -> None:
+        # the value of a sensor is the index of its telegram - all are received
+        index = sensor.resolve_state()
+        assert index is not None
+        report.incoming_latencies.append(
+            time.perf_counter() - receive_times[int(index)]
+        )
+
+    def telegram_received(telegram: Telegram) -> None:
+        report.incoming_processed += 1
+
+    sensors = [
+        NumericValue(
+            xknx,
+            f"Sensor {index}",
+            group_address=GroupAddress(_SENSOR_ADDRESS + index),
+            value_type="pulse_4_ucount",
+            device_updated_cb=sensor_updated,
+        )
+        for index in range((devices + 1) // 2)
+    ]
+    switches = [
+        Switch(
+            xknx,
+            f"Switch {index}",
+            group_address=GroupAddress(_SWITCH_ADDRESS + index),
+            respond_to_read=True,
+        )
+        for index in range(devices // 2)
+    ]
+    outputs = [
+        NumericValue(
+            xknx,
+            f"Output {index}",
+            group_address=GroupAddress(_OUTPUT_ADDRESS + index),
+            value_type="pulse_4_ucount",
+        )
+        for index in range(OUTPUT_DEVICES)
+    ]
+    for device in [*sensors, *switches, *outputs]:
+        xknx.devices.async_add(device)
+    xknx.telegram_queue.register_telegram_received_cb(telegram_received)
+
+    async def send_incoming(index: int) -> None:
+        match index % 5:
+            case 0 | 1:
+                destination = GroupAddress(_SENSOR_ADDRESS + index % len(sensors))
+                payload: apci.APCI = apci.GroupValueWrite(
+                    DPTArray(index.to_bytes(4, "big"))
+                )
+            case 2:
+                destination = GroupAddress(_SWITCH_ADDRESS + index % len(switches))
+                payload = apci.GroupValueWrite(DPTBinary(index // 5 % 2))
+            case 3:
+                # the switch written by the previous telegram - it has a value to respond
+                destination = GroupAddress(
+                    _SWITCH_ADDRESS + (index - 1) % len(switches)
+                )
+                payload = apci.GroupValueRead()
+            case _:
+                destination = _UNKNOWN_ADDRESS
+                payload = apci.GroupValueWrite(DPTBinary(1))
+        simulator.inject_telegram(
+            Telegram(
+                destination_address=destination,
+                payload=payload,
+                source_address=_SOURCE_ADDRESS,
+            )
+        )
+
+    set_times: list[float] = []
+
+    async def send_outgoing(index: int) -> None:
+        set_times.append(time.perf_counter())
+        await outputs[index % OUTPUT_DEVICES].set(index)
+
+    stopped = asyncio.Event()
+
+    async def sample_queues() -> None:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        while not stopped.is_set():
+            report.queue_depths.append(
+                (
+                    loop.time() - start,
+                    xknx.telegrams.qsize(),
+                    xknx.telegram_queue.outgoing_queue.qsize(),
+                )
+            )
+            try:
+                await asyncio.wait_for(stopped.wait(), sample_interval)
+            except TimeoutError:
+                pass
+
+    await xknx.start()
+    sampler = asyncio.create_task(sample_queues())
+    try:
+        start = time.perf_counter()
+        report.incoming_sent, report.outgoing_sent = await asyncio.gather(
+            _pace(incoming_rate, duration, send_incoming),
+            _pace(outgoing_rate, duration, send_outgoing),
+        )
+        await xknx.join()
+        report.duration = time.perf_counter() - start
+    finally:
+        # also when sending failed - the sampler ends as soon as `stopped` is set
+        stopped.set()
+        await sampler
+        await xknx.stop()
+
+    output_addresses = {output.sensor_value.group_address for output in outputs}
+    for sent_time, cemi in interface.sent_frames:
+        report.outgoing_processed += 1
+        if (
+            isinstance(cemi.data, CEMILData)
+            and cemi.data.dst_addr in output_addresses
+            and isinstance(cemi.data.payload, apci.GroupValueWrite)
+            and isinstance(cemi.data.payload.value, DPTArray)
+        ):
+            index = int.from_bytes(bytes(cemi.data.payload.value.value), "big")
+            report.outgoing_latencies.append(sent_time - set_times[index])
+    report.incoming_latencies.sort()
+    report.outgoing_latencies.sort()
+    return report
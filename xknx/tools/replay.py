@@ -0,0 +1,326 @@
+"""
+Replay of captured bus traffic.
+
+Received cEMI frames of a capture (see :mod:`xknx.cemi.capture`) are fed into an
+:class:`~xknx.xknx.XKNX` instance - to `CEMIHandler.handle_raw_cemi()` or any other
+target, eg. the :class:`ReplayTransport` of a :class:`ReplayInterface` standing in
+for the KNX/IP interface of the instance. A :class:`VirtualClock` replaces the event loop clock during the replay
+and follows the timestamps of the capture, so timers of StateUpdater, tasks and
+devices fire as they did when the capture was recorded - independent of the replay
+speed. The replay reports throughput, processing latency and the time spent in
+telegram callbacks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+import time
+from typing import TYPE_CHECKING, Any
+
+from xknx.cemi.capture import CapturedFrame
+from xknx.io import ConnectionConfig, ConnectionType, KNXIPInterface
+from xknx.io.routing import Routing
+from xknx.io.transport import KNXIPTransport
+from xknx.knxip import HPAI, KNXIPFrame, RoutingIndication
+from xknx.telegram import Telegram, TelegramDirection
+
+if TYPE_CHECKING:
+    from xknx.core import TelegramQueue
+    from xknx.io.interface import CEMIBytesCallbackType
+    from xknx.xknx import XKNX
+
+
+class VirtualClock:
+    """
+    Event loop clock advanced explicitly instead of by wall time.
+
+    Relies on the scheduling internals of the asyncio event loop implementation
+    of the standard library - other loops (eg. uvloop) are not supported.
+    """
+
+    __slots__ = ("_loop", "_loop_time", "now")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Initialize VirtualClock class starting at the current loop time."""
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop_time: Callable[[], float] | None = None
+        self.now = self._loop.time()
+
+    def install(self) -> None:
+        """Replace the clock of the event loop."""
+        self._loop_time = self._loop.time
+        self._loop.time = self.time  # type: ignore[method-assign]
+
+    def uninstall(self) -> None:
+        """Restore the clock of the event loop - it continues from its own time."""
+        if self._loop_time is not None:
+            self._loop.time = self._loop_time  # type: ignore[method-assign]
+            self._loop_time = None
+
+    def time(self) -> float:
+        """Return the virtual time."""
+        return self.now
+
+    async def run_ready(self) -> None:
+        """Run the loop until no callbacks are ready."""
+        while self._loop._ready:  # type: ignore[attr-defined] # noqa: ASYNC110, SLF001
+            await asyncio.sleep(0)
+
+    def _next_timer(self) -> float | None:
+        """Return the time of the earliest scheduled timer."""
+        return min(
+            (
+                handle.when()
+                for handle in self._loop._scheduled  # type: ignore[attr-defined] # noqa: SLF001
+                if not handle.cancelled()
+            ),
+            default=None,
+        )
+
+    async def advance_to(self, when: float) -> None:
+        """Advance the clock to `when` - stopping at every timer due on the way."""
+        await self.run_ready()
+        while (timer := self._next_timer()) is not None and timer <= when:
+            self.now = max(self.now, timer)
+            # the loop picks up due timers in its next iteration
+            await asyncio.sleep(0)
+            await self.run_ready()
+        self.now = max(self.now, when)
+        await self.run_ready()
+
+
+class ReplayTransport(KNXIPTransport):
+    """
+    KNX/IP transport stand-in receiving replayed cEMI frames.
+
+    Every frame passed to `feed()` is serialized as RoutingIndication and parsed
+    again - like a received datagram - before it is handed to the registered
+    callbacks. Sent frames are discarded.
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, source: HPAI | None = None) -> None:
+        """Initialize ReplayTransport class."""
+        super().__init__()
+        self.local_hpai = HPAI()
+        self.remote_addr = ("0.0.0.0", 0)
+        self.transport = None
+        self.source = source or HPAI()
+
+    async def connect(self) -> None:
+        """Connect transport - nothing to connect."""
+
+    def send(self, knxipframe: KNXIPFrame, addr: tuple[str, int] | None = None) -> None:
+        """Discard sent frames."""
+
+    def feed(self, raw_cemi: bytes) -> None:
+        """Receive a raw cEMI frame."""
+        raw = KNXIPFrame.init_from_body(RoutingIndication(raw_cemi=raw_cemi)).to_knx()
+        knxipframe, _ = KNXIPFrame.from_knx(raw)
+        self.handle_knxipframe(knxipframe, self.source)
+
+
+class _ReplayRouting(Routing):
+    """Routing receiving frames from a ReplayTransport."""
+
+    __slots__ = ("_replay_transport",)
+
+    transport: ReplayTransport  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        transport: ReplayTransport,
+        cemi_received_callback: CEMIBytesCallbackType,
+    ) -> None:
+        """Initialize _ReplayRouting class."""
+        self._replay_transport = transport
+        super().__init__(
+            xknx,
+            individual_address=None,
+            cemi_received_callback=cemi_received_callback,
+            local_ip="0.0.0.0",
+        )
+
+    def _init_transport(self) -> None:
+        """Initialize transport."""
+        self.transport = self._replay_transport
+
+
+class ReplayInterface(KNXIPInterface):
+    """
+    KNX/IP interface of an XKNX instance routing over a ReplayTransport.
+
+    Initializing it replaces `xknx.knxip_interface`. Frames fed to `transport`
+    pass the Routing and KNXIPInterface layers to `CEMIHandler` - pass
+    `interface.transport.feed` as `target` to `replay()`.
+    """
+
+    __slots__ = ("transport",)
+
+    def __init__(self, xknx: XKNX, transport: ReplayTransport | None = None) -> None:
+        """Initialize ReplayInterface class."""
+        super().__init__(xknx, ConnectionConfig(connection_type=ConnectionType.ROUTING))
+        self.transport = transport or ReplayTransport()
+        xknx.knxip_interface = self
+
+    async def _start(self) -> None:
+        """Connect the routing to the replay transport."""
+        self._interface = _ReplayRouting(
+            self.xknx, self.transport, cemi_received_callback=self.cemi_received
+        )
+        await self._interface.connect()
+
+
+def nearest_rank(values: list[float], percentile: float) -> float:
+    """Return the value of a percentile of sorted `values` - 0.0 if empty."""
+    if not values:
+        return 0.0
+    rank = round(percentile / 100 * (len(values) - 1))
+    return values[min(max(rank, 0), len(values) - 1)]
+
+
+@dataclass(slots=True)
+class CallbackCost:
+    """Calls and processing time of a telegram callback."""
+
+    calls: int = 0
+    total_time: float = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        """Return the mean processing time of a call in seconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+@dataclass(slots=True)
+class ReplayReport:
+    """Result of a replay. Times are in seconds."""
+
+    frames: int = 0
+    # wall time of the replay
+    duration: float = 0.0
+    # time covered by the replayed frames
+    virtual_duration: float = 0.0
+    # processing time of every frame - sorted
+    latencies: list[float] = field(default_factory=list)
+    # by qualified name of the callback
+    callback_costs: dict[str, CallbackCost] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Return processed frames per second of wall time."""
+        return self.frames / self.duration if self.duration else 0.0
+
+    def latency(self, percentile: float) -> float:
+        """Return the processing latency of a percentile - nearest rank."""
+        return nearest_rank(self.latencies, percentile)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable dict."""
+        return {
+            "frames": self.frames,
+            "duration": self.duration,
+            "virtual_duration": self.virtual_duration,
+            "throughput": self.throughput,
+            "latency": {
+                f"p{percentile}": self.latency(percentile)
+                for percentile in (50, 90, 99, 100)
+            },
+            "callbacks": {
+                name: {
+                    "calls": cost.calls,
+                    "total_time": cost.total_time,
+                    "mean_time": cost.mean_time,
+                }
+                for name, cost in self.callback_costs.items()
+            },
+        }
+
+
+def _timed_callback(
+    function: Callable[[Telegram], Any], cost: CallbackCost
+) -> Callable[[Telegram], Any]:
+    """Wrap the function of a telegram callback to measure its cost."""
+
+    def timed(telegram: Telegram) -> Any:
+        start = time.perf_counter()
+        try:
+            return function(telegram)
+        finally:
+            cost.calls += 1
+            cost.total_time += time.perf_counter() - start
+
+    return timed
+
+
+async def replay(
+    xknx: XKNX,
+    frames: Iterable[CapturedFrame],
+    speed: float | None = None,
+    target: Callable[[bytes], None] | None = None,
+) -> ReplayReport:
+    """
+    Replay received frames of a capture.
+
+    Only incoming frames are replayed - outgoing ones were sent by the recording
+    instance. The telegram queue is processed after each frame, so `xknx` shall not
+    be started. Telegrams sent by devices while replaying fail as there is no
+    connection.
+
+    :param xknx: XKNX instance to feed the frames into
+    :param frames: frames of a capture, eg. `capture_frames("bus.knxcap")`
+    :param speed: factor of the original speed, eg. 1.0 for the timing of the
+        capture or 10.0 for ten times faster - None to replay as fast as possible
+    :param target: called with every raw cEMI frame - defaults to
+        `xknx.cemi_handler.handle_raw_cemi`
+    :return: ReplayReport of the replay
+    """
+    loop = asyncio.get_running_loop()
+    target = target or xknx.cemi_handler.handle_raw_cemi
+    report = ReplayReport()
+    wrapped: list[tuple[TelegramQueue.Callback, Callable[[Telegram], Any]]] = []
+    for callback in xknx.telegram_queue.telegram_received_cbs:
+        name = getattr(callback.callback, "__qualname__", repr(callback.callback))
+        wrapped.append((callback, callback.callback))
+        callback.callback = _timed_callback(
+            callback.callback, report.callback_costs.setdefault(name, CallbackCost())
+        )
+
+    clock = VirtualClock(loop)
+    clock.install()
+    virtual_start = clock.now
+    first_timestamp: float | None = None
+    start = time.perf_counter()
+    try:
+        for frame in frames:
+            if frame.direction is not TelegramDirection.INCOMING:
+                continue
+            if first_timestamp is None:
+                first_timestamp = frame.timestamp
+            offset = frame.timestamp - first_timestamp
+            if speed is not None:
+                delay = start + offset / speed - time.perf_counter()
+                if delay > 0:
+                    # the loop clock is virtual - wait for wall time in a thread
+                    await loop.run_in_executor(None, time.sleep, delay)
+            await clock.advance_to(virtual_start + offset)
+
+            frame_start = time.perf_counter()
+            target(frame.raw)
+            # private helper - there is no consumer task when xknx isn't started
+            await xknx.telegram_queue._process_all_telegrams()  # noqa: SLF001
+            await clock.run_ready()
+            report.latencies.append(time.perf_counter() - frame_start)
+            report.frames += 1
+    finally:
+        report.duration = time.perf_counter() - start
+        report.virtual_duration = clock.now - virtual_start
+        clock.uninstall()
+        for callback, function in wrapped:
+            callback.callback = function
+    report.latencies.sort()
+    return report
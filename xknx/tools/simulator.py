@@ -0,0 +1,775 @@
+"""
+Local KNXnet/IP server simulator.
+
+:class:`KNXIPServerSimulator` is an in-process KNXnet/IP tunnelling and routing
+server listening on UDP and TCP - by default on localhost - so XKNX instances can be
+connected to it and exercised without a KNX installation, eg. for end-to-end tests
+and benchmarks. It implements the server side of the connection services, tunnelling
+with L_DATA_CON confirmations and routing with flow control. Telegrams are forwarded
+between all connected clients and :class:`SimulatedDevice` instances answer
+GroupValueRead requests for their group addresses.
+
+A :class:`LoopbackTransport` connects a client in memory instead - eg. a tunnel of
+a load test, independent of the network stack of the host. Latency, frame loss and
+RoutingBusy flow control can be configured to simulate a loaded installation.
+Secure services, device management and the description services are not supported.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import logging
+import random
+from types import TracebackType
+from typing import Final
+
+from xknx.cemi import CEMIFrame, CEMILData, CEMIMessageCode
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.exceptions import (
+    CouldNotParseCEMI,
+    CouldNotParseKNXIP,
+    IncompleteKNXIPFrame,
+    UnsupportedCEMIMessage,
+)
+from xknx.io.data_connection import IncomingSequenceCounter, SequenceVerdict
+from xknx.io.transport import TCPTransport
+from xknx.knxip import (
+    HPAI,
+    ConnectionStateRequest,
+    ConnectionStateResponse,
+    ConnectRequest,
+    ConnectRequestType,
+    ConnectResponse,
+    ConnectResponseData,
+    DisconnectRequest,
+    DisconnectResponse,
+    ErrorCode,
+    HostProtocol,
+    KNXIPBody,
+    KNXIPFrame,
+    RoutingBusy,
+    RoutingIndication,
+    TunnellingAck,
+    TunnellingRequest,
+)
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, apci
+
+logger = logging.getLogger("xknx.simulator")
+
+DEFAULT_SIMULATOR_ADDRESS: Final = IndividualAddress("1.1.0")
+DEFAULT_ROUTING_BUSY_WAIT_TIME: Final = 100  # ms
+
+
+@dataclass(slots=True)
+class SimulatedDevice:
+    """
+    KNX device on the simulated bus.
+
+    It answers GroupValueRead requests for the group addresses in `group_values`
+    and stores values written or responded to these group addresses.
+    """
+
+    individual_address: IndividualAddress
+    group_values: dict[GroupAddress, DPTArray | DPTBinary] = field(default_factory=dict)
+
+    def process(self, telegram: Telegram) -> Telegram | None:
+        """Process a telegram from the bus. Return the response to send, if any."""
+        if telegram.destination_address not in self.group_values:
+            return None
+        assert isinstance(telegram.destination_address, GroupAddress)
+        if isinstance(telegram.payload, apci.GroupValueRead):
+            return Telegram(
+                destination_address=telegram.destination_address,
+                payload=apci.GroupValueResponse(
+                    self.group_values[telegram.destination_address]
+                ),
+                source_address=self.individual_address,
+            )
+        if isinstance(
+            telegram.payload, (apci.GroupValueWrite, apci.GroupValueResponse)
+        ):
+            self.group_values[telegram.destination_address] = telegram.payload.value
+        return None
+
+
+class _DelayLine:
+    """Send frames after a fixed delay - keeping their order."""
+
+    __slots__ = ("_handle", "_queue", "delay")
+
+    def __init__(self, delay: float) -> None:
+        """Initialize _DelayLine class."""
+        self.delay = delay
+        self._queue: deque[tuple[float, Callable[[], None]]] = deque()
+        self._handle: asyncio.TimerHandle | None = None
+
+    def send(self, send: Callable[[], None]) -> None:
+        """Call `send` after the delay."""
+        if self.delay <= 0:
+            send()
+            return
+        loop = asyncio.get_running_loop()
+        self._queue.append((loop.time() + self.delay, send))
+        if self._handle is None:
+            self._handle = loop.call_at(self._queue[0][0], self._send_due)
+
+    def _send_due(self) -> None:
+        """Send all due frames and wait for the next one."""
+        self._handle = None
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        while self._queue and self._queue[0][0] <= now:
+            self._queue.popleft()[1]()
+        if self._queue:
+            self._handle = loop.call_at(self._queue[0][0], self._send_due)
+
+    def cancel(self) -> None:
+        """Drop pending frames."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._queue.clear()
+
+
+class _StreamConnection(ABC):
+    """Connection of a client to the simulator over a stream - like TCP."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def send(self, body: KNXIPBody) -> None:
+        """Send a KNX/IP body to the client."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the connection."""
+
+
+class _UDPServerProtocol(asyncio.DatagramProtocol):
+    """Datagram endpoint of the simulator."""
+
+    __slots__ = ("simulator", "transport")
+
+    def __init__(self, simulator: KNXIPServerSimulator) -> None:
+        """Initialize _UDPServerProtocol class."""
+        self.simulator = simulator
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Parse and handle a received datagram - unless it is lost."""
+        if self.simulator.loss and self.simulator.random.random() < self.simulator.loss:
+            self.simulator.lost_frames += 1
+            return
+        try:
+            knxipframe, _ = KNXIPFrame.from_knx(data)
+        except CouldNotParseKNXIP as err:
+            logger.debug("Invalid frame from %s: %s", addr, err)
+            return
+        self.simulator.handle_frame(knxipframe, addr, None)
+
+    def sendto(self, body: KNXIPBody, addr: tuple[str, int]) -> None:
+        """Send a KNX/IP body to `addr`."""
+        if self.transport is None or self.transport.is_closing():
+            return
+        raw = KNXIPFrame.init_from_body(body).to_knx()
+        self.simulator.delay_line.send(lambda: self._send_raw(raw, addr))
+
+    def _send_raw(self, raw: bytes, addr: tuple[str, int]) -> None:
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.sendto(raw, addr)
+
+
+class _TCPServerProtocol(asyncio.Protocol, _StreamConnection):
+    """Stream of a client connected over TCP."""
+
+    __slots__ = ("_buffer", "simulator", "transport")
+
+    def __init__(self, simulator: KNXIPServerSimulator) -> None:
+        """Initialize _TCPServerProtocol class."""
+        self.simulator = simulator
+        self.transport: asyncio.Transport | None = None
+        self._buffer = b""
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Assign transport."""
+        assert isinstance(transport, asyncio.Transport)
+        self.transport = transport
+        self.simulator.connections.add(self)
+
+    def data_received(self, data: bytes) -> None:
+        """Parse and handle received frames."""
+        raw = self._buffer + data
+        while raw:
+            try:
+                knxipframe, raw = KNXIPFrame.from_knx(raw)
+            except IncompleteKNXIPFrame:
+                break
+            except CouldNotParseKNXIP as err:
+                logger.debug("Invalid frame over TCP: %s", err)
+                raw = b""
+                break
+            self.simulator.handle_frame(knxipframe, None, self)
+        self._buffer = raw
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Close tunnels of the connection."""
+        self.transport = None
+        self.simulator.connection_lost(self)
+
+    def send(self, body: KNXIPBody) -> None:
+        """Send a KNX/IP body."""
+        if self.transport is None:
+            return
+        raw = KNXIPFrame.init_from_body(body).to_knx()
+        self.simulator.delay_line.send(lambda: self._send_raw(raw))
+
+    def _send_raw(self, raw: bytes) -> None:
+        if self.transport is not None:
+            self.transport.write(raw)
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self.transport is not None:
+            self.transport.close()
+
+
+class _LoopbackConnection(asyncio.Transport, _StreamConnection):
+    """In-memory stream between the simulator and the protocol of a client."""
+
+    __slots__ = ("_closed", "protocol", "simulator")
+
+    def __init__(
+        self, simulator: KNXIPServerSimulator, protocol: asyncio.Protocol
+    ) -> None:
+        """Initialize _LoopbackConnection class."""
+        super().__init__(extra={"sockname": ("0.0.0.0", 0), "peername": ("0.0.0.0", 0)})
+        self.simulator = simulator
+        self.protocol = protocol
+        self._closed = False
+        simulator.connections.add(self)
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        """Receive data written by the client in the next loop iteration."""
+        if not self._closed:
+            asyncio.get_running_loop().call_soon(self._receive, bytes(data))
+
+    def _receive(self, raw: bytes) -> None:
+        """Parse and handle frames written by the client."""
+        while raw and not self._closed:
+            try:
+                knxipframe, raw = KNXIPFrame.from_knx(raw)
+            except CouldNotParseKNXIP as err:
+                logger.debug("Invalid frame over loopback: %s", err)
+                return
+            self.simulator.handle_frame(knxipframe, None, self)
+
+    def send(self, body: KNXIPBody) -> None:
+        """Send a KNX/IP body to the client."""
+        if self._closed:
+            return
+        raw = KNXIPFrame.init_from_body(body).to_knx()
+        self.simulator.delay_line.send(lambda: self._send_raw(raw))
+
+    def _send_raw(self, raw: bytes) -> None:
+        if not self._closed:
+            self.protocol.data_received(raw)
+
+    def is_closing(self) -> bool:
+        """Return True if the connection is closed."""
+        return self._closed
+
+    def close(self) -> None:
+        """Close the connection - the client is notified in the next loop iteration."""
+        if self._closed:
+            return
+        self._closed = True
+        self.simulator.connection_lost(self)
+        asyncio.get_running_loop().call_soon(self.protocol.connection_lost, None)
+
+
+@dataclass(slots=True)
+class _Tunnel:
+    """Tunnelling connection of a client."""
+
+    communication_channel: int
+    individual_address: IndividualAddress
+    # None for stream connections
+    data_addr: tuple[str, int] | None
+    stream: _StreamConnection | None
+    sequence: IncomingSequenceCounter = field(default_factory=IncomingSequenceCounter)
+    sequence_counter: int = 0
+
+
+class KNXIPServerSimulator:
+    """
+    Simulated KNXnet/IP tunnelling and routing server.
+
+    :param host: IP address to listen on
+    :param port: port to listen on for UDP and TCP - 0 to use free ports
+    :param individual_address: address of the server - tunnels are assigned the
+        following `tunnel_slots` addresses of the same line
+    :param tunnel_slots: number of tunnels that can be connected at the same time
+    :param latency: delay in seconds of every frame sent by the server
+    :param loss: probability of a received UDP frame to be lost - TCP is reliable
+    :param busy_every: send RoutingBusy to routing clients after every so many
+        received RoutingIndications - None to never send it automatically
+    :param seed: seed of the random generator used for `loss`
+    """
+
+    __slots__ = (
+        "_next_channel",
+        "_routing_indications",
+        "_tcp_server",
+        "_udp",
+        "busy_every",
+        "connections",
+        "delay_line",
+        "devices",
+        "host",
+        "individual_address",
+        "latency",
+        "loss",
+        "lost_frames",
+        "port",
+        "random",
+        "routing_clients",
+        "tunnel_addresses",
+        "tunnels",
+    )
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        individual_address: IndividualAddress | str = DEFAULT_SIMULATOR_ADDRESS,
+        tunnel_slots: int = 4,
+        latency: float = 0.0,
+        loss: float = 0.0,
+        busy_every: int | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize KNXIPServerSimulator class."""
+        self.host = host
+        self.port = port
+        self.individual_address = IndividualAddress(individual_address)
+        self.tunnel_addresses = [
+            IndividualAddress(self.individual_address.raw + slot)
+            for slot in range(1, tunnel_slots + 1)
+        ]
+        self.latency = latency
+        self.loss = loss
+        self.busy_every = busy_every
+        self.random = random.Random(seed)
+        self.devices: list[SimulatedDevice] = []
+        self.tunnels: dict[int, _Tunnel] = {}
+        self.routing_clients: set[tuple[str, int]] = set()
+        self.connections: set[_StreamConnection] = set()
+        self.lost_frames = 0
+        self.delay_line = _DelayLine(latency)
+        self._udp: _UDPServerProtocol | None = None
+        self._tcp_server: asyncio.Server | None = None
+        self._next_channel = 1
+        self._routing_indications = 0
+
+    @property
+    def udp_port(self) -> int:
+        """Return the UDP port the server listens on."""
+        assert self._udp is not None and self._udp.transport is not None
+        return int(self._udp.transport.get_extra_info("sockname")[1])
+
+    @property
+    def tcp_port(self) -> int:
+        """Return the TCP port the server listens on."""
+        assert self._tcp_server is not None
+        return int(self._tcp_server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        """Start listening."""
+        loop = asyncio.get_running_loop()
+        self._udp = udp = _UDPServerProtocol(self)
+        (udp.transport, _) = await loop.create_datagram_endpoint(
+            lambda: udp, local_addr=(self.host, self.port)
+        )
+        self._tcp_server = await loop.create_server(
+            lambda: _TCPServerProtocol(self), host=self.host, port=self.port
+        )
+        logger.debug(
+            "KNXnet/IP simulator listening on %s - UDP %s, TCP %s",
+            self.host,
+            self.udp_port,
+            self.tcp_port,
+        )
+
+    async def stop(self) -> None:
+        """Stop listening and close all connections."""
+        self.delay_line.cancel()
+        if self._udp is not None and self._udp.transport is not None:
+            self._udp.transport.close()
+        self._udp = None
+        for connection in list(self.connections):
+            connection.close()
+        if self._tcp_server is not None:
+            self._tcp_server.close()
+            await self._tcp_server.wait_closed()
+        self._tcp_server = None
+        self.tunnels.clear()
+        self.routing_clients.clear()
+
+    async def __aenter__(self) -> KNXIPServerSimulator:
+        """Start the simulator as async context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop the simulator."""
+        await self.stop()
+
+    def add_device(
+        self,
+        individual_address: IndividualAddress | str,
+        group_values: dict[GroupAddress, DPTArray | DPTBinary] | None = None,
+    ) -> SimulatedDevice:
+        """Add a device to the simulated bus."""
+        device = SimulatedDevice(
+            IndividualAddress(individual_address), dict(group_values or {})
+        )
+        self.devices.append(device)
+        return device
+
+    def inject_telegram(self, telegram: Telegram) -> None:
+        """Send a telegram from the simulated bus to all clients."""
+        self._bus_received(
+            CEMIFrame(
+                code=CEMIMessageCode.L_DATA_IND,
+                data=CEMILData.init_from_telegram(telegram),
+            ),
+            origin=None,
+        )
+
+    def inject_busy(self, wait_time: int = DEFAULT_ROUTING_BUSY_WAIT_TIME) -> None:
+        """Send RoutingBusy with `wait_time` in milliseconds to all routing clients."""
+        if self._udp is None:
+            return
+        routing_busy = RoutingBusy(wait_time=wait_time)
+        for addr in self.routing_clients:
+            self._udp.sendto(routing_busy, addr)
+
+    ####################
+    #
+    # RECEIVED FRAMES
+    #
+    ####################
+
+    def handle_frame(
+        self,
+        knxipframe: KNXIPFrame,
+        addr: tuple[str, int] | None,
+        stream: _StreamConnection | None,
+    ) -> None:
+        """Handle a frame received over UDP from `addr` or over a stream connection."""
+        body = knxipframe.body
+        if isinstance(body, TunnellingRequest):
+            self._tunnelling_request_received(body, stream)
+        elif isinstance(body, TunnellingAck):
+            pass
+        elif isinstance(body, RoutingIndication) and addr is not None:
+            self._routing_indication_received(body, addr)
+        elif isinstance(body, ConnectRequest):
+            self._connect_request_received(body, addr, stream)
+        elif isinstance(body, ConnectionStateRequest):
+            self._reply(
+                ConnectionStateResponse(
+                    communication_channel_id=body.communication_channel_id,
+                    status_code=(
+                        ErrorCode.E_NO_ERROR
+                        if self._tunnel(body.communication_channel_id, stream)
+                        else ErrorCode.E_CONNECTION_ID
+                    ),
+                ),
+                body.control_endpoint,
+                addr,
+                stream,
+            )
+        elif isinstance(body, DisconnectRequest):
+            tunnel = self._tunnel(body.communication_channel_id, stream)
+            if tunnel is not None:
+                self._close_tunnel(tunnel)
+            self._reply(
+                DisconnectResponse(
+                    communication_channel_id=body.communication_channel_id,
+                    status_code=(
+                        ErrorCode.E_NO_ERROR if tunnel else ErrorCode.E_CONNECTION_ID
+                    ),
+                ),
+                body.control_endpoint,
+                addr,
+                stream,
+            )
+        else:
+            logger.debug("Service not implemented by simulator: %s", knxipframe)
+
+    def _reply(
+        self,
+        body: KNXIPBody,
+        endpoint: HPAI,
+        addr: tuple[str, int] | None,
+        stream: _StreamConnection | None,
+    ) -> None:
+        """Reply to the endpoint of a request."""
+        if stream is not None:
+            stream.send(body)
+        elif self._udp is not None and addr is not None:
+            self._udp.sendto(body, addr if endpoint.route_back else endpoint.addr_tuple)
+
+    def _tunnel(
+        self, communication_channel: int, stream: _StreamConnection | None
+    ) -> _Tunnel | None:
+        """Return the tunnel of a communication channel used by the connection."""
+        tunnel = self.tunnels.get(communication_channel)
+        if tunnel is None or tunnel.stream is not stream:
+            return None
+        return tunnel
+
+    def _connect_request_received(
+        self,
+        connect_request: ConnectRequest,
+        addr: tuple[str, int] | None,
+        stream: _StreamConnection | None,
+    ) -> None:
+        """Assign a tunnel to a client."""
+
+        def reply(
+            status_code: ErrorCode,
+            tunnel: _Tunnel | None = None,
+        ) -> None:
+            self._reply(
+                ConnectResponse(
+                    communication_channel=(
+                        tunnel.communication_channel if tunnel else 0
+                    ),
+                    status_code=status_code,
+                    data_endpoint=(
+                        HPAI(protocol=HostProtocol.IPV4_TCP)
+                        if stream
+                        else HPAI(ip_addr=self.host, port=self.udp_port)
+                    ),
+                    crd=ConnectResponseData(
+                        individual_address=(
+                            tunnel.individual_address
+                            if tunnel
+                            else IndividualAddress(0)
+                        ),
+                    ),
+                ),
+                connect_request.control_endpoint,
+                addr,
+                stream,
+            )
+
+        if (
+            connect_request.cri.connection_type
+            is not ConnectRequestType.TUNNEL_CONNECTION
+        ):
+            reply(ErrorCode.E_CONNECTION_TYPE)
+            return
+        used = {tunnel.individual_address for tunnel in self.tunnels.values()}
+        if (requested := connect_request.cri.individual_address) is not None:
+            if requested not in self.tunnel_addresses:
+                reply(ErrorCode.E_TUNNELLING_LAYER)
+                return
+            if requested in used:
+                reply(ErrorCode.E_CONNECTION_IN_USE)
+                return
+            individual_address = requested
+        else:
+            free = [address for address in self.tunnel_addresses if address not in used]
+            if not free or len(self.tunnels) >= 255:
+                reply(ErrorCode.E_NO_MORE_CONNECTIONS)
+                return
+            individual_address = free[0]
+
+        while self._next_channel in self.tunnels:
+            self._next_channel = self._next_channel % 255 + 1
+        data_endpoint = connect_request.data_endpoint
+        tunnel = _Tunnel(
+            communication_channel=self._next_channel,
+            individual_address=individual_address,
+            data_addr=(
+                None
+                if stream
+                else (addr if data_endpoint.route_back else data_endpoint.addr_tuple)
+            ),
+            stream=stream,
+        )
+        self._next_channel = self._next_channel % 255 + 1
+        self.tunnels[tunnel.communication_channel] = tunnel
+        logger.debug(
+            "Tunnel %s connected with address %s",
+            tunnel.communication_channel,
+            tunnel.individual_address,
+        )
+        reply(ErrorCode.E_NO_ERROR, tunnel)
+
+    def _close_tunnel(self, tunnel: _Tunnel) -> None:
+        """Remove a tunnel."""
+        self.tunnels.pop(tunnel.communication_channel, None)
+        logger.debug("Tunnel %s disconnected", tunnel.communication_channel)
+
+    def connection_lost(self, stream: _StreamConnection) -> None:
+        """Remove the tunnels of a closed stream connection."""
+        self.connections.discard(stream)
+        for tunnel in [
+            tunnel for tunnel in self.tunnels.values() if tunnel.stream is stream
+        ]:
+            self._close_tunnel(tunnel)
+
+    def _tunnelling_request_received(
+        self,
+        tunnelling_request: TunnellingRequest,
+        stream: _StreamConnection | None,
+    ) -> None:
+        """Acknowledge and confirm a telegram sent by a tunnel client."""
+        tunnel = self._tunnel(tunnelling_request.communication_channel_id, stream)
+        if tunnel is None:
+            logger.debug(
+                "TunnellingRequest for unknown channel %s",
+                tunnelling_request.communication_channel_id,
+            )
+            return
+        if stream is None:
+            verdict = tunnel.sequence.evaluate(tunnelling_request.sequence_counter)
+            if verdict is SequenceVerdict.OUT_OF_ORDER:
+                return
+            self._send_to_tunnel(
+                tunnel,
+                TunnellingAck(
+                    communication_channel_id=tunnel.communication_channel,
+                    sequence_counter=tunnelling_request.sequence_counter,
+                ),
+            )
+            if verdict is SequenceVerdict.REPEATED:
+                return
+        try:
+            cemi = CEMIFrame.from_knx(tunnelling_request.raw_cemi)
+        except (CouldNotParseCEMI, UnsupportedCEMIMessage) as err:
+            logger.debug("Unsupported cEMI frame from tunnel: %s", err)
+            return
+        if cemi.code is not CEMIMessageCode.L_DATA_REQ:
+            logger.debug("cEMI message code not supported by simulator: %s", cemi.code)
+            return
+        assert isinstance(cemi.data, CEMILData)
+        if cemi.data.src_addr.raw == 0:
+            cemi.data.src_addr = tunnel.individual_address
+        cemi.code = CEMIMessageCode.L_DATA_CON
+        self._send_cemi_to_tunnel(tunnel, cemi.to_knx())
+        cemi.code = CEMIMessageCode.L_DATA_IND
+        self._bus_received(cemi, origin=tunnel)
+
+    def _routing_indication_received(
+        self, routing_indication: RoutingIndication, addr: tuple[str, int]
+    ) -> None:
+        """Forward a telegram received from a routing client."""
+        self.routing_clients.add(addr)
+        self._routing_indications += 1
+        if self.busy_every and self._routing_indications % self.busy_every == 0:
+            self.inject_busy()
+        try:
+            cemi = CEMIFrame.from_knx(routing_indication.raw_cemi)
+        except (CouldNotParseCEMI, UnsupportedCEMIMessage) as err:
+            logger.debug("Unsupported cEMI frame from routing client: %s", err)
+            return
+        if cemi.code is not CEMIMessageCode.L_DATA_IND:
+            return
+        self._bus_received(cemi, origin=addr)
+
+    ####################
+    #
+    # BUS
+    #
+    ####################
+
+    def _bus_received(
+        self, cemi: CEMIFrame, origin: _Tunnel | tuple[str, int] | None
+    ) -> None:
+        """Forward an L_DATA_IND to all clients but `origin` and to the devices."""
+        raw_cemi = cemi.to_knx()
+        for tunnel in list(self.tunnels.values()):
+            if tunnel is not origin:
+                self._send_cemi_to_tunnel(tunnel, raw_cemi)
+        if self._udp is not None:
+            routing_indication = RoutingIndication(raw_cemi=raw_cemi)
+            for addr in self.routing_clients:
+                if addr != origin:
+                    self._udp.sendto(routing_indication, addr)
+
+        assert isinstance(cemi.data, CEMILData)
+        telegram = cemi.data.telegram()
+        for device in self.devices:
+            if (response := device.process(telegram)) is not None:
+                self._bus_received(
+                    CEMIFrame(
+                        code=CEMIMessageCode.L_DATA_IND,
+                        data=CEMILData.init_from_telegram(response),
+                    ),
+                    origin=None,
+                )
+
+    def _send_cemi_to_tunnel(self, tunnel: _Tunnel, raw_cemi: bytes) -> None:
+        """Send a cEMI frame to a tunnel client."""
+        self._send_to_tunnel(
+            tunnel,
+            TunnellingRequest(
+                communication_channel_id=tunnel.communication_channel,
+                sequence_counter=tunnel.sequence_counter,
+                raw_cemi=raw_cemi,
+            ),
+        )
+        tunnel.sequence_counter = tunnel.sequence_counter + 1 & 0xFF
+
+    def _send_to_tunnel(self, tunnel: _Tunnel, body: KNXIPBody) -> None:
+        """Send a frame to the data endpoint of a tunnel."""
+        if tunnel.stream is not None:
+            tunnel.stream.send(body)
+        elif self._udp is not None and tunnel.data_addr is not None:
+            self._udp.sendto(body, tunnel.data_addr)
+
+
+class LoopbackTransport(TCPTransport):
+    """
+    TCP transport connected in memory to a KNXIPServerSimulator.
+
+    No sockets are used - the simulator doesn't need to be started. Like received
+    data of a socket, frames are delivered in later iterations of the event loop.
+    """
+
+    __slots__ = ("simulator",)
+
+    def __init__(
+        self,
+        simulator: KNXIPServerSimulator,
+        connection_lost_cb: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize LoopbackTransport class."""
+        super().__init__(
+            remote_addr=(simulator.host, simulator.port),
+            connection_lost_cb=connection_lost_cb,
+        )
+        self.simulator = simulator
+
+    async def connect(self) -> None:
+        """Connect to the simulator."""
+        protocol = TCPTransport.TCPTransportFactory(
+            data_received_callback=self.data_received_callback,
+            connection_lost_callback=self._connection_lost,
+        )
+        self.transport = _LoopbackConnection(self.simulator, protocol)
+        protocol.connection_made(self.transport)
@@ -12,8 +12,11 @@ from types import TracebackType
 
 from xknx.cemi import CEMIHandler
 from xknx.core import (
+    BusLoadController,
     ConnectionManager,
     GroupAddressDPT,
+    PipelineMetrics,
+    ReadMultiplexer,
     TaskRegistry,
     TelegramQueue,
 )
@@ -42,6 +45,7 @@ class XKNX:
     """Class for reading and writing KNX/IP packets."""
 
     __slots__ = (
+        "bus_load",
         "cemi_handler",
         "connection_manager",
         "current_address",
@@ -50,9 +54,11 @@ class XKNX:
         "group_address_dpt",
         "knxip_interface",
         "management",
+        "metrics",
         "multicast_group",
         "multicast_port",
         "rate_limit",
+        "read_multiplexer",
         "sigint_received",
         "started",
         "state_updater",
@@ -84,10 +90,14 @@ class XKNX:
         self.management = Management(self)
         self.telegrams: asyncio.Queue[Telegram | None] = asyncio.Queue()
         self.telegram_queue = TelegramQueue(self)
+        self.read_multiplexer = ReadMultiplexer(self)
         self.cemi_handler = CEMIHandler(self)
+        self.bus_load = BusLoadController()
         self.state_updater = StateUpdater(self, default_tracker_option=state_updater)
         self.task_registry = TaskRegistry(self)
         self.group_address_dpt = GroupAddressDPT()
+        # set by creating PipelineMetrics - None disables instrumentation
+        self.metrics: PipelineMetrics | None = None
 
         self.current_address = IndividualAddress(0)
         self.daemon_mode = daemon_mode
@@ -96,7 +106,7 @@ class XKNX:
         self.rate_limit = rate_limit
         self.sigint_received = asyncio.Event()
         self.started = asyncio.Event()
-        self.devices = Devices(started=self.started)
+        self.devices = Devices(started=self.started, bus_load=self.bus_load)
         self.version = VERSION
 
         GroupAddress.address_format = address_format  # for global string representation
@@ -164,9 +174,11 @@ class XKNX:
         self.devices.async_remove_device_tasks()
         self.task_registry.stop()
         self.state_updater.stop()
+        await self.management.stop()
         await self.join()
         await self.telegram_queue.stop()
         await self.knxip_interface.stop()
+        await self.cemi_handler.stop()
         self.started.clear()
 
     async def loop_until_sigint(self) -> None: